@@ -0,0 +1,172 @@
+"""A thin client which runs CLI commands in a long-lived daemon.
+
+Every run of the CLI imports most of the app, builds its registries and gets the
+database ready before it can do any work. The daemon in `jupiter.cli.daemon`
+does that once and then serves commands over a Unix socket, until it's been idle
+for a while. This client forwards the command line and the environment to it,
+starting it first if needed, and relays back the output and the exit code.
+Interrupting the client asks the daemon to cancel the command.
+
+Use it in place of `python -m jupiter.cli.jupiter`, as `python -m jupiter.cli.client`.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import socket
+import subprocess  # nosec
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Final
+
+import jupiter.cli
+import jupiter.core
+from jupiter.core.framework.manifest import fingerprint_module_roots
+from jupiter.core.utils.global_properties import build_global_properties
+
+# The first start might have to migrate the database, or scan for commands.
+DAEMON_START_TIMEOUT_SECS: Final[float] = 60
+_DAEMON_START_POLL_INTERVAL_SECS: Final[float] = 0.05
+
+
+def daemon_socket_path() -> Path:
+    """The socket of the daemon for the current configuration.
+
+    A daemon is only ever shared by clients which would otherwise have run
+    exactly the same code against exactly the same configuration.
+    """
+    key = hashlib.sha256()
+    key.update(sys.executable.encode())
+    key.update(str(Path.cwd()).encode())
+    key.update(repr(build_global_properties()).encode())
+    key.update(fingerprint_module_roots(jupiter.core, jupiter.cli).encode())
+    socket_dir = Path(tempfile.gettempdir()) / f"jupiter-cli-{os.getuid()}"
+    socket_dir.mkdir(mode=0o700, exist_ok=True)
+    return socket_dir / f"{key.hexdigest()[:16]}.sock"
+
+
+def encode_frame(frame: dict[str, object]) -> bytes:
+    """Encode a frame of the protocol between the client and the daemon.
+
+    Frames are JSON objects, one per line.
+    """
+    return json.dumps(frame).encode() + b"\n"
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    daemon_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        daemon_socket.connect(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        daemon_socket.close()
+        return None
+    return daemon_socket
+
+
+def _start_daemon(socket_path: Path) -> socket.socket | None:
+    with socket_path.with_suffix(".log").open("ab") as log_file:
+        daemon_process = subprocess.Popen(  # nosec
+            [sys.executable, "-m", "jupiter.cli.daemon", str(socket_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT_SECS
+    while time.monotonic() < deadline:
+        daemon_socket = _connect(socket_path)
+        if daemon_socket is not None:
+            return daemon_socket
+        # A daemon which exits cleanly has lost the race to start to another
+        # one, which we keep waiting for.
+        if daemon_process.poll() not in (None, 0):
+            return None
+        time.sleep(_DAEMON_START_POLL_INTERVAL_SECS)
+    return None
+
+
+def _run_in_process() -> None:
+    os.execv(  # nosec
+        sys.executable, [sys.executable, "-m", "jupiter.cli.jupiter", *sys.argv[1:]]
+    )
+
+
+def run_in_daemon(daemon_socket: socket.socket, argv: list[str]) -> int | None:
+    """Run a command in the daemon, relaying back its output.
+
+    Returns the exit code of the command, or None if the daemon went away
+    before it got to the command.
+    """
+    is_terminal = sys.stdout.isatty()
+    terminal_size = os.get_terminal_size() if is_terminal else None
+
+    with daemon_socket, daemon_socket.makefile("rb") as stream:
+        daemon_socket.sendall(
+            encode_frame(
+                {
+                    "argv": argv,
+                    "environ": dict(os.environ),
+                    "is_terminal": is_terminal,
+                    "width": terminal_size.columns if terminal_size else None,
+                    "height": terminal_size.lines if terminal_size else None,
+                }
+            )
+        )
+
+        got_output = False
+        cancelled = False
+        while True:
+            try:
+                line = stream.readline()
+                if not line:
+                    break
+                frame = json.loads(line)
+                if "stdout" in frame:
+                    sys.stdout.write(frame["stdout"])
+                    sys.stdout.flush()
+                elif "stderr" in frame:
+                    sys.stderr.write(frame["stderr"])
+                    sys.stderr.flush()
+                elif "exit_code" in frame:
+                    return int(frame["exit_code"])
+                got_output = True
+            except KeyboardInterrupt:
+                # The first interrupt asks the daemon to cancel the command and
+                # report back, a second one gives up on it.
+                if cancelled:
+                    raise
+                cancelled = True
+                with contextlib.suppress(OSError):
+                    daemon_socket.sendall(encode_frame({"cancel": True}))
+
+    if not got_output:
+        # The daemon went away before it got to the command, most likely as
+        # it was shutting down for being idle.
+        return None
+
+    print("The CLI daemon stopped in the middle of the command", file=sys.stderr)
+    return 1
+
+
+def main() -> None:
+    """Run the command given on the command line in the daemon."""
+    socket_path = daemon_socket_path()
+    daemon_socket = _connect(socket_path) or _start_daemon(socket_path)
+    if daemon_socket is None:
+        _run_in_process()
+        return
+
+    exit_code = run_in_daemon(daemon_socket, sys.argv)
+    if exit_code is None:
+        _run_in_process()
+        return
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ import typing
 from argparse import ArgumentParser, Namespace
 from collections.abc import Iterator
 from datetime import date, datetime
+from pathlib import Path
 from typing import Any, Final, Generic, TypeVar, cast, get_args, get_origin
 
 import inflection
@@ -17,12 +18,18 @@ from jupiter.cli.session_storage import SessionInfo, SessionStorage
 from jupiter.cli.top_level_context import TopLevelContext
 from jupiter.core.domain.app import AppCore
 from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.schedule.ical_fetcher import ICalFetcher
 from jupiter.core.domain.concept.user.user import User
 from jupiter.core.domain.concept.workspaces.workspace import Workspace
 from jupiter.core.domain.crm import CRM
 from jupiter.core.domain.env import Env
 from jupiter.core.domain.features import UserFeature, WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainStorageEngine, SearchStorageEngine
+from jupiter.core.framework.manifest import (
+    ManifestSection,
+    import_path,
+    resolve_import_path,
+)
 from jupiter.core.framework.primitive import Primitive
 from jupiter.core.framework.realm import CliRealm, RealmCodecRegistry
 from jupiter.core.framework.thing import Thing
@@ -162,18 +169,26 @@ class UseCaseCommand(Generic[UseCaseT], Command, abc.ABC):
 
     def name(self) -> str:
         """The name of the command."""
-        if self.__class__ in (
+        return UseCaseCommand.name_for(self._use_case.__class__, self.__class__)
+
+    @staticmethod
+    def name_for(
+        use_case_type: type[UseCase[Any, Any, Any, Any]],
+        command_type: type[Command] | None = None,
+    ) -> str:
+        """The name of the command for a use case, with no command class of its own or with one."""
+        if command_type is None or command_type in (
             LoggedInMutationCommand,
             LoggedInReadonlyCommand,
             GuestMutationCommand,
             GuestReadonlyCommand,
         ):
             return inflection.dasherize(
-                inflection.underscore(self._use_case.__class__.__name__)
+                inflection.underscore(use_case_type.__name__)
             ).replace("-use-case", "")
         else:
             return inflection.dasherize(
-                inflection.underscore(self.__class__.__name__)
+                inflection.underscore(command_type.__name__)
             ).replace("-use-case", "")
 
     def description(self) -> str:
@@ -994,6 +1009,49 @@ class CliExceptionHandler(Generic[_ExceptionT], abc.ABC):
         """Handle an exception."""
 
 
+@dataclasses.dataclass
+class _CliModuleRootsExploration:
+    """The commands and exception handlers defined in the modules under some module roots."""
+
+    use_case_commands: list[
+        tuple[
+            type[
+                UseCaseCommand[
+                    UseCase[
+                        UseCaseSessionBase,
+                        UseCaseContextBase,
+                        UseCaseArgsBase,
+                        UseCaseResultBase | None,
+                    ]
+                ]
+            ],
+            type[
+                UseCase[
+                    UseCaseSessionBase,
+                    UseCaseContextBase,
+                    UseCaseArgsBase,
+                    UseCaseResultBase | None,
+                ]
+            ],
+        ]
+    ]
+    command_types: list[type[Command]]
+    # Use cases without a command class of their own, which get a standard one.
+    use_case_types: list[
+        type[
+            UseCase[
+                UseCaseSessionBase,
+                UseCaseContextBase,
+                UseCaseArgsBase,
+                UseCaseResultBase | None,
+            ]
+        ]
+    ]
+    exception_handlers: list[
+        tuple[type[Exception], type[CliExceptionHandler[Exception]]]
+    ]
+
+
 class CliApp:
     """A CLI application."""
 
@@ -1010,6 +1068,7 @@ class CliApp:
     _search_storage_engine: Final[SearchStorageEngine]
     _use_case_storage_engine: Final[UseCaseStorageEngine]
     _crm: Final[CRM]
+    _ical_fetcher: Final[ICalFetcher]
     _use_case_commands: dict[
         type[
             UseCase[
@@ -1023,6 +1082,11 @@ class CliApp:
     ]
     _commands: dict[str, Command]
     _exception_handlers: dict[type[Exception], CliExceptionHandler[Exception]]
+    # When built from a manifest, use case commands are keyed by their name and
+    # hold the import paths of the use case and of its command class, if any.
+    # Exception handlers are keyed by the import path of their exception.
+    _pending_use_case_commands: dict[str, tuple[str, str | None]]
+    _pending_exception_handlers: dict[str, str]
 
     def __init__(
         self,
@@ -1039,6 +1103,7 @@ class CliApp:
         search_storage_engine: SearchStorageEngine,
         use_case_storage_engine: UseCaseStorageEngine,
         crm: CRM,
+        ical_fetcher: ICalFetcher,
     ) -> None:
         """Constructor."""
         self._global_properties = global_properties
@@ -1054,9 +1119,12 @@ class CliApp:
         self._search_storage_engine = search_storage_engine
         self._use_case_storage_engine = use_case_storage_engine
         self._crm = crm
+        self._ical_fetcher = ical_fetcher
         self._use_case_commands = {}
         self._commands = {}
         self._exception_handlers = {}
+        self._pending_use_case_commands = {}
+        self._pending_exception_handlers = {}
 
     @staticmethod
     def build_from_module_root(
@@ -1073,10 +1141,147 @@ class CliApp:
         search_storage_engine: SearchStorageEngine,
         use_case_storage_engine: UseCaseStorageEngine,
         crm: CRM,
+        ical_fetcher: ICalFetcher,
         *module_root: types.ModuleType,
     ) -> "CliApp":
         """Build a CLI app from the module root."""
+        exploration = CliApp._explore_module_roots(*module_root)
+
+        cli_app = CliApp(
+            global_properties=global_properties,
+            top_level_context=top_level_context,
+            console=console,
+            time_provider=time_provider,
+            invocation_recorder=invocation_recorder,
+            progress_reporter_factory=progress_reporter_factory,
+            realm_codec_registry=realm_codec_registry,
+            session_storage=session_storage,
+            auth_token_stamper=auth_token_stamper,
+            domain_storage_engine=domain_storage_engine,
+            search_storage_engine=search_storage_engine,
+            use_case_storage_engine=use_case_storage_engine,
+            crm=crm,
+            ical_fetcher=ical_fetcher,
+        )
+
+        for use_case_command_type, use_case_type in exploration.use_case_commands:
+            cli_app._add_use_case_command(use_case_command_type, use_case_type)
+
+        for command_type in exploration.command_types:
+            cli_app._add_command(command_type)
+
+        for use_case_type in exploration.use_case_types:
+            cli_app._add_use_case_type(use_case_type)
+
+        for exception_type, exception_handler in exploration.exception_handlers:
+            cli_app._add_exception_handler(exception_type, exception_handler)
+
+        return cli_app
+
+    @staticmethod
+    def build_manifest_section(*module_root: types.ModuleType) -> ManifestSection:
+        """Build the manifest section from which the CLI app for the module root can be built."""
+        exploration = CliApp._explore_module_roots(*module_root)
+
+        section: ManifestSection = []
+        for use_case_command_type, use_case_type in exploration.use_case_commands:
+            section.append(
+                (
+                    "use-case-command",
+                    UseCaseCommand.name_for(use_case_type, use_case_command_type),
+                    import_path(use_case_type),
+                    import_path(use_case_command_type),
+                )
+            )
+        for command_type in exploration.command_types:
+            section.append(("command", import_path(command_type)))
+        for use_case_type in exploration.use_case_types:
+            section.append(
+                (
+                    "use-case",
+                    UseCaseCommand.name_for(use_case_type),
+                    import_path(use_case_type),
+                )
+            )
+        for exception_type, exception_handler in exploration.exception_handlers:
+            section.append(
+                (
+                    "exception-handler",
+                    import_path(exception_type),
+                    import_path(exception_handler),
+                )
+            )
+        return section
+
+    @staticmethod
+    def build_from_manifest(
+        global_properties: GlobalProperties,
+        top_level_context: TopLevelContext,
+        console: Console,
+        time_provider: TimeProvider,
+        invocation_recorder: MutationUseCaseInvocationRecorder,
+        progress_reporter_factory: RichConsoleProgressReporterFactory,
+        realm_codec_registry: RealmCodecRegistry,
+        session_storage: SessionStorage,
+        auth_token_stamper: AuthTokenStamper,
+        domain_storage_engine: DomainStorageEngine,
+        search_storage_engine: SearchStorageEngine,
+        use_case_storage_engine: UseCaseStorageEngine,
+        crm: CRM,
+        ical_fetcher: ICalFetcher,
+        section: ManifestSection,
+    ) -> "CliApp":
+        """Build a CLI app from a manifest section.
+
+        Use case commands are only imported when they are run, and exception
+        handlers when their exception is raised.
+        """
+        cli_app = CliApp(
+            global_properties=global_properties,
+            top_level_context=top_level_context,
+            console=console,
+            time_provider=time_provider,
+            invocation_recorder=invocation_recorder,
+            progress_reporter_factory=progress_reporter_factory,
+            realm_codec_registry=realm_codec_registry,
+            session_storage=session_storage,
+            auth_token_stamper=auth_token_stamper,
+            domain_storage_engine=domain_storage_engine,
+            search_storage_engine=search_storage_engine,
+            use_case_storage_engine=use_case_storage_engine,
+            crm=crm,
+            ical_fetcher=ical_fetcher,
+        )
+
+        for kind, *paths in section:
+            if kind == "use-case-command":
+                name, use_case_path, use_case_command_path = paths
+                cli_app._pending_use_case_commands[name] = (
+                    use_case_path,
+                    use_case_command_path,
+                )
+            elif kind == "use-case":
+                name, use_case_path = paths
+                cli_app._pending_use_case_commands[name] = (use_case_path, None)
+            elif kind == "command":
+                (command_path,) = paths
+                cli_app._add_command(
+                    cast(type[Command], resolve_import_path(command_path))
+                )
+            elif kind == "exception-handler":
+                exception_path, exception_handler_path = paths
+                cli_app._pending_exception_handlers[exception_path] = (
+                    exception_handler_path
+                )
+            else:
+                raise Exception(f"Unknown command manifest entry kind {kind}")
+
+        return cli_app
 
+    @staticmethod
+    def _explore_module_roots(
+        *module_root: types.ModuleType,
+    ) -> _CliModuleRootsExploration:
         def extract_use_case_command(
             the_module: types.ModuleType,
         ) -> Iterator[
@@ -1208,41 +1413,43 @@ class CliApp:
 
                 yield exception_type, obj
 
-        cli_app = CliApp(
-            global_properties=global_properties,
-            top_level_context=top_level_context,
-            console=console,
-            time_provider=time_provider,
-            invocation_recorder=invocation_recorder,
-            progress_reporter_factory=progress_reporter_factory,
-            realm_codec_registry=realm_codec_registry,
-            session_storage=session_storage,
-            auth_token_stamper=auth_token_stamper,
-            domain_storage_engine=domain_storage_engine,
-            search_storage_engine=search_storage_engine,
-            use_case_storage_engine=use_case_storage_engine,
-            crm=crm,
+        exploration = _CliModuleRootsExploration(
+            use_case_commands=[],
+            command_types=[],
+            use_case_types=[],
+            exception_handlers=[],
         )
 
         for m in find_all_modules(*module_root):
-            for use_case_command_type, use_case_type in extract_use_case_command(m):
-                cli_app._add_use_case_command(use_case_command_type, use_case_type)
+            exploration.use_case_commands.extend(extract_use_case_command(m))
 
         for m in find_all_modules(*module_root):
-            for command_type in extract_command(m):
-                cli_app._add_command(command_type)
+            exploration.command_types.extend(extract_command(m))
 
+        use_case_types_with_commands = {
+            use_case_type for _, use_case_type in exploration.use_case_commands
+        }
         for m in find_all_modules(*module_root):
             for use_case_type in extract_use_case(m):
-                if use_case_type in cli_app._use_case_commands:
+                if use_case_type in use_case_types_with_commands:
+                    continue
+                if not issubclass(
+                    use_case_type,
+                    (
+                        AppGuestMutationUseCase,
+                        AppGuestReadonlyUseCase,
+                        AppLoggedInMutationUseCase,
+                        AppLoggedInReadonlyUseCase,
+                    ),
+                ):
+                    # Only app use cases are exposed as commands.
                     continue
-                cli_app._add_use_case_type(use_case_type)
+                exploration.use_case_types.append(use_case_type)
 
         for m in find_all_modules(*module_root):
-            for exception_type, exception_handler in extract_exception_handler(m):
-                cli_app._add_exception_handler(exception_type, exception_handler)
+            exploration.exception_handlers.extend(extract_exception_handler(m))
 
-        return cli_app
+        return exploration
 
     def _add_use_case_command(
         self,
@@ -1302,6 +1509,7 @@ class CliApp:
                     search_storage_engine=self._search_storage_engine,
                     use_case_storage_engine=self._use_case_storage_engine,
                     crm=self._crm,
+                    ical_fetcher=self._ical_fetcher,
                 ),
             )
         elif issubclass(use_case_type, AppLoggedInReadonlyUseCase):
@@ -1387,6 +1595,7 @@ class CliApp:
                     search_storage_engine=self._search_storage_engine,
                     use_case_storage_engine=self._use_case_storage_engine,
                     crm=self._crm,
+                    ical_fetcher=self._ical_fetcher,
                 ),
             )
         elif issubclass(use_case_type, AppLoggedInReadonlyUseCase):
@@ -1423,8 +1632,11 @@ class CliApp:
 
     async def run(self, argv: list[str]) -> None:
         """Run the app."""
+        self._load_pending_use_case_commands(argv)
+
         parser = argparse.ArgumentParser(
-            description=self._global_properties.description
+            prog=Path(argv[0]).name,
+            description=self._global_properties.description,
         )
         parser.add_argument(
             "--version",
@@ -1495,6 +1707,7 @@ class CliApp:
                 try:
                     await command.run(self._console, args)
                 except Exception as e:
+                    self._load_pending_exception_handler(type(e))
                     if type(e) not in self._exception_handlers:
                         raise
 
@@ -1509,6 +1722,62 @@ class CliApp:
 
             break
 
+    def _load_pending_use_case_commands(self, argv: list[str]) -> None:
+        """Load the use case commands listed in the manifest that a run needs."""
+        if not self._pending_use_case_commands:
+            return
+
+        command_name = next((arg for arg in argv[1:] if not arg.startswith("-")), None)
+        if command_name in self._commands:
+            command_names = []
+        elif command_name in self._pending_use_case_commands:
+            command_names = [command_name]
+        else:
+            # Showing the help, or complaining about an unknown command, needs
+            # all of them.
+            command_names = list(self._pending_use_case_commands)
+
+        for name in command_names:
+            use_case_path, use_case_command_path = self._pending_use_case_commands.pop(
+                name
+            )
+            use_case_type = cast(
+                type[
+                    UseCase[
+                        UseCaseSessionBase,
+                        UseCaseContextBase,
+                        UseCaseArgsBase,
+                        UseCaseResultBase | None,
+                    ]
+                ],
+                resolve_import_path(use_case_path),
+            )
+            if use_case_command_path is None:
+                self._add_use_case_type(use_case_type)
+            else:
+                self._add_use_case_command(
+                    cast(
+                        type[UseCaseCommand[Any]],
+                        resolve_import_path(use_case_command_path),
+                    ),
+                    use_case_type,
+                )
+
+    def _load_pending_exception_handler(self, exception_type: type[Exception]) -> None:
+        """Load the handler for an exception listed in the manifest, if there is one."""
+        exception_handler_path = self._pending_exception_handlers.pop(
+            import_path(exception_type), None
+        )
+        if exception_handler_path is None:
+            return
+        self._add_exception_handler(
+            exception_type,
+            cast(
+                type[CliExceptionHandler[Exception]],
+                resolve_import_path(exception_handler_path),
+            ),
+        )
+
     @property
     def global_properties(self) -> GlobalProperties:
         """The global properties."""
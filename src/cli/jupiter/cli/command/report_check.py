@@ -0,0 +1,45 @@
+"""Command for checking the rollups which reports are computed from."""
+
+from jupiter.cli.command.command import LoggedInReadonlyCommand
+from jupiter.cli.command.rendering import source_to_rich_text
+from jupiter.core.use_cases.application.report_check import (
+    ReportCheckResult,
+    ReportCheckUseCase,
+)
+from jupiter.core.use_cases.infra.use_cases import AppLoggedInReadonlyUseCaseContext
+from rich.console import Console
+from rich.text import Text
+from rich.tree import Tree
+
+
+class ReportCheck(LoggedInReadonlyCommand[ReportCheckUseCase, ReportCheckResult]):
+    """Command for checking the rollups which reports are computed from."""
+
+    def _render_result(
+        self,
+        console: Console,
+        context: AppLoggedInReadonlyUseCaseContext,
+        result: ReportCheckResult,
+    ) -> None:
+        rich_tree = Tree(
+            f"🔎 Checked {result.rollups_cnt} rollups against {result.inbox_tasks_cnt} inbox tasks",
+            guide_style="bold bright_blue",
+        )
+
+        if len(result.mismatches) == 0:
+            rich_tree.add(Text("All rollups match", style="green"))
+
+        for mismatch in result.mismatches:
+            rollup = mismatch.rollup
+            mismatch_text = Text("")
+            mismatch_text.append(source_to_rich_text(rollup.source))
+            mismatch_text.append(
+                f" {rollup.kind.value} on {rollup.event_day} for modified on {rollup.modified_day}"
+            )
+            mismatch_text.append(
+                f" has {rollup.count} instead of {mismatch.expected_count}",
+                style="red",
+            )
+            rich_tree.add(mismatch_text)
+
+        console.print(rich_tree)
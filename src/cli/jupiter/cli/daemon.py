@@ -0,0 +1,232 @@
+"""A long-lived process which runs CLI commands for `jupiter.cli.client`.
+
+The daemon builds the parts of the app which can outlive a command once, and
+then runs each command it gets over its socket against them, one at a time.
+A client can ask for the command it sent to be cancelled while it runs. The
+daemon stops once it's gone for CLI_DAEMON_IDLE_TIMEOUT_SECS without a command.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import fcntl
+import io
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Final, TextIO, cast
+
+from jupiter.cli.client import encode_frame
+from jupiter.cli.jupiter import CliDependencies, build_cli_dependencies, run_cli
+from jupiter.cli.manifest import build_cli_manifest, load_cli_manifest
+from jupiter.core.domain.concept.schedule.service.ical_parser import (
+    shutdown_ical_parse_workers,
+)
+from jupiter.core.utils.global_properties import build_global_properties
+from rich.console import Console
+
+DEFAULT_IDLE_TIMEOUT_SECS: Final[float] = 15 * 60
+# What a shell reports for a command stopped by Ctrl-C.
+CANCELLED_EXIT_CODE: Final[int] = 130
+
+
+class _FrameWriter(io.TextIOBase):
+    """A text stream which sends whatever is written to it to the client.
+
+    Rich writes from its own threads while showing progress, so writes from
+    outside the event loop are handed over to it.
+    """
+
+    _loop: Final[asyncio.AbstractEventLoop]
+    _loop_thread_id: Final[int]
+    _writer: Final[asyncio.StreamWriter]
+    _channel: Final[str]
+    _is_terminal: Final[bool]
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        writer: asyncio.StreamWriter,
+        channel: str,
+        is_terminal: bool,
+    ) -> None:
+        """Constructor."""
+        super().__init__()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._writer = writer
+        self._channel = channel
+        self._is_terminal = is_terminal
+
+    def write(self, text: str) -> int:
+        """Send some text to the client."""
+        if not text:
+            return 0
+        frame = encode_frame({self._channel: text})
+        if threading.get_ident() == self._loop_thread_id:
+            self._writer.write(frame)
+        else:
+            self._loop.call_soon_threadsafe(self._writer.write, frame)
+        return len(text)
+
+    def writable(self) -> bool:
+        """Whether the stream can be written to."""
+        return True
+
+    def isatty(self) -> bool:
+        """Whether the client is writing to a terminal."""
+        return self._is_terminal
+
+
+class _Daemon:
+    """Runs the commands sent by clients."""
+
+    _dependencies: Final[CliDependencies]
+    _command_lock: Final[asyncio.Lock]
+    _last_active_time: float
+
+    def __init__(self, dependencies: CliDependencies) -> None:
+        """Constructor."""
+        self._dependencies = dependencies
+        self._command_lock = asyncio.Lock()
+        self._last_active_time = time.monotonic()
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Run the command a client asks for, and send back its outcome."""
+        try:
+            request = json.loads(await reader.readline())
+        except ValueError:
+            writer.close()
+            return
+
+        async with self._command_lock:
+            self._last_active_time = time.monotonic()
+            command = asyncio.create_task(self._run_command(request, writer))
+            cancel_watcher = asyncio.create_task(
+                self._cancel_when_asked(reader, command)
+            )
+            try:
+                exit_code = await command
+            except asyncio.CancelledError:
+                current_task = asyncio.current_task()
+                if current_task is not None and current_task.cancelling() > 0:
+                    raise
+                exit_code = CANCELLED_EXIT_CODE
+            finally:
+                cancel_watcher.cancel()
+                self._last_active_time = time.monotonic()
+
+        # Let through the output which was written from other threads.
+        await asyncio.sleep(0)
+        writer.write(encode_frame({"exit_code": exit_code}))
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _cancel_when_asked(
+        self, reader: asyncio.StreamReader, command: asyncio.Task[int]
+    ) -> None:
+        """Cancel a command once its client asks for it."""
+        async for line in reader:
+            try:
+                frame = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(frame, dict) and frame.get("cancel") is True:
+                command.cancel()
+                return
+
+    async def _run_command(
+        self, request: dict[str, object], writer: asyncio.StreamWriter
+    ) -> int:
+        loop = asyncio.get_running_loop()
+        is_terminal = request["is_terminal"] is True
+        stdout = cast(TextIO, _FrameWriter(loop, writer, "stdout", is_terminal))
+        stderr = cast(TextIO, _FrameWriter(loop, writer, "stderr", False))
+        console = Console(
+            file=stdout,
+            force_terminal=is_terminal,
+            width=request["width"] if isinstance(request["width"], int) else None,
+            height=request["height"] if isinstance(request["height"], int) else None,
+            _environ=request["environ"] if isinstance(request["environ"], dict) else {},
+        )
+        argv = request["argv"] if isinstance(request["argv"], list) else []
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                await run_cli(self._dependencies, console, argv)
+            except SystemExit as err:
+                if err.code is None or isinstance(err.code, int):
+                    return err.code or 0
+                print(err.code, file=stderr)
+                return 1
+            except Exception:  # noqa: BLE001
+                traceback.print_exc(file=stderr)
+                return 1
+        return 0
+
+    async def wait_until_idle(self, idle_timeout_secs: float) -> None:
+        """Wait until there's been no command for a while."""
+        while True:
+            idle_secs = time.monotonic() - self._last_active_time
+            if idle_secs >= idle_timeout_secs and not self._command_lock.locked():
+                return
+            await asyncio.sleep(max(idle_timeout_secs - idle_secs, 1))
+
+
+async def serve(socket_path: Path, idle_timeout_secs: float) -> None:
+    """Serve commands on a socket, until idle."""
+    with socket_path.with_suffix(".lock").open("w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # Another daemon is already serving, or starting to serve, here.
+            return
+
+        global_properties = build_global_properties()
+        # Without a manifest, scanning once here still beats scanning for each command.
+        manifest = load_cli_manifest() or build_cli_manifest()
+        dependencies = await build_cli_dependencies(global_properties, manifest)
+        daemon = _Daemon(dependencies)
+
+        socket_path.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(
+            daemon.handle_client, path=str(socket_path)
+        )
+        socket_path.chmod(0o600)
+
+        try:
+            await daemon.wait_until_idle(idle_timeout_secs)
+        finally:
+            server.close()
+            socket_path.unlink(missing_ok=True)
+            await server.wait_closed()
+            await dependencies.sqlite_connection.dispose()
+            shutdown_ical_parse_workers()
+
+
+def main() -> None:
+    """Application main function."""
+    logging.disable()
+
+    parser = argparse.ArgumentParser(description="The CLI daemon")
+    parser.add_argument("socket_path", type=Path, help="The socket to listen on")
+    args = parser.parse_args()
+
+    idle_timeout_secs = float(
+        os.getenv("CLI_DAEMON_IDLE_TIMEOUT_SECS", str(DEFAULT_IDLE_TIMEOUT_SECS))
+    )
+
+    asyncio.run(serve(args.socket_path, idle_timeout_secs))
+
+
+if __name__ == "__main__":
+    main()
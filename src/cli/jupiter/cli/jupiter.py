@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import sys
+from dataclasses import dataclass
 
 import jupiter.cli.command
 import jupiter.core.domain
@@ -10,10 +11,19 @@ import jupiter.core.impl.repository.sqlite.domain
 import jupiter.core.use_cases
 from jupiter.cli.command.command import CliApp
 from jupiter.cli.command.rendering import RichConsoleProgressReporterFactory
+from jupiter.cli.manifest import load_cli_manifest
 from jupiter.cli.session_storage import SessionStorage
 from jupiter.cli.top_level_context import TopLevelContext
 from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.schedule.ical_fetcher import ICalFetcher
+from jupiter.core.domain.concept.schedule.service.ical_parser import (
+    shutdown_ical_parse_workers,
+)
+from jupiter.core.domain.crm import CRM
+from jupiter.core.framework.manifest import Manifest
+from jupiter.core.framework.realm import RealmCodecRegistry
 from jupiter.core.impl.crm.noop import NoOpCRM
+from jupiter.core.impl.ical.requests_fetcher import RequestsICalFetcher
 from jupiter.core.impl.repository.sqlite.connection import SqliteConnection
 from jupiter.core.impl.repository.sqlite.domain.storage_engine import (
     SqliteDomainStorageEngine,
@@ -31,24 +41,45 @@ from jupiter.core.use_cases.load_top_level_info import (
     LoadTopLevelInfoArgs,
     LoadTopLevelInfoUseCase,
 )
-from jupiter.core.utils.global_properties import build_global_properties
+from jupiter.core.utils.global_properties import (
+    GlobalProperties,
+    build_global_properties,
+)
 from jupiter.core.utils.time_provider import TimeProvider
 from rich.console import Console
 
 # import coverage
 
 
-async def main() -> None:
-    """Application main function."""
-    logging.disable()
-
-    time_provider = TimeProvider()
-
-    global_properties = build_global_properties()
-
-    realm_codec_registry = ModuleExplorerRealmCodecRegistry.build_from_module_root(
-        jupiter.core.domain, jupiter.core.use_cases
-    )
+@dataclass(frozen=True)
+class CliDependencies:
+    """The parts of the app which can outlive a single run of a command."""
+
+    global_properties: GlobalProperties
+    manifest: Manifest | None
+    realm_codec_registry: RealmCodecRegistry
+    sqlite_connection: SqliteConnection
+    domain_storage_engine: SqliteDomainStorageEngine
+    search_storage_engine: SqliteSearchStorageEngine
+    usecase_storage_engine: SqliteUseCaseStorageEngine
+    crm: CRM
+    ical_fetcher: ICalFetcher
+    session_storage: SessionStorage
+    invocation_recorder: PersistentMutationUseCaseInvocationRecorder
+
+
+async def build_cli_dependencies(
+    global_properties: GlobalProperties, manifest: Manifest | None
+) -> CliDependencies:
+    """Build and prepare the long-lived parts of the app."""
+    if manifest is not None:
+        realm_codec_registry = ModuleExplorerRealmCodecRegistry.build_from_manifest(
+            manifest.section("realm-codecs")
+        )
+    else:
+        realm_codec_registry = ModuleExplorerRealmCodecRegistry.build_from_module_root(
+            jupiter.core.domain, jupiter.core.use_cases
+        )
 
     sqlite_connection = SqliteConnection(
         SqliteConnection.Config(
@@ -58,12 +89,17 @@ async def main() -> None:
         ),
     )
 
-    domain_storage_engine = SqliteDomainStorageEngine.build_from_module_root(
-        realm_codec_registry,
-        sqlite_connection,
-        jupiter.core.impl.repository.sqlite.domain,
-        jupiter.core.domain,
-    )
+    if manifest is not None:
+        domain_storage_engine = SqliteDomainStorageEngine.build_from_manifest(
+            realm_codec_registry, sqlite_connection, manifest.section("repositories")
+        )
+    else:
+        domain_storage_engine = SqliteDomainStorageEngine.build_from_module_root(
+            realm_codec_registry,
+            sqlite_connection,
+            jupiter.core.impl.repository.sqlite.domain,
+            jupiter.core.domain,
+        )
     search_storage_engine = SqliteSearchStorageEngine(
         realm_codec_registry, sqlite_connection
     )
@@ -71,40 +107,55 @@ async def main() -> None:
         realm_codec_registry, sqlite_connection
     )
 
-    crm = NoOpCRM()
+    await sqlite_connection.prepare()
+    await domain_storage_engine.initialize()
+    await search_storage_engine.initialize()
+    await usecase_storage_engine.initialize()
 
-    session_storage = SessionStorage(
-        global_properties.session_info_path, realm_codec_registry
+    return CliDependencies(
+        global_properties=global_properties,
+        manifest=manifest,
+        realm_codec_registry=realm_codec_registry,
+        sqlite_connection=sqlite_connection,
+        domain_storage_engine=domain_storage_engine,
+        search_storage_engine=search_storage_engine,
+        usecase_storage_engine=usecase_storage_engine,
+        crm=NoOpCRM(),
+        ical_fetcher=RequestsICalFetcher(),
+        session_storage=SessionStorage(
+            global_properties.session_info_path, realm_codec_registry
+        ),
+        invocation_recorder=PersistentMutationUseCaseInvocationRecorder(
+            usecase_storage_engine,
+        ),
     )
 
+
+async def run_cli(
+    dependencies: CliDependencies, console: Console, argv: list[str]
+) -> None:
+    """Run one command, as given by the command line arguments."""
+    global_properties = dependencies.global_properties
+
+    time_provider = TimeProvider()
+
     auth_token_stamper = AuthTokenStamper(
         auth_token_secret=global_properties.auth_token_secret,
         time_provider=time_provider,
     )
 
-    invocation_recorder = PersistentMutationUseCaseInvocationRecorder(
-        usecase_storage_engine,
-    )
-
-    console = Console()
-
     progress_reporter_factory = RichConsoleProgressReporterFactory(console)
 
     load_top_level_info_use_case = LoadTopLevelInfoUseCase(
         global_properties=global_properties,
         time_provider=time_provider,
-        realm_codec_registry=realm_codec_registry,
+        realm_codec_registry=dependencies.realm_codec_registry,
         auth_token_stamper=auth_token_stamper,
-        domain_storage_engine=domain_storage_engine,
-        search_storage_engine=search_storage_engine,
+        domain_storage_engine=dependencies.domain_storage_engine,
+        search_storage_engine=dependencies.search_storage_engine,
     )
 
-    await sqlite_connection.prepare()
-    await domain_storage_engine.initialize()
-    await search_storage_engine.initialize()
-    await usecase_storage_engine.initialize()
-
-    session_info = session_storage.load_optional()
+    session_info = dependencies.session_storage.load_optional()
     guest_session = AppGuestUseCaseSession.for_cli(
         app_client_version=global_properties.version,
         auth_token_ext=session_info.auth_token_ext if session_info else None,
@@ -120,28 +171,62 @@ async def main() -> None:
         workspace=top_level_info.workspace,
     )
 
-    cli_app = CliApp.build_from_module_root(
-        global_properties,
-        top_level_context,
-        console,
-        time_provider,
-        invocation_recorder,
-        progress_reporter_factory,
-        realm_codec_registry,
-        session_storage,
-        auth_token_stamper,
-        domain_storage_engine,
-        search_storage_engine,
-        usecase_storage_engine,
-        crm,
-        jupiter.core.use_cases,
-        jupiter.cli.command,
-    )
+    if dependencies.manifest is not None:
+        cli_app = CliApp.build_from_manifest(
+            global_properties,
+            top_level_context,
+            console,
+            time_provider,
+            dependencies.invocation_recorder,
+            progress_reporter_factory,
+            dependencies.realm_codec_registry,
+            dependencies.session_storage,
+            auth_token_stamper,
+            dependencies.domain_storage_engine,
+            dependencies.search_storage_engine,
+            dependencies.usecase_storage_engine,
+            dependencies.crm,
+            dependencies.ical_fetcher,
+            dependencies.manifest.section("commands"),
+        )
+    else:
+        cli_app = CliApp.build_from_module_root(
+            global_properties,
+            top_level_context,
+            console,
+            time_provider,
+            dependencies.invocation_recorder,
+            progress_reporter_factory,
+            dependencies.realm_codec_registry,
+            dependencies.session_storage,
+            auth_token_stamper,
+            dependencies.domain_storage_engine,
+            dependencies.search_storage_engine,
+            dependencies.usecase_storage_engine,
+            dependencies.crm,
+            dependencies.ical_fetcher,
+            jupiter.core.use_cases,
+            jupiter.cli.command,
+        )
+
+    await cli_app.run(argv)
+
+
+async def main() -> None:
+    """Application main function."""
+    logging.disable()
+
+    global_properties = build_global_properties()
+
+    # A manifest built ahead of time lets us skip scanning all the modules, and
+    # only import the ones a command needs. Without one, we scan.
+    dependencies = await build_cli_dependencies(global_properties, load_cli_manifest())
 
     try:
-        await cli_app.run(sys.argv)
+        await run_cli(dependencies, Console(), sys.argv)
     finally:
-        await sqlite_connection.dispose()
+        await dependencies.sqlite_connection.dispose()
+        shutdown_ical_parse_workers()
 
 
 if __name__ == "__main__":
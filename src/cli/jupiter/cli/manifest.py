@@ -0,0 +1,57 @@
+"""Build the manifest the CLI starts up from, rather than scanning its modules."""
+
+from pathlib import Path
+from typing import Final
+
+import jupiter.cli
+import jupiter.cli.command
+import jupiter.core
+import jupiter.core.domain
+import jupiter.core.impl.repository.sqlite.domain
+import jupiter.core.use_cases
+from jupiter.cli.command.command import CliApp
+from jupiter.core.framework.manifest import (
+    Manifest,
+    fingerprint_module_roots,
+    load_manifest,
+    save_manifest,
+)
+from jupiter.core.impl.repository.sqlite.domain.storage_engine import (
+    SqliteDomainStorageEngine,
+)
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+
+MANIFEST_PATH: Final[Path] = Path(__file__).parent / "manifest.json"
+
+
+def load_cli_manifest() -> Manifest | None:
+    """Load the manifest, if it has been built and is up to date with the sources."""
+    return load_manifest(MANIFEST_PATH, jupiter.core, jupiter.cli)
+
+
+def build_cli_manifest() -> Manifest:
+    """Build the manifest by scanning the modules of the CLI."""
+    return Manifest(
+        fingerprint=fingerprint_module_roots(jupiter.core, jupiter.cli),
+        sections={
+            "realm-codecs": ModuleExplorerRealmCodecRegistry.build_manifest_section(
+                jupiter.core.domain, jupiter.core.use_cases
+            ),
+            "repositories": SqliteDomainStorageEngine.build_manifest_section(
+                jupiter.core.impl.repository.sqlite.domain, jupiter.core.domain
+            ),
+            "commands": CliApp.build_manifest_section(
+                jupiter.core.use_cases, jupiter.cli.command
+            ),
+        },
+    )
+
+
+def main() -> None:
+    """Build and save the manifest."""
+    save_manifest(MANIFEST_PATH, build_cli_manifest())
+    print(f"Wrote {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""Tests for the CLI daemon and its client."""
+
+import asyncio
+import io
+import json
+import socket
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TypeVar, cast
+
+import jupiter.cli.client as client_module
+import jupiter.cli.daemon as daemon_module
+import pytest
+from jupiter.cli.client import encode_frame, run_in_daemon
+from jupiter.cli.daemon import CANCELLED_EXIT_CODE, _Daemon
+from jupiter.cli.jupiter import CliDependencies
+from rich.console import Console
+
+_RunCli = Callable[[CliDependencies, Console, list[str]], Awaitable[None]]
+_Handler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+_Frame = dict[str, object]
+
+_T = TypeVar("_T")
+
+
+async def _print_and_exit(
+    _dependencies: CliDependencies, console: Console, argv: list[str]
+) -> None:
+    console.print(f"Running {' '.join(argv[1:])}")
+    print("A warning", file=sys.stderr)
+    sys.exit(3)
+
+
+async def _do_nothing(
+    _dependencies: CliDependencies, _console: Console, _argv: list[str]
+) -> None:
+    pass
+
+
+async def _run_forever(
+    _dependencies: CliDependencies, console: Console, _argv: list[str]
+) -> None:
+    console.print("Started")
+    await asyncio.Event().wait()
+
+
+class _InterruptedOnce(io.StringIO):
+    """A stdout which gets a Ctrl-C the first time it's written to."""
+
+    _interrupted: bool = False
+
+    def write(self, text: str) -> int:
+        if not self._interrupted:
+            self._interrupted = True
+            raise KeyboardInterrupt
+        return super().write(text)
+
+
+def _connect(socket_path: Path) -> socket.socket:
+    daemon_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    daemon_socket.connect(str(socket_path))
+    return daemon_socket
+
+
+def _request(argv: list[str]) -> bytes:
+    return encode_frame(
+        {
+            "argv": argv,
+            "environ": {},
+            "is_terminal": False,
+            "width": None,
+            "height": None,
+        }
+    )
+
+
+def _send_command(
+    socket_path: Path, argv: list[str], cancel_after_frames: int | None = None
+) -> list[_Frame]:
+    """Send a command straight over the socket, and collect the frames sent back."""
+    frames: list[_Frame] = []
+    with _connect(socket_path) as daemon_socket, daemon_socket.makefile("rb") as stream:
+        daemon_socket.sendall(_request(argv))
+        for line in stream:
+            frames.append(json.loads(line))
+            if len(frames) == cancel_after_frames:
+                daemon_socket.sendall(encode_frame({"cancel": True}))
+    return frames
+
+
+async def _serve(tmp_path: Path, handler: _Handler, talk: Callable[[Path], _T]) -> _T:
+    socket_path = tmp_path / "daemon.sock"
+    server = await asyncio.start_unix_server(handler, path=str(socket_path))
+    async with server:
+        return await asyncio.wait_for(asyncio.to_thread(talk, socket_path), timeout=5)
+
+
+def _daemon(monkeypatch: pytest.MonkeyPatch, run_cli: _RunCli) -> _Daemon:
+    monkeypatch.setattr(daemon_module, "run_cli", run_cli)
+    return _Daemon(cast(CliDependencies, None))
+
+
+def test_daemon_relays_the_output_and_exit_code_of_commands(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    daemon = _daemon(monkeypatch, _print_and_exit)
+
+    frames = asyncio.run(
+        _serve(
+            tmp_path,
+            daemon.handle_client,
+            lambda socket_path: _send_command(
+                socket_path, ["jupiter", "inbox-task-show"]
+            ),
+        )
+    )
+
+    assert frames[-1] == {"exit_code": 3}
+    assert "".join(str(frame.get("stdout", "")) for frame in frames) == (
+        "Running inbox-task-show\n"
+    )
+    assert "".join(str(frame.get("stderr", "")) for frame in frames) == "A warning\n"
+
+
+def test_daemon_cancels_commands_when_the_client_asks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    daemon = _daemon(monkeypatch, _run_forever)
+
+    frames = asyncio.run(
+        _serve(
+            tmp_path,
+            daemon.handle_client,
+            lambda socket_path: _send_command(
+                socket_path, ["jupiter", "gen"], cancel_after_frames=1
+            ),
+        )
+    )
+
+    assert frames == [{"stdout": "Started\n"}, {"exit_code": CANCELLED_EXIT_CODE}]
+
+
+def test_daemon_stops_once_idle_for_long_enough(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    idle_timeout_secs = 0.5
+    daemon = _daemon(monkeypatch, _do_nothing)
+
+    async def run() -> float:
+        await _serve(
+            tmp_path,
+            daemon.handle_client,
+            lambda socket_path: _send_command(socket_path, ["jupiter"]),
+        )
+        start_time = time.monotonic()
+        await asyncio.wait_for(daemon.wait_until_idle(idle_timeout_secs), timeout=5)
+        return time.monotonic() - start_time
+
+    assert asyncio.run(run()) >= idle_timeout_secs * 0.9
+
+
+def test_daemon_does_not_stop_while_running_a_command(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    daemon = _daemon(monkeypatch, _do_nothing)
+
+    async def run() -> None:
+        async with daemon._command_lock:
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(daemon.wait_until_idle(0), timeout=0.2)
+        await asyncio.wait_for(daemon.wait_until_idle(0), timeout=5)
+
+    asyncio.run(run())
+
+
+def test_client_relays_the_output_and_exit_code_of_commands(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    requests: list[_Frame] = []
+
+    async def handle_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        requests.append(json.loads(await reader.readline()))
+        writer.write(encode_frame({"stdout": "Some output\n"}))
+        writer.write(encode_frame({"stderr": "A warning\n"}))
+        writer.write(encode_frame({"exit_code": 3}))
+        writer.close()
+
+    exit_code = asyncio.run(
+        _serve(
+            tmp_path,
+            handle_client,
+            lambda socket_path: run_in_daemon(
+                _connect(socket_path), ["jupiter", "inbox-task-show"]
+            ),
+        )
+    )
+
+    assert exit_code == 3
+    assert requests[0]["argv"] == ["jupiter", "inbox-task-show"]
+    assert requests[0]["is_terminal"] is False
+    captured = capsys.readouterr()
+    assert captured.out == "Some output\n"
+    assert captured.err == "A warning\n"
+
+
+def test_client_forwards_ctrl_c_as_a_cancel(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sys, "stdout", _InterruptedOnce())
+    frames: list[_Frame] = []
+
+    async def handle_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await reader.readline()
+        writer.write(encode_frame({"stdout": "Started\n"}))
+        frames.append(json.loads(await reader.readline()))
+        writer.write(encode_frame({"exit_code": CANCELLED_EXIT_CODE}))
+        writer.close()
+
+    exit_code = asyncio.run(
+        _serve(
+            tmp_path,
+            handle_client,
+            lambda socket_path: run_in_daemon(_connect(socket_path), ["jupiter"]),
+        )
+    )
+
+    assert frames == [{"cancel": True}]
+    assert exit_code == CANCELLED_EXIT_CODE
+
+
+def test_client_falls_back_when_the_daemon_goes_away_before_the_command(
+    tmp_path: Path,
+) -> None:
+    async def close_right_away(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await reader.readline()
+        writer.close()
+
+    exit_code = asyncio.run(
+        _serve(
+            tmp_path,
+            close_right_away,
+            lambda socket_path: run_in_daemon(_connect(socket_path), ["jupiter"]),
+        )
+    )
+
+    assert exit_code is None
+
+
+def test_client_fails_when_the_daemon_goes_away_during_the_command(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    async def close_midway(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await reader.readline()
+        writer.write(encode_frame({"stdout": "Some output\n"}))
+        writer.close()
+
+    exit_code = asyncio.run(
+        _serve(
+            tmp_path,
+            close_midway,
+            lambda socket_path: run_in_daemon(_connect(socket_path), ["jupiter"]),
+        )
+    )
+
+    assert exit_code == 1
+    assert "stopped in the middle" in capsys.readouterr().err
+
+
+def test_client_runs_in_process_without_a_daemon(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ran_in_process = []
+    monkeypatch.setattr(
+        client_module, "daemon_socket_path", lambda: tmp_path / "daemon.sock"
+    )
+    monkeypatch.setattr(client_module, "_start_daemon", lambda _socket_path: None)
+    monkeypatch.setattr(
+        client_module, "_run_in_process", lambda: ran_in_process.append(True)
+    )
+
+    client_module.main()
+
+    assert ran_in_process == [True]
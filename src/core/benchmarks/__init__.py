@@ -0,0 +1 @@
+"""Micro-benchmarks for the core, run as modules from src/core."""
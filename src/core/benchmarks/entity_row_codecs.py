@@ -0,0 +1,123 @@
+"""Benchmark decoding inbox task rows with compiled vs uncompiled entity codecs.
+
+Run with `python -m benchmarks.entity_row_codecs [row-count]` from src/core.
+"""
+
+import sys
+import time
+
+import jupiter.core.domain
+import jupiter.core.use_cases
+import pendulum
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTask
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.entity import ParentLink
+from jupiter.core.framework.realm import DatabaseRealm, RealmThing
+from jupiter.core.impl.repository.sqlite.infra.repository import (
+    SqliteEntityRepository,
+)
+from jupiter.core.use_cases.infra.realms import (
+    ModuleExplorerRealmCodecRegistry,
+    _StandardEntityDecoder,
+)
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    insert,
+    select,
+)
+
+_DEFAULT_ROW_COUNT = 5_000
+
+
+def build_inbox_task(idx: int) -> InboxTask:
+    """Build an inbox task to use as benchmark data."""
+    now = Timestamp.from_date_and_time(pendulum.now(tz=pendulum.UTC))
+    return InboxTask(
+        ref_id=EntityId(str(idx + 1)),
+        version=1,
+        archived=False,
+        archival_reason=None,
+        created_time=now,
+        last_modified_time=now,
+        archived_time=None,
+        events=[],
+        inbox_task_collection=ParentLink(EntityId("1")),
+        source=InboxTaskSource.HABIT,
+        project_ref_id=EntityId("1"),
+        name=InboxTaskName(f"Inbox task {idx}"),
+        status=InboxTaskStatus.NOT_STARTED,
+        is_key=idx % 2 == 0,
+        eisen=Eisen.REGULAR,
+        difficulty=Difficulty.EASY,
+        actionable_date=ADate.from_components(2024, 1, 1),
+        due_date=ADate.from_components(2024, 1, 7),
+        notes=None,
+        source_entity_ref_id=EntityId(str(idx % 10 + 1)),
+        recurring_timeline="2024,W1",
+        recurring_repeat_index=None,
+        recurring_gen_right_now=now,
+        working_time=None,
+        completed_time=None,
+    )
+
+
+def main(row_count: int) -> None:
+    """Run the benchmark."""
+    registry = ModuleExplorerRealmCodecRegistry.build_from_module_root(
+        jupiter.core.domain, jupiter.core.use_cases
+    )
+    encoder = registry.get_encoder(InboxTask, DatabaseRealm)
+    compiled_decoder = registry.get_decoder(InboxTask, DatabaseRealm)
+
+    metadata = MetaData()
+    Table(
+        "inbox_task_collection",
+        metadata,
+        Column("ref_id", Integer, primary_key=True),
+    )
+    table = SqliteEntityRepository._build_table_for_entity(
+        "inbox_task", metadata, InboxTask
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(table),
+            [encoder.encode(build_inbox_task(idx)) for idx in range(row_count)],
+        )
+        rows: list[RealmThing] = [
+            row._mapping for row in connection.execute(select(table))
+        ]
+
+    # An uncompiled decoder is what every row used to pay for: walking the
+    # dataclass fields and looking each field codec up in the registry.
+    start = time.perf_counter()
+    for row in rows:
+        _StandardEntityDecoder(registry, InboxTask, DatabaseRealm).decode(row)
+    uncompiled_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row in rows:
+        compiled_decoder.decode(row)
+    compiled_secs = time.perf_counter() - start
+
+    print(f"Decoded {len(rows)} inbox task rows")
+    print(f"  uncompiled: {uncompiled_secs:.3f}s")
+    print(f"  compiled:   {compiled_secs:.3f}s")
+    print(f"  speedup:    {uncompiled_secs / compiled_secs:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_ROW_COUNT)
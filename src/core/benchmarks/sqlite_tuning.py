@@ -0,0 +1,144 @@
+"""Benchmark concurrent reads and writes with and without the SQLite tuning profile.
+
+Each simulated request is one transaction, like a webapi request. Most of them
+read a page of inbox tasks and the rest write a new one. They all run against
+the same database file, through the same pooled engine.
+
+Run with `python -m benchmarks.sqlite_tuning [seconds] [concurrency]` from src/core.
+"""
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+import jupiter.core.domain
+import jupiter.core.use_cases
+import sqlalchemy.exc
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTask
+from jupiter.core.framework.realm import DatabaseRealm, RealmThing
+from jupiter.core.impl.repository.sqlite.connection import SqliteConnection
+from jupiter.core.impl.repository.sqlite.infra.repository import (
+    SqliteEntityRepository,
+)
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+from sqlalchemy import Column, Integer, MetaData, Table, insert, select
+
+from benchmarks.entity_row_codecs import build_inbox_task
+
+_DEFAULT_SECONDS = 5.0
+_DEFAULT_CONCURRENCY = 16
+_SEED_ROW_COUNT = 2_000
+_WRITE_RATIO = 0.2
+_PAGE_SIZE = 50
+
+
+@dataclass
+class _Counts:
+    reads: int = 0
+    writes: int = 0
+    errors: int = 0
+
+
+async def _run_profile(
+    name: str, tuning: SqliteConnection.Tuning, seconds: float, concurrency: int
+) -> None:
+    registry = ModuleExplorerRealmCodecRegistry.build_from_module_root(
+        jupiter.core.domain, jupiter.core.use_cases
+    )
+    encoder = registry.get_encoder(InboxTask, DatabaseRealm)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "bench.sqlite"
+        connection = SqliteConnection(
+            SqliteConnection.Config(
+                sqlite_db_url=f"sqlite+aiosqlite:///{db_path}",
+                alembic_ini_path=Path("migrations/alembic.ini"),
+                alembic_migrations_path=Path("migrations"),
+                tuning=tuning,
+            )
+        )
+        engine = connection.sql_engine
+
+        metadata = MetaData()
+        Table(
+            "inbox_task_collection",
+            metadata,
+            Column("ref_id", Integer, primary_key=True),
+        )
+        table = SqliteEntityRepository._build_table_for_entity(
+            "inbox_task", metadata, InboxTask
+        )
+
+        def _new_row(idx: int) -> dict[str, RealmThing]:
+            row = dict(
+                cast(dict[str, RealmThing], encoder.encode(build_inbox_task(idx)))
+            )
+            del row["ref_id"]
+            return row
+
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            await conn.execute(
+                insert(table), [_new_row(idx) for idx in range(_SEED_ROW_COUNT)]
+            )
+
+        counts = _Counts()
+        deadline = time.perf_counter() + seconds
+        rng = random.Random(42)
+
+        async def request_loop() -> None:
+            while time.perf_counter() < deadline:
+                try:
+                    if rng.random() < _WRITE_RATIO:
+                        async with engine.begin() as conn:
+                            await conn.execute(
+                                insert(table), [_new_row(rng.randrange(1_000_000))]
+                            )
+                        counts.writes += 1
+                    else:
+                        async with engine.begin() as conn:
+                            offset = rng.randrange(_SEED_ROW_COUNT - _PAGE_SIZE)
+                            result = await conn.execute(
+                                select(table)
+                                .order_by(table.c.ref_id)
+                                .limit(_PAGE_SIZE)
+                                .offset(offset)
+                            )
+                            result.all()
+                        counts.reads += 1
+                except sqlalchemy.exc.OperationalError:
+                    counts.errors += 1
+
+        await asyncio.gather(*(request_loop() for _ in range(concurrency)))
+        await connection.dispose()
+
+    print(f"{name}:")
+    print(f"  reads/s:  {counts.reads / seconds:.0f}")
+    print(f"  writes/s: {counts.writes / seconds:.0f}")
+    print(f"  errors:   {counts.errors}")
+
+
+async def main(seconds: float, concurrency: int) -> None:
+    """Run the benchmark."""
+    print(f"{concurrency} concurrent requests for {seconds:.1f}s per profile")
+    await _run_profile(
+        "sqlite defaults",
+        SqliteConnection.Tuning.sqlite_defaults(),
+        seconds,
+        concurrency,
+    )
+    await _run_profile("tuned", SqliteConnection.Tuning(), seconds, concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            float(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_SECONDS,
+            int(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_CONCURRENCY,
+        )
+    )
@@ -1,6 +1,7 @@
 """The best score for a period of time and a particular subdivision of it."""
 
 import abc
+from collections.abc import Mapping
 
 from jupiter.core.domain.application.gamification.score_stats import ScoreStats
 from jupiter.core.domain.application.gamification.user_score_overview import UserScore
@@ -106,3 +107,15 @@ class ScorePeriodBestRepository(
     abc.ABC,
 ):
     """A repository of score period bests."""
+
+    @abc.abstractmethod
+    async def upsert_many(self, records: list[ScorePeriodBest]) -> None:
+        """Create or overwrite many score period bests at once."""
+
+    @abc.abstractmethod
+    async def load_overview(
+        self,
+        score_log_ref_id: EntityId,
+        timelines: Mapping[RecurringTaskPeriod | None, str],
+    ) -> list[ScorePeriodBest]:
+        """Load the score period bests for a timeline of each of several periods at once."""
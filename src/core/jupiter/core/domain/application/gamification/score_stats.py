@@ -1,6 +1,7 @@
 """Statistics about scores for a particular time interval."""
 
 import abc
+from collections.abc import Mapping
 
 from jupiter.core.domain.application.gamification.score_log_entry import ScoreLogEntry
 from jupiter.core.domain.application.gamification.score_source import ScoreSource
@@ -96,6 +97,18 @@ class ScoreStatsRepository(
 ):
     """A repository of score stats."""
 
+    @abc.abstractmethod
+    async def upsert_many(self, records: list[ScoreStats]) -> None:
+        """Create or overwrite many score stats at once."""
+
+    @abc.abstractmethod
+    async def load_overview(
+        self,
+        score_log_ref_id: EntityId,
+        timelines: Mapping[RecurringTaskPeriod | None, str],
+    ) -> list[ScoreStats]:
+        """Load the score stats for a timeline of each of several periods at once."""
+
     @abc.abstractmethod
     async def find_all_in_timerange(
         self,
@@ -1,6 +1,8 @@
 """A service that records scores for various actions."""
 
 import asyncio
+from collections.abc import Sequence
+from typing import Final
 
 from jupiter.core.domain.application.gamification.score_log import ScoreLog
 from jupiter.core.domain.application.gamification.score_log_entry import ScoreLogEntry
@@ -8,6 +10,7 @@ from jupiter.core.domain.application.gamification.score_period_best import (
     ScorePeriodBest,
     ScorePeriodBestRepository,
 )
+from jupiter.core.domain.application.gamification.score_source import ScoreSource
 from jupiter.core.domain.application.gamification.score_stats import (
     ScoreStats,
     ScoreStatsRepository,
@@ -21,10 +24,39 @@ from jupiter.core.domain.concept.user.user import User
 from jupiter.core.domain.core.recurring_task_period import RecurringTaskPeriod
 from jupiter.core.domain.core.timeline import infer_timeline
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
+from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.repository import EntityAlreadyExistsError
 from jupiter.core.framework.value import CompositeValue, value
 
+_SCORE_STATS_PERIODS: Final[list[RecurringTaskPeriod | None]] = [
+    RecurringTaskPeriod.DAILY,
+    RecurringTaskPeriod.WEEKLY,
+    RecurringTaskPeriod.MONTHLY,
+    RecurringTaskPeriod.QUARTERLY,
+    RecurringTaskPeriod.YEARLY,
+    None,
+]
+
+_SCORE_PERIOD_BESTS: Final[
+    list[tuple[RecurringTaskPeriod | None, RecurringTaskPeriod]]
+] = [
+    (RecurringTaskPeriod.QUARTERLY, RecurringTaskPeriod.DAILY),
+    (RecurringTaskPeriod.QUARTERLY, RecurringTaskPeriod.WEEKLY),
+    (RecurringTaskPeriod.QUARTERLY, RecurringTaskPeriod.MONTHLY),
+    (RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.DAILY),
+    (RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.WEEKLY),
+    (RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.MONTHLY),
+    (RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.QUARTERLY),
+    (None, RecurringTaskPeriod.DAILY),
+    (None, RecurringTaskPeriod.WEEKLY),
+    (None, RecurringTaskPeriod.MONTHLY),
+    (None, RecurringTaskPeriod.QUARTERLY),
+    (None, RecurringTaskPeriod.YEARLY),
+]
+
+_TASK_REF_IDS_CHUNK_SIZE: Final[int] = 500
+
 
 @value
 class RecordScoreResult(CompositeValue):
@@ -248,6 +280,107 @@ class RecordScoreService:
             ),
         )
 
+    async def record_many_tasks(
+        self,
+        ctx: DomainContext,
+        uow: DomainUnitOfWork,
+        user: User,
+        tasks: Sequence[InboxTask | BigPlan],
+    ) -> list[InboxTask | BigPlan]:
+        """Record the scores of many tasks at once.
+
+        This has the same outcome as calling record_task for each of the tasks in
+        turn, but the stats and the bests are worked out in memory and each is
+        written just once. Returns the tasks which weren't recorded before.
+        """
+        score_log = await uow.get_for(ScoreLog).load_by_parent(user.ref_id)
+
+        # Entries are built for all tasks, like record_task does, so the lucky
+        # puppy bonuses come out the same.
+        candidate_entries: list[tuple[InboxTask | BigPlan, ScoreLogEntry]] = []
+        for task in tasks:
+            if not task.status.is_completed:
+                continue
+            if isinstance(task, InboxTask):
+                candidate_entries.append(
+                    (
+                        task,
+                        ScoreLogEntry.new_from_inbox_task(ctx, score_log.ref_id, task),
+                    )
+                )
+            else:
+                candidate_entries.append(
+                    (
+                        task,
+                        ScoreLogEntry.new_from_big_plan(ctx, score_log.ref_id, task),
+                    )
+                )
+
+        task_ref_ids = list({entry.task_ref_id for _, entry in candidate_entries})
+        recorded_keys: set[tuple[ScoreSource, EntityId]] = set()
+        for chunk_start in range(0, len(task_ref_ids), _TASK_REF_IDS_CHUNK_SIZE):
+            existing_entries = await uow.get_for(ScoreLogEntry).find_all_generic(
+                parent_ref_id=score_log.ref_id,
+                allow_archived=True,
+                task_ref_id=task_ref_ids[
+                    chunk_start : chunk_start + _TASK_REF_IDS_CHUNK_SIZE
+                ],
+            )
+            recorded_keys.update((e.source, e.task_ref_id) for e in existing_entries)
+
+        new_entries: list[tuple[InboxTask | BigPlan, ScoreLogEntry]] = []
+        for task, entry in candidate_entries:
+            if (entry.source, entry.task_ref_id) in recorded_keys:
+                continue
+            recorded_keys.add((entry.source, entry.task_ref_id))
+            new_entries.append((task, entry))
+
+        if len(new_entries) == 0:
+            return []
+
+        await uow.get_for(ScoreLogEntry).create_many([e for _, e in new_entries])
+
+        score_stats: dict[RecurringTaskPeriod | None, ScoreStats] = {}
+        for period in _SCORE_STATS_PERIODS:
+            timeline = infer_timeline(period, ctx.action_timestamp)
+            score_stats[period] = await uow.get(
+                ScoreStatsRepository
+            ).load_by_key_optional(
+                (score_log.ref_id, period, timeline)
+            ) or ScoreStats.new_score_stats(
+                ctx, score_log.ref_id, period, timeline
+            )
+
+        score_period_bests: dict[
+            tuple[RecurringTaskPeriod | None, RecurringTaskPeriod], ScorePeriodBest
+        ] = {}
+        for period, sub_period in _SCORE_PERIOD_BESTS:
+            timeline = infer_timeline(period, ctx.action_timestamp)
+            score_period_bests[(period, sub_period)] = await uow.get(
+                ScorePeriodBestRepository
+            ).load_by_key_optional(
+                (score_log.ref_id, period, timeline, sub_period)
+            ) or ScorePeriodBest.new_score_period_best(
+                ctx, score_log.ref_id, period, timeline, sub_period
+            )
+
+        # Scores are clamped at zero and bests track every intermediate total, so
+        # the entries are folded in one at a time rather than summed up.
+        for _, entry in new_entries:
+            for period in _SCORE_STATS_PERIODS:
+                score_stats[period] = score_stats[period].merge_score(ctx, entry)
+            for period, sub_period in _SCORE_PERIOD_BESTS:
+                score_period_bests[(period, sub_period)] = score_period_bests[
+                    (period, sub_period)
+                ].update_to_max(ctx, score_stats[sub_period])
+
+        await uow.get(ScoreStatsRepository).upsert_many(list(score_stats.values()))
+        await uow.get(ScorePeriodBestRepository).upsert_many(
+            list(score_period_bests.values())
+        )
+
+        return [task for task, _ in new_entries]
+
     async def _update_current_stats(
         self,
         ctx: DomainContext,
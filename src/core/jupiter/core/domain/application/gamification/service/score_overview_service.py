@@ -1,7 +1,5 @@
 """A service for getting the scores overview for a user."""
 
-import asyncio
-
 from jupiter.core.domain.application.gamification.score_log import ScoreLog
 from jupiter.core.domain.application.gamification.score_period_best import (
     ScorePeriodBestRepository,
@@ -29,156 +27,75 @@ class ScoreOverviewService:
         """Get the scores overview for a user."""
         score_log = await uow.get_for(ScoreLog).load_by_parent(user.ref_id)
 
-        (
-            daily_score,
-            weekly_score,
-            monthly_score,
-            quarterly_score,
-            yearly_score,
-            lifetime_score,
-        ) = await asyncio.gather(
-            self._load_stats(uow, score_log, RecurringTaskPeriod.DAILY, right_now),
-            self._load_stats(uow, score_log, RecurringTaskPeriod.WEEKLY, right_now),
-            self._load_stats(uow, score_log, RecurringTaskPeriod.MONTHLY, right_now),
-            self._load_stats(uow, score_log, RecurringTaskPeriod.QUARTERLY, right_now),
-            self._load_stats(uow, score_log, RecurringTaskPeriod.YEARLY, right_now),
-            self._load_stats(uow, score_log, None, right_now),
-        )
+        timelines = {
+            period: infer_timeline(period, right_now)
+            for period in [*RecurringTaskPeriod, None]
+        }
 
-        (
-            best_quarterly_daily_score,
-            best_quarterly_weekly_score,
-            best_quarterly_monthly_score,
-        ) = await asyncio.gather(
-            self._load_period_best(
-                uow,
-                score_log,
-                RecurringTaskPeriod.QUARTERLY,
-                right_now,
-                RecurringTaskPeriod.DAILY,
-            ),
-            self._load_period_best(
-                uow,
-                score_log,
-                RecurringTaskPeriod.QUARTERLY,
-                right_now,
-                RecurringTaskPeriod.WEEKLY,
-            ),
-            self._load_period_best(
-                uow,
-                score_log,
-                RecurringTaskPeriod.QUARTERLY,
-                right_now,
-                RecurringTaskPeriod.MONTHLY,
-            ),
+        all_score_stats = await uow.get(ScoreStatsRepository).load_overview(
+            score_log.ref_id, timelines
+        )
+        all_score_period_bests = await uow.get(ScorePeriodBestRepository).load_overview(
+            score_log.ref_id,
+            {
+                period: timeline
+                for period, timeline in timelines.items()
+                if period
+                in (RecurringTaskPeriod.QUARTERLY, RecurringTaskPeriod.YEARLY, None)
+            },
         )
 
-        (
-            best_yearly_daily_score,
-            best_yearly_weekly_score,
-            best_yearly_monthly_score,
-            best_yearly_quarterly_score,
-        ) = await asyncio.gather(
-            self._load_period_best(
-                uow,
-                score_log,
-                RecurringTaskPeriod.YEARLY,
-                right_now,
-                RecurringTaskPeriod.DAILY,
-            ),
-            self._load_period_best(
-                uow,
-                score_log,
-                RecurringTaskPeriod.YEARLY,
-                right_now,
-                RecurringTaskPeriod.WEEKLY,
-            ),
-            self._load_period_best(
-                uow,
-                score_log,
-                RecurringTaskPeriod.YEARLY,
-                right_now,
-                RecurringTaskPeriod.MONTHLY,
+        scores: dict[RecurringTaskPeriod | None, UserScore] = {}
+        for score_stats in all_score_stats:
+            scores.setdefault(score_stats.period, score_stats.to_user_score())
+        bests: dict[
+            tuple[RecurringTaskPeriod | None, RecurringTaskPeriod], UserScore
+        ] = {}
+        for score_period_best in all_score_period_bests:
+            bests.setdefault(
+                (score_period_best.period, score_period_best.sub_period),
+                score_period_best.to_user_score(),
+            )
+
+        def score(period: RecurringTaskPeriod | None) -> UserScore:
+            return scores.get(period, UserScore.new())
+
+        def best(
+            period: RecurringTaskPeriod | None, sub_period: RecurringTaskPeriod
+        ) -> UserScore:
+            return bests.get((period, sub_period), UserScore.new())
+
+        return UserScoreOverview(
+            daily_score=score(RecurringTaskPeriod.DAILY),
+            weekly_score=score(RecurringTaskPeriod.WEEKLY),
+            monthly_score=score(RecurringTaskPeriod.MONTHLY),
+            quarterly_score=score(RecurringTaskPeriod.QUARTERLY),
+            yearly_score=score(RecurringTaskPeriod.YEARLY),
+            lifetime_score=score(None),
+            best_quarterly_daily_score=best(
+                RecurringTaskPeriod.QUARTERLY, RecurringTaskPeriod.DAILY
             ),
-            self._load_period_best(
-                uow,
-                score_log,
-                RecurringTaskPeriod.YEARLY,
-                right_now,
-                RecurringTaskPeriod.QUARTERLY,
+            best_quarterly_weekly_score=best(
+                RecurringTaskPeriod.QUARTERLY, RecurringTaskPeriod.WEEKLY
             ),
-        )
-
-        (
-            best_lifetime_daily_score,
-            best_lifetime_weekly_score,
-            best_lifetime_monthly_score,
-            best_lifetime_quarterly_score,
-            best_lifetime_yearly_score,
-        ) = await asyncio.gather(
-            self._load_period_best(
-                uow, score_log, None, right_now, RecurringTaskPeriod.DAILY
+            best_quarterly_monthly_score=best(
+                RecurringTaskPeriod.QUARTERLY, RecurringTaskPeriod.MONTHLY
             ),
-            self._load_period_best(
-                uow, score_log, None, right_now, RecurringTaskPeriod.WEEKLY
+            best_yearly_daily_score=best(
+                RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.DAILY
             ),
-            self._load_period_best(
-                uow, score_log, None, right_now, RecurringTaskPeriod.MONTHLY
+            best_yearly_weekly_score=best(
+                RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.WEEKLY
             ),
-            self._load_period_best(
-                uow, score_log, None, right_now, RecurringTaskPeriod.QUARTERLY
+            best_yearly_monthly_score=best(
+                RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.MONTHLY
             ),
-            self._load_period_best(
-                uow, score_log, None, right_now, RecurringTaskPeriod.YEARLY
+            best_yearly_quarterly_score=best(
+                RecurringTaskPeriod.YEARLY, RecurringTaskPeriod.QUARTERLY
             ),
-        )
-
-        return UserScoreOverview(
-            daily_score=daily_score,
-            weekly_score=weekly_score,
-            monthly_score=monthly_score,
-            quarterly_score=quarterly_score,
-            yearly_score=yearly_score,
-            lifetime_score=lifetime_score,
-            best_quarterly_daily_score=best_quarterly_daily_score,
-            best_quarterly_weekly_score=best_quarterly_weekly_score,
-            best_quarterly_monthly_score=best_quarterly_monthly_score,
-            best_yearly_daily_score=best_yearly_daily_score,
-            best_yearly_weekly_score=best_yearly_weekly_score,
-            best_yearly_monthly_score=best_yearly_monthly_score,
-            best_yearly_quarterly_score=best_yearly_quarterly_score,
-            best_lifetime_daily_score=best_lifetime_daily_score,
-            best_lifetime_weekly_score=best_lifetime_weekly_score,
-            best_lifetime_monthly_score=best_lifetime_monthly_score,
-            best_lifetime_quarterly_score=best_lifetime_quarterly_score,
-            best_lifetime_yearly_score=best_lifetime_yearly_score,
-        )
-
-    async def _load_stats(
-        self,
-        uow: DomainUnitOfWork,
-        score_log: ScoreLog,
-        period: RecurringTaskPeriod | None,
-        right_now: Timestamp,
-    ) -> UserScore:
-        timeline = infer_timeline(period, right_now)
-        score_stats = await uow.get(ScoreStatsRepository).load_by_key_optional(
-            (score_log.ref_id, period, timeline)
-        )
-        return score_stats.to_user_score() if score_stats else UserScore.new()
-
-    async def _load_period_best(
-        self,
-        uow: DomainUnitOfWork,
-        score_log: ScoreLog,
-        period: RecurringTaskPeriod | None,
-        right_now: Timestamp,
-        sub_period: RecurringTaskPeriod,
-    ) -> UserScore:
-        timeline = infer_timeline(period, right_now)
-        score_period_best = await uow.get(
-            ScorePeriodBestRepository
-        ).load_by_key_optional((score_log.ref_id, period, timeline, sub_period))
-        return (
-            score_period_best.to_user_score() if score_period_best else UserScore.new()
+            best_lifetime_daily_score=best(None, RecurringTaskPeriod.DAILY),
+            best_lifetime_weekly_score=best(None, RecurringTaskPeriod.WEEKLY),
+            best_lifetime_monthly_score=best(None, RecurringTaskPeriod.MONTHLY),
+            best_lifetime_quarterly_score=best(None, RecurringTaskPeriod.QUARTERLY),
+            best_lifetime_yearly_score=best(None, RecurringTaskPeriod.YEARLY),
         )
@@ -114,7 +114,7 @@ class GCService:
                 async with progress_reporter.section(
                     "Archiving all done inbox tasks",
                 ):
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
+                    async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                         inbox_tasks = await uow.get_for(InboxTask).find_all(
                             parent_ref_id=inbox_task_collection.ref_id,
                             allow_archived=False,
@@ -131,7 +131,7 @@ class GCService:
             and SyncTarget.WORKING_MEM in gc_targets
         ):
             async with progress_reporter.section("Working Mem"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     working_mems = await uow.get_for(WorkingMem).find_all(
                         parent_ref_id=inbox_task_collection.ref_id, allow_archived=False
                     )
@@ -147,7 +147,7 @@ class GCService:
                 async with progress_reporter.section(
                     "Archiving all done big plans",
                 ):
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
+                    async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                         big_plans = await uow.get_for(BigPlan).find_all(
                             parent_ref_id=big_plan_collection.ref_id,
                             allow_archived=False,
@@ -165,7 +165,7 @@ class GCService:
             and SyncTarget.SLACK_TASKS in gc_targets
         ):
             async with progress_reporter.section("Slack Tasks"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     slack_tasks = await uow.get_for(SlackTask).find_all(
                         parent_ref_id=slack_task_collection.ref_id,
                         allow_archived=False,
@@ -189,7 +189,7 @@ class GCService:
             and SyncTarget.EMAIL_TASKS in gc_targets
         ):
             async with progress_reporter.section("Email Tasks"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     email_tasks = await uow.get_for(EmailTask).find_all(
                         parent_ref_id=email_task_collection.ref_id,
                         allow_archived=False,
@@ -1,8 +1,10 @@
 """Generate tasks for a workspace."""
 
+import dataclasses
 import typing
 from collections import defaultdict
-from typing import Final, Sequence, cast
+from collections.abc import Iterator
+from typing import Final, Sequence, TypeVar, cast
 
 from jupiter.core.domain.application.gen.gen_log import GenLog
 from jupiter.core.domain.application.gen.gen_log_entry import GenLogEntry
@@ -75,16 +77,150 @@ from jupiter.core.domain.features import FeatureUnavailableError, WorkspaceFeatu
 from jupiter.core.domain.infer_sync_targets import (
     infer_sync_targets_for_enabled_features,
 )
-from jupiter.core.domain.storage_engine import DomainStorageEngine
+from jupiter.core.domain.storage_engine import DomainStorageEngine, DomainUnitOfWork
 from jupiter.core.domain.sync_target import (
     SyncTarget,
 )
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.base.entity_name import EntityName
 from jupiter.core.framework.context import DomainContext
-from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.entity import CrownEntity, NoFilter
 from jupiter.core.framework.use_case import ProgressReporter
 
+_FLUSH_CHUNK_SIZE: Final[int] = 500
+
+_T = TypeVar("_T")
+
+
+def _chunked(items: list[_T]) -> Iterator[list[_T]]:
+    for start in range(0, len(items), _FLUSH_CHUNK_SIZE):
+        yield items[start : start + _FLUSH_CHUNK_SIZE]
+
+
+@dataclasses.dataclass(frozen=True)
+class _PlannedWrite:
+    """A create or an update planned during generation."""
+
+    entity: CrownEntity
+    report: bool
+    log: bool
+
+
+class _GenWriteBatch:
+    """The writes planned by a generation run, applied together at the end.
+
+    Working mems, time plans and journals are still created as soon as they are
+    planned, because the notes and tasks generated for them need their ref ids.
+    They are only recorded here so they end up in the log entry.
+    """
+
+    _creates: dict[type[CrownEntity], list[_PlannedWrite]]
+    _updates: dict[type[CrownEntity], list[_PlannedWrite]]
+    _already_created: list[CrownEntity]
+    _inbox_task_removes: list[InboxTask]
+    _habit_streaks: list[tuple[ADate, Habit, list[InboxTask]]]
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._creates = {}
+        self._updates = {}
+        self._already_created = []
+        self._inbox_task_removes = []
+        self._habit_streaks = []
+
+    def plan_create(
+        self, entity: CrownEntity, *, report: bool = True, log: bool = True
+    ) -> None:
+        """Plan the creation of an entity."""
+        self._creates.setdefault(type(entity), []).append(
+            _PlannedWrite(entity=entity, report=report, log=log)
+        )
+
+    def plan_update(
+        self, entity: CrownEntity, *, report: bool = True, log: bool = True
+    ) -> None:
+        """Plan saving a modified entity."""
+        self._updates.setdefault(type(entity), []).append(
+            _PlannedWrite(entity=entity, report=report, log=log)
+        )
+
+    def record_created(self, entity: CrownEntity) -> None:
+        """Record an entity which had to be created ahead of the flush."""
+        self._already_created.append(entity)
+
+    def plan_inbox_task_remove(self, inbox_task: InboxTask) -> None:
+        """Plan the removal of an inbox task."""
+        self._inbox_task_removes.append(inbox_task)
+
+    def plan_habit_streak(
+        self, today: ADate, habit: Habit, inbox_tasks: list[InboxTask]
+    ) -> None:
+        """Plan recording the streak of a habit, once its tasks are written."""
+        self._habit_streaks.append((today, habit, inbox_tasks))
+
+    async def flush(
+        self,
+        ctx: DomainContext,
+        uow: DomainUnitOfWork,
+        progress_reporter: ProgressReporter,
+        gen_log_entry: GenLogEntry,
+    ) -> GenLogEntry:
+        """Apply all the planned writes in the given unit of work."""
+        for entity in self._already_created:
+            gen_log_entry = gen_log_entry.add_entity_created(ctx, entity)
+
+        # Planned entities don't have a ref id yet, so the streaks refer to them
+        # by identity until they are created.
+        created_by_planned_id: dict[int, CrownEntity] = {}
+        for entity_type, planned_creates in self._creates.items():
+            for chunk in _chunked(planned_creates):
+                new_entities = await uow.get_for(entity_type).create_many(
+                    [p.entity for p in chunk]
+                )
+                for planned, new_entity in zip(chunk, new_entities, strict=True):
+                    created_by_planned_id[id(planned.entity)] = new_entity
+                    if planned.report:
+                        await progress_reporter.mark_created(new_entity)
+                    if planned.log:
+                        gen_log_entry = gen_log_entry.add_entity_created(
+                            ctx, new_entity
+                        )
+
+        for entity_type, planned_updates in self._updates.items():
+            for chunk in _chunked(planned_updates):
+                saved_entities = await uow.get_for(entity_type).save_many(
+                    [p.entity for p in chunk]
+                )
+                for planned, saved_entity in zip(chunk, saved_entities, strict=True):
+                    if planned.report:
+                        await progress_reporter.mark_updated(saved_entity)
+                    if planned.log:
+                        gen_log_entry = gen_log_entry.add_entity_updated(
+                            ctx, saved_entity
+                        )
+
+        inbox_task_remove_service = InboxTaskRemoveService()
+        for inbox_task in self._inbox_task_removes:
+            await inbox_task_remove_service.do_it(
+                ctx, uow, progress_reporter, inbox_task
+            )
+            gen_log_entry = gen_log_entry.add_entity_removed(ctx, inbox_task)
+
+        streak_recorder_service = HabitStreakRecorderService()
+        for today, habit, inbox_tasks in self._habit_streaks:
+            await streak_recorder_service.upsert(
+                ctx=ctx,
+                uow=uow,
+                today=today,
+                habit=habit,
+                inbox_tasks=[
+                    cast(InboxTask, created_by_planned_id.get(id(t), t))
+                    for t in inbox_tasks
+                ],
+            )
+
+        return gen_log_entry
+
 
 class GenService:
     """Shared service for performing garbage collection."""
@@ -182,6 +318,7 @@ class GenService:
             )
             gen_log_entry = await uow.get_for(GenLogEntry).create(gen_log_entry)
 
+        async with self._domain_storage_engine.get_read_unit_of_work() as uow:
             vacation_collection = await uow.get_for(VacationCollection).load_by_parent(
                 workspace.ref_id,
             )
@@ -231,13 +368,15 @@ class GenService:
                 workspace.ref_id,
             )
 
+        batch = _GenWriteBatch()
+
         if (
             workspace.is_feature_available(WorkspaceFeature.WORKING_MEM)
             and SyncTarget.WORKING_MEM in gen_targets
         ):
             async with progress_reporter.section("Generating working mem"):
                 all_working_mem_by_timeline = {}
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_working_mem = await uow.get_for(WorkingMem).find_all_generic(
                         parent_ref_id=working_mem_collection.ref_id,
                         allow_archived=False,
@@ -246,7 +385,7 @@ class GenService:
                         all_working_mem_by_timeline[working_mem.timeline] = working_mem
 
                 all_notes_by_working_mem_ref_id = {}
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_notes = await uow.get_for(Note).find_all_generic(
                         parent_ref_id=note_collection.ref_id,
                         allow_archived=False,
@@ -262,7 +401,7 @@ class GenService:
                             note
                         )
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_cleanup_inbox_tasks = await uow.get_for(
                         InboxTask
                     ).find_all_generic(
@@ -289,7 +428,7 @@ class GenService:
                         (inbox_task.source_entity_ref_id, inbox_task.recurring_timeline)
                     ] = inbox_task
 
-                gen_log_entry = await self._generate_working_mem_and_inbox_task(
+                await self._generate_working_mem_and_inbox_task(
                     ctx,
                     progress_reporter=progress_reporter,
                     user=user,
@@ -302,7 +441,7 @@ class GenService:
                     all_inbox_tasks_by_working_mem_ref_id_and_timeline=all_inbox_tasks_by_working_mem_ref_id_and_timeline,
                     today=today,
                     gen_even_if_not_modified=gen_even_if_not_modified,
-                    gen_log_entry=gen_log_entry,
+                    batch=batch,
                 )
 
         if (
@@ -310,7 +449,7 @@ class GenService:
             and SyncTarget.TIME_PLANS in gen_targets
         ):
             async with progress_reporter.section("Generating time plans"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_time_plans = await uow.get_for(TimePlan).find_all_generic(
                         parent_ref_id=time_plan_domain.ref_id,
                         allow_archived=False,
@@ -320,7 +459,7 @@ class GenService:
                 for time_plan in all_time_plans:
                     all_time_plans_by_timeline[time_plan.timeline] = time_plan
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_inbox_tasks = await uow.get_for(InboxTask).find_all_generic(
                         parent_ref_id=inbox_task_collection.ref_id,
                         allow_archived=True,
@@ -345,7 +484,7 @@ class GenService:
                         inbox_task
                     )
 
-                gen_log_entry = await self._generate_time_plans_and_planning_tasks_for_time_plan_domain(
+                await self._generate_time_plans_and_planning_tasks_for_time_plan_domain(
                     ctx,
                     progress_reporter=progress_reporter,
                     user=user,
@@ -358,7 +497,7 @@ class GenService:
                     all_time_plans_by_timeline=all_time_plans_by_timeline,
                     all_inbox_tasks_by_timeline=all_inbox_tasks_by_timeline,
                     gen_even_if_not_modified=gen_even_if_not_modified,
-                    gen_log_entry=gen_log_entry,
+                    batch=batch,
                 )
 
         if (
@@ -366,7 +505,7 @@ class GenService:
             and SyncTarget.HABITS in gen_targets
         ):
             async with progress_reporter.section("Generating habits"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_habits = await uow.get_for(Habit).find_all_generic(
                         parent_ref_id=habit_collection.ref_id,
                         allow_archived=False,
@@ -374,7 +513,7 @@ class GenService:
                         project_ref_id=filter_project_ref_ids or NoFilter(),
                     )
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_collection_inbox_tasks = await uow.get_for(
                         InboxTask
                     ).find_all_generic(
@@ -406,7 +545,7 @@ class GenService:
 
                 for habit in all_habits:
                     project = all_projects_by_ref_id[habit.project_ref_id]
-                    gen_log_entry = await self._generate_inbox_tasks_for_habit(
+                    await self._generate_inbox_tasks_for_habit(
                         ctx,
                         progress_reporter=progress_reporter,
                         user=user,
@@ -417,7 +556,7 @@ class GenService:
                         habit=habit,
                         all_inbox_tasks_by_habit_ref_id_and_timeline=all_inbox_tasks_by_habit_ref_id_and_timeline,
                         gen_even_if_not_modified=gen_even_if_not_modified,
-                        gen_log_entry=gen_log_entry,
+                        batch=batch,
                     )
 
         if (
@@ -425,7 +564,7 @@ class GenService:
             and SyncTarget.CHORES in gen_targets
         ):
             async with progress_reporter.section("Generating chores"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_chores = await uow.get_for(Chore).find_all_generic(
                         parent_ref_id=chore_collection.ref_id,
                         allow_archived=False,
@@ -433,7 +572,7 @@ class GenService:
                         project_ref_id=filter_project_ref_ids or NoFilter(),
                     )
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_collection_inbox_tasks = await uow.get_for(
                         InboxTask
                     ).find_all_generic(
@@ -462,7 +601,7 @@ class GenService:
 
                 for chore in all_chores:
                     project = all_projects_by_ref_id[chore.project_ref_id]
-                    gen_log_entry = await self._generate_inbox_tasks_for_chore(
+                    await self._generate_inbox_tasks_for_chore(
                         ctx,
                         progress_reporter=progress_reporter,
                         user=user,
@@ -475,7 +614,7 @@ class GenService:
                         chore=chore,
                         all_inbox_tasks_by_chore_ref_id_and_timeline=all_inbox_tasks_by_chore_ref_id_and_timeline,
                         gen_even_if_not_modified=gen_even_if_not_modified,
-                        gen_log_entry=gen_log_entry,
+                        batch=batch,
                     )
 
         if (
@@ -483,7 +622,7 @@ class GenService:
             and SyncTarget.JOURNALS in gen_targets
         ):
             async with progress_reporter.section("Generating journals"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_journals = await uow.get_for(Journal).find_all_generic(
                         parent_ref_id=journal_collection.ref_id,
                         allow_archived=False,
@@ -493,7 +632,7 @@ class GenService:
                 for journal in all_journals:
                     all_journals_by_timeline[journal.timeline] = journal
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_inbox_tasks = await uow.get_for(InboxTask).find_all_generic(
                         parent_ref_id=inbox_task_collection.ref_id,
                         allow_archived=True,
@@ -518,7 +657,7 @@ class GenService:
                         inbox_task
                     )
 
-                gen_log_entry = await self._generate_journals_and_writing_tasks_for_journal_collection(
+                await self._generate_journals_and_writing_tasks_for_journal_collection(
                     ctx,
                     progress_reporter=progress_reporter,
                     workspace=workspace,
@@ -532,7 +671,7 @@ class GenService:
                     all_journals_by_timeline=all_journals_by_timeline,
                     all_writing_tasks_by_timeline=all_writing_tasks_by_timeline,
                     gen_even_if_not_modified=gen_even_if_not_modified,
-                    gen_log_entry=gen_log_entry,
+                    batch=batch,
                 )
 
         if (
@@ -540,7 +679,7 @@ class GenService:
             and SyncTarget.METRICS in gen_targets
         ):
             async with progress_reporter.section("Generating for metrics"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     metric_collection = await uow.get_for(
                         MetricCollection
                     ).load_by_parent(
@@ -586,7 +725,7 @@ class GenService:
                     project = all_projects_by_ref_id[
                         metric_collection.collection_project_ref_id
                     ]
-                    gen_log_entry = await self._generate_collection_inbox_tasks_for_metric(
+                    await self._generate_collection_inbox_tasks_for_metric(
                         ctx,
                         progress_reporter=progress_reporter,
                         user=user,
@@ -598,7 +737,7 @@ class GenService:
                         collection_params=metric.collection_params,
                         all_inbox_tasks_by_metric_ref_id_and_timeline=all_collection_inbox_tasks_by_metric_ref_id_and_timeline,
                         gen_even_if_not_modified=gen_even_if_not_modified,
-                        gen_log_entry=gen_log_entry,
+                        batch=batch,
                     )
 
         if (
@@ -606,7 +745,7 @@ class GenService:
             and SyncTarget.PERSONS in gen_targets
         ):
             async with progress_reporter.section("Generating for persons"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     person_collection = await uow.get_for(
                         PersonCollection
                     ).load_by_parent(
@@ -677,7 +816,7 @@ class GenService:
 
                     # MyPy not smart enough to infer that if (not A and not B) then (A or B)
 
-                    gen_log_entry = await self._generate_catch_up_inbox_tasks_for_person(
+                    await self._generate_catch_up_inbox_tasks_for_person(
                         ctx,
                         progress_reporter=progress_reporter,
                         user=user,
@@ -689,7 +828,7 @@ class GenService:
                         catch_up_params=person.catch_up_params,
                         all_inbox_tasks_by_person_ref_id_and_timeline=all_catch_up_inbox_tasks_by_person_ref_id_and_timeline,
                         gen_even_if_not_modified=gen_even_if_not_modified,
-                        gen_log_entry=gen_log_entry,
+                        batch=batch,
                     )
 
             all_birthday_inbox_tasks_by_person_ref_id_and_timeline = {}
@@ -716,7 +855,7 @@ class GenService:
                     continue
 
                 for idx in range(5):
-                    gen_log_entry = await self._generate_birthday_time_event_block_for_person(
+                    await self._generate_birthday_time_event_block_for_person(
                         ctx,
                         progress_reporter=progress_reporter,
                         time_event_domain=time_event_domain,
@@ -724,10 +863,10 @@ class GenService:
                         person=person,
                         all_birthday_time_event_blocks_by_person_ref_id_and_start_date=all_birthday_time_event_blocks_by_person_ref_id_and_start_date,
                         gen_even_if_not_modified=gen_even_if_not_modified,
-                        gen_log_entry=gen_log_entry,
+                        batch=batch,
                     )
 
-                    gen_log_entry = await self._generate_birthday_inbox_task_for_person(
+                    await self._generate_birthday_inbox_task_for_person(
                         ctx,
                         progress_reporter=progress_reporter,
                         user=user,
@@ -738,7 +877,7 @@ class GenService:
                         birthday=person.birthday,
                         all_inbox_tasks_by_person_ref_id_and_timeline=all_birthday_inbox_tasks_by_person_ref_id_and_timeline,
                         gen_even_if_not_modified=gen_even_if_not_modified,
-                        gen_log_entry=gen_log_entry,
+                        batch=batch,
                     )
 
         if (
@@ -746,7 +885,7 @@ class GenService:
             and SyncTarget.SLACK_TASKS in gen_targets
         ):
             async with progress_reporter.section("Generating for Slack tasks"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     push_integration_group = await uow.get_for(
                         PushIntegrationGroup
                     ).load_by_parent(
@@ -782,20 +921,18 @@ class GenService:
                     project = all_projects_by_ref_id[
                         slack_collection.generation_project_ref_id
                     ]
-                    gen_log_entry = (
-                        await self._generate_slack_inbox_task_for_slack_task(
-                            ctx,
-                            progress_reporter=progress_reporter,
-                            slack_task=slack_task,
-                            inbox_task_collection=inbox_task_collection,
-                            project=project,
-                            all_inbox_tasks_by_slack_task_ref_id=typing.cast(
-                                dict[EntityId, InboxTask],
-                                all_inbox_tasks_by_slack_task_ref_id,
-                            ),
-                            gen_even_if_not_modified=gen_even_if_not_modified,
-                            gen_log_entry=gen_log_entry,
-                        )
+                    await self._generate_slack_inbox_task_for_slack_task(
+                        ctx,
+                        progress_reporter=progress_reporter,
+                        slack_task=slack_task,
+                        inbox_task_collection=inbox_task_collection,
+                        project=project,
+                        all_inbox_tasks_by_slack_task_ref_id=typing.cast(
+                            dict[EntityId, InboxTask],
+                            all_inbox_tasks_by_slack_task_ref_id,
+                        ),
+                        gen_even_if_not_modified=gen_even_if_not_modified,
+                        batch=batch,
                     )
 
         if (
@@ -803,7 +940,7 @@ class GenService:
             and SyncTarget.EMAIL_TASKS in gen_targets
         ):
             async with progress_reporter.section("Generating for email tasks"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     push_integration_group = await uow.get_for(
                         PushIntegrationGroup
                     ).load_by_parent(
@@ -839,23 +976,24 @@ class GenService:
                     project = all_projects_by_ref_id[
                         email_collection.generation_project_ref_id
                     ]
-                    gen_log_entry = (
-                        await self._generate_email_inbox_task_for_email_task(
-                            ctx,
-                            progress_reporter=progress_reporter,
-                            email_task=email_task,
-                            inbox_task_collection=inbox_task_collection,
-                            project=project,
-                            all_inbox_tasks_by_email_task_ref_id=typing.cast(
-                                dict[EntityId, InboxTask],
-                                all_inbox_tasks_by_email_task_ref_id,
-                            ),
-                            gen_even_if_not_modified=gen_even_if_not_modified,
-                            gen_log_entry=gen_log_entry,
-                        )
+                    await self._generate_email_inbox_task_for_email_task(
+                        ctx,
+                        progress_reporter=progress_reporter,
+                        email_task=email_task,
+                        inbox_task_collection=inbox_task_collection,
+                        project=project,
+                        all_inbox_tasks_by_email_task_ref_id=typing.cast(
+                            dict[EntityId, InboxTask],
+                            all_inbox_tasks_by_email_task_ref_id,
+                        ),
+                        gen_even_if_not_modified=gen_even_if_not_modified,
+                        batch=batch,
                     )
 
         async with self._domain_storage_engine.get_unit_of_work() as uow:
+            gen_log_entry = await batch.flush(
+                ctx, uow, progress_reporter, gen_log_entry
+            )
             gen_log_entry = gen_log_entry.close(ctx)
             gen_log_entry = await uow.get_for(GenLogEntry).save(gen_log_entry)
 
@@ -876,8 +1014,8 @@ class GenService:
         ],
         today: ADate,
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         schedule = schedules.get_schedule(
             working_mem_collection.generation_period,
             EntityName("Cleanup WorkingMem.txt"),
@@ -910,20 +1048,17 @@ class GenService:
                 period=working_mem_collection.generation_period,
             )
 
+            # The note and the cleanup task point to the working mem, so it
+            # can't wait for the batch.
             async with self._domain_storage_engine.get_unit_of_work() as uow:
                 working_mem = await uow.get_for(WorkingMem).create(working_mem)
                 await progress_reporter.mark_created(working_mem)
 
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                working_mem,
-            )
+            batch.record_created(working_mem)
 
         found_note = all_notes_by_working_mem_ref_id.get(working_mem.ref_id, None)
 
-        if found_note:
-            note = found_note
-        else:
+        if not found_note:
             note = Note.new_note(
                 ctx,
                 note_collection_ref_id=note_collection.ref_id,
@@ -932,8 +1067,7 @@ class GenService:
                 content=[],
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                note = await uow.get_for(Note).create(note)
+            batch.plan_create(note, report=False, log=False)
 
         found_inbox_task = all_inbox_tasks_by_working_mem_ref_id_and_timeline.get(
             (working_mem.ref_id, schedule.timeline),
@@ -946,7 +1080,7 @@ class GenService:
                 and found_inbox_task.last_modified_time
                 >= working_mem.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_inbox_task = found_inbox_task.update_link_to_working_mem_cleanup(
                 ctx,
@@ -956,13 +1090,7 @@ class GenService:
                 due_date=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(InboxTask).save(found_inbox_task)
-                await progress_reporter.mark_updated(found_inbox_task)
-            gen_log_entry = gen_log_entry.add_entity_updated(
-                ctx,
-                found_inbox_task,
-            )
+            batch.plan_update(found_inbox_task)
         else:
             inbox_task = InboxTask.new_inbox_task_for_working_mem_cleanup(
                 ctx,
@@ -975,15 +1103,7 @@ class GenService:
                 recurring_task_gen_right_now=today.to_timestamp_at_end_of_day(),
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                await progress_reporter.mark_created(inbox_task)
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                inbox_task,
-            )
-
-        return gen_log_entry
+            batch.plan_create(inbox_task)
 
     async def _generate_time_plans_and_planning_tasks_for_time_plan_domain(
         self,
@@ -999,8 +1119,8 @@ class GenService:
         all_time_plans_by_timeline: dict[str, TimePlan],
         all_inbox_tasks_by_timeline: dict[str, InboxTask],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         for period in time_plan_domain.periods:
             if period_filter is not None and period not in period_filter:
                 continue
@@ -1046,13 +1166,7 @@ class GenService:
                         today=real_today,
                     )
 
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        await uow.get_for(TimePlan).save(found_time_plan)
-                        await progress_reporter.mark_updated(found_time_plan)
-                    gen_log_entry = gen_log_entry.add_entity_updated(
-                        ctx,
-                        found_time_plan,
-                    )
+                    batch.plan_update(found_time_plan)
                 else:
                     time_plan = TimePlan.new_time_plan_generated(
                         ctx,
@@ -1067,10 +1181,7 @@ class GenService:
                     async with self._domain_storage_engine.get_unit_of_work() as uow:
                         time_plan = await uow.get_for(TimePlan).create(time_plan)
                         await progress_reporter.mark_created(time_plan)
-                    gen_log_entry = gen_log_entry.add_entity_created(
-                        ctx,
-                        time_plan,
-                    )
+                    batch.record_created(time_plan)
 
                     new_note = Note.new_note(
                         ctx,
@@ -1080,8 +1191,7 @@ class GenService:
                         content=[],
                     )
 
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        new_note = await uow.get_for(Note).create(new_note)
+                    batch.plan_create(new_note, report=False, log=False)
 
                     found_time_plan = time_plan
 
@@ -1111,13 +1221,7 @@ class GenService:
                         due_date=cast(TimePlan, found_time_plan).start_date,
                     )
 
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        await uow.get_for(InboxTask).save(found_planning_task)
-                        await progress_reporter.mark_updated(found_planning_task)
-                    gen_log_entry = gen_log_entry.add_entity_updated(
-                        ctx,
-                        found_planning_task,
-                    )
+                    batch.plan_update(found_planning_task)
                 else:
                     inbox_task = InboxTask.new_inbox_task_for_time_plan(
                         ctx,
@@ -1133,15 +1237,7 @@ class GenService:
                         recurring_task_gen_right_now=real_today.to_timestamp_at_end_of_day(),
                     )
 
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                        await progress_reporter.mark_created(inbox_task)
-                    gen_log_entry = gen_log_entry.add_entity_created(
-                        ctx,
-                        inbox_task,
-                    )
-
-        return gen_log_entry
+                    batch.plan_create(inbox_task)
 
     async def _generate_inbox_tasks_for_habit(
         self,
@@ -1158,13 +1254,13 @@ class GenService:
             list[InboxTask],
         ],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         if habit.suspended:
-            return gen_log_entry
+            return
 
         if period_filter is not None and habit.gen_params.period not in period_filter:
-            return gen_log_entry
+            return
 
         schedule = schedules.get_schedule(
             habit.gen_params.period,
@@ -1178,7 +1274,7 @@ class GenService:
         )
 
         if not schedule.should_keep:
-            return gen_log_entry
+            return
 
         all_found_tasks_by_repeat_index: dict[int, InboxTask] = {
             cast(int, ft.recurring_repeat_index): ft
@@ -1201,7 +1297,7 @@ class GenService:
         else:
             task_ranges = [(schedule.actionable_date, schedule.due_date)]
 
-        remaining_tasks: set[InboxTask] = set()
+        remaining_tasks: list[InboxTask] = []
 
         for task_idx in range(habit.repeats_in_period_count or 1):
             found_task = all_found_tasks_by_repeat_index.get(task_idx, None)
@@ -1212,7 +1308,7 @@ class GenService:
                     not gen_even_if_not_modified
                     and found_task.last_modified_time >= habit.last_modified_time
                 ):
-                    remaining_tasks.add(found_task)
+                    remaining_tasks.append(found_task)
                     continue
 
                 found_task = found_task.update_link_to_habit(
@@ -1229,15 +1325,8 @@ class GenService:
                     difficulty=habit.gen_params.difficulty,
                 )
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
-                    found_task = await uow.get_for(InboxTask).save(found_task)
-                    await progress_reporter.mark_updated(found_task)
-
-                remaining_tasks.add(found_task)
-                gen_log_entry = gen_log_entry.add_entity_updated(
-                    ctx,
-                    found_task,
-                )
+                batch.plan_update(found_task)
+                remaining_tasks.append(found_task)
             else:
                 inbox_task = InboxTask.new_inbox_task_for_habit(
                     ctx,
@@ -1256,42 +1345,17 @@ class GenService:
                     repeats_in_period_count=habit.repeats_in_period_count,
                 )
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
-                    inbox_task = await uow.get_for(InboxTask).create(
-                        inbox_task,
-                    )
-                    await progress_reporter.mark_created(inbox_task)
-
-                remaining_tasks.add(inbox_task)
-                gen_log_entry = gen_log_entry.add_entity_created(
-                    ctx,
-                    inbox_task,
-                )
-
-        async with self._domain_storage_engine.get_unit_of_work() as uow:
-            inbox_task_remove_service = InboxTaskRemoveService()
-            for task in all_found_tasks_by_repeat_index.values():
-                if task.recurring_repeat_index is None:
-                    continue
-                if task.recurring_repeat_index in repeat_idx_to_keep:
-                    continue
-                await inbox_task_remove_service.do_it(ctx, uow, progress_reporter, task)
-                gen_log_entry = gen_log_entry.add_entity_removed(
-                    ctx,
-                    task,
-                )
+                batch.plan_create(inbox_task)
+                remaining_tasks.append(inbox_task)
 
-        async with self._domain_storage_engine.get_unit_of_work() as uow:
-            streak_recorder_service = HabitStreakRecorderService()
-            await streak_recorder_service.upsert(
-                ctx=ctx,
-                uow=uow,
-                today=today,
-                habit=habit,
-                inbox_tasks=remaining_tasks,
-            )
+        for task in all_found_tasks_by_repeat_index.values():
+            if task.recurring_repeat_index is None:
+                continue
+            if task.recurring_repeat_index in repeat_idx_to_keep:
+                continue
+            batch.plan_inbox_task_remove(task)
 
-        return gen_log_entry
+        batch.plan_habit_streak(today, habit, remaining_tasks)
 
     async def _generate_inbox_tasks_for_chore(
         self,
@@ -1310,13 +1374,13 @@ class GenService:
             InboxTask,
         ],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         if chore.suspended:
-            return gen_log_entry
+            return
 
         if period_filter is not None and chore.gen_params.period not in period_filter:
-            return gen_log_entry
+            return
 
         schedule = schedules.get_schedule(
             chore.gen_params.period,
@@ -1333,13 +1397,13 @@ class GenService:
             if not chore.must_do:
                 for vacation in all_vacations:
                     if vacation.is_in_vacation(schedule.first_day, schedule.end_day):
-                        return gen_log_entry
+                        return
 
         if not chore.is_in_active_interval(schedule.first_day, schedule.end_day):
-            return gen_log_entry
+            return
 
         if not schedule.should_keep:
-            return gen_log_entry
+            return
 
         found_task = all_inbox_tasks_by_chore_ref_id_and_timeline.get(
             (chore.ref_id, schedule.timeline),
@@ -1351,7 +1415,7 @@ class GenService:
                 not gen_even_if_not_modified
                 and found_task.last_modified_time >= chore.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_task = found_task.update_link_to_chore(
                 ctx,
@@ -1365,14 +1429,7 @@ class GenService:
                 difficulty=chore.gen_params.difficulty,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(InboxTask).save(found_task)
-                await progress_reporter.mark_updated(found_task)
-
-            gen_log_entry = gen_log_entry.add_entity_updated(
-                ctx,
-                found_task,
-            )
+            batch.plan_update(found_task)
         else:
             inbox_task = InboxTask.new_inbox_task_for_chore(
                 ctx,
@@ -1389,16 +1446,7 @@ class GenService:
                 due_date=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                await progress_reporter.mark_created(inbox_task)
-
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                inbox_task,
-            )
-
-        return gen_log_entry
+            batch.plan_create(inbox_task)
 
     async def _generate_journals_and_writing_tasks_for_journal_collection(
         self,
@@ -1415,8 +1463,8 @@ class GenService:
         all_journals_by_timeline: dict[str, Journal],
         all_writing_tasks_by_timeline: dict[str, InboxTask],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         for period in journal_collection.periods:
             if period_filter is not None and period not in period_filter:
                 continue
@@ -1459,13 +1507,7 @@ class GenService:
                         right_now=real_today,
                     )
 
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        await uow.get_for(Journal).save(found_journal)
-                        await progress_reporter.mark_updated(found_journal)
-                    gen_log_entry = gen_log_entry.add_entity_updated(
-                        ctx,
-                        found_journal,
-                    )
+                    batch.plan_update(found_journal)
                 else:
                     journal = Journal.new_journal_generated(
                         ctx,
@@ -1478,10 +1520,18 @@ class GenService:
                     async with self._domain_storage_engine.get_unit_of_work() as uow:
                         journal = await uow.get_for(Journal).create(journal)
                         await progress_reporter.mark_created(journal)
-                    gen_log_entry = gen_log_entry.add_entity_created(
-                        ctx,
-                        journal,
-                    )
+
+                        new_journal_stats = JournalStats.new_stats(
+                            ctx,
+                            journal_ref_id=journal.ref_id,
+                            today=real_today,
+                            period=period,
+                            sources=workspace.infer_sources_for_enabled_features(None),
+                        )
+                        new_journal_stats = await uow.get(
+                            JournalStatsRepository
+                        ).create(new_journal_stats)
+                    batch.record_created(journal)
 
                     new_note = Note.new_note(
                         ctx,
@@ -1491,19 +1541,7 @@ class GenService:
                         content=[],
                     )
 
-                    new_journal_stats = JournalStats.new_stats(
-                        ctx,
-                        journal_ref_id=journal.ref_id,
-                        today=real_today,
-                        period=period,
-                        sources=workspace.infer_sources_for_enabled_features(None),
-                    )
-
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        new_note = await uow.get_for(Note).create(new_note)
-                        new_journal_stats = await uow.get(
-                            JournalStatsRepository
-                        ).create(new_journal_stats)
+                    batch.plan_create(new_note, report=False, log=False)
 
                     found_journal = journal
 
@@ -1531,13 +1569,7 @@ class GenService:
                         due_date=schedule.due_date,
                     )
 
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        await uow.get_for(InboxTask).save(found_writing_task)
-                        await progress_reporter.mark_updated(found_writing_task)
-                    gen_log_entry = gen_log_entry.add_entity_updated(
-                        ctx,
-                        found_writing_task,
-                    )
+                    batch.plan_update(found_writing_task)
                 else:
                     inbox_task = InboxTask.new_inbox_task_for_journal(
                         ctx,
@@ -1555,15 +1587,7 @@ class GenService:
                         recurring_task_gen_right_now=real_today.to_timestamp_at_end_of_day(),
                     )
 
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                        await progress_reporter.mark_created(inbox_task)
-                    gen_log_entry = gen_log_entry.add_entity_created(
-                        ctx,
-                        inbox_task,
-                    )
-
-        return gen_log_entry
+                    batch.plan_create(inbox_task)
 
     async def _generate_collection_inbox_tasks_for_metric(
         self,
@@ -1581,10 +1605,10 @@ class GenService:
             InboxTask,
         ],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         if period_filter is not None and collection_params.period not in period_filter:
-            return gen_log_entry
+            return
 
         schedule = schedules.get_schedule(
             typing.cast(RecurringTaskPeriod, collection_params.period),
@@ -1607,7 +1631,7 @@ class GenService:
                 not gen_even_if_not_modified
                 and found_task.last_modified_time >= metric.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_task = found_task.update_link_to_metric(
                 ctx,
@@ -1620,14 +1644,7 @@ class GenService:
                 due_time=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(InboxTask).save(found_task)
-                await progress_reporter.mark_updated(found_task)
-
-            gen_log_entry = gen_log_entry.add_entity_updated(
-                ctx,
-                found_task,
-            )
+            batch.plan_update(found_task)
         else:
             inbox_task = InboxTask.new_inbox_task_for_metric_collection(
                 ctx,
@@ -1643,16 +1660,7 @@ class GenService:
                 due_date=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                await progress_reporter.mark_created(inbox_task)
-
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                inbox_task,
-            )
-
-        return gen_log_entry
+            batch.plan_create(inbox_task)
 
     async def _generate_catch_up_inbox_tasks_for_person(
         self,
@@ -1670,10 +1678,10 @@ class GenService:
             InboxTask,
         ],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         if period_filter is not None and catch_up_params.period not in period_filter:
-            return gen_log_entry
+            return
 
         schedule = schedules.get_schedule(
             typing.cast(RecurringTaskPeriod, catch_up_params.period),
@@ -1696,7 +1704,7 @@ class GenService:
                 not gen_even_if_not_modified
                 and found_task.last_modified_time >= person.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_task = found_task.update_link_to_person_catch_up(
                 ctx,
@@ -1709,14 +1717,7 @@ class GenService:
                 due_time=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(InboxTask).save(found_task)
-                await progress_reporter.mark_updated(found_task)
-
-            gen_log_entry = gen_log_entry.add_entity_updated(
-                ctx,
-                found_task,
-            )
+            batch.plan_update(found_task)
         else:
             inbox_task = InboxTask.new_inbox_task_for_person_catch_up(
                 ctx,
@@ -1732,16 +1733,7 @@ class GenService:
                 due_date=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                await progress_reporter.mark_created(inbox_task)
-
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                inbox_task,
-            )
-
-        return gen_log_entry
+            batch.plan_create(inbox_task)
 
     async def _generate_birthday_time_event_block_for_person(
         self,
@@ -1755,8 +1747,8 @@ class GenService:
             TimeEventFullDaysBlock,
         ],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         found_block = (
             all_birthday_time_event_blocks_by_person_ref_id_and_start_date.get(
                 (person.ref_id, person.birthday_in_year(today)), None
@@ -1768,15 +1760,14 @@ class GenService:
                 not gen_even_if_not_modified
                 and found_block.last_modified_time >= person.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_block = found_block.update_for_person_birthday(
                 ctx,
                 birthday_date=person.birthday_in_year(today),
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(TimeEventFullDaysBlock).save(found_block)
+            batch.plan_update(found_block, report=False, log=False)
         else:
             found_block = TimeEventFullDaysBlock.new_time_event_for_person_birthday(
                 ctx,
@@ -1785,12 +1776,7 @@ class GenService:
                 birthday_date=person.birthday_in_year(today),
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                found_block = await uow.get_for(TimeEventFullDaysBlock).create(
-                    found_block
-                )
-
-        return gen_log_entry
+            batch.plan_create(found_block, report=False, log=False)
 
     async def _generate_birthday_inbox_task_for_person(
         self,
@@ -1807,8 +1793,8 @@ class GenService:
             InboxTask,
         ],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         schedule = schedules.get_schedule(
             RecurringTaskPeriod.YEARLY,
             person.name,
@@ -1836,7 +1822,7 @@ class GenService:
                 not gen_even_if_not_modified
                 and found_task.last_modified_time >= person.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_task = found_task.update_link_to_person_birthday(
                 ctx,
@@ -1847,14 +1833,7 @@ class GenService:
                 due_time=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(InboxTask).save(found_task)
-                await progress_reporter.mark_updated(found_task)
-
-            gen_log_entry = gen_log_entry.add_entity_updated(
-                ctx,
-                found_task,
-            )
+            batch.plan_update(found_task)
         else:
             inbox_task = InboxTask.new_inbox_task_for_person_birthday(
                 ctx,
@@ -1868,16 +1847,7 @@ class GenService:
                 due_date=schedule.due_date,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                await progress_reporter.mark_created(inbox_task)
-
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                inbox_task,
-            )
-
-        return gen_log_entry
+            batch.plan_create(inbox_task)
 
     async def _generate_slack_inbox_task_for_slack_task(
         self,
@@ -1888,8 +1858,8 @@ class GenService:
         project: Project,
         all_inbox_tasks_by_slack_task_ref_id: dict[EntityId, InboxTask],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         found_task = all_inbox_tasks_by_slack_task_ref_id.get(
             slack_task.ref_id,
             None,
@@ -1900,7 +1870,7 @@ class GenService:
                 not gen_even_if_not_modified
                 and found_task.last_modified_time >= slack_task.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_task = found_task.update_link_to_slack_task(
                 ctx,
@@ -1911,14 +1881,7 @@ class GenService:
                 generation_extra_info=slack_task.generation_extra_info,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(InboxTask).save(found_task)
-                await progress_reporter.mark_updated(found_task)
-
-            gen_log_entry = gen_log_entry.add_entity_updated(
-                ctx,
-                found_task,
-            )
+            batch.plan_update(found_task)
         else:
             inbox_task = InboxTask.new_inbox_task_for_slack_task(
                 ctx,
@@ -1931,20 +1894,9 @@ class GenService:
                 message=slack_task.message,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                slack_task = slack_task.mark_as_used_for_generation(ctx)
-                await uow.get_for(SlackTask).save(slack_task)
-                await progress_reporter.mark_updated(slack_task)
-
-                inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                await progress_reporter.mark_created(inbox_task)
-
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                inbox_task,
-            )
-
-        return gen_log_entry
+            slack_task = slack_task.mark_as_used_for_generation(ctx)
+            batch.plan_update(slack_task, log=False)
+            batch.plan_create(inbox_task)
 
     async def _generate_email_inbox_task_for_email_task(
         self,
@@ -1955,8 +1907,8 @@ class GenService:
         project: Project,
         all_inbox_tasks_by_email_task_ref_id: dict[EntityId, InboxTask],
         gen_even_if_not_modified: bool,
-        gen_log_entry: GenLogEntry,
-    ) -> GenLogEntry:
+        batch: _GenWriteBatch,
+    ) -> None:
         found_task = all_inbox_tasks_by_email_task_ref_id.get(
             email_task.ref_id,
             None,
@@ -1967,7 +1919,7 @@ class GenService:
                 not gen_even_if_not_modified
                 and found_task.last_modified_time >= email_task.last_modified_time
             ):
-                return gen_log_entry
+                return
 
             found_task = found_task.update_link_to_email_task(
                 ctx,
@@ -1980,14 +1932,7 @@ class GenService:
                 generation_extra_info=email_task.generation_extra_info,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                await uow.get_for(InboxTask).save(found_task)
-                await progress_reporter.mark_updated(found_task)
-
-            gen_log_entry = gen_log_entry.add_entity_updated(
-                ctx,
-                found_task,
-            )
+            batch.plan_update(found_task)
         else:
             inbox_task = InboxTask.new_inbox_task_for_email_task(
                 ctx,
@@ -2002,17 +1947,6 @@ class GenService:
                 generation_extra_info=email_task.generation_extra_info,
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                email_task = email_task.mark_as_used_for_generation(ctx)
-                await uow.get_for(EmailTask).save(email_task)
-                await progress_reporter.mark_updated(email_task)
-
-                inbox_task = await uow.get_for(InboxTask).create(inbox_task)
-                await progress_reporter.mark_created(inbox_task)
-
-            gen_log_entry = gen_log_entry.add_entity_created(
-                ctx,
-                inbox_task,
-            )
-
-        return gen_log_entry
+            email_task = email_task.mark_as_used_for_generation(ctx)
+            batch.plan_update(email_task, log=False)
+            batch.plan_create(inbox_task)
@@ -0,0 +1,135 @@
+"""Everything needed to compute reports for any period in a range of days."""
+
+import dataclasses
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from jupiter.core.domain.concept.big_plans.big_plan import BigPlan
+from jupiter.core.domain.concept.chores.chore import Chore
+from jupiter.core.domain.concept.habits.habit import Habit
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollup,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
+from jupiter.core.domain.concept.metrics.metric import Metric
+from jupiter.core.domain.concept.persons.person import Person
+from jupiter.core.domain.concept.projects.project import Project
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.framework.base.entity_id import EntityId
+
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    """Everything needed to compute reports for any period in a range of days.
+
+    The inbox task rollups are those of the inbox tasks modified in the range,
+    indexed by the day they were modified. Rollups summed up over the modified
+    day sit under None, and count for any period in the range.
+    """
+
+    first_day: ADate
+    end_day: ADate
+    projects: list[Project]
+    metrics: list[Metric]
+    persons: list[Person]
+    habits: list[Habit]
+    chores: list[Chore]
+    big_plans: list[BigPlan]
+    inbox_task_rollups: dict[ADate | None, list[InboxTaskReportRollup]]
+
+    @staticmethod
+    def index_inbox_task_rollups(
+        inbox_task_rollups: Iterable[InboxTaskReportRollup],
+    ) -> dict[ADate | None, list[InboxTaskReportRollup]]:
+        """Index inbox task rollups by the day they were modified."""
+        result: dict[ADate | None, list[InboxTaskReportRollup]] = {}
+        for rollup in inbox_task_rollups:
+            result.setdefault(rollup.modified_day, []).append(rollup)
+        return result
+
+    def covers(self, first_day: ADate, end_day: ADate) -> bool:
+        """Whether a report for a period between two days can use the snapshot."""
+        return self.first_day <= first_day and end_day <= self.end_day
+
+    def find_report_rollups(
+        self,
+        filter_sources: (
+            Mapping[InboxTaskSource, Iterable[EntityId] | None] | None
+        ) = None,
+        filter_project_ref_ids: Iterable[EntityId] | None = None,
+        filter_modified_day_start: ADate | None = None,
+        filter_modified_day_end: ADate | None = None,
+        filter_event_day_start: ADate | None = None,
+        filter_event_day_end: ADate | None = None,
+        by_event_day: bool = False,
+        by_project: bool = False,
+        by_source_entity: bool = False,
+    ) -> list[InboxTaskReportRollup]:
+        """Sum up the inbox task rollups, like InboxTaskRepository.find_report_rollups."""
+        allowed_sources = (
+            {
+                source: (
+                    set(source_entity_ref_ids)
+                    if source_entity_ref_ids is not None
+                    else None
+                )
+                for source, source_entity_ref_ids in filter_sources.items()
+            }
+            if filter_sources is not None
+            else None
+        )
+        allowed_project_ref_ids = (
+            set(filter_project_ref_ids) if filter_project_ref_ids is not None else None
+        )
+
+        rollups = list(self.inbox_task_rollups.get(None, []))
+        modified_day = filter_modified_day_start or self.first_day
+        while modified_day <= (filter_modified_day_end or self.end_day):
+            rollups.extend(self.inbox_task_rollups.get(modified_day, []))
+            modified_day = modified_day.next_day()
+
+        totals: Counter[InboxTaskReportRollup] = Counter()
+        for rollup in rollups:
+            if allowed_sources is not None:
+                if rollup.source not in allowed_sources:
+                    continue
+                allowed_source_entity_ref_ids = allowed_sources[rollup.source]
+                if (
+                    allowed_source_entity_ref_ids is not None
+                    and rollup.source_entity_ref_id not in allowed_source_entity_ref_ids
+                ):
+                    continue
+            if (
+                allowed_project_ref_ids is not None
+                and rollup.project_ref_id not in allowed_project_ref_ids
+            ):
+                continue
+            if rollup.event_day is not None and (
+                (
+                    filter_event_day_start is not None
+                    and rollup.event_day < filter_event_day_start
+                )
+                or (
+                    filter_event_day_end is not None
+                    and rollup.event_day > filter_event_day_end
+                )
+            ):
+                continue
+
+            bucket = dataclasses.replace(
+                rollup,
+                modified_day=None,
+                event_day=rollup.event_day if by_event_day else None,
+                project_ref_id=rollup.project_ref_id if by_project else None,
+                source_entity_ref_id=(
+                    rollup.source_entity_ref_id if by_source_entity else None
+                ),
+                count=0,
+            )
+            totals[bucket] += rollup.count
+
+        return sorted(
+            (bucket.with_count(total) for bucket, total in totals.items() if total),
+            key=lambda r: (r.source.value, r.kind.value),
+        )
@@ -1,7 +1,7 @@
 """The domain service which constructs a report."""
 
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from itertools import groupby
 from operator import itemgetter
 from typing import Final, cast
@@ -25,6 +25,7 @@ from jupiter.core.domain.application.report.report_period_result import (
     WorkableBigPlan,
     WorkableSummary,
 )
+from jupiter.core.domain.application.report.report_snapshot import ReportSnapshot
 from jupiter.core.domain.concept.big_plans.big_plan import BigPlan
 from jupiter.core.domain.concept.big_plans.big_plan_collection import BigPlanCollection
 from jupiter.core.domain.concept.big_plans.big_plan_status import BigPlanStatus
@@ -32,15 +33,15 @@ from jupiter.core.domain.concept.chores.chore import Chore
 from jupiter.core.domain.concept.chores.chore_collection import ChoreCollection
 from jupiter.core.domain.concept.habits.habit import Habit
 from jupiter.core.domain.concept.habits.habit_collection import HabitCollection
-from jupiter.core.domain.concept.inbox_tasks.inbox_task import (
-    InboxTask,
-    InboxTaskRepository,
-)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTaskRepository
 from jupiter.core.domain.concept.inbox_tasks.inbox_task_collection import (
     InboxTaskCollection,
 )
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollup,
+    InboxTaskReportRollupKind,
+)
 from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
-from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
 from jupiter.core.domain.concept.metrics.metric import Metric
 from jupiter.core.domain.concept.metrics.metric_collection import MetricCollection
 from jupiter.core.domain.concept.persons.person import Person
@@ -93,8 +94,13 @@ class ReportService:
         filter_slack_task_ref_ids: list[EntityId] | None = None,
         filter_email_task_ref_ids: list[EntityId] | None = None,
         breakdown_period: RecurringTaskPeriod | None = None,
+        snapshot: ReportSnapshot | None = None,
     ) -> ReportPeriodResult:
-        """Compute the report."""
+        """Compute the report.
+
+        When computing many reports, a snapshot covering all of their periods can
+        be loaded once via load_snapshot and shared between them.
+        """
         if (
             not workspace.is_feature_available(WorkspaceFeature.PROJECTS)
             and filter_project_ref_ids is not None
@@ -163,163 +169,160 @@ class ReportService:
                 period,
             )
 
-        async with self._storage_engine.get_unit_of_work() as uow:
-            project_collection = await uow.get_for(ProjectCollection).load_by_parent(
-                workspace.ref_id,
-            )
-            projects = await uow.get_for(Project).find_all_generic(
-                parent_ref_id=project_collection.ref_id,
-                allow_archived=True,
-                ref_id=filter_project_ref_ids or NoFilter(),
-            )
-            filter_project_ref_ids = [p.ref_id for p in projects]
-            projects_by_ref_id: dict[EntityId, Project] = {
-                p.ref_id: p for p in projects
-            }
-            projects_by_name: dict[ProjectName, Project] = {p.name: p for p in projects}
-
-            inbox_task_collection = await uow.get_for(
-                InboxTaskCollection
-            ).load_by_parent(
-                workspace.ref_id,
-            )
-            habit_collection = await uow.get_for(HabitCollection).load_by_parent(
-                workspace.ref_id,
-            )
-            chore_collection = await uow.get_for(ChoreCollection).load_by_parent(
-                workspace.ref_id,
-            )
-            big_plan_collection = await uow.get_for(BigPlanCollection).load_by_parent(
-                workspace.ref_id,
-            )
-
-            metric_collection = await uow.get_for(MetricCollection).load_by_parent(
-                workspace.ref_id,
-            )
-            metrics = await uow.get_for(Metric).find_all(
-                parent_ref_id=metric_collection.ref_id,
-                allow_archived=True,
-                filter_ref_ids=filter_metric_ref_ids,
-            )
-            metrics_by_ref_id: dict[EntityId, Metric] = {m.ref_id: m for m in metrics}
+        schedule = schedules.get_schedule(
+            period,
+            EntityName("Helper"),
+            today.to_timestamp_at_end_of_day(),
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
 
-            person_collection = await uow.get_for(PersonCollection).load_by_parent(
-                workspace.ref_id,
+        if snapshot is None:
+            snapshot = await self._load_snapshot(
+                workspace,
+                schedule.first_day,
+                schedule.end_day,
+                filter_sources={
+                    source: source_entity_ref_ids
+                    for source, source_entity_ref_ids in {
+                        InboxTaskSource.USER: None,
+                        InboxTaskSource.BIG_PLAN: filter_big_plan_ref_ids,
+                        InboxTaskSource.HABIT: filter_habit_ref_ids,
+                        InboxTaskSource.CHORE: filter_chore_ref_ids,
+                        InboxTaskSource.METRIC: filter_metric_ref_ids,
+                        InboxTaskSource.PERSON_CATCH_UP: filter_person_ref_ids,
+                        InboxTaskSource.PERSON_BIRTHDAY: filter_person_ref_ids,
+                        InboxTaskSource.SLACK_TASK: filter_slack_task_ref_ids,
+                        InboxTaskSource.EMAIL_TASK: filter_email_task_ref_ids,
+                    }.items()
+                    if source in sources
+                },
+                filter_project_ref_ids=filter_project_ref_ids,
+                filter_metric_ref_ids=filter_metric_ref_ids,
+                filter_person_ref_ids=filter_person_ref_ids,
+                filter_habit_ref_ids=filter_habit_ref_ids,
+                filter_chore_ref_ids=filter_chore_ref_ids,
+                filter_big_plan_ref_ids=filter_big_plan_ref_ids,
+                by_modified_day=False,
             )
-            persons = await uow.get_for(Person).find_all(
-                parent_ref_id=person_collection.ref_id,
-                allow_archived=True,
-                filter_ref_ids=filter_person_ref_ids,
+        elif not snapshot.covers(schedule.first_day, schedule.end_day):
+            raise Exception(
+                f"The snapshot does not cover the period {schedule.first_day}-{schedule.end_day}"
             )
-            persons_by_ref_id = {p.ref_id: p for p in persons}
 
-            schedule = schedules.get_schedule(
-                period,
-                EntityName("Helper"),
-                today.to_timestamp_at_end_of_day(),
-                None,
-                None,
-                None,
-                None,
-                None,
-            )
+        # The snapshot might hold more than what the report is about, so
+        # everything is filtered again here.
+        projects = [
+            p
+            for p in snapshot.projects
+            if not filter_project_ref_ids or p.ref_id in filter_project_ref_ids
+        ]
+        filter_project_ref_ids = [p.ref_id for p in projects]
+        projects_by_ref_id: dict[EntityId, Project] = {p.ref_id: p for p in projects}
+        projects_by_name: dict[ProjectName, Project] = {p.name: p for p in projects}
+
+        metrics_by_ref_id: dict[EntityId, Metric] = {
+            m.ref_id: m
+            for m in snapshot.metrics
+            if filter_metric_ref_ids is None or m.ref_id in filter_metric_ref_ids
+        }
+        persons_by_ref_id: dict[EntityId, Person] = {
+            p.ref_id: p
+            for p in snapshot.persons
+            if filter_person_ref_ids is None or p.ref_id in filter_person_ref_ids
+        }
+
+        # Only these sources show up in reports, and some of them are
+        # limited to particular source entities.
+        source_entity_filters: dict[InboxTaskSource, list[EntityId] | None] = {
+            InboxTaskSource.USER: None,
+            InboxTaskSource.BIG_PLAN: filter_big_plan_ref_ids,
+            InboxTaskSource.HABIT: filter_habit_ref_ids,
+            InboxTaskSource.CHORE: filter_chore_ref_ids,
+            InboxTaskSource.METRIC: list(metrics_by_ref_id.keys()),
+            InboxTaskSource.PERSON_CATCH_UP: list(persons_by_ref_id.keys()),
+            InboxTaskSource.PERSON_BIRTHDAY: list(persons_by_ref_id.keys()),
+            InboxTaskSource.SLACK_TASK: filter_slack_task_ref_ids,
+            InboxTaskSource.EMAIL_TASK: filter_email_task_ref_ids,
+        }
+        filter_sources = {
+            source: source_entity_ref_ids
+            for source, source_entity_ref_ids in source_entity_filters.items()
+            if source in sources
+        }
+
+        # The rollups are keyed by the day each inbox task was last modified,
+        # so these look at the same inbox tasks as a scan of the ones modified
+        # in the period, without loading any of them.
+        rollups_by_event_day = snapshot.find_report_rollups(
+            filter_sources=filter_sources,
+            filter_project_ref_ids=filter_project_ref_ids,
+            filter_modified_day_start=schedule.first_day,
+            filter_modified_day_end=schedule.end_day,
+            by_event_day=True,
+        )
 
-            raw_all_inbox_tasks = await uow.get(
-                InboxTaskRepository
-            ).find_modified_in_range(
-                parent_ref_id=inbox_task_collection.ref_id,
-                allow_archived=True,
-                filter_sources=sources,
+        rollups_by_project: list[InboxTaskReportRollup] = []
+        if workspace.is_feature_available(WorkspaceFeature.PROJECTS):
+            rollups_by_project = snapshot.find_report_rollups(
+                filter_sources=filter_sources,
                 filter_project_ref_ids=filter_project_ref_ids,
-                filter_last_modified_time_start=schedule.first_day,
-                filter_last_modified_time_end=schedule.end_day.next_day(),
-            )
-            all_inbox_tasks = [
-                it
-                for it in raw_all_inbox_tasks
-                # (source is BIG_PLAN and (need to filter then (big_plan_ref_id in filter))
-                if it.source is InboxTaskSource.USER
-                or (
-                    it.source is InboxTaskSource.BIG_PLAN
-                    and (
-                        not (filter_big_plan_ref_ids is not None)
-                        or it.source_entity_ref_id_for_sure in filter_big_plan_ref_ids
-                    )
-                )
-                or (
-                    it.source is InboxTaskSource.HABIT
-                    and (
-                        not (filter_habit_ref_ids is not None)
-                        or it.source_entity_ref_id_for_sure in filter_habit_ref_ids
-                    )
-                )
-                or (
-                    it.source is InboxTaskSource.CHORE
-                    and (
-                        not (filter_chore_ref_ids is not None)
-                        or it.source_entity_ref_id_for_sure in filter_chore_ref_ids
-                    )
-                )
-                or (
-                    it.source is InboxTaskSource.METRIC
-                    and it.source_entity_ref_id_for_sure in metrics_by_ref_id
-                )
-                or (
-                    (
-                        it.source is InboxTaskSource.PERSON_CATCH_UP
-                        or it.source is InboxTaskSource.PERSON_BIRTHDAY
-                    )
-                    and it.source_entity_ref_id_for_sure in persons_by_ref_id
-                )
-                or (
-                    it.source is InboxTaskSource.SLACK_TASK
-                    and (
-                        not (filter_slack_task_ref_ids is not None)
-                        or it.source_entity_ref_id_for_sure in filter_slack_task_ref_ids
-                    )
-                )
-                or (
-                    it.source is InboxTaskSource.EMAIL_TASK
-                    and (
-                        not (filter_email_task_ref_ids is not None)
-                        or it.source_entity_ref_id_for_sure in filter_email_task_ref_ids
-                    )
-                )
-            ]
-
-            all_habits = await uow.get_for(Habit).find_all_generic(
-                parent_ref_id=habit_collection.ref_id,
-                allow_archived=True,
-                ref_id=filter_habit_ref_ids or NoFilter(),
-                project_ref_id=filter_project_ref_ids or NoFilter(),
+                filter_modified_day_start=schedule.first_day,
+                filter_modified_day_end=schedule.end_day,
+                filter_event_day_start=schedule.first_day,
+                filter_event_day_end=schedule.end_day,
+                by_project=True,
             )
-            all_habits_by_ref_id: dict[EntityId, Habit] = {
-                rt.ref_id: rt for rt in all_habits
-            }
 
-            all_chores = await uow.get_for(Chore).find_all_generic(
-                parent_ref_id=chore_collection.ref_id,
-                allow_archived=True,
-                ref_id=filter_chore_ref_ids or NoFilter(),
-                project_ref_id=filter_project_ref_ids or NoFilter(),
-            )
-            all_chores_by_ref_id: dict[EntityId, Chore] = {
-                rt.ref_id: rt for rt in all_chores
-            }
+        rollups_by_source_entity = snapshot.find_report_rollups(
+            filter_sources={
+                source: source_entity_ref_ids
+                for source, source_entity_ref_ids in filter_sources.items()
+                if source
+                in (
+                    InboxTaskSource.HABIT,
+                    InboxTaskSource.CHORE,
+                    InboxTaskSource.BIG_PLAN,
+                )
+            },
+            filter_project_ref_ids=filter_project_ref_ids,
+            filter_modified_day_start=schedule.first_day,
+            filter_modified_day_end=schedule.end_day,
+            filter_event_day_start=schedule.first_day,
+            filter_event_day_end=schedule.end_day,
+            by_source_entity=True,
+        )
 
-            all_big_plans = await uow.get_for(BigPlan).find_all_generic(
-                parent_ref_id=big_plan_collection.ref_id,
-                allow_archived=True,
-                ref_id=filter_big_plan_ref_ids or NoFilter(),
-                project_ref_id=filter_project_ref_ids or NoFilter(),
-            )
-            big_plans_by_ref_id: dict[EntityId, BigPlan] = {
-                bp.ref_id: bp for bp in all_big_plans
-            }
+        all_habits_by_ref_id: dict[EntityId, Habit] = {
+            rt.ref_id: rt
+            for rt in snapshot.habits
+            if (not filter_habit_ref_ids or rt.ref_id in filter_habit_ref_ids)
+            and (not filter_project_ref_ids or rt.project_ref_id in projects_by_ref_id)
+        }
+
+        all_chores_by_ref_id: dict[EntityId, Chore] = {
+            rt.ref_id: rt
+            for rt in snapshot.chores
+            if (not filter_chore_ref_ids or rt.ref_id in filter_chore_ref_ids)
+            and (not filter_project_ref_ids or rt.project_ref_id in projects_by_ref_id)
+        }
+
+        all_big_plans = [
+            bp
+            for bp in snapshot.big_plans
+            if (not filter_big_plan_ref_ids or bp.ref_id in filter_big_plan_ref_ids)
+            and (not filter_project_ref_ids or bp.project_ref_id in projects_by_ref_id)
+        ]
+        big_plans_by_ref_id: dict[EntityId, BigPlan] = {
+            bp.ref_id: bp for bp in all_big_plans
+        }
 
         global_inbox_tasks_summary = self._run_report_for_inbox_tasks(
             schedule,
-            all_inbox_tasks,
+            rollups_by_event_day,
         )
 
         if workspace.is_feature_available(WorkspaceFeature.BIG_PLANS):
@@ -341,14 +344,19 @@ class ReportService:
         # Build per project breakdown
 
         if workspace.is_feature_available(WorkspaceFeature.PROJECTS):
-            # all_inbox_tasks.groupBy(it -> it.project.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
+            # rollups_by_project.groupBy(it -> it.project.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
             per_project_inbox_tasks_summary = {
                 k: self._run_report_for_inbox_tasks(schedule, (vx[1] for vx in v))
                 for (k, v) in groupby(
                     sorted(
                         [
-                            (projects_by_ref_id[it.project_ref_id].name, it)
-                            for it in all_inbox_tasks
+                            (
+                                projects_by_ref_id[
+                                    cast(EntityId, r.project_ref_id)
+                                ].name,
+                                r,
+                            )
+                            for r in rollups_by_project
                         ],
                         key=itemgetter(0),
                     ),
@@ -410,7 +418,7 @@ class ReportService:
                 curr_date = curr_date.next_day()
 
             per_period_inbox_tasks_summary = {
-                k: self._run_report_for_inbox_tasks(v, all_inbox_tasks)
+                k: self._run_report_for_inbox_tasks(v, rollups_by_event_day)
                 for (k, v) in all_schedules.items()
             }
             per_period_big_plans_summary = {
@@ -431,7 +439,7 @@ class ReportService:
 
         # Build per habit breakdown
 
-        # all_inbox_tasks.groupBy(it -> it.habit.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
+        # rollups_by_source_entity.groupBy(it -> it.habit.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
         if workspace.is_feature_available(WorkspaceFeature.HABITS):
             per_habit_breakdown = [
                 hb
@@ -450,9 +458,9 @@ class ReportService:
                     for (k, v) in groupby(
                         sorted(
                             [
-                                (it.source_entity_ref_id, it)
-                                for it in all_inbox_tasks
-                                if it.source == InboxTaskSource.HABIT
+                                (r.source_entity_ref_id, r)
+                                for r in rollups_by_source_entity
+                                if r.source == InboxTaskSource.HABIT
                             ],
                             key=itemgetter(0),
                         ),
@@ -466,7 +474,7 @@ class ReportService:
 
         # Build per chore breakdown
 
-        # all_inbox_tasks.groupBy(it -> it.chore.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
+        # rollups_by_source_entity.groupBy(it -> it.chore.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
         if workspace.is_feature_available(WorkspaceFeature.CHORES):
             per_chore_breakdown = [
                 cb
@@ -485,9 +493,9 @@ class ReportService:
                     for (k, v) in groupby(
                         sorted(
                             [
-                                (it.source_entity_ref_id, it)
-                                for it in all_inbox_tasks
-                                if it.source == InboxTaskSource.CHORE
+                                (r.source_entity_ref_id, r)
+                                for r in rollups_by_source_entity
+                                if r.source == InboxTaskSource.CHORE
                             ],
                             key=itemgetter(0),
                         ),
@@ -501,7 +509,7 @@ class ReportService:
 
         # Build per big plan breakdown
 
-        # all_inbox_tasks.groupBy(it -> it.bigPlan.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
+        # rollups_by_source_entity.groupBy(it -> it.bigPlan.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
         if workspace.is_feature_available(WorkspaceFeature.BIG_PLANS):
             per_big_plan_breakdown = [
                 bb
@@ -518,9 +526,9 @@ class ReportService:
                     for (k, v) in groupby(
                         sorted(
                             [
-                                (it.source_entity_ref_id, it)
-                                for it in all_inbox_tasks
-                                if it.source == InboxTaskSource.BIG_PLAN
+                                (r.source_entity_ref_id, r)
+                                for r in rollups_by_source_entity
+                                if r.source == InboxTaskSource.BIG_PLAN
                             ],
                             key=itemgetter(0),
                         ),
@@ -556,115 +564,212 @@ class ReportService:
             user_score_overview=user_score_overview,
         )
 
+    async def load_snapshot(
+        self, workspace: Workspace, first_day: ADate, end_day: ADate
+    ) -> ReportSnapshot:
+        """Load everything needed to compute reports for any period between two days."""
+        return await self._load_snapshot(
+            workspace,
+            first_day,
+            end_day,
+            filter_sources=None,
+            filter_project_ref_ids=None,
+            filter_metric_ref_ids=None,
+            filter_person_ref_ids=None,
+            filter_habit_ref_ids=None,
+            filter_chore_ref_ids=None,
+            filter_big_plan_ref_ids=None,
+            by_modified_day=True,
+        )
+
+    async def _load_snapshot(
+        self,
+        workspace: Workspace,
+        first_day: ADate,
+        end_day: ADate,
+        filter_sources: Mapping[InboxTaskSource, list[EntityId] | None] | None,
+        filter_project_ref_ids: list[EntityId] | None,
+        filter_metric_ref_ids: list[EntityId] | None,
+        filter_person_ref_ids: list[EntityId] | None,
+        filter_habit_ref_ids: list[EntityId] | None,
+        filter_chore_ref_ids: list[EntityId] | None,
+        filter_big_plan_ref_ids: list[EntityId] | None,
+        by_modified_day: bool,
+    ) -> ReportSnapshot:
+        async with self._storage_engine.get_unit_of_work() as uow:
+            project_collection = await uow.get_for(ProjectCollection).load_by_parent(
+                workspace.ref_id,
+            )
+            projects = await uow.get_for(Project).find_all_generic(
+                parent_ref_id=project_collection.ref_id,
+                allow_archived=True,
+                ref_id=filter_project_ref_ids or NoFilter(),
+            )
+
+            metric_collection = await uow.get_for(MetricCollection).load_by_parent(
+                workspace.ref_id,
+            )
+            metrics = await uow.get_for(Metric).find_all(
+                parent_ref_id=metric_collection.ref_id,
+                allow_archived=True,
+                filter_ref_ids=filter_metric_ref_ids,
+            )
+
+            person_collection = await uow.get_for(PersonCollection).load_by_parent(
+                workspace.ref_id,
+            )
+            persons = await uow.get_for(Person).find_all(
+                parent_ref_id=person_collection.ref_id,
+                allow_archived=True,
+                filter_ref_ids=filter_person_ref_ids,
+            )
+
+            # A report only needs the rollups summed up over the days tasks were
+            # modified on, as long as it's for the whole range.
+            inbox_task_collection = await uow.get_for(
+                InboxTaskCollection
+            ).load_by_parent(
+                workspace.ref_id,
+            )
+            inbox_task_rollups = await uow.get(InboxTaskRepository).find_report_rollups(
+                parent_ref_id=inbox_task_collection.ref_id,
+                filter_sources=filter_sources,
+                filter_project_ref_ids=(
+                    [p.ref_id for p in projects] if filter_project_ref_ids else None
+                ),
+                filter_modified_day_start=first_day,
+                filter_modified_day_end=end_day,
+                by_modified_day=by_modified_day,
+                by_event_day=True,
+                by_project=True,
+                by_source_entity=True,
+            )
+
+            habit_collection = await uow.get_for(HabitCollection).load_by_parent(
+                workspace.ref_id,
+            )
+            habits = await uow.get_for(Habit).find_all_generic(
+                parent_ref_id=habit_collection.ref_id,
+                allow_archived=True,
+                ref_id=filter_habit_ref_ids or NoFilter(),
+            )
+
+            chore_collection = await uow.get_for(ChoreCollection).load_by_parent(
+                workspace.ref_id,
+            )
+            chores = await uow.get_for(Chore).find_all_generic(
+                parent_ref_id=chore_collection.ref_id,
+                allow_archived=True,
+                ref_id=filter_chore_ref_ids or NoFilter(),
+            )
+
+            big_plan_collection = await uow.get_for(BigPlanCollection).load_by_parent(
+                workspace.ref_id,
+            )
+            big_plans = await uow.get_for(BigPlan).find_all_generic(
+                parent_ref_id=big_plan_collection.ref_id,
+                allow_archived=True,
+                ref_id=filter_big_plan_ref_ids or NoFilter(),
+            )
+
+        return ReportSnapshot(
+            first_day=first_day,
+            end_day=end_day,
+            projects=projects,
+            metrics=metrics,
+            persons=persons,
+            habits=habits,
+            chores=chores,
+            big_plans=big_plans,
+            inbox_task_rollups=ReportSnapshot.index_inbox_task_rollups(
+                inbox_task_rollups
+            ),
+        )
+
     @staticmethod
     def _run_report_for_inbox_tasks(
         schedule: Schedule,
-        inbox_tasks: Iterable[InboxTask],
+        rollups: Iterable[InboxTaskReportRollup],
     ) -> InboxTasksSummary:
-        created_cnt_total = 0
+        # Rollups without an event day were already limited to the schedule.
+        touched_per_source_cnt: defaultdict[InboxTaskSource, int] = defaultdict(int)
         created_per_source_cnt: defaultdict[InboxTaskSource, int] = defaultdict(int)
-        not_started_cnt_total = 0
-        not_started_per_source_cnt: defaultdict[InboxTaskSource, int] = defaultdict(int)
-        working_cnt_total = 0
         working_per_source_cnt: defaultdict[InboxTaskSource, int] = defaultdict(int)
-        done_cnt_total = 0
         done_per_source_cnt: defaultdict[InboxTaskSource, int] = defaultdict(int)
-        not_done_cnt_total = 0
         not_done_per_source_cnt: defaultdict[InboxTaskSource, int] = defaultdict(int)
-
-        for inbox_task in inbox_tasks:
-            if schedule.contains_timestamp(inbox_task.created_time):
-                created_cnt_total += 1
-                created_per_source_cnt[inbox_task.source] += 1
-
-            if inbox_task.status.is_completed and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.completed_time),
-            ):
-                if inbox_task.status == InboxTaskStatus.DONE:
-                    done_cnt_total += 1
-                    done_per_source_cnt[inbox_task.source] += 1
-                else:
-                    not_done_cnt_total += 1
-                    not_done_per_source_cnt[inbox_task.source] += 1
-            elif inbox_task.status.is_working and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.working_time),
-            ):
-                working_cnt_total += 1
-                working_per_source_cnt[inbox_task.source] += 1
-            else:
-                not_started_cnt_total += 1
-                not_started_per_source_cnt[inbox_task.source] += 1
-
-        return InboxTasksSummary(
-            created=NestedResult(
-                total_cnt=created_cnt_total,
-                per_source_cnt=list(
-                    NestedResultPerSource(a, b)
-                    for a, b in created_per_source_cnt.items()
-                ),
-            ),
-            not_started=NestedResult(
-                total_cnt=not_started_cnt_total,
-                per_source_cnt=list(
-                    NestedResultPerSource(a, b)
-                    for a, b in not_started_per_source_cnt.items()
-                ),
-            ),
-            working=NestedResult(
-                total_cnt=working_cnt_total,
-                per_source_cnt=list(
-                    NestedResultPerSource(a, b)
-                    for a, b in working_per_source_cnt.items()
-                ),
-            ),
-            not_done=NestedResult(
-                total_cnt=not_done_cnt_total,
+        event_day_in_schedule: dict[ADate, bool] = {}
+
+        for rollup in rollups:
+            if rollup.kind == InboxTaskReportRollupKind.TOUCHED:
+                touched_per_source_cnt[rollup.source] += rollup.count
+                continue
+
+            if rollup.event_day is not None:
+                if rollup.event_day not in event_day_in_schedule:
+                    event_day_in_schedule[rollup.event_day] = (
+                        schedule.contains_timestamp(
+                            rollup.event_day.to_timestamp_at_start_of_day()
+                        )
+                    )
+                if not event_day_in_schedule[rollup.event_day]:
+                    continue
+
+            if rollup.kind == InboxTaskReportRollupKind.CREATED:
+                created_per_source_cnt[rollup.source] += rollup.count
+            elif rollup.kind == InboxTaskReportRollupKind.WORKING:
+                working_per_source_cnt[rollup.source] += rollup.count
+            elif rollup.kind == InboxTaskReportRollupKind.DONE:
+                done_per_source_cnt[rollup.source] += rollup.count
+            elif rollup.kind == InboxTaskReportRollupKind.NOT_DONE:
+                not_done_per_source_cnt[rollup.source] += rollup.count
+
+        # Every inbox task which wasn't worked on or completed in the schedule
+        # counts as not started.
+        not_started_per_source_cnt: dict[InboxTaskSource, int] = {}
+        for source, touched_cnt in touched_per_source_cnt.items():
+            not_started_cnt = (
+                touched_cnt
+                - working_per_source_cnt[source]
+                - done_per_source_cnt[source]
+                - not_done_per_source_cnt[source]
+            )
+            if not_started_cnt > 0:
+                not_started_per_source_cnt[source] = not_started_cnt
+
+        def nested_result(
+            per_source_cnt: Mapping[InboxTaskSource, int],
+        ) -> NestedResult:
+            return NestedResult(
+                total_cnt=sum(per_source_cnt.values()),
                 per_source_cnt=list(
                     NestedResultPerSource(a, b)
-                    for a, b in not_done_per_source_cnt.items()
-                ),
-            ),
-            done=NestedResult(
-                total_cnt=done_cnt_total,
-                per_source_cnt=list(
-                    NestedResultPerSource(a, b) for a, b in done_per_source_cnt.items()
+                    for a, b in per_source_cnt.items()
+                    if b > 0
                 ),
-            ),
+            )
+
+        return InboxTasksSummary(
+            created=nested_result(created_per_source_cnt),
+            not_started=nested_result(not_started_per_source_cnt),
+            working=nested_result(working_per_source_cnt),
+            not_done=nested_result(not_done_per_source_cnt),
+            done=nested_result(done_per_source_cnt),
         )
 
     @staticmethod
     def _run_report_for_inbox_tasks_for_big_plan(
         schedule: Schedule,
-        inbox_tasks: Iterable[InboxTask],
+        rollups: Iterable[InboxTaskReportRollup],
     ) -> BigPlanWorkSummary:
-        created_cnt = 0
-        not_started_cnt = 0
-        working_cnt = 0
-        done_cnt = 0
-        not_done_cnt = 0
-
-        for inbox_task in inbox_tasks:
-            if schedule.contains_timestamp(inbox_task.created_time):
-                created_cnt += 1
-
-            if inbox_task.status.is_completed and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.completed_time),
-            ):
-                if inbox_task.status == InboxTaskStatus.DONE:
-                    done_cnt += 1
-                else:
-                    not_done_cnt += 1
-            elif inbox_task.status.is_working and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.working_time),
-            ):
-                working_cnt += 1
-            else:
-                not_started_cnt += 1
+        summary = ReportService._run_report_for_inbox_tasks(schedule, rollups)
+        created_cnt = summary.created.total_cnt
+        not_done_cnt = summary.not_done.total_cnt
+        done_cnt = summary.done.total_cnt
 
         return BigPlanWorkSummary(
             created_cnt=created_cnt,
-            not_started_cnt=not_started_cnt,
-            working_cnt=working_cnt,
+            not_started_cnt=summary.not_started.total_cnt,
+            working_cnt=summary.working.total_cnt,
             not_done_cnt=not_done_cnt,
             not_done_ratio=(
                 not_done_cnt / float(created_cnt) if created_cnt > 0 else 0.0
@@ -676,37 +781,18 @@ class ReportService:
     @staticmethod
     def _run_report_for_inbox_for_recurring_tasks(
         schedule: Schedule,
-        inbox_tasks: list[InboxTask],
+        rollups: Iterable[InboxTaskReportRollup],
     ) -> RecurringTaskWorkSummary:
         # The simple summary computations here.
-        created_cnt = 0
-        not_started_cnt = 0
-        working_cnt = 0
-        done_cnt = 0
-        not_done_cnt = 0
-
-        for inbox_task in inbox_tasks:
-            if schedule.contains_timestamp(inbox_task.created_time):
-                created_cnt += 1
-
-            if inbox_task.status.is_completed and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.completed_time),
-            ):
-                if inbox_task.status == InboxTaskStatus.DONE:
-                    done_cnt += 1
-                else:
-                    not_done_cnt += 1
-            elif inbox_task.status.is_working and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.working_time),
-            ):
-                working_cnt += 1
-            else:
-                not_started_cnt += 1
+        summary = ReportService._run_report_for_inbox_tasks(schedule, rollups)
+        created_cnt = summary.created.total_cnt
+        not_done_cnt = summary.not_done.total_cnt
+        done_cnt = summary.done.total_cnt
 
         return RecurringTaskWorkSummary(
             created_cnt=created_cnt,
-            not_started_cnt=not_started_cnt,
-            working_cnt=working_cnt,
+            not_started_cnt=summary.not_started.total_cnt,
+            working_cnt=summary.working.total_cnt,
             not_done_cnt=not_done_cnt,
             not_done_ratio=(
                 not_done_cnt / float(created_cnt) if created_cnt > 0 else 0.0
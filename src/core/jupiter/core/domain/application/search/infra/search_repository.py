@@ -29,10 +29,22 @@ class SearchRepository(Repository, abc.ABC):
     async def upsert(self, workspace_ref_id: EntityId, entity: CrownEntity) -> None:
         """Add an entity and make it available for searching."""
 
+    @abc.abstractmethod
+    async def upsert_many(
+        self, workspace_ref_id: EntityId, entities: Iterable[CrownEntity]
+    ) -> None:
+        """Add several entities and make them available for searching."""
+
     @abc.abstractmethod
     async def remove(self, workspace_ref_id: EntityId, entity: CrownEntity) -> None:
         """Remove an entity from the search index."""
 
+    @abc.abstractmethod
+    async def remove_many(
+        self, workspace_ref_id: EntityId, entities: Iterable[CrownEntity]
+    ) -> None:
+        """Remove several entities from the search index."""
+
     @abc.abstractmethod
     async def drop(self, workspace_ref_id: EntityId) -> None:
         """Remove all entries from the search index for a particular workspace."""
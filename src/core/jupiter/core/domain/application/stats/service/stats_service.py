@@ -35,12 +35,14 @@ from jupiter.core.domain.concept.journals.journal_stats import (
 )
 from jupiter.core.domain.concept.user.user import User
 from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.core import schedules
 from jupiter.core.domain.core.adate import ADate
 from jupiter.core.domain.core.recurring_task_period import RecurringTaskPeriod
 from jupiter.core.domain.features import UserFeature, WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainStorageEngine
 from jupiter.core.domain.sync_target import SyncTarget
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.entity_name import EntityName
 from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.entity import NoFilter
 from jupiter.core.framework.use_case import ProgressReporter
@@ -96,7 +98,7 @@ class StatsService:
             and SyncTarget.HABITS in stats_targets
         ):
             async with progress_reporter.section("Computing stats for habits"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_habits = await uow.get_for(Habit).find_all_generic(
                         parent_ref_id=habit_collection.ref_id,
                         allow_archived=False,
@@ -105,7 +107,7 @@ class StatsService:
                         ),
                     )
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_inbox_tasks = await uow.get_for(InboxTask).find_all_generic(
                         parent_ref_id=inbox_task_collection.ref_id,
                         allow_archived=True,
@@ -132,7 +134,7 @@ class StatsService:
             and SyncTarget.BIG_PLANS in stats_targets
         ):
             async with progress_reporter.section("Computing stats for big plans"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_big_plans = await uow.get_for(BigPlan).find_all_generic(
                         parent_ref_id=big_plan_collection.ref_id,
                         allow_archived=False,
@@ -143,7 +145,7 @@ class StatsService:
                         ),
                     )
 
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_inbox_tasks = await uow.get_for(InboxTask).find_all_generic(
                         parent_ref_id=inbox_task_collection.ref_id,
                         allow_archived=True,
@@ -170,7 +172,7 @@ class StatsService:
             and SyncTarget.JOURNALS in stats_targets
         ):
             async with progress_reporter.section("Computing stats for journals"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     if filter_journal_ref_ids:
                         all_journals = await uow.get(
                             JournalRepository
@@ -204,7 +206,7 @@ class StatsService:
             and SyncTarget.GAMIFICATION in stats_targets
         ):
             async with progress_reporter.section("Computing stats for gamification"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                async with self._domain_storage_engine.get_read_unit_of_work() as uow:
                     all_inbox_tasks_last_year = await uow.get(
                         InboxTaskRepository
                     ).find_completed_in_range(
@@ -333,26 +335,54 @@ class StatsService:
         all_journals: list[Journal],
         stats_log_entry: StatsLogEntry,
     ) -> StatsLogEntry:
+        if len(all_journals) == 0:
+            return stats_log_entry
+
         report_service = ReportService(self._domain_storage_engine)
 
+        # Load everything once for the union of the journals' periods, instead
+        # of once per journal.
+        journal_schedules = [
+            schedules.get_schedule(
+                journal.period,
+                EntityName("Helper"),
+                journal.right_now.to_timestamp_at_end_of_day(),
+                None,
+                None,
+                None,
+                None,
+                None,
+            )
+            for journal in all_journals
+        ]
+        snapshot = await report_service.load_snapshot(
+            workspace,
+            min(s.first_day for s in journal_schedules),
+            max(s.end_day for s in journal_schedules),
+        )
+
+        all_journal_stats = []
         for journal in all_journals:
             report_period_result = await report_service.do_it(
                 user=user,
                 workspace=workspace,
                 today=journal.right_now,
                 period=journal.period,
+                snapshot=snapshot,
             )
 
-            new_journal_stats = JournalStats.new_stats_for_journal(
-                ctx,
-                journal_ref_id=journal.ref_id,
-                report=report_period_result,
+            all_journal_stats.append(
+                JournalStats.new_stats_for_journal(
+                    ctx,
+                    journal_ref_id=journal.ref_id,
+                    report=report_period_result,
+                )
             )
 
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                new_journal_stats = await uow.get(JournalStatsRepository).save(
-                    new_journal_stats
-                )
+        async with self._domain_storage_engine.get_unit_of_work() as uow:
+            await uow.get(JournalStatsRepository).upsert_many(all_journal_stats)
+
+        for journal in all_journals:
             await progress_reporter.mark_updated(journal)
             stats_log_entry = stats_log_entry.add_entity_updated(ctx, journal)
 
@@ -368,31 +398,16 @@ class StatsService:
         all_big_plans_last_year: list[BigPlan],
         stats_log_entry: StatsLogEntry,
     ) -> StatsLogEntry:
-        record_score_service = RecordScoreService()
-        for inbox_task in all_inbox_tasks_last_year:
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                record_score_result = await record_score_service.record_task(
-                    ctx,
-                    uow,
-                    user,
-                    inbox_task,
-                )
-                if record_score_result is not None:
-                    await progress_reporter.mark_updated(inbox_task)
-                    stats_log_entry = stats_log_entry.add_entity_updated(
-                        ctx, inbox_task
-                    )
+        async with self._domain_storage_engine.get_unit_of_work() as uow:
+            recorded_tasks = await RecordScoreService().record_many_tasks(
+                ctx,
+                uow,
+                user,
+                [*all_inbox_tasks_last_year, *all_big_plans_last_year],
+            )
 
-        for big_plan in all_big_plans_last_year:
-            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                record_score_result = await record_score_service.record_task(
-                    ctx,
-                    uow,
-                    user,
-                    big_plan,
-                )
-                if record_score_result is not None:
-                    await progress_reporter.mark_updated(big_plan)
-                    stats_log_entry = stats_log_entry.add_entity_updated(ctx, big_plan)
+        for task in recorded_tasks:
+            await progress_reporter.mark_updated(task)
+            stats_log_entry = stats_log_entry.add_entity_updated(ctx, task)
 
         return stats_log_entry
@@ -2,10 +2,14 @@
 
 import abc
 import textwrap
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import ClassVar
 
 from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollup,
+    InboxTaskReportRollupKind,
+)
 from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
 from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
 from jupiter.core.domain.concept.push_integrations.email.email_user_name import (
@@ -991,6 +995,35 @@ class InboxTask(LeafEntity):
         """Whether this task is complete or not."""
         return self.status.is_completed
 
+    @property
+    def report_rollups(self) -> list[InboxTaskReportRollup]:
+        """What this task contributes to the report rollups, one bucket each."""
+        modified_day = ADate.from_date(self.last_modified_time.as_date())
+        events = [
+            (InboxTaskReportRollupKind.TOUCHED, self.last_modified_time),
+            (InboxTaskReportRollupKind.CREATED, self.created_time),
+        ]
+        if self.status == InboxTaskStatus.DONE and self.completed_time is not None:
+            events.append((InboxTaskReportRollupKind.DONE, self.completed_time))
+        elif (
+            self.status == InboxTaskStatus.NOT_DONE and self.completed_time is not None
+        ):
+            events.append((InboxTaskReportRollupKind.NOT_DONE, self.completed_time))
+        elif self.status.is_working and self.working_time is not None:
+            events.append((InboxTaskReportRollupKind.WORKING, self.working_time))
+        return [
+            InboxTaskReportRollup(
+                modified_day=modified_day,
+                event_day=ADate.from_date(event_time.as_date()),
+                project_ref_id=self.project_ref_id,
+                source=self.source,
+                source_entity_ref_id=self.source_entity_ref_id,
+                kind=kind,
+                count=1,
+            )
+            for kind, event_time in events
+        ]
+
     @staticmethod
     def _build_name_for_working_mem_cleanup(
         recurring_task_timeline: str,
@@ -1151,3 +1184,39 @@ class InboxTaskRepository(LeafEntityRepository[InboxTask], abc.ABC):
         filter_exclude_ref_ids: Iterable[EntityId] | None = None,
     ) -> list[InboxTask]:
         """Find all completed inbox tasks in a time range."""
+
+    @abc.abstractmethod
+    async def find_report_rollups(
+        self,
+        parent_ref_id: EntityId,
+        filter_sources: (
+            Mapping[InboxTaskSource, Iterable[EntityId] | None] | None
+        ) = None,
+        filter_project_ref_ids: Iterable[EntityId] | None = None,
+        filter_modified_day_start: ADate | None = None,
+        filter_modified_day_end: ADate | None = None,
+        filter_event_day_start: ADate | None = None,
+        filter_event_day_end: ADate | None = None,
+        by_modified_day: bool = False,
+        by_event_day: bool = False,
+        by_project: bool = False,
+        by_source_entity: bool = False,
+    ) -> list[InboxTaskReportRollup]:
+        """Sum up the report rollups of the inbox tasks, keeping only some dimensions.
+
+        The day ranges are inclusive. The sources filter maps each allowed source to
+        the source entities allowed for it, or to None to allow all of them.
+        """
+
+    @abc.abstractmethod
+    async def rebuild_report_rollups(
+        self,
+        parent_ref_id: EntityId,
+        after_ref_id: EntityId | None,
+        limit: int,
+    ) -> EntityId | None:
+        """Rebuild the report rollups for the next chunk of inbox tasks in a collection.
+
+        Rebuilding starts by clearing the rollups of the collection when there's
+        no previous chunk. Returns the last inbox task of the chunk, if any.
+        """
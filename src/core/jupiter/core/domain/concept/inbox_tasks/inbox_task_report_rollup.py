@@ -0,0 +1,42 @@
+"""Daily counts of inbox task activity, kept up to date for reports."""
+
+import dataclasses
+
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.value import CompositeValue, EnumValue, enum_value, value
+
+
+@enum_value
+class InboxTaskReportRollupKind(EnumValue):
+    """What an inbox task contributes to a report rollup."""
+
+    # Every inbox task is touched on the day it was last modified.
+    TOUCHED = "touched"
+    CREATED = "created"
+    WORKING = "working"
+    NOT_DONE = "not-done"
+    DONE = "done"
+
+
+@value
+class InboxTaskReportRollup(CompositeValue):
+    """The number of inbox tasks which fall into a particular bucket.
+
+    A bucket groups inbox tasks by the day they were last modified, the day the
+    counted thing happened, their project, their source, and what is counted.
+    When rollups are summed up, the dimensions which aren't kept are None.
+    """
+
+    modified_day: ADate | None
+    event_day: ADate | None
+    project_ref_id: EntityId | None
+    source: InboxTaskSource
+    source_entity_ref_id: EntityId | None
+    kind: InboxTaskReportRollupKind
+    count: int
+
+    def with_count(self, count: int) -> "InboxTaskReportRollup":
+        """The same bucket, with a different number of inbox tasks."""
+        return dataclasses.replace(self, count=count)
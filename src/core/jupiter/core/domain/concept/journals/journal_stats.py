@@ -60,3 +60,7 @@ class JournalStats(Record):
 
 class JournalStatsRepository(RecordRepository[JournalStats, EntityId], abc.ABC):
     """A repository of journal stats."""
+
+    @abc.abstractmethod
+    async def upsert_many(self, records: list[JournalStats]) -> None:
+        """Create or overwrite the stats of many journals at once."""
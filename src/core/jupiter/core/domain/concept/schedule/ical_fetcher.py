@@ -0,0 +1,38 @@
+"""A way of fetching external iCal calendars."""
+
+from abc import ABC, abstractmethod
+
+from jupiter.core.domain.core.url import URL
+from jupiter.core.framework.value import CompositeValue, value
+
+
+class ICalFetchError(Exception):
+    """Error raised when an iCal cannot be fetched."""
+
+
+@value
+class ICalFetchResult(CompositeValue):
+    """The result of fetching an iCal.
+
+    The content is None when the server said the iCal was not modified since
+    the etag or the last modified time that were sent along.
+    """
+
+    content: str | None
+    etag: str | None
+    last_modified: str | None
+
+    @property
+    def not_modified(self) -> bool:
+        """Whether the iCal was not modified since it was last fetched."""
+        return self.content is None
+
+
+class ICalFetcher(ABC):
+    """A way of fetching external iCal calendars."""
+
+    @abstractmethod
+    async def fetch(
+        self, url: URL, etag: str | None, last_modified: str | None
+    ) -> ICalFetchResult:
+        """Fetch an iCal, conditional on it having changed since the etag or last modified time."""
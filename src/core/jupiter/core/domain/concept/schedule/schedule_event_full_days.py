@@ -36,6 +36,7 @@ class ScheduleEventFullDays(LeafEntity):
     source: ScheduleSource
     name: ScheduleEventName
     external_uid: ScheduleExternalUid | None
+    external_content_hash: str | None
 
     time_event_full_days_block = OwnsOne(
         TimeEventFullDaysBlock,
@@ -62,6 +63,7 @@ class ScheduleEventFullDays(LeafEntity):
             source=ScheduleSource.USER,
             name=name,
             external_uid=None,
+            external_content_hash=None,
         )
 
     @staticmethod
@@ -72,6 +74,7 @@ class ScheduleEventFullDays(LeafEntity):
         schedule_stream_ref_id: EntityId,
         name: ScheduleEventName,
         external_uid: ScheduleExternalUid,
+        external_content_hash: str,
     ) -> "ScheduleEventFullDays":
         """Create a schedule event from an external iCal."""
         return ScheduleEventFullDays._create(
@@ -81,6 +84,7 @@ class ScheduleEventFullDays(LeafEntity):
             source=ScheduleSource.EXTERNAL_ICAL,
             name=name,
             external_uid=external_uid,
+            external_content_hash=external_content_hash,
         )
 
     @update_entity_action
@@ -109,6 +113,22 @@ class ScheduleEventFullDays(LeafEntity):
             name=name.or_else(self.name),
         )
 
+    @update_entity_action
+    def update_from_external_ical(
+        self,
+        ctx: DomainContext,
+        name: ScheduleEventName,
+        external_content_hash: str,
+    ) -> "ScheduleEventFullDays":
+        """Update the schedule event from its external iCal event."""
+        if self.source != ScheduleSource.EXTERNAL_ICAL:
+            raise Exception("Cannot update a user event from an external iCal.")
+        return self._new_version(
+            ctx,
+            name=name,
+            external_content_hash=external_content_hash,
+        )
+
     @property
     def can_be_modified_independently(self) -> bool:
         """Return whether the event can be modified independently."""
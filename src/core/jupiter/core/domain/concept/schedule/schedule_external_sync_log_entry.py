@@ -24,11 +24,16 @@ from jupiter.core.framework.value import CompositeValue, value
 
 @value
 class ScheduleExternalSyncLogPerStreamResult(CompositeValue):
-    """The result of syncing a stream."""
+    """The result of syncing a stream.
+
+    The count of unchanged events is None when the events of the stream were
+    not looked at, because the iCal itself was unchanged or it failed to sync.
+    """
 
     schedule_stream_ref_id: EntityId
     success: bool
     error_msg: str | None
+    unchanged_events_cnt: int | None
 
 
 @entity
@@ -84,6 +89,7 @@ class ScheduleExternalSyncLogEntry(LeafEntity):
         self,
         ctx: DomainContext,
         schedule_stream_ref_id: EntityId,
+        unchanged_events_cnt: int | None,
     ) -> "ScheduleExternalSyncLogEntry":
         """Mark a stream as successfully synced."""
         if not self.opened:
@@ -96,6 +102,7 @@ class ScheduleExternalSyncLogEntry(LeafEntity):
                     schedule_stream_ref_id=schedule_stream_ref_id,
                     success=True,
                     error_msg=None,
+                    unchanged_events_cnt=unchanged_events_cnt,
                 ),
             ],
         )
@@ -118,6 +125,7 @@ class ScheduleExternalSyncLogEntry(LeafEntity):
                     schedule_stream_ref_id=schedule_stream_ref_id,
                     success=False,
                     error_msg=error_msg,
+                    unchanged_events_cnt=None,
                 ),
             ],
         )
@@ -12,6 +12,9 @@ from jupiter.core.domain.concept.schedule.schedule_source import (
 from jupiter.core.domain.concept.schedule.schedule_stream_color import (
     ScheduleStreamColor,
 )
+from jupiter.core.domain.concept.schedule.schedule_stream_ical_fingerprint import (
+    ScheduleStreamIcalFingerprint,
+)
 from jupiter.core.domain.concept.schedule.schedule_stream_name import ScheduleStreamName
 from jupiter.core.domain.core.notes.note import Note
 from jupiter.core.domain.core.notes.note_domain import NoteDomain
@@ -45,6 +48,7 @@ class ScheduleStream(LeafEntity):
     name: ScheduleStreamName
     color: ScheduleStreamColor
     source_ical_url: URL | None
+    source_ical_fingerprint: ScheduleStreamIcalFingerprint | None
 
     in_day_events = OwnsMany(ScheduleEventInDay, schedule_stream_ref_id=IsRefId())
     full_days_events = OwnsMany(ScheduleEventFullDays, schedule_stream_ref_id=IsRefId())
@@ -68,6 +72,7 @@ class ScheduleStream(LeafEntity):
             name=name,
             color=color,
             source_ical_url=None,
+            source_ical_fingerprint=None,
         )
 
     @staticmethod
@@ -87,6 +92,7 @@ class ScheduleStream(LeafEntity):
             name=name,
             color=color,
             source_ical_url=source_ical_url,
+            source_ical_fingerprint=None,
         )
 
     @update_entity_action
@@ -103,6 +109,22 @@ class ScheduleStream(LeafEntity):
             color=color.or_else(self.color),
         )
 
+    @update_entity_action
+    def record_ical_fingerprint(
+        self,
+        ctx: DomainContext,
+        source_ical_fingerprint: ScheduleStreamIcalFingerprint,
+    ) -> "ScheduleStream":
+        """Record what was synced from the external iCal."""
+        if self.source != ScheduleSource.EXTERNAL_ICAL:
+            raise CannotModifyScheduleStreamError(
+                "Only schedule streams from an external iCal can have a fingerprint"
+            )
+        return self._new_version(
+            ctx,
+            source_ical_fingerprint=source_ical_fingerprint,
+        )
+
     @property
     def can_be_modified_independently(self) -> bool:
         """Return whether the schedule can be modified independently."""
@@ -0,0 +1,60 @@
+"""What was last synced from the external iCal of a schedule stream."""
+
+import dataclasses
+import hashlib
+
+from jupiter.core.domain.concept.schedule.ical_fetcher import ICalFetchResult
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.framework.value import CompositeValue, value
+
+
+@value
+class ScheduleStreamIcalFingerprint(CompositeValue):
+    """What was last synced from the external iCal of a schedule stream.
+
+    The etag and last modified time come from the server, and are sent back to
+    it to skip fetching an unchanged iCal. The content hash catches unchanged
+    iCals from servers which don't support that. Events are only synced within
+    a window of days, so a fingerprint only holds for the window it was made in.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    content_hash: str
+    start_of_window: ADate
+    end_of_window: ADate
+
+    @staticmethod
+    def from_fetch_result(
+        fetch_result: ICalFetchResult, start_of_window: ADate, end_of_window: ADate
+    ) -> "ScheduleStreamIcalFingerprint":
+        """Build a fingerprint from a freshly fetched iCal."""
+        if fetch_result.content is None:
+            raise Exception("Cannot fingerprint an iCal without content")
+        return ScheduleStreamIcalFingerprint(
+            etag=fetch_result.etag,
+            last_modified=fetch_result.last_modified,
+            content_hash=ScheduleStreamIcalFingerprint.hash_content(
+                fetch_result.content
+            ),
+            start_of_window=start_of_window,
+            end_of_window=end_of_window,
+        )
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """Hash the content of an iCal."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def with_validators(
+        self, etag: str | None, last_modified: str | None
+    ) -> "ScheduleStreamIcalFingerprint":
+        """The same fingerprint, with the validators the server handed out now."""
+        return dataclasses.replace(self, etag=etag, last_modified=last_modified)
+
+    def holds_for_window(self, start_of_window: ADate, end_of_window: ADate) -> bool:
+        """Whether the fingerprint was made for the same window of days."""
+        return (
+            self.start_of_window == start_of_window
+            and self.end_of_window == end_of_window
+        )
@@ -0,0 +1,129 @@
+"""Reconcile the events of an external iCal with the ones already synced."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from jupiter.core.domain.concept.schedule.schedule_event_full_days import (
+    ScheduleEventFullDays,
+)
+from jupiter.core.domain.concept.schedule.schedule_event_in_day import (
+    ScheduleEventInDay,
+)
+from jupiter.core.domain.concept.schedule.schedule_event_name import ScheduleEventName
+from jupiter.core.domain.concept.schedule.schedule_external_uid import (
+    ScheduleExternalUid,
+)
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.time_in_day import TimeInDay
+
+
+def _hash_content(*parts: str | None) -> str:
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class ExternalFullDaysEvent:
+    """A full days event as it should look after a sync."""
+
+    uid: ScheduleExternalUid
+    name: ScheduleEventName
+    start_date: ADate
+    duration_days: int
+    description: str | None
+
+    @property
+    def content_hash(self) -> str:
+        """A hash of everything that is synced from the event."""
+        return _hash_content(
+            str(self.name),
+            str(self.start_date),
+            str(self.duration_days),
+            self.description,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ExternalInDayEvent:
+    """An in day event as it should look after a sync."""
+
+    uid: ScheduleExternalUid
+    name: ScheduleEventName
+    start_date: ADate
+    start_time_in_day: TimeInDay
+    duration_mins: int
+    description: str | None
+
+    @property
+    def content_hash(self) -> str:
+        """A hash of everything that is synced from the event."""
+        return _hash_content(
+            str(self.name),
+            str(self.start_date),
+            str(self.start_time_in_day),
+            str(self.duration_mins),
+            self.description,
+        )
+
+
+_ExternalEventT = TypeVar("_ExternalEventT", ExternalFullDaysEvent, ExternalInDayEvent)
+_ScheduleEventT = TypeVar("_ScheduleEventT", ScheduleEventFullDays, ScheduleEventInDay)
+
+
+@dataclass(frozen=True, slots=True)
+class ExternalEventsDiff(Generic[_ExternalEventT, _ScheduleEventT]):
+    """What needs to change for the synced events to match an external iCal."""
+
+    to_create: list[_ExternalEventT]
+    to_update: list[tuple[_ScheduleEventT, _ExternalEventT]]
+    unchanged: list[_ScheduleEventT]
+    missing: list[_ScheduleEventT]
+
+
+def diff_external_events(
+    external_events: list[_ExternalEventT],
+    schedule_events: list[_ScheduleEventT],
+    force_update: bool,
+) -> ExternalEventsDiff[_ExternalEventT, _ScheduleEventT]:
+    """Diff the events of an external iCal against the ones already synced.
+
+    Events are matched by their external uid, and a synced event only needs an
+    update when its content hash differs from the external one. Events synced
+    before hashes were recorded have none, and are always updated. When an uid
+    appears several times in the iCal, the last occurrence wins.
+    """
+    external_events_by_uid = {event.uid: event for event in external_events}
+    schedule_events_by_uid = {
+        event.external_uid: event
+        for event in schedule_events
+        if event.external_uid is not None
+    }
+
+    to_create = []
+    to_update = []
+    unchanged = []
+    for uid, external_event in external_events_by_uid.items():
+        schedule_event = schedule_events_by_uid.get(uid)
+        if schedule_event is None:
+            to_create.append(external_event)
+        elif (
+            force_update
+            or schedule_event.external_content_hash != external_event.content_hash
+        ):
+            to_update.append((schedule_event, external_event))
+        else:
+            unchanged.append(schedule_event)
+
+    missing = [
+        schedule_event
+        for schedule_event in schedule_events
+        if schedule_event.external_uid not in external_events_by_uid
+    ]
+
+    return ExternalEventsDiff(
+        to_create=to_create,
+        to_update=to_update,
+        unchanged=unchanged,
+        missing=missing,
+    )
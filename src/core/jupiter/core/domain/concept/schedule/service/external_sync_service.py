@@ -1,11 +1,14 @@
 """The service which syncs external calendars with jupiter."""
 
-from typing import Final, cast
-
-import recurring_ical_events
-import requests
-from icalendar import Calendar
-from icalendar.cal import Component
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from typing import Final, TypeVar, cast
+
+from jupiter.core.domain.concept.schedule.ical_fetcher import (
+    ICalFetcher,
+    ICalFetchError,
+    ICalFetchResult,
+)
 from jupiter.core.domain.concept.schedule.schedule_domain import ScheduleDomain
 from jupiter.core.domain.concept.schedule.schedule_event_full_days import (
     ScheduleEventFullDays,
@@ -25,7 +28,20 @@ from jupiter.core.domain.concept.schedule.schedule_external_uid import (
 )
 from jupiter.core.domain.concept.schedule.schedule_source import ScheduleSource
 from jupiter.core.domain.concept.schedule.schedule_stream import ScheduleStream
+from jupiter.core.domain.concept.schedule.schedule_stream_ical_fingerprint import (
+    ScheduleStreamIcalFingerprint,
+)
 from jupiter.core.domain.concept.schedule.schedule_stream_name import ScheduleStreamName
+from jupiter.core.domain.concept.schedule.service.external_event_reconciler import (
+    ExternalEventsDiff,
+    ExternalFullDaysEvent,
+    ExternalInDayEvent,
+    diff_external_events,
+)
+from jupiter.core.domain.concept.schedule.service.ical_parser import (
+    ParsedICal,
+    parse_ical_in_worker,
+)
 from jupiter.core.domain.concept.workspaces.workspace import Workspace
 from jupiter.core.domain.core.adate import ADate
 from jupiter.core.domain.core.archival_reason import ArchivalReason
@@ -48,8 +64,7 @@ from jupiter.core.domain.core.time_events.time_event_in_day_block import (
 from jupiter.core.domain.core.time_events.time_event_namespace import TimeEventNamespace
 from jupiter.core.domain.core.time_in_day import TimeInDay
 from jupiter.core.domain.core.url import URL
-from jupiter.core.domain.infra.generic_crown_archiver import generic_crown_archiver
-from jupiter.core.domain.storage_engine import DomainStorageEngine
+from jupiter.core.domain.storage_engine import DomainStorageEngine, DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.base.timestamp import Timestamp
 from jupiter.core.framework.context import DomainContext
@@ -59,6 +74,13 @@ from jupiter.core.framework.update_action import UpdateAction
 from jupiter.core.framework.use_case import ProgressReporter
 from jupiter.core.utils.time_provider import TimeProvider
 
+_FETCH_CONCURRENCY: Final[int] = 8
+
+_ScheduleEventT = TypeVar("_ScheduleEventT", ScheduleEventFullDays, ScheduleEventInDay)
+_TimeEventBlockT = TypeVar(
+    "_TimeEventBlockT", TimeEventFullDaysBlock, TimeEventInDayBlock
+)
+
 
 class ScheduleExternalSyncService:
     """The service which syncs external calendars with jupiter."""
@@ -66,17 +88,20 @@ class ScheduleExternalSyncService:
     _time_provider: Final[TimeProvider]
     _realm_codec_registry: Final[RealmCodecRegistry]
     _domain_storage_engine: Final[DomainStorageEngine]
+    _ical_fetcher: Final[ICalFetcher]
 
     def __init__(
         self,
         time_provider: TimeProvider,
         realm_codec_registry: RealmCodecRegistry,
         domain_storage_engine: DomainStorageEngine,
+        ical_fetcher: ICalFetcher,
     ) -> None:
         """Constructor."""
         self._time_provider = time_provider
         self._realm_codec_registry = realm_codec_registry
         self._domain_storage_engine = domain_storage_engine
+        self._ical_fetcher = ical_fetcher
 
     async def do_it(
         self,
@@ -171,7 +196,16 @@ class ScheduleExternalSyncService:
                 note.source_entity_ref_id: note for note in all_notes_for_in_day
             }
 
-        for schedule_stream in schedule_streams:
+        fetch_results = await self._fetch_calendar_icals(
+            start_of_window,
+            end_of_window,
+            sync_even_if_not_modified,
+            schedule_streams,
+        )
+
+        for schedule_stream, fetch_result in zip(
+            schedule_streams, fetch_results, strict=True
+        ):
             sync_log_entry = await self._process_schedule_stream(
                 ctx,
                 today,
@@ -187,6 +221,7 @@ class ScheduleExternalSyncService:
                 all_notes_for_dull_days_by_source_entity_ref_id,
                 all_notes_for_in_day_by_source_entity_ref_id,
                 schedule_stream,
+                fetch_result,
                 sync_log_entry,
             )
 
@@ -216,577 +251,183 @@ class ScheduleExternalSyncService:
         all_notes_for_dull_days_by_source_entity_ref_id: dict[EntityId, Note],
         all_notes_for_in_day_by_source_entity_ref_id: dict[EntityId, Note],
         schedule_stream: ScheduleStream,
+        fetch_result: ICalFetchResult | ICalFetchError,
         sync_log_entry: ScheduleExternalSyncLogEntry,
     ) -> ScheduleExternalSyncLogEntry:
         """Process a schedule stream."""
-        # Step 1: Fetch the iCal
+        if isinstance(fetch_result, ICalFetchError):
+            return sync_log_entry.mark_stream_error(
+                ctx,
+                schedule_stream_ref_id=schedule_stream.ref_id,
+                error_msg=f"{fetch_result}",
+            )
+
+        # Step 0: Skip the iCal if it hasn't changed since the last sync
+        old_fingerprint = schedule_stream.source_ical_fingerprint
+        if fetch_result.content is None or (
+            not sync_even_if_not_modified
+            and old_fingerprint is not None
+            and old_fingerprint.holds_for_window(start_of_window, end_of_window)
+            and old_fingerprint.content_hash
+            == ScheduleStreamIcalFingerprint.hash_content(fetch_result.content)
+        ):
+            if old_fingerprint is not None and (
+                old_fingerprint.etag != fetch_result.etag
+                or old_fingerprint.last_modified != fetch_result.last_modified
+            ):
+                # The server might have handed out new validators for the same iCal.
+                async with self._domain_storage_engine.get_unit_of_work() as uow:
+                    schedule_stream = schedule_stream.record_ical_fingerprint(
+                        ctx,
+                        old_fingerprint.with_validators(
+                            etag=fetch_result.etag,
+                            last_modified=fetch_result.last_modified,
+                        ),
+                    )
+                    await uow.get_for(ScheduleStream).save(schedule_stream)
+            return sync_log_entry.mark_stream_success(
+                ctx,
+                schedule_stream_ref_id=schedule_stream.ref_id,
+                unchanged_events_cnt=None,
+            )
+
+        # Step 1: Parse the iCal
         try:
             async with progress_reporter.section("Processing stream"):
-                calendar = self._retrieve_calendar_ical(schedule_stream)
+                parsed_ical = await self._parse_calendar_ical(
+                    start_of_window,
+                    end_of_window,
+                    schedule_stream,
+                    fetch_result.content,
+                )
 
-                # Step 2: Update the schedule stream
                 name = self._realm_codec_registry.db_decode(
-                    ScheduleStreamName, calendar.get("X-WR-CALNAME")
+                    ScheduleStreamName, parsed_ical.name
                 )
-
-                schedule_stream = schedule_stream.update(
-                    ctx,
-                    name=UpdateAction.change_to(name),
-                    color=UpdateAction.do_nothing(),
+                external_full_days_events, external_in_day_events = (
+                    self._decode_calendar_events(parsed_ical)
                 )
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
+
+            # Everything the stream changes is applied in a single transaction.
+            async with self._domain_storage_engine.get_unit_of_work() as uow:
+                # Step 2: Update the schedule stream
+                async with progress_reporter.section("Updating stream"):
+                    schedule_stream = schedule_stream.update(
+                        ctx,
+                        name=UpdateAction.change_to(name),
+                        color=UpdateAction.do_nothing(),
+                    )
                     await uow.get_for(ScheduleStream).save(schedule_stream)
                     await progress_reporter.mark_updated(schedule_stream)
 
-                sync_log_entry = sync_log_entry.add_entity(ctx, schedule_stream)
+                    sync_log_entry = sync_log_entry.add_entity(ctx, schedule_stream)
 
-            newly_created_schedule_full_days: set[EntityId] = set()
-            newly_created_schedule_in_day: set[EntityId] = set()
+                # Step 3: Diff the events against the ones synced before
+                all_full_days_events = await uow.get_for(
+                    ScheduleEventFullDays
+                ).find_all_generic(
+                    parent_ref_id=schedule_domain.ref_id,
+                    allow_archived=False,
+                    schedule_stream_ref_id=schedule_stream.ref_id,
+                )
+                all_in_day_events = await uow.get_for(
+                    ScheduleEventInDay
+                ).find_all_generic(
+                    parent_ref_id=schedule_domain.ref_id,
+                    allow_archived=False,
+                    schedule_stream_ref_id=schedule_stream.ref_id,
+                )
 
-            # Step 3: Process the events
-            async with progress_reporter.section("Adding and updating events"):
-                async with self._domain_storage_engine.get_unit_of_work() as uow:
-                    all_full_days_events = await uow.get_for(
-                        ScheduleEventFullDays
-                    ).find_all_generic(
-                        parent_ref_id=schedule_domain.ref_id,
-                        allow_archived=False,
-                        schedule_stream_ref_id=schedule_stream.ref_id,
+                full_days_diff = diff_external_events(
+                    external_full_days_events,
+                    all_full_days_events,
+                    force_update=sync_even_if_not_modified,
+                )
+                in_day_diff = diff_external_events(
+                    external_in_day_events,
+                    all_in_day_events,
+                    force_update=sync_even_if_not_modified,
+                )
+
+                # Step 4: Add and update the events that changed
+                async with progress_reporter.section("Adding and updating events"):
+                    sync_log_entry = await self._apply_full_days_events(
+                        ctx,
+                        uow,
+                        progress_reporter,
+                        schedule_domain,
+                        time_event_domain,
+                        note_collection,
+                        all_time_event_full_days_blocks_by_source_entity_ref_id,
+                        all_notes_for_dull_days_by_source_entity_ref_id,
+                        schedule_stream,
+                        full_days_diff,
+                        sync_log_entry,
                     )
-                    all_in_day_events = await uow.get_for(
-                        ScheduleEventInDay
-                    ).find_all_generic(
-                        parent_ref_id=schedule_domain.ref_id,
-                        allow_archived=False,
-                        schedule_stream_ref_id=schedule_stream.ref_id,
+                    sync_log_entry = await self._apply_in_day_events(
+                        ctx,
+                        uow,
+                        progress_reporter,
+                        schedule_domain,
+                        time_event_domain,
+                        note_collection,
+                        all_time_event_in_day_blocks_by_source_entity_ref_id,
+                        all_notes_for_in_day_by_source_entity_ref_id,
+                        schedule_stream,
+                        in_day_diff,
+                        sync_log_entry,
                     )
 
-                all_full_days_events_by_external_uid = {
-                    event.external_uid: event for event in all_full_days_events
-                }
-                all_in_day_events_by_external_uid = {
-                    event.external_uid: event for event in all_in_day_events
-                }
+                if parsed_ical.unexpected_event is not None:
+                    return sync_log_entry.mark_stream_error(
+                        ctx,
+                        schedule_stream_ref_id=schedule_stream.ref_id,
+                        error_msg=f"Unexpected event type {parsed_ical.unexpected_event}",
+                    )
 
-                processed_events_external_uids = set()
+                # Step 5: Archive old events not present in the stream anymore
+                async with progress_reporter.section("Archiving old events"):
+                    sync_log_entry = await self._archive_missing_events(
+                        ctx,
+                        uow,
+                        progress_reporter,
+                        ScheduleEventFullDays,
+                        TimeEventFullDaysBlock,
+                        start_of_window,
+                        all_time_event_full_days_blocks_by_source_entity_ref_id,
+                        all_notes_for_dull_days_by_source_entity_ref_id,
+                        full_days_diff.missing,
+                        sync_log_entry,
+                    )
+                    sync_log_entry = await self._archive_missing_events(
+                        ctx,
+                        uow,
+                        progress_reporter,
+                        ScheduleEventInDay,
+                        TimeEventInDayBlock,
+                        start_of_window,
+                        all_time_event_in_day_blocks_by_source_entity_ref_id,
+                        all_notes_for_in_day_by_source_entity_ref_id,
+                        in_day_diff.missing,
+                        sync_log_entry,
+                    )
 
-                all_events = recurring_ical_events.of(calendar).between(
-                    start_of_window.the_date, end_of_window.the_date
+                # Step 6: Remember what was synced, to skip it next time if unchanged
+                schedule_stream = schedule_stream.record_ical_fingerprint(
+                    ctx,
+                    ScheduleStreamIcalFingerprint.from_fetch_result(
+                        fetch_result, start_of_window, end_of_window
+                    ),
                 )
+                await uow.get_for(ScheduleStream).save(schedule_stream)
 
-                for event in all_events:
-                    if (
-                        "SUMMARY" not in event
-                        or "UID" not in event
-                        or "DTSTART" not in event
-                        or "DTEND" not in event
-                    ):
-                        # Skipping events that are malformed
-                        continue
-
-                    if (
-                        "value" in event["DTSTART"].params
-                        and event["DTSTART"].params["value"] == "DATE"
-                        and "value" in event["DTEND"].params
-                        and event["DTEND"].params["value"] == "DATE"
-                    ):
-                        # Full day event
-                        event_name = self._realm_codec_registry.db_decode(
-                            ScheduleEventName, event["SUMMARY"]
-                        )
-                        uid_base = self._realm_codec_registry.db_decode(
-                            ScheduleExternalUid, event["UID"].to_ical().decode()
-                        )
-                        start_date = self._realm_codec_registry.db_decode(
-                            ADate, event["DTSTART"].dt
-                        )
-                        uid = ScheduleExternalUid.from_string(
-                            f"{uid_base.the_uid}:{start_date}"
-                        )
-                        end_date = self._realm_codec_registry.db_decode(
-                            ADate, event["DTEND"].dt
-                        )
-                        if "RECURRENCE-ID" in event:
-                            recurrence_id = self._realm_codec_registry.db_decode(
-                                Timestamp, event["RECURRENCE-ID"].dt
-                            )
-                            uid = ScheduleExternalUid.from_string(
-                                f"{uid.the_uid}:{recurrence_id}"
-                            )
-                        last_modified = None
-                        if "LAST-MODIFIED" in event:
-                            last_modified = self._realm_codec_registry.db_decode(
-                                Timestamp, event["LAST-MODIFIED"].dt
-                            )
-                        description = (
-                            str(event["DESCRIPTION"])
-                            if "DESCRIPTION" in event
-                            else None
-                        )
-
-                        if uid not in all_full_days_events_by_external_uid:
-                            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                                schedule_event_full_days = ScheduleEventFullDays.new_schedule_full_days_block_from_external_ical(
-                                    ctx,
-                                    schedule_domain_ref_id=schedule_domain.ref_id,
-                                    schedule_stream_ref_id=schedule_stream.ref_id,
-                                    name=event_name,
-                                    external_uid=uid,
-                                )
-
-                                schedule_event_full_days = await uow.get_for(
-                                    ScheduleEventFullDays
-                                ).create(schedule_event_full_days)
-                                await progress_reporter.mark_created(
-                                    schedule_event_full_days
-                                )
-                                newly_created_schedule_full_days.add(
-                                    schedule_event_full_days.ref_id
-                                )
-
-                                time_event_full_days_block = TimeEventFullDaysBlock.new_time_event_for_schedule_event(
-                                    ctx,
-                                    time_event_domain_ref_id=time_event_domain.ref_id,
-                                    schedule_event_ref_id=schedule_event_full_days.ref_id,
-                                    start_date=start_date,
-                                    duration_days=end_date.days_since(start_date),
-                                )
-                                time_event_full_days_block = await uow.get_for(
-                                    TimeEventFullDaysBlock
-                                ).create(time_event_full_days_block)
-
-                                if description is not None:
-                                    note_content: list[OneOfNoteContentBlock] = [
-                                        ParagraphBlock(
-                                            kind="paragraph",
-                                            correlation_id=CorrelationId("0"),
-                                            text=description,
-                                        )
-                                    ]
-                                    note: Note | None = Note.new_note(
-                                        ctx,
-                                        note_collection_ref_id=note_collection.ref_id,
-                                        domain=NoteDomain.SCHEDULE_EVENT_FULL_DAYS,
-                                        source_entity_ref_id=schedule_event_full_days.ref_id,
-                                        content=note_content,
-                                    )
-                                    note = await uow.get_for(Note).create(
-                                        cast(Note, note)
-                                    )
-                                    all_notes_for_dull_days_by_source_entity_ref_id[
-                                        schedule_event_full_days.ref_id
-                                    ] = note
-
-                                all_full_days_events.append(schedule_event_full_days)
-                                all_full_days_events_by_external_uid[uid] = (
-                                    schedule_event_full_days
-                                )
-                                all_time_event_full_days_blocks_by_source_entity_ref_id[
-                                    schedule_event_full_days.ref_id
-                                ] = time_event_full_days_block
-                                sync_log_entry = sync_log_entry.add_entity(
-                                    ctx, schedule_event_full_days
-                                )
-                        elif (
-                            sync_even_if_not_modified
-                            or (last_modified is None)
-                            or (
-                                last_modified
-                                > all_full_days_events_by_external_uid[
-                                    uid
-                                ].last_modified_time
-                            )
-                        ):
-                            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                                schedule_event_full_days = (
-                                    all_full_days_events_by_external_uid[uid]
-                                )
-                                schedule_event_full_days = (
-                                    schedule_event_full_days.update(
-                                        ctx,
-                                        name=UpdateAction.change_to(event_name),
-                                    )
-                                )
-                                await uow.get_for(ScheduleEventFullDays).save(
-                                    schedule_event_full_days
-                                )
-                                await progress_reporter.mark_updated(
-                                    schedule_event_full_days
-                                )
-
-                                time_event_full_days_block = all_time_event_full_days_blocks_by_source_entity_ref_id[
-                                    schedule_event_full_days.ref_id
-                                ]
-                                time_event_full_days_block = time_event_full_days_block.update_for_schedule_event(
-                                    ctx,
-                                    start_date=UpdateAction.change_to(start_date),
-                                    duration_days=UpdateAction.change_to(
-                                        end_date.days_since(start_date)
-                                    ),
-                                )
-                                await uow.get_for(TimeEventFullDaysBlock).save(
-                                    time_event_full_days_block
-                                )
-
-                                if description is not None:
-                                    note = all_notes_for_dull_days_by_source_entity_ref_id.get(
-                                        schedule_event_full_days.ref_id, None
-                                    )
-                                    if note is None:
-                                        note_content = [
-                                            ParagraphBlock(
-                                                kind="paragraph",
-                                                correlation_id=CorrelationId("0"),
-                                                text=description,
-                                            )
-                                        ]
-                                        note = Note.new_note(
-                                            ctx,
-                                            note_collection_ref_id=note_collection.ref_id,
-                                            domain=NoteDomain.SCHEDULE_EVENT_FULL_DAYS,
-                                            source_entity_ref_id=schedule_event_full_days.ref_id,
-                                            content=note_content,
-                                        )
-                                        note = await uow.get_for(Note).create(note)
-                                        all_notes_for_dull_days_by_source_entity_ref_id[
-                                            schedule_event_full_days.ref_id
-                                        ] = note
-                                    else:
-                                        note_content = [
-                                            ParagraphBlock(
-                                                kind="paragraph",
-                                                correlation_id=CorrelationId("0"),
-                                                text=description,
-                                            )
-                                        ]
-                                        note = note.update(
-                                            ctx,
-                                            content=UpdateAction.change_to(
-                                                note_content
-                                            ),
-                                        )
-                                        await uow.get_for(Note).save(note)
-                                else:
-                                    note = all_notes_for_dull_days_by_source_entity_ref_id.get(
-                                        schedule_event_full_days.ref_id, None
-                                    )
-                                    if note is not None:
-                                        # We don't archive right now, but just blank the content. We don't have a
-                                        # good story on archival and de-archival right now.
-                                        note_content = [
-                                            ParagraphBlock(
-                                                kind="paragraph",
-                                                correlation_id=CorrelationId("0"),
-                                                text="",
-                                            )
-                                        ]
-                                        note = note.update(
-                                            ctx,
-                                            content=UpdateAction.change_to(
-                                                note_content
-                                            ),
-                                        )
-                                        await uow.get_for(Note).save(note)
-
-                                if (
-                                    schedule_event_full_days.ref_id
-                                    not in newly_created_schedule_full_days
-                                ):
-                                    sync_log_entry = sync_log_entry.add_entity(
-                                        ctx, schedule_event_full_days
-                                    )
-
-                        processed_events_external_uids.add(uid)
-                    elif (
-                        "value" not in event["DTSTART"].params
-                        and "value" not in event["DTEND"].params
-                    ):
-                        # In-day event
-                        event_name = self._realm_codec_registry.db_decode(
-                            ScheduleEventName, event["SUMMARY"]
-                        )
-                        uid_base = self._realm_codec_registry.db_decode(
-                            ScheduleExternalUid, event["UID"].to_ical().decode()
-                        )
-                        # icalendar makes everything UTC so we don't need to.
-                        start_time = self._realm_codec_registry.db_decode(
-                            Timestamp, event["DTSTART"].dt
-                        )
-                        uid = ScheduleExternalUid.from_string(
-                            f"{uid_base.the_uid}:{start_time}"
-                        )
-                        end_time = self._realm_codec_registry.db_decode(
-                            Timestamp, event["DTEND"].dt
-                        )
-                        if "RECURRENCE-ID" in event:
-                            recurrence_id = self._realm_codec_registry.db_decode(
-                                Timestamp, event["RECURRENCE-ID"].dt
-                            )
-                            uid = ScheduleExternalUid.from_string(
-                                f"{uid.the_uid}:{recurrence_id}"
-                            )
-                        last_modified = None
-                        if "LAST-MODIFIED" in event:
-                            last_modified = self._realm_codec_registry.db_decode(
-                                Timestamp, event["LAST-MODIFIED"].dt
-                            )
-                        description = (
-                            str(event["DESCRIPTION"])
-                            if "DESCRIPTION" in event
-                            else None
-                        )
-
-                        total_duration = min(
-                            MAX_DURATION_MINS, end_time.mins_since(start_time)
-                        )
-
-                        if uid not in all_in_day_events_by_external_uid:
-                            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                                schedule_event_in_day = ScheduleEventInDay.new_schedule_event_in_day_from_external_ical(
-                                    ctx,
-                                    schedule_domain_ref_id=schedule_domain.ref_id,
-                                    schedule_stream_ref_id=schedule_stream.ref_id,
-                                    name=event_name,
-                                    external_uid=uid,
-                                )
-                                schedule_event_in_day = await uow.get_for(
-                                    ScheduleEventInDay
-                                ).create(schedule_event_in_day)
-                                await progress_reporter.mark_created(
-                                    schedule_event_in_day
-                                )
-                                newly_created_schedule_in_day.add(
-                                    schedule_event_in_day.ref_id
-                                )
-
-                                time_event_in_day_block = TimeEventInDayBlock.new_time_event_for_schedule_event(
-                                    ctx,
-                                    time_event_domain_ref_id=time_event_domain.ref_id,
-                                    schedule_event_ref_id=schedule_event_in_day.ref_id,
-                                    start_date=ADate.from_date(start_time.as_date()),
-                                    start_time_in_day=TimeInDay.from_parts(
-                                        start_time.value.hour, start_time.value.minute
-                                    ),
-                                    duration_mins=total_duration,
-                                )
-                                time_event_in_day_block = await uow.get_for(
-                                    TimeEventInDayBlock
-                                ).create(time_event_in_day_block)
-
-                                if description is not None:
-                                    note_content = [
-                                        ParagraphBlock(
-                                            kind="paragraph",
-                                            correlation_id=CorrelationId("0"),
-                                            text=description,
-                                        )
-                                    ]
-                                    note = Note.new_note(
-                                        ctx,
-                                        note_collection_ref_id=note_collection.ref_id,
-                                        domain=NoteDomain.SCHEDULE_EVENT_IN_DAY,
-                                        source_entity_ref_id=schedule_event_in_day.ref_id,
-                                        content=note_content,
-                                    )
-                                    note = await uow.get_for(Note).create(note)
-
-                                all_in_day_events.append(schedule_event_in_day)
-                                all_in_day_events_by_external_uid[uid] = (
-                                    schedule_event_in_day
-                                )
-                                all_time_event_in_day_blocks_by_source_entity_ref_id[
-                                    schedule_event_in_day.ref_id
-                                ] = time_event_in_day_block
-                                sync_log_entry = sync_log_entry.add_entity(
-                                    ctx, schedule_event_in_day
-                                )
-                        elif (
-                            sync_even_if_not_modified
-                            or (last_modified is None)
-                            or (
-                                last_modified
-                                > all_in_day_events_by_external_uid[
-                                    uid
-                                ].last_modified_time
-                            )
-                        ):
-                            async with self._domain_storage_engine.get_unit_of_work() as uow:
-                                schedule_event_in_day = (
-                                    all_in_day_events_by_external_uid[uid]
-                                )
-                                schedule_event_in_day = schedule_event_in_day.update(
-                                    ctx,
-                                    name=UpdateAction.change_to(event_name),
-                                )
-                                await uow.get_for(ScheduleEventInDay).save(
-                                    schedule_event_in_day
-                                )
-                                await progress_reporter.mark_updated(
-                                    schedule_event_in_day
-                                )
-
-                                time_event_in_day_block = all_time_event_in_day_blocks_by_source_entity_ref_id[
-                                    schedule_event_in_day.ref_id
-                                ]
-                                time_event_in_day_block = (
-                                    time_event_in_day_block.update(
-                                        ctx,
-                                        start_date=UpdateAction.change_to(
-                                            ADate.from_date(start_time.as_date())
-                                        ),
-                                        start_time_in_day=UpdateAction.change_to(
-                                            TimeInDay.from_parts(
-                                                start_time.value.hour,
-                                                start_time.value.minute,
-                                            )
-                                        ),
-                                        duration_mins=UpdateAction.change_to(
-                                            total_duration
-                                        ),
-                                    )
-                                )
-                                await uow.get_for(TimeEventInDayBlock).save(
-                                    time_event_in_day_block
-                                )
-
-                                if description is not None:
-                                    note = all_notes_for_in_day_by_source_entity_ref_id.get(
-                                        schedule_event_in_day.ref_id, None
-                                    )
-                                    if note is None:
-                                        note_content = [
-                                            ParagraphBlock(
-                                                kind="paragraph",
-                                                correlation_id=CorrelationId("0"),
-                                                text=description,
-                                            )
-                                        ]
-                                        note = Note.new_note(
-                                            ctx,
-                                            note_collection_ref_id=note_collection.ref_id,
-                                            domain=NoteDomain.SCHEDULE_EVENT_IN_DAY,
-                                            source_entity_ref_id=schedule_event_in_day.ref_id,
-                                            content=note_content,
-                                        )
-                                        note = await uow.get_for(Note).create(note)
-                                        all_notes_for_in_day_by_source_entity_ref_id[
-                                            schedule_event_in_day.ref_id
-                                        ] = note
-                                    else:
-                                        note_content = [
-                                            ParagraphBlock(
-                                                kind="paragraph",
-                                                correlation_id=CorrelationId("0"),
-                                                text=description,
-                                            )
-                                        ]
-                                        note = note.update(
-                                            ctx,
-                                            content=UpdateAction.change_to(
-                                                note_content
-                                            ),
-                                        )
-                                        await uow.get_for(Note).save(note)
-                                else:
-                                    note = all_notes_for_in_day_by_source_entity_ref_id.get(
-                                        schedule_event_in_day.ref_id, None
-                                    )
-                                    if note is not None:
-                                        # We don't archive right now, but just blank the content. We don't have a
-                                        # good story on archival and de-archival right now.
-                                        note_content = [
-                                            ParagraphBlock(
-                                                kind="paragraph",
-                                                correlation_id=CorrelationId("0"),
-                                                text="",
-                                            )
-                                        ]
-                                        note = note.update(
-                                            ctx,
-                                            content=UpdateAction.change_to(
-                                                note_content
-                                            ),
-                                        )
-                                        await uow.get_for(Note).save(note)
-
-                                if (
-                                    schedule_event_in_day.ref_id
-                                    not in newly_created_schedule_in_day
-                                ):
-                                    sync_log_entry = sync_log_entry.add_entity(
-                                        ctx, schedule_event_in_day
-                                    )
-
-                        processed_events_external_uids.add(uid)
-                    else:
-                        return sync_log_entry.mark_stream_error(
-                            ctx,
-                            schedule_stream_ref_id=schedule_stream.ref_id,
-                            error_msg=f"Unexpected event type {event}",
-                        )
-
-            # Step 4: Archive old events not present in the stream anymore
-            async with progress_reporter.section("Archiving old events"):
-                for schedule_event_full_days in all_full_days_events:
-                    if (
-                        schedule_event_full_days.external_uid
-                        in processed_events_external_uids
-                    ):
-                        continue
-
-                    time_event_full_days_block = (
-                        all_time_event_full_days_blocks_by_source_entity_ref_id[
-                            schedule_event_full_days.ref_id
-                        ]
-                    )
-                    if time_event_full_days_block.start_date < start_of_window:
-                        continue
-
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        await generic_crown_archiver(
-                            ctx,
-                            uow,
-                            progress_reporter,
-                            ScheduleEventFullDays,
-                            schedule_event_full_days.ref_id,
-                            ArchivalReason.SYNC,
-                        )
-                        sync_log_entry = sync_log_entry.add_entity(
-                            ctx, schedule_event_full_days
-                        )
-
-                for schedule_event_in_day in all_in_day_events:
-                    if (
-                        schedule_event_in_day.external_uid
-                        in processed_events_external_uids
-                    ):
-                        continue
-
-                    time_event_in_day_block = (
-                        all_time_event_in_day_blocks_by_source_entity_ref_id[
-                            schedule_event_in_day.ref_id
-                        ]
-                    )
-                    if time_event_in_day_block.start_date < start_of_window:
-                        continue
-
-                    async with self._domain_storage_engine.get_unit_of_work() as uow:
-                        await generic_crown_archiver(
-                            ctx,
-                            uow,
-                            progress_reporter,
-                            ScheduleEventInDay,
-                            schedule_event_in_day.ref_id,
-                            ArchivalReason.SYNC,
-                        )
-                        sync_log_entry = sync_log_entry.add_entity(
-                            ctx, schedule_event_in_day
-                        )
-
-            # Step 5: done!
+            # Step 7: done!
 
             return sync_log_entry.mark_stream_success(
-                ctx, schedule_stream_ref_id=schedule_stream.ref_id
+                ctx,
+                schedule_stream_ref_id=schedule_stream.ref_id,
+                unchanged_events_cnt=len(full_days_diff.unchanged)
+                + len(in_day_diff.unchanged),
             )
         except ValueError as err:
             return sync_log_entry.mark_stream_error(
@@ -795,38 +436,432 @@ class ScheduleExternalSyncService:
                 error_msg=f"{err}",
             )
 
-    def _retrieve_calendar_ical(self, schedule_stream: ScheduleStream) -> Component:
-        """Retrieve the iCal for a schedule stream."""
-        try:
-            calendar_ical_response = requests.get(
-                cast(URL, schedule_stream.source_ical_url).the_url, timeout=10
+    def _decode_calendar_events(
+        self, parsed_ical: ParsedICal
+    ) -> tuple[list[ExternalFullDaysEvent], list[ExternalInDayEvent]]:
+        """Decode the events of an iCal into what they should look like once synced."""
+        full_days_events = []
+        in_day_events = []
+
+        for event in parsed_ical.events:
+            event_name = self._realm_codec_registry.db_decode(
+                ScheduleEventName, event.summary
+            )
+            uid_base = self._realm_codec_registry.db_decode(
+                ScheduleExternalUid, event.uid
             )
-            if calendar_ical_response.status_code != 200:
-                # Early exit mark some error in sync log entry
-                raise ValueError(
-                    f"Failed to fetch iCal from {schedule_stream.source_ical_url} (error {calendar_ical_response.status_code})"
+
+            if event.is_full_days:
+                start_date = self._realm_codec_registry.db_decode(ADate, event.start)
+                end_date = self._realm_codec_registry.db_decode(ADate, event.end)
+                uid = ScheduleExternalUid.from_string(
+                    f"{uid_base.the_uid}:{start_date}"
                 )
-            calendar_ical = calendar_ical_response.text
-        except requests.exceptions.Timeout as err:
-            raise ValueError(
-                f"Failed to fetch iCal from {schedule_stream.source_ical_url} (timeout)"
-            ) from err
-        except requests.RequestException as err:
-            # Early exit in sync log entry
-            raise ValueError(
-                f"Failed to fetch iCal from {schedule_stream.source_ical_url} ({err})"
-            ) from err
+            else:
+                # icalendar makes everything UTC so we don't need to.
+                start_time = self._realm_codec_registry.db_decode(
+                    Timestamp, event.start
+                )
+                end_time = self._realm_codec_registry.db_decode(Timestamp, event.end)
+                uid = ScheduleExternalUid.from_string(
+                    f"{uid_base.the_uid}:{start_time}"
+                )
+
+            if event.recurrence_id is not None:
+                recurrence_id = self._realm_codec_registry.db_decode(
+                    Timestamp, event.recurrence_id
+                )
+                uid = ScheduleExternalUid.from_string(f"{uid.the_uid}:{recurrence_id}")
+
+            if event.is_full_days:
+                full_days_events.append(
+                    ExternalFullDaysEvent(
+                        uid=uid,
+                        name=event_name,
+                        start_date=start_date,
+                        duration_days=end_date.days_since(start_date),
+                        description=event.description,
+                    )
+                )
+            else:
+                in_day_events.append(
+                    ExternalInDayEvent(
+                        uid=uid,
+                        name=event_name,
+                        start_date=ADate.from_date(start_time.as_date()),
+                        start_time_in_day=TimeInDay.from_parts(
+                            start_time.value.hour, start_time.value.minute
+                        ),
+                        duration_mins=min(
+                            MAX_DURATION_MINS, end_time.mins_since(start_time)
+                        ),
+                        description=event.description,
+                    )
+                )
+
+        return full_days_events, in_day_events
 
+    async def _apply_full_days_events(
+        self,
+        ctx: DomainContext,
+        uow: DomainUnitOfWork,
+        progress_reporter: ProgressReporter,
+        schedule_domain: ScheduleDomain,
+        time_event_domain: TimeEventDomain,
+        note_collection: NoteCollection,
+        blocks_by_source_entity_ref_id: dict[EntityId, TimeEventFullDaysBlock],
+        notes_by_source_entity_ref_id: dict[EntityId, Note],
+        schedule_stream: ScheduleStream,
+        diff: ExternalEventsDiff[ExternalFullDaysEvent, ScheduleEventFullDays],
+        sync_log_entry: ScheduleExternalSyncLogEntry,
+    ) -> ScheduleExternalSyncLogEntry:
+        """Create and update the full days events which changed, in bulk."""
+        created_events = await uow.get_for(ScheduleEventFullDays).create_many(
+            [
+                ScheduleEventFullDays.new_schedule_full_days_block_from_external_ical(
+                    ctx,
+                    schedule_domain_ref_id=schedule_domain.ref_id,
+                    schedule_stream_ref_id=schedule_stream.ref_id,
+                    name=external_event.name,
+                    external_uid=external_event.uid,
+                    external_content_hash=external_event.content_hash,
+                )
+                for external_event in diff.to_create
+            ]
+        )
+        created_blocks = await uow.get_for(TimeEventFullDaysBlock).create_many(
+            [
+                TimeEventFullDaysBlock.new_time_event_for_schedule_event(
+                    ctx,
+                    time_event_domain_ref_id=time_event_domain.ref_id,
+                    schedule_event_ref_id=schedule_event.ref_id,
+                    start_date=external_event.start_date,
+                    duration_days=external_event.duration_days,
+                )
+                for schedule_event, external_event in zip(
+                    created_events, diff.to_create, strict=True
+                )
+            ]
+        )
+        for block in created_blocks:
+            blocks_by_source_entity_ref_id[block.source_entity_ref_id] = block
+
+        updated_events = await uow.get_for(ScheduleEventFullDays).save_many(
+            [
+                schedule_event.update_from_external_ical(
+                    ctx,
+                    name=external_event.name,
+                    external_content_hash=external_event.content_hash,
+                )
+                for schedule_event, external_event in diff.to_update
+            ]
+        )
+        updated_blocks = await uow.get_for(TimeEventFullDaysBlock).save_many(
+            [
+                blocks_by_source_entity_ref_id[
+                    schedule_event.ref_id
+                ].update_for_schedule_event(
+                    ctx,
+                    start_date=UpdateAction.change_to(external_event.start_date),
+                    duration_days=UpdateAction.change_to(external_event.duration_days),
+                )
+                for schedule_event, external_event in diff.to_update
+            ]
+        )
+        for block in updated_blocks:
+            blocks_by_source_entity_ref_id[block.source_entity_ref_id] = block
+
+        await self._apply_notes(
+            ctx,
+            uow,
+            note_collection,
+            NoteDomain.SCHEDULE_EVENT_FULL_DAYS,
+            notes_by_source_entity_ref_id,
+            [
+                (schedule_event.ref_id, external_event.description)
+                for schedule_event, external_event in zip(
+                    created_events, diff.to_create, strict=True
+                )
+            ],
+            [
+                (schedule_event.ref_id, external_event.description)
+                for schedule_event, external_event in diff.to_update
+            ],
+        )
+
+        for schedule_event in created_events:
+            await progress_reporter.mark_created(schedule_event)
+            sync_log_entry = sync_log_entry.add_entity(ctx, schedule_event)
+        for schedule_event in updated_events:
+            await progress_reporter.mark_updated(schedule_event)
+            sync_log_entry = sync_log_entry.add_entity(ctx, schedule_event)
+
+        return sync_log_entry
+
+    async def _apply_in_day_events(
+        self,
+        ctx: DomainContext,
+        uow: DomainUnitOfWork,
+        progress_reporter: ProgressReporter,
+        schedule_domain: ScheduleDomain,
+        time_event_domain: TimeEventDomain,
+        note_collection: NoteCollection,
+        blocks_by_source_entity_ref_id: dict[EntityId, TimeEventInDayBlock],
+        notes_by_source_entity_ref_id: dict[EntityId, Note],
+        schedule_stream: ScheduleStream,
+        diff: ExternalEventsDiff[ExternalInDayEvent, ScheduleEventInDay],
+        sync_log_entry: ScheduleExternalSyncLogEntry,
+    ) -> ScheduleExternalSyncLogEntry:
+        """Create and update the in day events which changed, in bulk."""
+        created_events = await uow.get_for(ScheduleEventInDay).create_many(
+            [
+                ScheduleEventInDay.new_schedule_event_in_day_from_external_ical(
+                    ctx,
+                    schedule_domain_ref_id=schedule_domain.ref_id,
+                    schedule_stream_ref_id=schedule_stream.ref_id,
+                    name=external_event.name,
+                    external_uid=external_event.uid,
+                    external_content_hash=external_event.content_hash,
+                )
+                for external_event in diff.to_create
+            ]
+        )
+        created_blocks = await uow.get_for(TimeEventInDayBlock).create_many(
+            [
+                TimeEventInDayBlock.new_time_event_for_schedule_event(
+                    ctx,
+                    time_event_domain_ref_id=time_event_domain.ref_id,
+                    schedule_event_ref_id=schedule_event.ref_id,
+                    start_date=external_event.start_date,
+                    start_time_in_day=external_event.start_time_in_day,
+                    duration_mins=external_event.duration_mins,
+                )
+                for schedule_event, external_event in zip(
+                    created_events, diff.to_create, strict=True
+                )
+            ]
+        )
+        for block in created_blocks:
+            blocks_by_source_entity_ref_id[block.source_entity_ref_id] = block
+
+        updated_events = await uow.get_for(ScheduleEventInDay).save_many(
+            [
+                schedule_event.update_from_external_ical(
+                    ctx,
+                    name=external_event.name,
+                    external_content_hash=external_event.content_hash,
+                )
+                for schedule_event, external_event in diff.to_update
+            ]
+        )
+        updated_blocks = await uow.get_for(TimeEventInDayBlock).save_many(
+            [
+                blocks_by_source_entity_ref_id[schedule_event.ref_id].update(
+                    ctx,
+                    start_date=UpdateAction.change_to(external_event.start_date),
+                    start_time_in_day=UpdateAction.change_to(
+                        external_event.start_time_in_day
+                    ),
+                    duration_mins=UpdateAction.change_to(external_event.duration_mins),
+                )
+                for schedule_event, external_event in diff.to_update
+            ]
+        )
+        for block in updated_blocks:
+            blocks_by_source_entity_ref_id[block.source_entity_ref_id] = block
+
+        await self._apply_notes(
+            ctx,
+            uow,
+            note_collection,
+            NoteDomain.SCHEDULE_EVENT_IN_DAY,
+            notes_by_source_entity_ref_id,
+            [
+                (schedule_event.ref_id, external_event.description)
+                for schedule_event, external_event in zip(
+                    created_events, diff.to_create, strict=True
+                )
+            ],
+            [
+                (schedule_event.ref_id, external_event.description)
+                for schedule_event, external_event in diff.to_update
+            ],
+        )
+
+        for schedule_event in created_events:
+            await progress_reporter.mark_created(schedule_event)
+            sync_log_entry = sync_log_entry.add_entity(ctx, schedule_event)
+        for schedule_event in updated_events:
+            await progress_reporter.mark_updated(schedule_event)
+            sync_log_entry = sync_log_entry.add_entity(ctx, schedule_event)
+
+        return sync_log_entry
+
+    async def _apply_notes(
+        self,
+        ctx: DomainContext,
+        uow: DomainUnitOfWork,
+        note_collection: NoteCollection,
+        note_domain: NoteDomain,
+        notes_by_source_entity_ref_id: dict[EntityId, Note],
+        created_descriptions: list[tuple[EntityId, str | None]],
+        updated_descriptions: list[tuple[EntityId, str | None]],
+    ) -> None:
+        """Create and update the notes holding the descriptions of events, in bulk."""
+        new_notes = []
+        changed_notes = []
+
+        for schedule_event_ref_id, description in created_descriptions:
+            if description is None:
+                continue
+            new_notes.append(
+                Note.new_note(
+                    ctx,
+                    note_collection_ref_id=note_collection.ref_id,
+                    domain=note_domain,
+                    source_entity_ref_id=schedule_event_ref_id,
+                    content=self._build_note_content(description),
+                )
+            )
+
+        for schedule_event_ref_id, description in updated_descriptions:
+            note = notes_by_source_entity_ref_id.get(schedule_event_ref_id, None)
+            if note is None:
+                if description is None:
+                    continue
+                new_notes.append(
+                    Note.new_note(
+                        ctx,
+                        note_collection_ref_id=note_collection.ref_id,
+                        domain=note_domain,
+                        source_entity_ref_id=schedule_event_ref_id,
+                        content=self._build_note_content(description),
+                    )
+                )
+            else:
+                # We don't archive right now, but just blank the content. We don't have a
+                # good story on archival and de-archival right now.
+                changed_notes.append(
+                    note.update(
+                        ctx,
+                        content=UpdateAction.change_to(
+                            self._build_note_content(description or "")
+                        ),
+                    )
+                )
+
+        for note in await uow.get_for(Note).create_many(new_notes):
+            notes_by_source_entity_ref_id[note.source_entity_ref_id] = note
+        for note in await uow.get_for(Note).save_many(changed_notes):
+            notes_by_source_entity_ref_id[note.source_entity_ref_id] = note
+
+    @staticmethod
+    def _build_note_content(text: str) -> list[OneOfNoteContentBlock]:
+        """Build the content of the note holding the description of an event."""
+        return [
+            ParagraphBlock(
+                kind="paragraph",
+                correlation_id=CorrelationId("0"),
+                text=text,
+            )
+        ]
+
+    async def _archive_missing_events(
+        self,
+        ctx: DomainContext,
+        uow: DomainUnitOfWork,
+        progress_reporter: ProgressReporter,
+        schedule_event_type: type[_ScheduleEventT],
+        block_type: type[_TimeEventBlockT],
+        start_of_window: ADate,
+        blocks_by_source_entity_ref_id: dict[EntityId, _TimeEventBlockT],
+        notes_by_source_entity_ref_id: dict[EntityId, Note],
+        missing_events: list[_ScheduleEventT],
+        sync_log_entry: ScheduleExternalSyncLogEntry,
+    ) -> ScheduleExternalSyncLogEntry:
+        """Archive the events missing from the iCal, along with their blocks and notes, in bulk."""
+        archived_events = []
+        archived_blocks = []
+        archived_notes = []
+
+        for schedule_event in missing_events:
+            block = blocks_by_source_entity_ref_id[schedule_event.ref_id]
+            if block.start_date < start_of_window:
+                continue
+
+            archived_events.append(
+                schedule_event.mark_archived(ctx, ArchivalReason.SYNC)
+            )
+            archived_blocks.append(block.mark_archived(ctx, ArchivalReason.SYNC))
+            note = notes_by_source_entity_ref_id.pop(schedule_event.ref_id, None)
+            if note is not None:
+                archived_notes.append(note.mark_archived(ctx, ArchivalReason.SYNC))
+            del blocks_by_source_entity_ref_id[schedule_event.ref_id]
+
+        await uow.get_for(schedule_event_type).save_many(archived_events)
+        await uow.get_for(block_type).save_many(archived_blocks)
+        await uow.get_for(Note).save_many(archived_notes)
+
+        for schedule_event in archived_events:
+            await progress_reporter.mark_updated(schedule_event)
+            sync_log_entry = sync_log_entry.add_entity(ctx, schedule_event)
+
+        return sync_log_entry
+
+    async def _fetch_calendar_icals(
+        self,
+        start_of_window: ADate,
+        end_of_window: ADate,
+        sync_even_if_not_modified: bool,
+        schedule_streams: list[ScheduleStream],
+    ) -> list[ICalFetchResult | ICalFetchError]:
+        """Fetch the iCals for several schedule streams, a few at a time."""
+        semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+        async def fetch(
+            schedule_stream: ScheduleStream,
+        ) -> ICalFetchResult | ICalFetchError:
+            fingerprint = schedule_stream.source_ical_fingerprint
+            if (
+                sync_even_if_not_modified
+                or fingerprint is None
+                or not fingerprint.holds_for_window(start_of_window, end_of_window)
+            ):
+                etag, last_modified = None, None
+            else:
+                etag, last_modified = fingerprint.etag, fingerprint.last_modified
+            async with semaphore:
+                try:
+                    return await self._ical_fetcher.fetch(
+                        cast(URL, schedule_stream.source_ical_url),
+                        etag,
+                        last_modified,
+                    )
+                except ICalFetchError as err:
+                    return err
+
+        return await asyncio.gather(
+            *(fetch(schedule_stream) for schedule_stream in schedule_streams)
+        )
+
+    async def _parse_calendar_ical(
+        self,
+        start_of_window: ADate,
+        end_of_window: ADate,
+        schedule_stream: ScheduleStream,
+        calendar_ical: str,
+    ) -> ParsedICal:
+        """Parse the iCal for a schedule stream."""
         try:
-            calendar = Calendar.from_ical(calendar_ical)
-        except ValueError as err:
+            return await parse_ical_in_worker(
+                calendar_ical, start_of_window.the_date, end_of_window.the_date
+            )
+        except (ValueError, BrokenProcessPool) as err:
             # Early exit in sync log entry
             raise ValueError(
                 f"Failed to parse iCal from {schedule_stream.source_ical_url} ({err})"
             ) from err
 
-        return calendar
-
     def _build_processing_window(self, today: ADate) -> tuple[ADate, ADate]:
         """Build the processing window."""
         today_date = today.the_date
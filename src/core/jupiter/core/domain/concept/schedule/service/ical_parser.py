@@ -0,0 +1,146 @@
+"""Parse external iCals into the events to sync, in worker processes."""
+
+import asyncio
+import datetime as dt
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Final
+
+import recurring_ical_events
+from icalendar import Calendar
+
+_PARSE_WORKERS: Final[int] = 2
+
+_parse_executor: ProcessPoolExecutor | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedICalEvent:
+    """An event from an iCal, reduced to what a sync needs.
+
+    The start and end are dates for full days events, and datetimes for
+    in day events. Recurring events appear once for every occurrence.
+    """
+
+    uid: str
+    summary: str
+    start: dt.date
+    end: dt.date
+    is_full_days: bool
+    recurrence_id: dt.date | None
+    last_modified: dt.date | None
+    description: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedICal:
+    """An iCal, with its events expanded over a window of days.
+
+    Events are listed in iCal order up to the first one which is neither a
+    full days nor an in day event. That one is described in unexpected_event.
+    """
+
+    name: str | None
+    events: list[ParsedICalEvent]
+    unexpected_event: str | None
+
+
+def parse_ical(
+    calendar_ical: str, start_of_window: dt.date, end_of_window: dt.date
+) -> ParsedICal:
+    """Parse an iCal and expand its events over a window of days."""
+    calendar = Calendar.from_ical(calendar_ical)
+    name = calendar.get("X-WR-CALNAME")
+
+    events: list[ParsedICalEvent] = []
+    for event in recurring_ical_events.of(calendar).between(
+        start_of_window, end_of_window
+    ):
+        if (
+            "SUMMARY" not in event
+            or "UID" not in event
+            or "DTSTART" not in event
+            or "DTEND" not in event
+        ):
+            # Skipping events that are malformed
+            continue
+
+        if (
+            "value" in event["DTSTART"].params
+            and event["DTSTART"].params["value"] == "DATE"
+            and "value" in event["DTEND"].params
+            and event["DTEND"].params["value"] == "DATE"
+        ):
+            is_full_days = True
+        elif (
+            "value" not in event["DTSTART"].params
+            and "value" not in event["DTEND"].params
+        ):
+            is_full_days = False
+        else:
+            return ParsedICal(
+                name=str(name) if name is not None else None,
+                events=events,
+                unexpected_event=f"{event}",
+            )
+
+        events.append(
+            ParsedICalEvent(
+                uid=event["UID"].to_ical().decode(),
+                summary=str(event["SUMMARY"]),
+                start=event["DTSTART"].dt,
+                end=event["DTEND"].dt,
+                is_full_days=is_full_days,
+                recurrence_id=(
+                    event["RECURRENCE-ID"].dt if "RECURRENCE-ID" in event else None
+                ),
+                last_modified=(
+                    event["LAST-MODIFIED"].dt if "LAST-MODIFIED" in event else None
+                ),
+                description=(
+                    str(event["DESCRIPTION"]) if "DESCRIPTION" in event else None
+                ),
+            )
+        )
+
+    return ParsedICal(
+        name=str(name) if name is not None else None,
+        events=events,
+        unexpected_event=None,
+    )
+
+
+async def parse_ical_in_worker(
+    calendar_ical: str, start_of_window: dt.date, end_of_window: dt.date
+) -> ParsedICal:
+    """Parse an iCal in a worker process, keeping the CPU heavy work off the event loop."""
+    global _parse_executor
+    if _parse_executor is None:
+        # Spawned rather than forked, since the parent holds threads and open connections.
+        _parse_executor = ProcessPoolExecutor(
+            max_workers=_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    executor = _parse_executor
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, parse_ical, calendar_ical, start_of_window, end_of_window
+        )
+    except BrokenProcessPool:
+        # A worker died, say from running out of memory on a huge iCal, and the
+        # pool is unusable from now on. The next parse starts a fresh one,
+        # unless a parse which failed alongside this one already did.
+        if _parse_executor is executor:
+            _parse_executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def shutdown_ical_parse_workers() -> None:
+    """Stop the worker processes which parse iCals, if any were started."""
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=True, cancel_futures=True)
+        _parse_executor = None
@@ -90,3 +90,16 @@ class NoteRepository(LeafEntityRepository[Note], abc.ABC):
         allow_archived: bool = False,
     ) -> Note | None:
         """Load a particular note via its source entity."""
+
+    @abc.abstractmethod
+    async def reindex_content(
+        self,
+        note_collection_ref_id: EntityId,
+        after_ref_id: EntityId | None,
+        limit: int,
+    ) -> EntityId | None:
+        """Rebuild the search index entries for the next chunk of notes in a collection.
+
+        Notes are taken in ref_id order, starting after `after_ref_id`. Returns
+        the ref_id of the last note indexed, or None once there are no more.
+        """
@@ -185,3 +185,30 @@ OneOfNoteContentBlock = (
     | LinkBlock
     | EntityReferenceBlock
 )
+
+
+def note_content_to_text(content: list[OneOfNoteContentBlock]) -> str:
+    """Flatten the content of a note to plain text, one line per piece of text."""
+    lines: list[str] = []
+
+    def add_list_items(items: list[ListItem]) -> None:
+        for item in items:
+            lines.append(item.text)
+            add_list_items(item.items)
+
+    for block in content:
+        if isinstance(block, (ParagraphBlock, HeadingBlock, QuoteBlock)):
+            lines.append(block.text)
+        elif isinstance(block, (BulletedListBlock, NumberedListBlock)):
+            add_list_items(block.items)
+        elif isinstance(block, ChecklistBlock):
+            lines.extend(item.text for item in block.items)
+        elif isinstance(block, TableBlock):
+            lines.extend(" ".join(row) for row in block.contents)
+        elif isinstance(block, CodeBlock):
+            lines.append(block.code)
+        elif isinstance(block, LinkBlock):
+            lines.append(str(block.url))
+        # Dividers and entity references have no text of their own.
+
+    return "\n".join(line for line in lines if line.strip())
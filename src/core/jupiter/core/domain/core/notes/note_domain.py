@@ -1,5 +1,6 @@
 """The source of the note."""
 
+from jupiter.core.domain.named_entity_tag import NamedEntityTag
 from jupiter.core.framework.value import EnumValue, enum_value
 
 
@@ -25,3 +26,10 @@ class NoteDomain(EnumValue):
     METRIC = "metric"
     METRIC_ENTRY = "metric-entry"
     PERSON = "person"
+
+    @property
+    def source_entity_tag(self) -> NamedEntityTag:
+        """The tag of the entity a note in this domain is attached to."""
+        if self == NoteDomain.SCHEDULE_EVENT_FULL_DAYS:
+            return NamedEntityTag.SCHEDULE_EVENT_FULL_DAYS_BLOCK
+        return NamedEntityTag[self.name]
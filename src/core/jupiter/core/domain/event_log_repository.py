@@ -0,0 +1,57 @@
+"""A repository for keeping the event logs of entities from growing without bound."""
+
+import abc
+
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.repository import Repository
+from jupiter.core.framework.value import CompositeValue, value
+
+
+@value
+class EventLogBatchOutcome(CompositeValue):
+    """What a single batch of retention work did to an event log."""
+
+    events_removed: int
+    events_added: int
+    has_more: bool
+
+
+class EventLogRepository(Repository, abc.ABC):
+    """A repository for keeping the event logs of entities from growing without bound.
+
+    Every entity type has its own event log. Old events in it can either be
+    compacted, where the events of a window of entity versions get collapsed
+    into a single snapshot event, or be moved out to a separate archive.
+    Both work in batches, and report whether there's more to do.
+    """
+
+    @abc.abstractmethod
+    async def find_all_event_logs(self) -> list[str]:
+        """Find the names of all the event logs."""
+
+    @abc.abstractmethod
+    async def has_archive(self) -> bool:
+        """Whether there's an archive to move old events to."""
+
+    @abc.abstractmethod
+    async def find_free_space_bytes(self) -> int:
+        """How much space in the storage is free to be reused."""
+
+    @abc.abstractmethod
+    async def compact_before(
+        self,
+        event_log: str,
+        before: Timestamp,
+        version_window: int,
+        batch_size: int,
+    ) -> EventLogBatchOutcome:
+        """Compact the events from before a time, for at most batch_size version windows."""
+
+    @abc.abstractmethod
+    async def archive_before(
+        self,
+        event_log: str,
+        before: Timestamp,
+        batch_size: int,
+    ) -> EventLogBatchOutcome:
+        """Move at most batch_size events from before a time to the archive."""
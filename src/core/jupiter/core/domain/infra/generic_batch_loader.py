@@ -0,0 +1,121 @@
+"""A generic loader for the linked entities of many entities at once."""
+
+from collections.abc import Sequence
+from typing import TypeVar
+
+from jupiter.core.domain.storage_engine import DomainUnitOfWork
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import (
+    CrownEntity,
+    EntityLink,
+    EntityLinkFilterCompiled,
+    EntityLinkFiltersCompiled,
+    IsFieldRefId,
+    IsOneOfRefId,
+    IsParentLink,
+    IsRefId,
+    ParentLink,
+)
+
+_LinkedEntityT = TypeVar("_LinkedEntityT", bound=CrownEntity)
+
+
+async def generic_batch_loader(
+    uow: DomainUnitOfWork,
+    entities: Sequence[CrownEntity],
+    entity_link: EntityLink[_LinkedEntityT],
+    *,
+    allow_archived: bool = False,
+    **filters: EntityLinkFilterCompiled,
+) -> dict[EntityId, list[_LinkedEntityT]]:
+    """Load the linked entities of many entities with a single query.
+
+    The result maps the ref id of each of the entities to its linked entities.
+    Any extra filters are applied on top of the ones in the link.
+    """
+    if len(entities) == 0:
+        return {}
+
+    static_filters: EntityLinkFiltersCompiled = {}
+    batch_key: str | None = None
+    keys_by_ref_id: dict[EntityId, list[EntityId]] = {}
+    for filter_name, filter_rule in entity_link.filters.items():
+        if not isinstance(
+            filter_rule, (IsRefId, IsParentLink, IsFieldRefId, IsOneOfRefId)
+        ):
+            static_filters[filter_name] = filter_rule
+            continue
+        if batch_key is not None:
+            raise Exception(
+                f"Cannot batch load a link to {entity_link.the_type.__name__} which depends on more than one field"
+            )
+        batch_key = filter_name
+        keys_by_ref_id = {
+            entity.ref_id: _keys_for_entity(entity, filter_rule) for entity in entities
+        }
+
+    if batch_key is None:
+        linked_entities = await uow.get_for(entity_link.the_type).find_all_generic(
+            parent_ref_id=None,
+            allow_archived=allow_archived,
+            **static_filters,
+            **filters,
+        )
+        return {entity.ref_id: list(linked_entities) for entity in entities}
+
+    all_keys = list({k: None for keys in keys_by_ref_id.values() for k in keys})
+    linked_entities = await uow.get_for(entity_link.the_type).find_all_generic(
+        parent_ref_id=None,
+        allow_archived=allow_archived,
+        **static_filters,
+        **filters,
+        **{batch_key: all_keys},
+    )
+
+    linked_by_key: dict[EntityId, list[_LinkedEntityT]] = {}
+    for linked_entity in linked_entities:
+        key = _linked_entity_key(linked_entity, batch_key)
+        if key is not None:
+            linked_by_key.setdefault(key, []).append(linked_entity)
+
+    return {
+        ref_id: [
+            linked_entity
+            for key in keys
+            for linked_entity in linked_by_key.get(key, [])
+        ]
+        for ref_id, keys in keys_by_ref_id.items()
+    }
+
+
+def _keys_for_entity(
+    entity: CrownEntity,
+    filter_rule: IsRefId | IsParentLink | IsFieldRefId | IsOneOfRefId,
+) -> list[EntityId]:
+    if isinstance(filter_rule, IsRefId):
+        return [entity.ref_id]
+    elif isinstance(filter_rule, IsParentLink):
+        return [entity.parent_ref_id]
+    elif isinstance(filter_rule, IsFieldRefId):
+        possible = getattr(entity, filter_rule.field_name)
+        if not isinstance(possible, EntityId):
+            raise Exception("Invalid type of filter")
+        return [possible]
+    else:
+        possible = getattr(entity, filter_rule.field_name)
+        if not isinstance(possible, list):
+            raise Exception("Invalid type of filter")
+        return [p for p in possible if isinstance(p, EntityId)]
+
+
+def _linked_entity_key(linked_entity: CrownEntity, filter_name: str) -> EntityId | None:
+    # Filters on a parent are named after the parent link field plus "_ref_id".
+    if hasattr(linked_entity, filter_name):
+        possible = getattr(linked_entity, filter_name)
+    else:
+        possible = getattr(linked_entity, filter_name.removesuffix("_ref_id"))
+    if isinstance(possible, ParentLink):
+        return possible.ref_id
+    if isinstance(possible, EntityId):
+        return possible
+    return None
@@ -0,0 +1,144 @@
+"""A planner for cascading operations over the entities descending from a root."""
+
+from dataclasses import dataclass
+from typing import Final
+
+from jupiter.core.domain.storage_engine import DomainUnitOfWork
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import (
+    ContainsLink,
+    CrownEntity,
+    Entity,
+    IsRefId,
+    StubEntity,
+    TrunkEntity,
+)
+from jupiter.core.framework.record import ContainsRecordLink, Record
+
+ContainedEntity = TrunkEntity | StubEntity | CrownEntity
+
+
+@dataclass(frozen=True)
+class ContainedTypes:
+    """The types of entities and records that an entity type contains."""
+
+    entity_types: list[type[ContainedEntity]]
+    record_types: list[type[Record]]
+
+
+@dataclass(frozen=True)
+class CascadeEntityStep:
+    """All the entities of one type, with parents in a given set, reached by a cascade."""
+
+    entity_type: type[ContainedEntity]
+    parent_ref_ids: list[EntityId]
+    unsafe_to_archive_ref_ids: list[EntityId]
+
+
+@dataclass(frozen=True)
+class CascadeRecordStep:
+    """All the records of one type, with parents in a given set, reached by a cascade."""
+
+    record_type: type[Record]
+    parent_ref_ids: list[EntityId]
+
+
+@dataclass(frozen=True)
+class CascadeLevel:
+    """Everything a cascade reaches at one depth below the root."""
+
+    entity_steps: list[CascadeEntityStep]
+    record_steps: list[CascadeRecordStep]
+
+
+_CONTAINED_TYPES: Final[dict[type[Entity], ContainedTypes]] = {}
+
+
+def contained_types(entity_type: type[Entity]) -> ContainedTypes:
+    """The types of entities and records that an entity type contains."""
+    if entity_type in _CONTAINED_TYPES:
+        return _CONTAINED_TYPES[entity_type]
+
+    entity_types: list[type[ContainedEntity]] = []
+    record_types: list[type[Record]] = []
+    for field in entity_type.__dict__.values():
+        if not isinstance(field, (ContainsLink, ContainsRecordLink)):
+            continue
+        # Children are found via their parent, so only links which tie the
+        # child to this entity's ref id take part. Other links, like the
+        # writing tasks of journals, are reached through their own parents.
+        if not any(isinstance(f, IsRefId) for f in field.filters.values()):
+            continue
+        if issubclass(field.the_type, (TrunkEntity, StubEntity, CrownEntity)):
+            entity_types.append(field.the_type)
+        elif issubclass(field.the_type, Record):
+            record_types.append(field.the_type)
+        else:
+            raise Exception(f"Unsupported field type {field.the_type}")
+
+    result = ContainedTypes(entity_types=entity_types, record_types=record_types)
+    _CONTAINED_TYPES[entity_type] = result
+    return result
+
+
+async def plan_cascade(
+    uow: DomainUnitOfWork,
+    root: Entity,
+    *,
+    for_archival: bool,
+) -> list[CascadeLevel]:
+    """Find all the entities and records descending from a root, level by level.
+
+    Each level has one step per contained type, covering all the parents from the
+    level above at once. When planning for an archival, archived entities and
+    everything under them are left out, and entities which aren't safe to archive
+    are noted in their step.
+    """
+    levels: list[CascadeLevel] = []
+    frontier: dict[type[Entity], list[EntityId]] = {root.__class__: [root.ref_id]}
+
+    while len(frontier) > 0:
+        level = CascadeLevel(entity_steps=[], record_steps=[])
+        next_frontier: dict[type[Entity], list[EntityId]] = {}
+
+        for parent_type, parent_ref_ids in frontier.items():
+            parent_contained_types = contained_types(parent_type)
+
+            for record_type in parent_contained_types.record_types:
+                level.record_steps.append(
+                    CascadeRecordStep(record_type, parent_ref_ids)
+                )
+
+            for entity_type in parent_contained_types.entity_types:
+                repository = uow.get_for(entity_type)
+                unsafe_to_archive_ref_ids: list[EntityId] = []
+                if for_archival and _can_be_unsafe_to_archive(entity_type):
+                    children = await repository.find_all_by_parents(parent_ref_ids)
+                    child_ref_ids = [child.ref_id for child in children]
+                    unsafe_to_archive_ref_ids = [
+                        child.ref_id
+                        for child in children
+                        if not child.is_safe_to_archive
+                    ]
+                else:
+                    child_ref_ids = await repository.find_ref_ids_by_parents(
+                        parent_ref_ids, allow_archived=not for_archival
+                    )
+
+                level.entity_steps.append(
+                    CascadeEntityStep(
+                        entity_type, parent_ref_ids, unsafe_to_archive_ref_ids
+                    )
+                )
+                if len(child_ref_ids) > 0:
+                    next_frontier.setdefault(entity_type, []).extend(child_ref_ids)
+
+        levels.append(level)
+        frontier = next_frontier
+
+    return levels
+
+
+def _can_be_unsafe_to_archive(entity_type: type[Entity]) -> bool:
+    # Only types which override the default need their entities loaded to check.
+    return entity_type.is_safe_to_archive is not Entity.is_safe_to_archive
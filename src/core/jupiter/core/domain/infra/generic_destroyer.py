@@ -1,16 +1,10 @@
 """A generic archiver service."""
 
+from jupiter.core.domain.infra.generic_cascade_planner import plan_cascade
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.context import DomainContext
-from jupiter.core.framework.entity import (
-    ContainsLink,
-    CrownEntity,
-    RootEntity,
-    StubEntity,
-    TrunkEntity,
-)
-from jupiter.core.framework.record import ContainsRecordLink, Record
+from jupiter.core.framework.entity import RootEntity
 
 
 async def generic_destroyer(
@@ -20,48 +14,18 @@ async def generic_destroyer(
     ref_id: EntityId,
 ) -> None:
     """Removes all entities descending from a given root, no exceptions."""
-
-    async def _remover(
-        entity: RootEntity | TrunkEntity | StubEntity | CrownEntity,
-    ) -> None:
-        for field in entity.__class__.__dict__.values():
-            if not isinstance(field, ContainsLink) and not isinstance(
-                field, ContainsRecordLink
-            ):
-                continue
-
-            if issubclass(field.the_type, TrunkEntity):
-                linked_trunk_entity = await uow.get_for(field.the_type).load_by_parent(
-                    entity.ref_id
-                )
-
-                await _remover(linked_trunk_entity)
-            elif issubclass(field.the_type, StubEntity):
-                linked_stub_entity = await uow.get_for(field.the_type).load_by_parent(
-                    entity.ref_id
-                )
-
-                await _remover(linked_stub_entity)
-            elif issubclass(field.the_type, CrownEntity):
-                linked_entities = await uow.get_for(field.the_type).find_all(
-                    parent_ref_id=entity.ref_id, allow_archived=False
-                )
-
-                for linked_entity in linked_entities:
-                    await _remover(linked_entity)
-            elif issubclass(field.the_type, Record):
-                linked_records = await uow.get_for_record(field.the_type).find_all(
-                    entity.ref_id,
-                )
-
-                for linked_record in linked_records:
-                    await uow.get_for_record(field.the_type).remove(
-                        linked_record.raw_key
-                    )
-            else:
-                raise Exception(f"Unsupported field type {field.the_type}")
-
-        await uow.get_for(entity.__class__).remove(entity.ref_id)
-
     entity = await uow.get_for(entity_type).load_by_id(ref_id)
-    await _remover(entity)
+    levels = await plan_cascade(uow, entity, for_archival=False)
+
+    # Children go before their parents, one bulk delete per type and level.
+    for level in reversed(levels):
+        for record_step in level.record_steps:
+            await uow.get_for_record(record_step.record_type).remove_all(
+                record_step.parent_ref_ids
+            )
+        for entity_step in level.entity_steps:
+            await uow.get_for(entity_step.entity_type).remove_all_by_parents(
+                entity_step.parent_ref_ids
+            )
+
+    await uow.get_for(entity_type).remove(entity.ref_id)
@@ -1,17 +1,11 @@
 """A generic archiver service."""
 
 from jupiter.core.domain.core.archival_reason import ArchivalReason
+from jupiter.core.domain.infra.generic_cascade_planner import plan_cascade
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.context import DomainContext
-from jupiter.core.framework.entity import (
-    ContainsLink,
-    CrownEntity,
-    RootEntity,
-    StubEntity,
-    TrunkEntity,
-)
-from jupiter.core.framework.record import ContainsRecordLink, Record
+from jupiter.core.framework.entity import RootEntity
 
 
 async def generic_full_archiver(
@@ -22,54 +16,25 @@ async def generic_full_archiver(
     archival_reason: ArchivalReason,
 ) -> None:
     """Archives all entities descending from a given root, no exceptions."""
-
-    async def _archiver(
-        entity: RootEntity | TrunkEntity | StubEntity | CrownEntity,
-    ) -> None:
-        if entity.archived:
-            return
-        if entity.is_safe_to_archive:
-            entity = entity.mark_archived(ctx, archival_reason)
-            # Typing is faulty here, as it can't map A|B|C|D to
-            # save(A) or save(B) or save(C) or save(D)
-            await uow.get_for(entity.__class__).save(entity)  # type: ignore
-
-        for field in entity.__class__.__dict__.values():
-            if not isinstance(field, ContainsLink) and not isinstance(
-                field, ContainsRecordLink
-            ):
-                continue
-
-            if issubclass(field.the_type, TrunkEntity):
-                linked_trunk_entity = await uow.get_for(field.the_type).load_by_parent(
-                    entity.ref_id
-                )
-
-                await _archiver(linked_trunk_entity)
-            elif issubclass(field.the_type, StubEntity):
-                linked_stub_entity = await uow.get_for(field.the_type).load_by_parent(
-                    entity.ref_id
-                )
-
-                await _archiver(linked_stub_entity)
-            elif issubclass(field.the_type, CrownEntity):
-                linked_entities = await uow.get_for(field.the_type).find_all(
-                    parent_ref_id=entity.ref_id, allow_archived=False
-                )
-
-                for linked_entity in linked_entities:
-                    await _archiver(linked_entity)
-            elif issubclass(field.the_type, Record):
-                linked_records = await uow.get_for_record(field.the_type).find_all(
-                    entity.ref_id,
-                )
-
-                for linked_record in linked_records:
-                    await uow.get_for_record(field.the_type).remove(
-                        linked_record.raw_key
-                    )
-            else:
-                raise Exception(f"Unsupported field type {field.the_type}")
-
     entity = await uow.get_for(entity_type).load_by_id(ref_id)
-    await _archiver(entity)
+
+    # The whole plan is read before anything gets archived, since archiving
+    # hides entities from the reads the planner does.
+    levels = await plan_cascade(uow, entity, for_archival=True)
+
+    if entity.is_safe_to_archive:
+        entity = entity.mark_archived(ctx, archival_reason)
+        await uow.get_for(entity_type).save(entity)
+
+    for level in levels:
+        for record_step in level.record_steps:
+            await uow.get_for_record(record_step.record_type).remove_all(
+                record_step.parent_ref_ids
+            )
+        for entity_step in level.entity_steps:
+            await uow.get_for(entity_step.entity_type).archive_all_by_parents(
+                ctx,
+                entity_step.parent_ref_ids,
+                archival_reason,
+                exclude_ref_ids=entity_step.unsafe_to_archive_ref_ids,
+            )
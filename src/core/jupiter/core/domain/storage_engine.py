@@ -93,6 +93,12 @@ class DomainStorageEngine(abc.ABC):
     def get_unit_of_work(self) -> AbstractAsyncContextManager[DomainUnitOfWork]:
         """Build a unit of work."""
 
+    @abc.abstractmethod
+    def get_read_unit_of_work(
+        self,
+    ) -> AbstractAsyncContextManager[DomainUnitOfWork]:
+        """Build a unit of work which can only read."""
+
 
 class SearchUnitOfWork(abc.ABC):
     """A unit of work from a search engine."""
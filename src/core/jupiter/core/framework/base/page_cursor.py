@@ -0,0 +1,87 @@
+"""A cursor into a paginated list of entities."""
+
+import base64
+import binascii
+import json
+
+import pendulum.parser
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.entity import CrownEntity
+from jupiter.core.framework.errors import InputValidationError
+from jupiter.core.framework.realm import (
+    DatabaseRealm,
+    RealmDecoder,
+    RealmDecodingError,
+    RealmEncoder,
+    RealmThing,
+)
+from jupiter.core.framework.value import AtomicValue, value
+from pendulum.datetime import DateTime
+
+
+@value
+class PageCursor(AtomicValue[str]):
+    """A cursor into a paginated list of entities.
+
+    Pages are ordered by last modified time, with the ref id breaking ties,
+    and a cursor points just past the last entity of a page. Clients see it
+    as an opaque string.
+    """
+
+    last_modified_time: Timestamp
+    ref_id: EntityId
+
+    @staticmethod
+    def after_entity(entity: CrownEntity) -> "PageCursor":
+        """A cursor for the page which follows a given entity."""
+        return PageCursor(
+            last_modified_time=entity.last_modified_time, ref_id=entity.ref_id
+        )
+
+
+class PageCursorDatabaseEncoder(RealmEncoder[PageCursor, DatabaseRealm]):
+    """An encoder for page cursors."""
+
+    def encode(self, value: PageCursor) -> RealmThing:
+        """Encode to a database realm."""
+        raw = json.dumps(
+            [value.last_modified_time.the_ts.isoformat(), value.ref_id.the_id]
+        )
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+class PageCursorDatabaseDecoder(RealmDecoder[PageCursor, DatabaseRealm]):
+    """A decoder for page cursors."""
+
+    def decode(self, value: RealmThing) -> PageCursor:
+        """Decode from a database realm."""
+        if not isinstance(value, str):
+            raise RealmDecodingError(
+                f"Expected value for {self.__class__} to be a string"
+            )
+
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(value.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError) as err:
+            raise InputValidationError(f"Invalid page cursor '{value}'") from err
+
+        if (
+            not isinstance(raw, list)
+            or len(raw) != 2
+            or not all(isinstance(r, str) for r in raw)
+            or not raw[1].isdigit()
+        ):
+            raise InputValidationError(f"Invalid page cursor '{value}'")
+
+        try:
+            last_modified_time = pendulum.parser.parse(raw[0], exact=True)
+        except ValueError as err:
+            raise InputValidationError(f"Invalid page cursor '{value}'") from err
+        if not isinstance(last_modified_time, DateTime):
+            raise InputValidationError(f"Invalid page cursor '{value}'")
+
+        return PageCursor(
+            last_modified_time=Timestamp.from_date_and_time(last_modified_time),
+            ref_id=EntityId(raw[1]),
+        )
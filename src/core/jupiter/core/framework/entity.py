@@ -43,6 +43,12 @@ class Entity(Concept):
     archived_time: Timestamp | None = dataclasses.field(compare=False, hash=False)
     events: list[Event] = dataclasses.field(compare=False, hash=False)
 
+    # How many of the events are already in the event store. It's not part of any
+    # realm, and dataclasses.replace() resets it, so new versions carry it over.
+    _persisted_events_count: int = dataclasses.field(
+        default=0, init=False, compare=False, repr=False
+    )
+
     @classmethod
     def _create(
         cls: type[_EntityT],
@@ -73,21 +79,42 @@ class Entity(Concept):
         # the original object.
         for arg_name, arg_value in kwargs.items():
             if arg_value != getattr(self, arg_name):
-                return cast(
-                    _EntityT,
-                    dataclasses.replace(
-                        self,
-                        version=self.version + 1,
-                        events=self.events.copy(),
-                        last_modified_time=ctx.action_timestamp,
-                        **kwargs,  # type: ignore[arg-type]
-                    ),
+                return self._carry_persisted_events_count(
+                    cast(
+                        _EntityT,
+                        dataclasses.replace(
+                            self,
+                            version=self.version + 1,
+                            events=self.events.copy(),
+                            last_modified_time=ctx.action_timestamp,
+                            **kwargs,  # type: ignore[arg-type]
+                        ),
+                    )
                 )
         return self
 
     def assign_ref_id(self: _EntityT, ref_id: EntityId) -> _EntityT:
         """Assign a ref id to the root."""
-        return dataclasses.replace(self, ref_id=ref_id)
+        return self._carry_persisted_events_count(
+            dataclasses.replace(self, ref_id=ref_id)
+        )
+
+    @property
+    def persisted_events_count(self) -> int:
+        """How many of the events, from the start, are already in the event store."""
+        return self._persisted_events_count
+
+    def mark_events_persisted(self) -> None:
+        """Record that all the events so far have been written to the event store."""
+        object.__setattr__(self, "_persisted_events_count", len(self.events))
+
+    def _carry_persisted_events_count(self, new_entity: _EntityT) -> _EntityT:
+        # A new version starts out with the same events, so the ones already
+        # written stay written.
+        object.__setattr__(
+            new_entity, "_persisted_events_count", self._persisted_events_count
+        )
+        return new_entity
 
     def mark_archived(
         self: _EntityT,
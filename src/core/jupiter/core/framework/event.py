@@ -15,6 +15,8 @@ class EventKind(enum.Enum):
     CREATE = "Created"
     UPDATE = "Updated"
     ARCHIVE = "Archived"
+    # Stands in for a run of older events, once they've been compacted.
+    SNAPSHOT = "Snapshot"
 
 
 @enum_value
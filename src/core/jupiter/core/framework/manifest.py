@@ -0,0 +1,155 @@
+"""A precomputed manifest of what the modules under some module roots define.
+
+Building the registries of an app means importing every module under its
+module roots and reflecting over them. A manifest records the outcome of
+that as import paths, so the registries can be built without the scan, and
+a module only gets imported once something defined in it is needed.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Final, Generic, TypeVar
+
+MANIFEST_FORMAT_VERSION: Final[int] = 1
+
+ManifestEntry = tuple[str, ...]
+ManifestSection = list[ManifestEntry]
+
+_KeyT = TypeVar("_KeyT")
+_ValueT = TypeVar("_ValueT")
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """A manifest, with a section for each registry it describes."""
+
+    fingerprint: str
+    sections: dict[str, ManifestSection]
+
+    def section(self, name: str) -> ManifestSection:
+        """The entries of a particular section."""
+        if name not in self.sections:
+            raise Exception(f"Manifest has no section {name}")
+        return self.sections[name]
+
+
+def fingerprint_module_roots(*module_roots: ModuleType) -> str:
+    """A fingerprint of the sources under some module roots.
+
+    It covers the path, size and modification time of every source file, so
+    it changes whenever a module is added, removed or edited.
+    """
+    digest = hashlib.sha256()
+    for module_root in module_roots:
+        for root_path in module_root.__path__:
+            for dir_path, dir_names, file_names in os.walk(root_path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    if not file_name.endswith(".py"):
+                        continue
+                    file_path = Path(dir_path) / file_name
+                    file_stat = file_path.stat()
+                    relative_path = file_path.relative_to(root_path)
+                    digest.update(
+                        f"{module_root.__name__}:{relative_path}:{file_stat.st_size}:{file_stat.st_mtime_ns}\n".encode()
+                    )
+    return digest.hexdigest()
+
+
+def import_path(the_type: type) -> str:
+    """The path a type can be imported from."""
+    return f"{the_type.__module__}:{the_type.__qualname__}"
+
+
+def resolve_import_path(path: str) -> type:
+    """Import the type at a path."""
+    module_name, _, qualname = path.partition(":")
+    obj: object = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    if not isinstance(obj, type):
+        raise Exception(f"Manifest path {path} does not point to a type")
+    return obj
+
+
+def load_manifest(manifest_path: Path, *module_roots: ModuleType) -> Manifest | None:
+    """Load a manifest, if there is one and it is up to date with the module roots."""
+    try:
+        raw_manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(raw_manifest, dict)
+        or raw_manifest.get("version") != MANIFEST_FORMAT_VERSION
+    ):
+        return None
+
+    fingerprint = fingerprint_module_roots(*module_roots)
+    if raw_manifest.get("fingerprint") != fingerprint:
+        return None
+
+    return Manifest(
+        fingerprint=fingerprint,
+        sections={
+            name: [tuple(entry) for entry in entries]
+            for name, entries in raw_manifest["sections"].items()
+        },
+    )
+
+
+def save_manifest(manifest_path: Path, manifest: Manifest) -> None:
+    """Save a manifest."""
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "version": MANIFEST_FORMAT_VERSION,
+                "fingerprint": manifest.fingerprint,
+                "sections": manifest.sections,
+            },
+            indent=1,
+        )
+    )
+
+
+class LazyTypeMapping(Mapping[type[_KeyT], _ValueT], Generic[_KeyT, _ValueT]):
+    """A mapping keyed by types, whose entries are resolved on first lookup.
+
+    Entries are given by the import path of their key, together with a function
+    which builds the value from the key once it is imported.
+    """
+
+    _resolved: dict[type[_KeyT], _ValueT]
+    _pending: dict[str, Callable[[type[_KeyT]], _ValueT]]
+
+    def __init__(self, pending: dict[str, Callable[[type[_KeyT]], _ValueT]]) -> None:
+        """Constructor."""
+        self._resolved = {}
+        self._pending = pending
+
+    def __getitem__(self, key: type[_KeyT]) -> _ValueT:
+        """Get the value for a key, resolving it if needed."""
+        if key in self._resolved:
+            return self._resolved[key]
+        resolver = self._pending.pop(import_path(key), None)
+        if resolver is None:
+            raise KeyError(key)
+        value = resolver(key)
+        self._resolved[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[type[_KeyT]]:
+        """Iterate over all the keys, resolving them all."""
+        for path in list(self._pending):
+            self[resolve_import_path(path)]
+        return iter(self._resolved)
+
+    def __len__(self) -> int:
+        """The number of entries, resolved or not."""
+        return len(self._resolved) + len(self._pending)
@@ -0,0 +1,69 @@
+"""Framework level elements for use cases which return a page of entities at a time."""
+
+from dataclasses import dataclass
+from typing import Final, TypeVar
+
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.page_cursor import PageCursor
+from jupiter.core.framework.entity import CrownEntity, EntityLinkFilterCompiled
+from jupiter.core.framework.errors import InputValidationError
+from jupiter.core.framework.repository import CrownEntityRepository
+from jupiter.core.framework.use_case_io import UseCaseArgsBase, UseCaseResultBase
+from jupiter.core.framework.value import EnumValue
+
+MAX_PAGE_SIZE: Final[int] = 1000
+
+_CrownEntityT = TypeVar("_CrownEntityT", bound=CrownEntity)
+_ArchivalReasonT = TypeVar("_ArchivalReasonT", bound=EnumValue)
+
+
+@dataclass(frozen=True)
+class PaginatedUseCaseArgsBase(UseCaseArgsBase):
+    """The base class for use case args types which ask for a page of entities.
+
+    Without a page size all the entities past the cursor are returned.
+    """
+
+    page_size: int | None
+    cursor: PageCursor | None
+
+
+@dataclass(frozen=True)
+class PaginatedUseCaseResultBase(UseCaseResultBase):
+    """The base class for use case result types which hold a page of entities.
+
+    The page itself is in an entries field of the derived type. The next cursor
+    is None when this is the last page.
+    """
+
+    next_cursor: PageCursor | None
+
+
+async def find_page(
+    repository: CrownEntityRepository[_CrownEntityT],
+    args: PaginatedUseCaseArgsBase,
+    *,
+    parent_ref_id: EntityId,
+    allow_archived: bool | _ArchivalReasonT | list[_ArchivalReasonT] = False,
+    **kwargs: EntityLinkFilterCompiled,
+) -> tuple[list[_CrownEntityT], PageCursor | None]:
+    """Find the page of crowns some args ask for, and the cursor for the next one."""
+    if args.page_size is not None and not (1 <= args.page_size <= MAX_PAGE_SIZE):
+        raise InputValidationError(
+            f"Page size must be between 1 and {MAX_PAGE_SIZE}, not {args.page_size}"
+        )
+
+    # One more crown than asked for tells whether there's a next page at all.
+    entities = await repository.find_page_generic(
+        args.page_size + 1 if args.page_size is not None else None,
+        args.cursor,
+        parent_ref_id=parent_ref_id,
+        allow_archived=allow_archived,
+        **kwargs,
+    )
+
+    if args.page_size is None or len(entities) <= args.page_size:
+        return entities, None
+
+    page = entities[: args.page_size]
+    return page, PageCursor.after_entity(page[-1])
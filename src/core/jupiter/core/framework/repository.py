@@ -5,6 +5,8 @@ from collections.abc import Iterable
 from typing import Generic, TypeVar
 
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.page_cursor import PageCursor
+from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.entity import (
     BranchEntity,
     CrownEntity,
@@ -59,6 +61,10 @@ class RecordRepository(Generic[RecordT, RecordKeyT], Repository, abc.ABC):
     async def find_all(self, parent_ref_id: EntityId | list[EntityId]) -> list[RecordT]:
         """Find all records matching some criteria."""
 
+    @abc.abstractmethod
+    async def remove_all(self, parent_ref_id: EntityId | list[EntityId]) -> None:
+        """Hard remove all the records of one or more parents - an irreversible operation."""
+
 
 class EntityAlreadyExistsError(Exception):
     """Error raised when an entity already exists."""
@@ -87,6 +93,35 @@ class EntityRepository(Generic[EntityT], Repository, abc.ABC):
     async def remove(self, ref_id: EntityId) -> EntityT:
         """Hard remove an entity - an irreversible operation."""
 
+    # The bulk operations below work with the children of many parents at once, and
+    # only make sense for entities which have a parent.
+
+    @abc.abstractmethod
+    async def find_ref_ids_by_parents(
+        self, parent_ref_ids: list[EntityId], allow_archived: bool = False
+    ) -> list[EntityId]:
+        """Find the ids of all entities with one of the given parents."""
+
+    @abc.abstractmethod
+    async def find_all_by_parents(
+        self, parent_ref_ids: list[EntityId], allow_archived: bool = False
+    ) -> list[EntityT]:
+        """Find all entities with one of the given parents."""
+
+    @abc.abstractmethod
+    async def archive_all_by_parents(
+        self,
+        ctx: DomainContext,
+        parent_ref_ids: list[EntityId],
+        archival_reason: ArchivalReasonT,
+        exclude_ref_ids: list[EntityId] | None = None,
+    ) -> None:
+        """Archive all unarchived entities with one of the given parents, in bulk."""
+
+    @abc.abstractmethod
+    async def remove_all_by_parents(self, parent_ref_ids: list[EntityId]) -> None:
+        """Hard remove all entities with one of the given parents - an irreversible operation."""
+
 
 RootEntityT = TypeVar("RootEntityT", bound=RootEntity)
 
@@ -106,6 +141,10 @@ class RootEntityRepository(EntityRepository[RootEntityT], abc.ABC):
     async def load_optional(self, entity_id: EntityId) -> RootEntityT | None:
         """Loads the root entity but returns null if there isn't one."""
 
+    @abc.abstractmethod
+    async def load_version_optional(self, entity_id: EntityId) -> int | None:
+        """Loads just the version of the root entity, or null if there isn't one."""
+
     @abc.abstractmethod
     async def find_all(
         self,
@@ -202,6 +241,35 @@ class CrownEntityRepository(EntityRepository[CrownEntityT], abc.ABC):
     ) -> list[CrownEntityT]:
         """Find all crowns with generic filters."""
 
+    @abc.abstractmethod
+    async def find_page_generic(
+        self,
+        page_size: int | None,
+        page_cursor: PageCursor | None,
+        /,
+        *,
+        parent_ref_id: EntityId | None = None,
+        allow_archived: bool | ArchivalReasonT | list[ArchivalReasonT] = False,
+        **kwargs: EntityLinkFilterCompiled,
+    ) -> list[CrownEntityT]:
+        """Find a page of crowns with generic filters.
+
+        Crowns are ordered by last modified time and ref id, and only those past
+        the cursor, up to the page size, are returned.
+        """
+
+    @abc.abstractmethod
+    async def create_many(self, entities: list[CrownEntityT]) -> list[CrownEntityT]:
+        """Create several crowns at once, returning them with their ref ids assigned."""
+
+    @abc.abstractmethod
+    async def save_many(self, entities: list[CrownEntityT]) -> list[CrownEntityT]:
+        """Save several crowns at once."""
+
+    @abc.abstractmethod
+    async def remove_many(self, ref_ids: list[EntityId]) -> list[CrownEntityT]:
+        """Hard remove several crowns at once - an irreversible operation."""
+
 
 BranchEntityT = TypeVar("BranchEntityT", bound=BranchEntity)
 
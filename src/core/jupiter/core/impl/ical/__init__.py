@@ -0,0 +1 @@
+"""Implementations for fetching iCal calendars."""
@@ -0,0 +1,62 @@
+"""An iCal fetcher backed by aiohttp."""
+
+import asyncio
+from typing import Final
+
+import aiohttp
+from jupiter.core.domain.concept.schedule.ical_fetcher import (
+    ICalFetcher,
+    ICalFetchError,
+    ICalFetchResult,
+)
+from jupiter.core.domain.core.url import URL
+
+_FETCH_TIMEOUT_SECS: Final[int] = 10
+
+
+class AiohttpICalFetcher(ICalFetcher):
+    """An iCal fetcher backed by aiohttp."""
+
+    _session: Final[aiohttp.ClientSession]
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Constructor."""
+        self._session = session
+
+    async def fetch(
+        self, url: URL, etag: str | None, last_modified: str | None
+    ) -> ICalFetchResult:
+        """Fetch an iCal, conditional on it having changed since the etag or last modified time."""
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            async with self._session.get(
+                url.the_url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=_FETCH_TIMEOUT_SECS),
+            ) as response:
+                if response.status == 304:
+                    return ICalFetchResult(
+                        content=None,
+                        etag=response.headers.get("ETag", etag),
+                        last_modified=response.headers.get(
+                            "Last-Modified", last_modified
+                        ),
+                    )
+                if response.status != 200:
+                    raise ICalFetchError(
+                        f"Failed to fetch iCal from {url} (error {response.status})"
+                    )
+                return ICalFetchResult(
+                    content=await response.text(),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+        except asyncio.TimeoutError as err:
+            raise ICalFetchError(f"Failed to fetch iCal from {url} (timeout)") from err
+        except aiohttp.ClientError as err:
+            raise ICalFetchError(f"Failed to fetch iCal from {url} ({err})") from err
@@ -0,0 +1,60 @@
+"""An iCal fetcher backed by requests."""
+
+import asyncio
+from typing import Final
+
+import requests
+from jupiter.core.domain.concept.schedule.ical_fetcher import (
+    ICalFetcher,
+    ICalFetchError,
+    ICalFetchResult,
+)
+from jupiter.core.domain.core.url import URL
+
+_FETCH_TIMEOUT_SECS: Final[int] = 10
+
+
+class RequestsICalFetcher(ICalFetcher):
+    """An iCal fetcher backed by requests.
+
+    Requests blocks, so each fetch runs in a worker thread to keep the event
+    loop free. This is for apps which don't otherwise hold an aiohttp session.
+    """
+
+    async def fetch(
+        self, url: URL, etag: str | None, last_modified: str | None
+    ) -> ICalFetchResult:
+        """Fetch an iCal, conditional on it having changed since the etag or last modified time."""
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = await asyncio.to_thread(
+                requests.get,
+                url.the_url,
+                headers=headers,
+                timeout=_FETCH_TIMEOUT_SECS,
+            )
+        except requests.exceptions.Timeout as err:
+            raise ICalFetchError(f"Failed to fetch iCal from {url} (timeout)") from err
+        except requests.RequestException as err:
+            raise ICalFetchError(f"Failed to fetch iCal from {url} ({err})") from err
+
+        if response.status_code == 304:
+            return ICalFetchResult(
+                content=None,
+                etag=response.headers.get("ETag", etag),
+                last_modified=response.headers.get("Last-Modified", last_modified),
+            )
+        if response.status_code != 200:
+            raise ICalFetchError(
+                f"Failed to fetch iCal from {url} (error {response.status_code})"
+            )
+        return ICalFetchResult(
+            content=response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
@@ -1,21 +1,84 @@
 """The SQLite connection."""
 
+import asyncio
 import json
-from dataclasses import dataclass
+import logging
+import pickle  # nosec
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Final
 
+import sqlalchemy
 import sqlalchemy.exc
-from alembic import command
-from alembic.config import Config
 from jupiter.core.framework.storage import Connection, ConnectionPrepareError
 from pydantic_core import to_jsonable_python
+from sqlalchemy import MetaData, event, make_url, text
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import ConnectionPoolEntry
+
+LOGGER = logging.getLogger(__name__)
+
+_REVISION_RE: Final[re.Pattern[str]] = re.compile(
+    r"^revision\b[^=]*=\s*[\"'](\w+)[\"']", re.MULTILINE
+)
+_DOWN_REVISION_RE: Final[re.Pattern[str]] = re.compile(
+    r"^down_revision\b[^=]*=(.*)$", re.MULTILINE
+)
+_QUOTED_REVISION_RE: Final[re.Pattern[str]] = re.compile(r"[\"'](\w+)[\"']")
+
+# The schema the event archive is attached as, when there is one.
+EVENT_ARCHIVE_SCHEMA: Final[str] = "event_archive"
 
 
 class SqliteConnection(Connection):
     """A connection to the file backed Sqlite storage engine."""
 
+    @dataclass(frozen=True)
+    class Tuning:
+        """The pragmas applied to every connection, and periodic maintenance.
+
+        The defaults put the database in WAL mode, so readers don't block behind
+        a writer, and trade a little durability on power loss (synchronous=NORMAL)
+        for much cheaper commits.
+        """
+
+        journal_mode: str = "WAL"
+        synchronous: str = "NORMAL"
+        busy_timeout_ms: int = 5_000
+        # Negative values are in KiB, as per the cache_size pragma.
+        cache_size: int = -64 * 1024
+        mmap_size_bytes: int = 256 * 1024 * 1024
+        temp_store: str = "MEMORY"
+        # How often to run PRAGMA optimize and a WAL checkpoint, if ever.
+        maintenance_interval_secs: float | None = 60 * 60
+
+        @staticmethod
+        def sqlite_defaults() -> "SqliteConnection.Tuning":
+            """The settings SQLite would use on its own, with no maintenance."""
+            return SqliteConnection.Tuning(
+                journal_mode="DELETE",
+                synchronous="FULL",
+                busy_timeout_ms=5_000,
+                cache_size=-2_000,
+                mmap_size_bytes=0,
+                temp_store="DEFAULT",
+                maintenance_interval_secs=None,
+            )
+
+        @property
+        def pragmas(self) -> list[str]:
+            """The pragmas to run on a new connection."""
+            return [
+                f"PRAGMA journal_mode={self.journal_mode}",
+                f"PRAGMA synchronous={self.synchronous}",
+                f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+                f"PRAGMA cache_size={self.cache_size}",
+                f"PRAGMA mmap_size={self.mmap_size_bytes}",
+                f"PRAGMA temp_store={self.temp_store}",
+            ]
+
     @dataclass(frozen=True)
     class Config:
         """Config for a Sqlite metric engine."""
@@ -23,15 +86,54 @@ class SqliteConnection(Connection):
         sqlite_db_url: str
         alembic_ini_path: Path
         alembic_migrations_path: Path
+        tuning: "SqliteConnection.Tuning" = field(
+            default_factory=lambda: SqliteConnection.Tuning()
+        )
+        # A separate database old events get moved to, attached to every
+        # connection which can write.
+        event_archive_db_path: Path | None = None
 
     _config: Final[Config]
     _sql_engine: Final[AsyncEngine]
+    _read_sql_engine: Final[AsyncEngine]
+    _maintenance_task: asyncio.Task[None] | None
+    _schema_revisions: frozenset[str] | None
+    _metadata: MetaData
+    _metadata_reflected: bool
+    _metadata_lock: Final[asyncio.Lock]
 
     def __init__(self, config: Config) -> None:
         """Constructor."""
         self._config = config
-        self._sql_engine = create_async_engine(
+        self._sql_engine = self._build_engine(
             config.sqlite_db_url,
+            config.tuning,
+            event_archive_db_path=config.event_archive_db_path,
+        )
+        # For an in memory database a second engine would open a second, empty,
+        # database, so both reads and writes go through the one engine.
+        self._read_sql_engine = (
+            self._sql_engine
+            if self._is_in_memory(config.sqlite_db_url)
+            else self._build_engine(
+                config.sqlite_db_url, config.tuning, query_only=True
+            )
+        )
+        self._maintenance_task = None
+        self._schema_revisions = None
+        self._metadata = MetaData()
+        self._metadata_reflected = False
+        self._metadata_lock = asyncio.Lock()
+
+    @staticmethod
+    def _build_engine(
+        sqlite_db_url: str,
+        tuning: "SqliteConnection.Tuning",
+        query_only: bool = False,
+        event_archive_db_path: Path | None = None,
+    ) -> AsyncEngine:
+        sql_engine = create_async_engine(
+            sqlite_db_url,
             future=True,
             json_serializer=lambda *a, **kw: json.dumps(
                 to_jsonable_python(*a, **kw),
@@ -39,31 +141,221 @@ class SqliteConnection(Connection):
             # connect_args={"detect_types": sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES}
         )
 
+        pragmas = tuning.pragmas
+        if query_only:
+            # Last, since setting the journal mode can itself need a write.
+            pragmas.append("PRAGMA query_only=ON")
+
+        @event.listens_for(sql_engine.sync_engine, "connect")
+        def _apply_tuning(
+            dbapi_connection: DBAPIConnection, _: ConnectionPoolEntry
+        ) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+                if event_archive_db_path is not None:
+                    cursor.execute(
+                        f"ATTACH DATABASE ? AS {EVENT_ARCHIVE_SCHEMA}",
+                        (str(event_archive_db_path),),
+                    )
+            finally:
+                cursor.close()
+
+        return sql_engine
+
+    @staticmethod
+    def _is_in_memory(sqlite_db_url: str) -> bool:
+        database = make_url(sqlite_db_url).database
+        return database is None or database in ("", ":memory:")
+
     async def prepare(self) -> None:
         """Prepare the Sqlite storage."""
         try:
-            async with self._sql_engine.begin() as connection:
-                alembic_cfg = Config(str(self._config.alembic_ini_path))
-                alembic_cfg.set_section_option(
-                    "alembic",
-                    "script_location",
-                    str(self._config.alembic_migrations_path),
-                )
-                alembic_cfg.attributes["connection"] = connection
-                command.upgrade(alembic_cfg, "head")
+            self._schema_revisions = await self._read_schema_revisions()
+            head_revisions = self._find_head_revisions(
+                self._config.alembic_migrations_path
+            )
+            if not head_revisions or self._schema_revisions != head_revisions:
+                await self._migrate()
+                self._schema_revisions = await self._read_schema_revisions()
         except sqlalchemy.exc.OperationalError as exc:
             raise ConnectionPrepareError("Failed to prepare Sqlite connection") from exc
+        if (
+            self._config.tuning.maintenance_interval_secs is not None
+            and self._maintenance_task is None
+        ):
+            self._maintenance_task = asyncio.create_task(
+                self._run_maintenance(self._config.tuning.maintenance_interval_secs)
+            )
+
+    async def _read_schema_revisions(self) -> frozenset[str]:
+        async with self._sql_engine.connect() as connection:
+            has_version_table = (
+                await connection.execute(
+                    text(
+                        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='alembic_version'"
+                    )
+                )
+            ).first()
+            if has_version_table is None:
+                return frozenset()
+            result = await connection.execute(
+                text("SELECT version_num FROM alembic_version")
+            )
+            return frozenset(row[0] for row in result)
+
+    @staticmethod
+    def _find_head_revisions(alembic_migrations_path: Path) -> frozenset[str]:
+        """The revisions no other migration builds on.
+
+        These are read straight out of the headers of the migration scripts,
+        which is a lot cheaper than having Alembic load them all.
+        """
+        revisions = set()
+        down_revisions = set()
+        for script_path in (alembic_migrations_path / "versions").glob("*.py"):
+            script = script_path.read_text()
+            revision_match = _REVISION_RE.search(script)
+            if revision_match is None:
+                continue
+            revisions.add(revision_match.group(1))
+            down_revision_match = _DOWN_REVISION_RE.search(script)
+            if down_revision_match is not None:
+                down_revisions.update(
+                    _QUOTED_REVISION_RE.findall(down_revision_match.group(1))
+                )
+        return frozenset(revisions - down_revisions)
+
+    async def _migrate(self) -> None:
+        # Alembic is only needed when there's something to migrate, and
+        # importing it is a good chunk of the time it takes to start up.
+        from alembic import command
+        from alembic.config import Config as AlembicConfig
+
+        async with self._sql_engine.begin() as connection:
+            alembic_cfg = AlembicConfig(str(self._config.alembic_ini_path))
+            alembic_cfg.set_section_option(
+                "alembic",
+                "script_location",
+                str(self._config.alembic_migrations_path),
+            )
+            alembic_cfg.attributes["connection"] = connection
+            command.upgrade(alembic_cfg, "head")
+
+    async def reflect_metadata(self) -> None:
+        """Reflect the schema of the database into the shared metadata.
+
+        This happens at most once per connection. The reflected schema is also
+        kept in a snapshot next to the database, keyed by the migrations it is
+        at, so later processes can load it instead of reflecting again.
+        """
+        async with self._metadata_lock:
+            if self._metadata_reflected:
+                return
+            metadata = self._load_schema_snapshot()
+            if metadata is None:
+                metadata = MetaData()
+                async with self._sql_engine.connect() as connection:
+                    await connection.run_sync(metadata.reflect)
+                self._save_schema_snapshot(metadata)
+            self._metadata = metadata
+            self._metadata_reflected = True
+
+    def _schema_snapshot_path(self) -> Path | None:
+        if self._is_in_memory(self._config.sqlite_db_url):
+            return None
+        return Path(f"{make_url(self._config.sqlite_db_url).database}.schema")
+
+    def _schema_snapshot_key(self) -> tuple[str, tuple[str, ...]] | None:
+        if not self._schema_revisions:
+            return None
+        return sqlalchemy.__version__, tuple(sorted(self._schema_revisions))
+
+    def _load_schema_snapshot(self) -> MetaData | None:
+        snapshot_path = self._schema_snapshot_path()
+        snapshot_key = self._schema_snapshot_key()
+        if snapshot_path is None or snapshot_key is None:
+            return None
+        try:
+            with snapshot_path.open("rb") as snapshot_file:
+                key, metadata = pickle.load(snapshot_file)  # nosec
+        except (
+            OSError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            ValueError,
+            pickle.UnpicklingError,
+        ):
+            return None
+        if key != snapshot_key or not isinstance(metadata, MetaData):
+            return None
+        return metadata
+
+    def _save_schema_snapshot(self, metadata: MetaData) -> None:
+        snapshot_path = self._schema_snapshot_path()
+        snapshot_key = self._schema_snapshot_key()
+        if snapshot_path is None or snapshot_key is None:
+            return
+        temp_snapshot_path = snapshot_path.with_name(f"{snapshot_path.name}.tmp")
+        try:
+            with temp_snapshot_path.open("wb") as snapshot_file:
+                pickle.dump((snapshot_key, metadata), snapshot_file)
+            temp_snapshot_path.replace(snapshot_path)
+        except OSError:
+            LOGGER.warning("Could not save the Sqlite schema snapshot", exc_info=True)
 
     async def dispose(self) -> None:
         """Close the Sqlite storage."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+            self._maintenance_task = None
+        if self._read_sql_engine is not self._sql_engine:
+            await self._read_sql_engine.dispose()
         await self._sql_engine.dispose()
 
+    async def _run_maintenance(self, interval_secs: float) -> None:
+        while True:
+            await asyncio.sleep(interval_secs)
+            try:
+                async with self._sql_engine.connect() as connection:
+                    await connection.execute(text("PRAGMA optimize"))
+                    await connection.execute(text("PRAGMA wal_checkpoint(PASSIVE)"))
+            except sqlalchemy.exc.OperationalError:
+                LOGGER.exception("Periodic Sqlite maintenance failed")
+
     def nuke(self) -> None:
         """Completely destroy the Sqlite storage."""
         real_path = self._config.sqlite_db_url.replace("sqlite+pysqlite:///", "")
         Path(real_path).unlink()
+        # Left behind by WAL mode.
+        Path(real_path + "-wal").unlink(missing_ok=True)
+        Path(real_path + "-shm").unlink(missing_ok=True)
+        Path(real_path + ".schema").unlink(missing_ok=True)
 
     @property
     def sql_engine(self) -> AsyncEngine:
         """The raw SQLite engine object."""
         return self._sql_engine
+
+    @property
+    def metadata(self) -> MetaData:
+        """The metadata shared by all the storage engines over this connection.
+
+        It holds the reflected schema once `reflect_metadata` has run.
+        """
+        return self._metadata
+
+    @property
+    def read_sql_engine(self) -> AsyncEngine:
+        """The raw SQLite engine object for read-only work.
+
+        Its connections are query only and pooled separately from the
+        ones in `sql_engine`, so readers don't queue behind writers.
+        """
+        return self._read_sql_engine
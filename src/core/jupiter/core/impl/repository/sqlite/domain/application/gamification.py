@@ -40,8 +40,10 @@ from sqlalchemy import (
     MetaData,
     String,
     Table,
+    and_,
     delete,
     insert,
+    or_,
     select,
     update,
 )
@@ -225,6 +227,85 @@ class SqliteScoreStatsRepository(
         )
         return [self._row_to_entity(row) for row in result]
 
+    async def remove_all(self, prefix: EntityId | list[EntityId]) -> None:
+        """Remove all the score stats of one or more score logs."""
+        await self._connection.execute(
+            delete(self._score_stats_table).where(
+                self._score_stats_table.c.score_log_ref_id.in_(
+                    [prefix.as_int()]
+                    if isinstance(prefix, EntityId)
+                    else [p.as_int() for p in prefix]
+                )
+            )
+        )
+
+    async def upsert_many(self, records: list[ScoreStats]) -> None:
+        """Create or overwrite many score stats at once."""
+        if len(records) == 0:
+            return
+        # There's no unique index to upsert against, so the existing rows for
+        # the keys are replaced instead.
+        await self._connection.execute(
+            delete(self._score_stats_table).where(
+                or_(
+                    *(
+                        and_(
+                            self._score_stats_table.c.score_log_ref_id
+                            == record.score_log.as_int(),
+                            (
+                                self._score_stats_table.c.period == record.period.value
+                                if record.period is not None
+                                else self._score_stats_table.c.period.is_(None)
+                            ),
+                            self._score_stats_table.c.timeline == record.timeline,
+                        )
+                        for record in records
+                    )
+                )
+            )
+        )
+        await self._connection.execute(
+            insert(self._score_stats_table),
+            [
+                cast(
+                    Mapping[str, RealmThing],
+                    self._realm_codec_registry.db_encode(record),
+                )
+                for record in records
+            ],
+        )
+
+    async def load_overview(
+        self,
+        score_log_ref_id: EntityId,
+        timelines: Mapping[RecurringTaskPeriod | None, str],
+    ) -> list[ScoreStats]:
+        """Load the score stats for a timeline of each of several periods at once."""
+        if len(timelines) == 0:
+            return []
+        result = await self._connection.execute(
+            select(self._score_stats_table)
+            .where(
+                self._score_stats_table.c.score_log_ref_id == score_log_ref_id.as_int()
+            )
+            .where(
+                or_(
+                    *(
+                        and_(
+                            (
+                                self._score_stats_table.c.period == period.value
+                                if period is not None
+                                else self._score_stats_table.c.period.is_(None)
+                            ),
+                            self._score_stats_table.c.timeline == timeline,
+                        )
+                        for period, timeline in timelines.items()
+                    )
+                )
+            )
+        )
+        return [self._row_to_entity(row) for row in result]
+
     async def find_all_in_timerange(
         self,
         score_log_ref_id: EntityId,
@@ -407,6 +488,89 @@ class SqliteScorePeriodBestRepository(
         )
         return [self._row_to_entity(row) for row in result]
 
+    async def remove_all(self, prefix: EntityId | list[EntityId]) -> None:
+        """Remove all the score period bests of one or more score logs."""
+        await self._connection.execute(
+            delete(self._score_period_best_table).where(
+                self._score_period_best_table.c.score_log_ref_id.in_(
+                    [prefix.as_int()]
+                    if isinstance(prefix, EntityId)
+                    else [p.as_int() for p in prefix]
+                )
+            )
+        )
+
+    async def load_overview(
+        self,
+        score_log_ref_id: EntityId,
+        timelines: Mapping[RecurringTaskPeriod | None, str],
+    ) -> list[ScorePeriodBest]:
+        """Load the score period bests for a timeline of each of several periods at once."""
+        if len(timelines) == 0:
+            return []
+        result = await self._connection.execute(
+            select(self._score_period_best_table)
+            .where(
+                self._score_period_best_table.c.score_log_ref_id
+                == score_log_ref_id.as_int()
+            )
+            .where(
+                or_(
+                    *(
+                        and_(
+                            (
+                                self._score_period_best_table.c.period == period.value
+                                if period is not None
+                                else self._score_period_best_table.c.period.is_(None)
+                            ),
+                            self._score_period_best_table.c.timeline == timeline,
+                        )
+                        for period, timeline in timelines.items()
+                    )
+                )
+            )
+        )
+        return [self._row_to_entity(row) for row in result]
+
+    async def upsert_many(self, records: list[ScorePeriodBest]) -> None:
+        """Create or overwrite many score period bests at once."""
+        if len(records) == 0:
+            return
+        # There's no unique index to upsert against, so the existing rows for
+        # the keys are replaced instead.
+        await self._connection.execute(
+            delete(self._score_period_best_table).where(
+                or_(
+                    *(
+                        and_(
+                            self._score_period_best_table.c.score_log_ref_id
+                            == record.score_log.as_int(),
+                            (
+                                self._score_period_best_table.c.period
+                                == record.period.value
+                                if record.period is not None
+                                else self._score_period_best_table.c.period.is_(None)
+                            ),
+                            self._score_period_best_table.c.timeline == record.timeline,
+                            self._score_period_best_table.c.sub_period
+                            == record.sub_period.value,
+                        )
+                        for record in records
+                    )
+                )
+            )
+        )
+        await self._connection.execute(
+            insert(self._score_period_best_table),
+            [
+                cast(
+                    Mapping[str, RealmThing],
+                    self._realm_codec_registry.db_encode(record),
+                )
+                for record in records
+            ],
+        )
+
     def _row_to_entity(self, row: RowType) -> ScorePeriodBest:
         return self._realm_codec_registry.db_decode(
             ScorePeriodBest, cast(Mapping[str, RealmThing], row._mapping)
@@ -10,14 +10,18 @@ from jupiter.core.domain.application.search.infra.search_repository import (
 from jupiter.core.domain.application.search.search_limit import SearchLimit
 from jupiter.core.domain.application.search.search_query import SearchQuery
 from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.domain.entity_summary import EntitySummary
 from jupiter.core.domain.named_entity_tag import NamedEntityTag
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.base.entity_name import EntityName
 from jupiter.core.framework.base.timestamp import Timestamp
 from jupiter.core.framework.entity import CrownEntity
+from jupiter.core.framework.primitive import Primitive
 from jupiter.core.framework.realm import DatabaseRealm, RealmCodecRegistry
-from jupiter.core.framework.repository import EntityNotFoundError
+from jupiter.core.impl.repository.sqlite.domain.core.notes import (
+    build_note_content_index_table,
+)
 from jupiter.core.impl.repository.sqlite.infra.repository import SqliteRepository
 from sqlalchemy import (
     Boolean,
@@ -27,21 +31,41 @@ from sqlalchemy import (
     Integer,
     MetaData,
     RowMapping,
+    Select,
     String,
     Table,
     delete,
     insert,
     select,
     text,
-    update,
+    tuple_,
 )
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+# Each key is two bound parameters, so this stays well within SQLite's limits.
+_KEYS_CHUNK_SIZE: Final[int] = 400
+# Some content matches get dropped by the filters on the entity they belong to,
+# so ask for more than the limit up front.
+_CONTENT_MATCHES_OVERFETCH: Final[int] = 2
+
+
+def _relative_rank(rank: float, best_rank: float) -> float:
+    """Scale an FTS5 rank against the best one from the same query.
+
+    FTS5 ranks are negated BM25 scores, so lower is better. The best match
+    maps to -1 and the rest fall between -1 and 0.
+    """
+    if best_rank >= 0:
+        return -1.0
+    return -rank / best_rank
+
 
 class SqliteSearchRepository(SqliteRepository, SearchRepository):
     """The SQLite based search repository."""
 
     _search_index_table: Final[Table]
+    _note_content_index_table: Final[Table]
+    _note_collection_table: Final[Table]
 
     def __init__(
         self,
@@ -70,94 +94,97 @@ class SqliteSearchRepository(SqliteRepository, SearchRepository):
             Column("archived_time", DateTime, nullable=True),
             keep_existing=True,
         )
+        self._note_content_index_table = build_note_content_index_table(metadata)
+        self._note_collection_table = Table(
+            "note_collection",
+            metadata,
+            Column("ref_id", Integer, primary_key=True),
+            Column("workspace_ref_id", Integer, nullable=False),
+            keep_existing=True,
+        )
 
     async def upsert(self, workspace_ref_id: EntityId, entity: CrownEntity) -> None:
         """Create an entity in the index."""
-        try:
-            await self._update(workspace_ref_id, entity)
-        except EntityNotFoundError:
-            await self._connection.execute(
-                insert(self._search_index_table).values(
-                    workspace_ref_id=workspace_ref_id.as_int(),
-                    entity_tag=str(NamedEntityTag.from_entity(entity).value),
-                    parent_ref_id=self._realm_codec_registry.get_encoder(
-                        EntityId, DatabaseRealm
-                    ).encode(entity.parent_ref_id),
-                    ref_id=self._realm_codec_registry.get_encoder(
-                        EntityId, DatabaseRealm
-                    ).encode(entity.ref_id),
-                    name=self._realm_codec_registry.get_encoder(
-                        EntityName, DatabaseRealm
-                    ).encode(entity.name),
-                    archived=self._realm_codec_registry.get_encoder(
-                        bool, DatabaseRealm
-                    ).encode(entity.archived),
-                    created_time=self._realm_codec_registry.get_encoder(
-                        Timestamp, DatabaseRealm
-                    ).encode(entity.created_time),
-                    last_modified_time=self._realm_codec_registry.get_encoder(
-                        Timestamp, DatabaseRealm
-                    ).encode(entity.last_modified_time),
-                    archived_time=(
-                        self._realm_codec_registry.get_encoder(
-                            Timestamp, DatabaseRealm
-                        ).encode(entity.archived_time)
+        await self.upsert_many(workspace_ref_id, [entity])
+
+    async def upsert_many(
+        self, workspace_ref_id: EntityId, entities: Iterable[CrownEntity]
+    ) -> None:
+        """Create or update several entities in the index."""
+        # An entity can be in here more than once, say when it was created and
+        # then updated. The last version of it is the one to index.
+        entities = list(
+            {
+                (NamedEntityTag.from_entity(entity), entity.ref_id): entity
+                for entity in entities
+            }.values()
+        )
+        if len(entities) == 0:
+            return
+        # The FTS table has no unique key to do an INSERT OR REPLACE against,
+        # so clear out any existing rows first.
+        await self.remove_many(workspace_ref_id, entities)
+
+        entity_id_encoder = self._realm_codec_registry.get_encoder(
+            EntityId, DatabaseRealm
+        )
+        entity_name_encoder = self._realm_codec_registry.get_encoder(
+            EntityName, DatabaseRealm
+        )
+        bool_encoder = self._realm_codec_registry.get_encoder(bool, DatabaseRealm)
+        timestamp_encoder = self._realm_codec_registry.get_encoder(
+            Timestamp, DatabaseRealm
+        )
+        await self._connection.execute(
+            insert(self._search_index_table),
+            [
+                {
+                    "workspace_ref_id": workspace_ref_id.as_int(),
+                    "entity_tag": str(NamedEntityTag.from_entity(entity).value),
+                    "parent_ref_id": entity_id_encoder.encode(entity.parent_ref_id),
+                    "ref_id": entity_id_encoder.encode(entity.ref_id),
+                    "name": entity_name_encoder.encode(entity.name),
+                    "archived": bool_encoder.encode(entity.archived),
+                    "created_time": timestamp_encoder.encode(entity.created_time),
+                    "last_modified_time": timestamp_encoder.encode(
+                        entity.last_modified_time
+                    ),
+                    "archived_time": (
+                        timestamp_encoder.encode(entity.archived_time)
                         if entity.archived_time
                         else None
                     ),
-                )
-            )
-
-    async def _update(self, workspace_ref_id: EntityId, entity: CrownEntity) -> None:
-        """Update an entity in the index."""
-        query = (
-            update(self._search_index_table)
-            .where(
-                self._search_index_table.c.workspace_ref_id == workspace_ref_id.as_int()
-            )
-            .where(
-                self._search_index_table.c.entity_tag
-                == str(NamedEntityTag.from_entity(entity).value)
-            )
-            .where(self._search_index_table.c.ref_id == entity.ref_id.as_int())
-            .values(
-                name=self._realm_codec_registry.get_encoder(
-                    EntityName, DatabaseRealm
-                ).encode(entity.name),
-                archived=self._realm_codec_registry.get_encoder(
-                    bool, DatabaseRealm
-                ).encode(entity.archived),
-                last_modified_time=self._realm_codec_registry.get_encoder(
-                    Timestamp, DatabaseRealm
-                ).encode(entity.last_modified_time),
-                archived_time=(
-                    self._realm_codec_registry.get_encoder(
-                        Timestamp, DatabaseRealm
-                    ).encode(entity.archived_time)
-                    if entity.archived_time
-                    else None
-                ),
-            )
+                }
+                for entity in entities
+            ],
         )
-        result = await self._connection.execute(query)
-        if result.rowcount == 0:
-            raise EntityNotFoundError(
-                "The entity does not exist",
-            )
 
     async def remove(self, workspace_ref_id: EntityId, entity: CrownEntity) -> None:
         """Remove an entity from the index."""
-        await self._connection.execute(
-            delete(self._search_index_table)
-            .where(
-                self._search_index_table.c.workspace_ref_id == workspace_ref_id.as_int()
-            )
-            .where(
-                self._search_index_table.c.entity_tag
-                == str(NamedEntityTag.from_entity(entity))
+        await self.remove_many(workspace_ref_id, [entity])
+
+    async def remove_many(
+        self, workspace_ref_id: EntityId, entities: Iterable[CrownEntity]
+    ) -> None:
+        """Remove several entities from the index."""
+        keys = [
+            (str(NamedEntityTag.from_entity(entity).value), entity.ref_id.as_int())
+            for entity in entities
+        ]
+        for chunk_start in range(0, len(keys), _KEYS_CHUNK_SIZE):
+            await self._connection.execute(
+                delete(self._search_index_table)
+                .where(
+                    self._search_index_table.c.workspace_ref_id
+                    == workspace_ref_id.as_int()
+                )
+                .where(
+                    tuple_(
+                        self._search_index_table.c.entity_tag,
+                        self._search_index_table.c.ref_id,
+                    ).in_(keys[chunk_start : chunk_start + _KEYS_CHUNK_SIZE])
+                )
             )
-            .where(self._search_index_table.c.ref_id == entity.ref_id.as_int())
-        )
 
     async def drop(self, workspace_ref_id: EntityId) -> None:
         """Remove everything from the index."""
@@ -181,30 +208,194 @@ class SqliteSearchRepository(SqliteRepository, SearchRepository):
         filter_archived_time_after: ADate | None,
         filter_archived_time_before: ADate | None,
     ) -> list[SearchMatch]:
-        """Search for entities in the index."""
+        """Search for entities in the index, by their name or by the content of their notes."""
         query_clean = SqliteSearchRepository._clean_query(query)
+        # Both the name and the note content queries go over the tags.
+        if filter_entity_tags is not None:
+            filter_entity_tags = list(filter_entity_tags)
 
-        query_stmt = (
+        query_stmt: Select[tuple[Primitive, ...]] = select(
+            self._search_index_table.c.workspace_ref_id,
+            self._search_index_table.c.entity_tag,
+            self._search_index_table.c.parent_ref_id,
+            self._search_index_table.c.ref_id,
+            self._search_index_table.c.name,
+            self._search_index_table.c.archived,
+            self._search_index_table.c.created_time,
+            self._search_index_table.c.last_modified_time,
+            self._search_index_table.c.archived_time,
+            text("highlight(search_index, 4, '[found]', '[/found]') as highlight"),
+            text(
+                "snippet(search_index, 4, '[found]', '[/found]', '[nomatch]', 64) as snippet"
+            ),
+            text("rank"),
+        ).where(self._search_index_table.c.name.match(f'"{query_clean}"'))
+        query_stmt = self._apply_filters(
+            query_stmt,
+            workspace_ref_id,
+            include_archived,
+            filter_entity_tags,
+            filter_created_time_after,
+            filter_created_time_before,
+            filter_last_modified_time_after,
+            filter_last_modified_time_before,
+            filter_archived_time_after,
+            filter_archived_time_before,
+        )
+        query_stmt = query_stmt.limit(limit.the_limit)
+        query_stmt = query_stmt.order_by(text("rank"))
+        query_stmt = query_stmt.order_by(self._search_index_table.c.archived)
+        query_stmt = query_stmt.order_by(
+            self._search_index_table.c.last_modified_time.desc()
+        )
+        results = await self._connection.execute(query_stmt)
+        rows = results.mappings().all()
+        float_decoder = self._realm_codec_registry.get_decoder(float, DatabaseRealm)
+        best_name_rank = min(
+            (float_decoder.decode(row["rank"]) for row in rows), default=0.0
+        )
+        matches = {
+            (row["entity_tag"], row["ref_id"]): SearchMatch(
+                summary=self._row_to_summary(
+                    row,
+                    self._realm_codec_registry.get_decoder(str, DatabaseRealm).decode(
+                        row["snippet"]
+                    ),
+                ),
+                search_rank=_relative_rank(
+                    float_decoder.decode(row["rank"]), best_name_rank
+                ),
+            )
+            for row in rows
+        }
+
+        content_matches = await self._search_note_content(
+            workspace_ref_id,
+            query_clean,
+            limit,
+            include_archived,
+            filter_entity_tags,
+            filter_created_time_after,
+            filter_created_time_before,
+            filter_last_modified_time_after,
+            filter_last_modified_time_before,
+            filter_archived_time_after,
+            filter_archived_time_before,
+        )
+        for key, content_match in content_matches.items():
+            name_match = matches.get(key)
+            if name_match is None or content_match.search_rank < name_match.search_rank:
+                matches[key] = content_match
+
+        # Both ranks are relative to the best match in their own table, as BM25
+        # scores from different tables aren't on the same scale. The sort is
+        # stable, so ties keep the archived and recency order from above.
+        return sorted(matches.values(), key=lambda m: m.search_rank)[: limit.the_limit]
+
+    async def _search_note_content(
+        self,
+        workspace_ref_id: EntityId,
+        query_clean: str,
+        limit: SearchLimit,
+        include_archived: bool,
+        filter_entity_tags: Iterable[NamedEntityTag] | None,
+        filter_created_time_after: ADate | None,
+        filter_created_time_before: ADate | None,
+        filter_last_modified_time_after: ADate | None,
+        filter_last_modified_time_before: ADate | None,
+        filter_archived_time_after: ADate | None,
+        filter_archived_time_before: ADate | None,
+    ) -> dict[tuple[str, int], SearchMatch]:
+        content_query_stmt = (
             select(
-                self._search_index_table.c.workspace_ref_id,
-                self._search_index_table.c.entity_tag,
-                self._search_index_table.c.parent_ref_id,
-                self._search_index_table.c.ref_id,
-                self._search_index_table.c.name,
-                self._search_index_table.c.archived,
-                self._search_index_table.c.created_time,
-                self._search_index_table.c.last_modified_time,
-                self._search_index_table.c.archived_time,
-                text("highlight(search_index, 4, '[found]', '[/found]') as highlight"),
+                self._note_content_index_table.c.domain,
+                self._note_content_index_table.c.source_entity_ref_id,
                 text(
-                    "snippet(search_index, 4, '[found]', '[/found]', '[nomatch]', 64) as snippet"
+                    "snippet(note_content_index, 3, '[found]', '[/found]', '[nomatch]', 64) as snippet"
                 ),
                 text("rank"),
             )
             .where(
-                self._search_index_table.c.workspace_ref_id == workspace_ref_id.as_int()
+                self._note_content_index_table.c.note_collection_ref_id
+                == select(self._note_collection_table.c.ref_id)
+                .where(
+                    self._note_collection_table.c.workspace_ref_id
+                    == workspace_ref_id.as_int()
+                )
+                .scalar_subquery()
             )
-            .where(self._search_index_table.c.name.match(f'"{query_clean}"'))
+            .where(self._note_content_index_table.c.content.match(f'"{query_clean}"'))
+            .order_by(text("rank"))
+            .limit(limit.the_limit * _CONTENT_MATCHES_OVERFETCH)
+        )
+        str_decoder = self._realm_codec_registry.get_decoder(str, DatabaseRealm)
+        float_decoder = self._realm_codec_registry.get_decoder(float, DatabaseRealm)
+        note_domain_decoder = self._realm_codec_registry.get_decoder(
+            NoteDomain, DatabaseRealm
+        )
+        snippets_and_ranks: dict[tuple[str, int], tuple[str, float]] = {}
+        for row in (await self._connection.execute(content_query_stmt)).mappings():
+            key = (
+                str(note_domain_decoder.decode(row["domain"]).source_entity_tag.value),
+                row["source_entity_ref_id"],
+            )
+            # Rows come best first, so keep the first note seen for an entity.
+            if key not in snippets_and_ranks:
+                snippets_and_ranks[key] = (
+                    str_decoder.decode(row["snippet"]),
+                    float_decoder.decode(row["rank"]),
+                )
+        if len(snippets_and_ranks) == 0:
+            return {}
+        best_content_rank = min(rank for _, rank in snippets_and_ranks.values())
+
+        keys = list(snippets_and_ranks.keys())
+        content_matches = {}
+        for chunk_start in range(0, len(keys), _KEYS_CHUNK_SIZE):
+            summary_query_stmt: Select[tuple[Primitive, ...]] = select(
+                self._search_index_table
+            ).where(
+                tuple_(
+                    self._search_index_table.c.entity_tag,
+                    self._search_index_table.c.ref_id,
+                ).in_(keys[chunk_start : chunk_start + _KEYS_CHUNK_SIZE])
+            )
+            summary_query_stmt = self._apply_filters(
+                summary_query_stmt,
+                workspace_ref_id,
+                include_archived,
+                filter_entity_tags,
+                filter_created_time_after,
+                filter_created_time_before,
+                filter_last_modified_time_after,
+                filter_last_modified_time_before,
+                filter_archived_time_after,
+                filter_archived_time_before,
+            )
+            for row in (await self._connection.execute(summary_query_stmt)).mappings():
+                key = (row["entity_tag"], row["ref_id"])
+                snippet, rank = snippets_and_ranks[key]
+                content_matches[key] = SearchMatch(
+                    summary=self._row_to_summary(row, snippet),
+                    search_rank=_relative_rank(rank, best_content_rank),
+                )
+        return content_matches
+
+    def _apply_filters(
+        self,
+        query_stmt: Select[tuple[Primitive, ...]],
+        workspace_ref_id: EntityId,
+        include_archived: bool,
+        filter_entity_tags: Iterable[NamedEntityTag] | None,
+        filter_created_time_after: ADate | None,
+        filter_created_time_before: ADate | None,
+        filter_last_modified_time_after: ADate | None,
+        filter_last_modified_time_before: ADate | None,
+        filter_archived_time_after: ADate | None,
+        filter_archived_time_before: ADate | None,
+    ) -> Select[tuple[Primitive, ...]]:
+        query_stmt = query_stmt.where(
+            self._search_index_table.c.workspace_ref_id == workspace_ref_id.as_int()
         )
         if not include_archived:
             query_stmt = query_stmt.where(
@@ -248,54 +439,39 @@ class SqliteSearchRepository(SqliteRepository, SearchRepository):
                 self._search_index_table.c.archived_time
                 <= adate_encoder.encode(filter_archived_time_before)
             )
-        query_stmt = query_stmt.limit(limit.the_limit)
-        query_stmt = query_stmt.order_by(text("rank"))
-        query_stmt = query_stmt.order_by(self._search_index_table.c.archived)
-        query_stmt = query_stmt.order_by(
-            self._search_index_table.c.last_modified_time.desc()
-        )
-        results = await self._connection.execute(query_stmt)
-        rows = results.mappings().all()
-        return [self._row_to_match(row) for row in rows]
+        return query_stmt
 
-    def _row_to_match(self, row: RowMapping) -> SearchMatch:
-        return SearchMatch(
-            summary=EntitySummary(
-                entity_tag=self._realm_codec_registry.get_decoder(
-                    NamedEntityTag, DatabaseRealm
-                ).decode(row["entity_tag"]),
-                ref_id=self._realm_codec_registry.get_decoder(
-                    EntityId, DatabaseRealm
-                ).decode(row["ref_id"]),
-                parent_ref_id=self._realm_codec_registry.get_decoder(
-                    EntityId, DatabaseRealm
-                ).decode(row["parent_ref_id"]),
-                name=self._realm_codec_registry.get_decoder(
-                    EntityName, DatabaseRealm
-                ).decode(row["name"]),
-                archived=self._realm_codec_registry.get_decoder(
-                    bool, DatabaseRealm
-                ).decode(row["archived"]),
-                created_time=self._realm_codec_registry.get_decoder(
-                    Timestamp, DatabaseRealm
-                ).decode(row["created_time"]),
-                archived_time=(
-                    self._realm_codec_registry.get_decoder(
-                        Timestamp, DatabaseRealm
-                    ).decode(row["archived_time"])
-                    if row["archived_time"]
-                    else None
-                ),
-                last_modified_time=self._realm_codec_registry.get_decoder(
-                    Timestamp, DatabaseRealm
-                ).decode(row["last_modified_time"]),
-                snippet=self._realm_codec_registry.get_decoder(
-                    str, DatabaseRealm
-                ).decode(row["snippet"]),
+    def _row_to_summary(self, row: RowMapping, snippet: str) -> EntitySummary:
+        return EntitySummary(
+            entity_tag=self._realm_codec_registry.get_decoder(
+                NamedEntityTag, DatabaseRealm
+            ).decode(row["entity_tag"]),
+            ref_id=self._realm_codec_registry.get_decoder(
+                EntityId, DatabaseRealm
+            ).decode(row["ref_id"]),
+            parent_ref_id=self._realm_codec_registry.get_decoder(
+                EntityId, DatabaseRealm
+            ).decode(row["parent_ref_id"]),
+            name=self._realm_codec_registry.get_decoder(
+                EntityName, DatabaseRealm
+            ).decode(row["name"]),
+            archived=self._realm_codec_registry.get_decoder(bool, DatabaseRealm).decode(
+                row["archived"]
+            ),
+            created_time=self._realm_codec_registry.get_decoder(
+                Timestamp, DatabaseRealm
+            ).decode(row["created_time"]),
+            archived_time=(
+                self._realm_codec_registry.get_decoder(Timestamp, DatabaseRealm).decode(
+                    row["archived_time"]
+                )
+                if row["archived_time"]
+                else None
             ),
-            search_rank=self._realm_codec_registry.get_decoder(
-                float, DatabaseRealm
-            ).decode(row["rank"]),
+            last_modified_time=self._realm_codec_registry.get_decoder(
+                Timestamp, DatabaseRealm
+            ).decode(row["last_modified_time"]),
+            snippet=snippet,
         )
 
     @staticmethod
@@ -216,6 +216,18 @@ class SqliteBigPlanStatsRepository(
         results = result.fetchall()
         return [self._row_to_entity(row) for row in results]
 
+    async def remove_all(self, prefix: EntityId | list[EntityId]) -> None:
+        """Remove all the big plan stats of one or more big plans."""
+        await self._connection.execute(
+            delete(self._big_plan_stats_table).where(
+                self._big_plan_stats_table.c.big_plan_ref_id.in_(
+                    [prefix.as_int()]
+                    if isinstance(prefix, EntityId)
+                    else [p.as_int() for p in prefix]
+                )
+            )
+        )
+
     async def mark_add_inbox_task(self, big_plan_ref_id: EntityId) -> None:
         """Mark that a new inbox task has been added to the big plan."""
         result = await self._connection.execute(
@@ -153,6 +153,18 @@ class SqliteHabitStreakMarkRepository(
         results = result.fetchall()
         return [self._row_to_entity(row) for row in results]
 
+    async def remove_all(self, prefix: EntityId | list[EntityId]) -> None:
+        """Remove all the habit streak marks of one or more habits."""
+        await self._connection.execute(
+            delete(self._habit_streak_mark_table).where(
+                self._habit_streak_mark_table.c.habit_ref_id.in_(
+                    [prefix.as_int()]
+                    if isinstance(prefix, EntityId)
+                    else [p.as_int() for p in prefix]
+                )
+            )
+        )
+
     async def upsert(self, habit_streak_mark: HabitStreakMark) -> None:
         """Upsert a habit streak mark."""
         query = (
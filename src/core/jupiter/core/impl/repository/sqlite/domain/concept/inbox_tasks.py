@@ -1,21 +1,93 @@
 """The SQLite repository for inbox tasks."""
 
-from collections.abc import Iterable
-from typing import cast
+import datetime as dt
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Final, TypeVar, cast
 
 from jupiter.core.domain.concept.inbox_tasks.inbox_task import (
     InboxTask,
     InboxTaskRepository,
 )
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollup,
+    InboxTaskReportRollupKind,
+)
 from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
 from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
 from jupiter.core.domain.core.adate import ADate
 from jupiter.core.domain.core.archival_reason import ArchivalReason
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.realm import RealmCodecRegistry, RealmThing
+from jupiter.core.framework.value import EnumValue
 from jupiter.core.impl.repository.sqlite.infra.repository import (
     SqliteLeafEntityRepository,
 )
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Date,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    delete,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Each row is eight bound parameters, so this stays well within SQLite's limits.
+_ROLLUP_CHUNK_SIZE: Final[int] = 400
+
+# Stands in for a missing source entity, so it can be part of the primary key.
+_NO_SOURCE_ENTITY: Final[int] = 0
+
+_ROLLUP_KEY_COLUMNS: Final[tuple[str, ...]] = (
+    "inbox_task_collection_ref_id",
+    "modified_day",
+    "event_day",
+    "project_ref_id",
+    "source",
+    "source_entity_ref_id",
+    "kind",
+)
+
+_RollupKey = tuple[RealmThing, ...]
+
+_ArchivalReasonT = TypeVar("_ArchivalReasonT", bound=EnumValue)
+
+
+def build_inbox_task_report_rollup_table(metadata: MetaData) -> Table:
+    """The table with daily counts of inbox task activity, used by reports."""
+    return Table(
+        "inbox_task_report_rollup",
+        metadata,
+        Column("inbox_task_collection_ref_id", Integer, primary_key=True),
+        Column("modified_day", Date, primary_key=True),
+        Column("event_day", Date, primary_key=True),
+        Column("project_ref_id", Integer, primary_key=True),
+        Column("source", String, primary_key=True),
+        Column("source_entity_ref_id", Integer, primary_key=True),
+        Column("kind", String, primary_key=True),
+        Column("count", Integer, nullable=False),
+        extend_existing=True,
+    )
+
+
+def _day_of(column: ColumnElement[dt.datetime]) -> ColumnElement[dt.date]:
+    """The day of a timestamp column, as a date."""
+    return type_coerce(func.date(column), Date)
 
 
 class SqliteInboxTaskRepository(
@@ -23,6 +95,92 @@ class SqliteInboxTaskRepository(
 ):
     """The inbox task repository."""
 
+    _report_rollup_table: Final[Table]
+
+    def __init__(
+        self,
+        realm_codec_registry: RealmCodecRegistry,
+        connection: AsyncConnection,
+        metadata: MetaData,
+    ) -> None:
+        """Constructor."""
+        super().__init__(realm_codec_registry, connection, metadata)
+        self._report_rollup_table = build_inbox_task_report_rollup_table(metadata)
+
+    async def create(self, entity: InboxTask) -> InboxTask:
+        """Create an inbox task, and count it in the report rollups."""
+        inbox_task = await super().create(entity)
+        await self._update_report_rollups([], [inbox_task])
+        return inbox_task
+
+    async def save(self, entity: InboxTask) -> InboxTask:
+        """Save an inbox task, and move it between report rollups as needed."""
+        old_inbox_tasks = await self._find_for_report_rollups([entity.ref_id])
+        inbox_task = await super().save(entity)
+        await self._update_report_rollups(old_inbox_tasks, [inbox_task])
+        return inbox_task
+
+    async def remove(self, ref_id: EntityId) -> InboxTask:
+        """Hard remove an inbox task, and drop it from the report rollups."""
+        inbox_task = await super().remove(ref_id)
+        await self._update_report_rollups([inbox_task], [])
+        return inbox_task
+
+    async def create_many(self, entities: list[InboxTask]) -> list[InboxTask]:
+        """Create several inbox tasks at once, and count them in the report rollups."""
+        inbox_tasks = await super().create_many(entities)
+        await self._update_report_rollups([], inbox_tasks)
+        return inbox_tasks
+
+    async def save_many(self, entities: list[InboxTask]) -> list[InboxTask]:
+        """Save several inbox tasks at once, and move them between report rollups."""
+        old_inbox_tasks = await self._find_for_report_rollups(
+            [entity.ref_id for entity in entities]
+        )
+        inbox_tasks = await super().save_many(entities)
+        await self._update_report_rollups(old_inbox_tasks, inbox_tasks)
+        return inbox_tasks
+
+    async def remove_many(self, ref_ids: list[EntityId]) -> list[InboxTask]:
+        """Hard remove several inbox tasks at once, and drop them from the report rollups."""
+        inbox_tasks = await super().remove_many(ref_ids)
+        await self._update_report_rollups(inbox_tasks, [])
+        return inbox_tasks
+
+    async def _archive_where(
+        self,
+        ctx: DomainContext,
+        where_clause: ColumnElement[bool],
+        archival_reason: _ArchivalReasonT,
+    ) -> None:
+        """Archive inbox tasks in bulk, and move them between report rollups."""
+        # Of everything the rollups are keyed by, archiving only changes the
+        # modification time. So where the tasks go can be worked out in SQL,
+        # from the rows about to be archived, without loading any of them.
+        archived_day = self._realm_codec_registry.db_encode(
+            ADate.from_date(ctx.action_timestamp.as_date())
+        )
+        deltas: Counter[_RollupKey] = Counter()
+        for key, count in await self._sum_report_rollups_where(where_clause):
+            deltas[key] -= count
+        for key, count in await self._sum_report_rollups_where(
+            where_clause, modified_day=archived_day
+        ):
+            deltas[key] += count
+        await super()._archive_where(ctx, where_clause, archival_reason)
+        await self._apply_report_rollup_deltas(deltas)
+
+    async def remove_all_by_parents(self, parent_ref_ids: list[EntityId]) -> None:
+        """Hard remove all inbox tasks of the given collections, and their report rollups."""
+        await super().remove_all_by_parents(parent_ref_ids)
+        await self._connection.execute(
+            delete(self._report_rollup_table).where(
+                self._report_rollup_table.c.inbox_task_collection_ref_id.in_(
+                    [ref_id.as_int() for ref_id in parent_ref_ids]
+                )
+            )
+        )
+
     async def count_all_for_source(
         self,
         parent_ref_id: EntityId,
@@ -220,3 +378,286 @@ class SqliteInboxTaskRepository(
 
         results = await self._connection.execute(query_stmt)
         return [self._row_to_entity(row) for row in results]
+
+    async def find_report_rollups(
+        self,
+        parent_ref_id: EntityId,
+        filter_sources: (
+            Mapping[InboxTaskSource, Iterable[EntityId] | None] | None
+        ) = None,
+        filter_project_ref_ids: Iterable[EntityId] | None = None,
+        filter_modified_day_start: ADate | None = None,
+        filter_modified_day_end: ADate | None = None,
+        filter_event_day_start: ADate | None = None,
+        filter_event_day_end: ADate | None = None,
+        by_modified_day: bool = False,
+        by_event_day: bool = False,
+        by_project: bool = False,
+        by_source_entity: bool = False,
+    ) -> list[InboxTaskReportRollup]:
+        """Sum up the report rollups of the inbox tasks, keeping only some dimensions."""
+        table = self._report_rollup_table
+        dimensions = [table.c.source, table.c.kind]
+        if by_modified_day:
+            dimensions.append(table.c.modified_day)
+        if by_event_day:
+            dimensions.append(table.c.event_day)
+        if by_project:
+            dimensions.append(table.c.project_ref_id)
+        if by_source_entity:
+            dimensions.append(table.c.source_entity_ref_id)
+
+        total = func.sum(table.c.count)
+        query_stmt = (
+            select(*dimensions, total.label("total"))
+            .where(table.c.inbox_task_collection_ref_id == parent_ref_id.as_int())
+            .group_by(*dimensions)
+            .having(total != 0)
+        )
+        if filter_sources is not None:
+            query_stmt = query_stmt.where(self._sources_clause(filter_sources))
+        if filter_project_ref_ids is not None:
+            query_stmt = query_stmt.where(
+                table.c.project_ref_id.in_(
+                    [fi.as_int() for fi in filter_project_ref_ids]
+                )
+            )
+        if filter_modified_day_start is not None:
+            query_stmt = query_stmt.where(
+                table.c.modified_day
+                >= self._realm_codec_registry.db_encode(filter_modified_day_start)
+            )
+        if filter_modified_day_end is not None:
+            query_stmt = query_stmt.where(
+                table.c.modified_day
+                <= self._realm_codec_registry.db_encode(filter_modified_day_end)
+            )
+        if filter_event_day_start is not None:
+            query_stmt = query_stmt.where(
+                table.c.event_day
+                >= self._realm_codec_registry.db_encode(filter_event_day_start)
+            )
+        if filter_event_day_end is not None:
+            query_stmt = query_stmt.where(
+                table.c.event_day
+                <= self._realm_codec_registry.db_encode(filter_event_day_end)
+            )
+
+        results = await self._connection.execute(query_stmt)
+        return [
+            InboxTaskReportRollup(
+                modified_day=(
+                    self._realm_codec_registry.db_decode(ADate, row.modified_day)
+                    if by_modified_day
+                    else None
+                ),
+                event_day=(
+                    self._realm_codec_registry.db_decode(ADate, row.event_day)
+                    if by_event_day
+                    else None
+                ),
+                project_ref_id=(
+                    EntityId(str(row.project_ref_id)) if by_project else None
+                ),
+                source=InboxTaskSource(row.source),
+                source_entity_ref_id=(
+                    EntityId(str(row.source_entity_ref_id))
+                    if by_source_entity
+                    and row.source_entity_ref_id != _NO_SOURCE_ENTITY
+                    else None
+                ),
+                kind=InboxTaskReportRollupKind(row.kind),
+                count=row.total,
+            )
+            for row in results
+        ]
+
+    async def rebuild_report_rollups(
+        self,
+        parent_ref_id: EntityId,
+        after_ref_id: EntityId | None,
+        limit: int,
+    ) -> EntityId | None:
+        """Rebuild the report rollups for the next chunk of inbox tasks in a collection."""
+        if after_ref_id is None:
+            await self._connection.execute(
+                delete(self._report_rollup_table).where(
+                    self._report_rollup_table.c.inbox_task_collection_ref_id
+                    == parent_ref_id.as_int()
+                )
+            )
+        query_stmt = (
+            select(self._table)
+            .where(self._table.c.inbox_task_collection_ref_id == parent_ref_id.as_int())
+            .order_by(self._table.c.ref_id)
+            .limit(limit)
+        )
+        if after_ref_id is not None:
+            query_stmt = query_stmt.where(self._table.c.ref_id > after_ref_id.as_int())
+        inbox_tasks = [
+            self._row_to_entity(row)
+            for row in await self._connection.execute(query_stmt)
+        ]
+        if len(inbox_tasks) == 0:
+            return None
+        await self._update_report_rollups([], inbox_tasks)
+        return inbox_tasks[-1].ref_id
+
+    async def _find_for_report_rollups(
+        self, ref_ids: list[EntityId]
+    ) -> list[InboxTask]:
+        if len(ref_ids) == 0:
+            return []
+        return await self.find_all_generic(
+            parent_ref_id=None, allow_archived=True, ref_id=ref_ids
+        )
+
+    async def _update_report_rollups(
+        self, old_inbox_tasks: list[InboxTask], new_inbox_tasks: list[InboxTask]
+    ) -> None:
+        # Tasks which are saved without changing what they count towards cancel
+        # out here, so the common case of a same day edit writes very little.
+        deltas: Counter[_RollupKey] = Counter()
+        for inbox_task in old_inbox_tasks:
+            for rollup in inbox_task.report_rollups:
+                deltas[self._report_rollup_key(inbox_task, rollup)] -= rollup.count
+        for inbox_task in new_inbox_tasks:
+            for rollup in inbox_task.report_rollups:
+                deltas[self._report_rollup_key(inbox_task, rollup)] += rollup.count
+        await self._apply_report_rollup_deltas(deltas)
+
+    async def _sum_report_rollups_where(
+        self,
+        where_clause: ColumnElement[bool],
+        modified_day: RealmThing | None = None,
+    ) -> list[tuple[_RollupKey, int]]:
+        """What the matching inbox tasks contribute to the report rollups, summed up in SQL.
+
+        This mirrors `InboxTask.report_rollups`. When a modified day is given,
+        it stands in for the one the tasks were last modified on.
+        """
+        table = self._table
+        modified_day_column = (
+            _day_of(table.c.last_modified_time)
+            if modified_day is None
+            else literal(modified_day, Date)
+        )
+        kinds = [
+            (InboxTaskReportRollupKind.TOUCHED, modified_day_column, true()),
+            (InboxTaskReportRollupKind.CREATED, _day_of(table.c.created_time), true()),
+            (
+                InboxTaskReportRollupKind.DONE,
+                _day_of(table.c.completed_time),
+                (table.c.status == InboxTaskStatus.DONE.value)
+                & table.c.completed_time.is_not(None),
+            ),
+            (
+                InboxTaskReportRollupKind.NOT_DONE,
+                _day_of(table.c.completed_time),
+                (table.c.status == InboxTaskStatus.NOT_DONE.value)
+                & table.c.completed_time.is_not(None),
+            ),
+            (
+                InboxTaskReportRollupKind.WORKING,
+                _day_of(table.c.working_time),
+                table.c.status.in_(
+                    [status.value for status in InboxTaskStatus if status.is_working]
+                )
+                & table.c.working_time.is_not(None),
+            ),
+        ]
+
+        selects = []
+        for kind, event_day_column, kind_clause in kinds:
+            key_columns = [
+                table.c.inbox_task_collection_ref_id,
+                modified_day_column.label("modified_day"),
+                event_day_column.label("event_day"),
+                table.c.project_ref_id,
+                table.c.source,
+                func.coalesce(table.c.source_entity_ref_id, _NO_SOURCE_ENTITY).label(
+                    "source_entity_ref_id"
+                ),
+                literal(kind.value, String).label("kind"),
+            ]
+            selects.append(
+                select(*key_columns, func.count().label("total"))
+                .where(where_clause, kind_clause)
+                .group_by(*key_columns)
+            )
+
+        results = await self._connection.execute(union_all(*selects))
+        return [(tuple(row[: len(_ROLLUP_KEY_COLUMNS)]), row.total) for row in results]
+
+    async def _apply_report_rollup_deltas(self, deltas: Counter[_RollupKey]) -> None:
+        rows = [
+            {**dict(zip(_ROLLUP_KEY_COLUMNS, key, strict=True)), "count": delta}
+            for key, delta in deltas.items()
+            if delta != 0
+        ]
+        upsert_stmt = sqlite_insert(self._report_rollup_table)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=list(_ROLLUP_KEY_COLUMNS),
+            set_={
+                "count": self._report_rollup_table.c.count + upsert_stmt.excluded.count
+            },
+        )
+        for chunk_start in range(0, len(rows), _ROLLUP_CHUNK_SIZE):
+            await self._connection.execute(
+                upsert_stmt, rows[chunk_start : chunk_start + _ROLLUP_CHUNK_SIZE]
+            )
+
+        # Only buckets which lost tasks can have become empty.
+        emptied_keys = [key for key, delta in deltas.items() if delta < 0]
+        key_columns = tuple_(
+            *(self._report_rollup_table.c[column] for column in _ROLLUP_KEY_COLUMNS)
+        )
+        for chunk_start in range(0, len(emptied_keys), _ROLLUP_CHUNK_SIZE):
+            await self._connection.execute(
+                delete(self._report_rollup_table).where(
+                    and_(
+                        self._report_rollup_table.c.count == 0,
+                        key_columns.in_(
+                            emptied_keys[chunk_start : chunk_start + _ROLLUP_CHUNK_SIZE]
+                        ),
+                    )
+                )
+            )
+
+    def _report_rollup_key(
+        self, inbox_task: InboxTask, rollup: InboxTaskReportRollup
+    ) -> _RollupKey:
+        return (
+            inbox_task.inbox_task_collection.ref_id.as_int(),
+            self._realm_codec_registry.db_encode(rollup.modified_day),
+            self._realm_codec_registry.db_encode(rollup.event_day),
+            inbox_task.project_ref_id.as_int(),
+            rollup.source.value,
+            (
+                rollup.source_entity_ref_id.as_int()
+                if rollup.source_entity_ref_id is not None
+                else _NO_SOURCE_ENTITY
+            ),
+            rollup.kind.value,
+        )
+
+    def _sources_clause(
+        self, filter_sources: Mapping[InboxTaskSource, Iterable[EntityId] | None]
+    ) -> ColumnElement[bool]:
+        table = self._report_rollup_table
+        return or_(
+            false(),
+            *(
+                and_(
+                    table.c.source == source.value,
+                    (
+                        table.c.source_entity_ref_id.in_(
+                            [fi.as_int() for fi in source_entity_ref_ids]
+                        )
+                        if source_entity_ref_ids is not None
+                        else true()
+                    ),
+                )
+                for source, source_entity_ref_ids in filter_sources.items()
+            ),
+        )
@@ -38,6 +38,7 @@ from sqlalchemy import (
     select,
     update,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -129,6 +130,7 @@ class SqliteJournalStatsRepository(
                 "journal_ref_id",
                 Integer,
                 ForeignKey("journal.ref_id"),
+                unique=True,
                 nullable=False,
             ),
             Column("report", JSON, nullable=False),
@@ -178,6 +180,29 @@ class SqliteJournalStatsRepository(
             )
         return record
 
+    async def upsert_many(self, records: list[JournalStats]) -> None:
+        """Create or overwrite the stats of many journals at once."""
+        if len(records) == 0:
+            return
+        upsert_stmt = sqlite_insert(self._journal_stats_table)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=[self._journal_stats_table.c.journal_ref_id],
+            set_={
+                "report": upsert_stmt.excluded.report,
+                "last_modified_time": upsert_stmt.excluded.last_modified_time,
+            },
+        )
+        await self._connection.execute(
+            upsert_stmt,
+            [
+                cast(
+                    Mapping[str, RealmThing],
+                    self._realm_codec_registry.db_encode(record),
+                )
+                for record in records
+            ],
+        )
+
     async def remove(self, key: EntityId) -> None:
         """Remove a journal stats."""
         result = await self._connection.execute(
@@ -216,6 +241,18 @@ class SqliteJournalStatsRepository(
         results = result.fetchall()
         return [self._row_to_entity(row) for row in results]
 
+    async def remove_all(self, prefix: EntityId | list[EntityId]) -> None:
+        """Remove all the journal stats of one or more journals."""
+        await self._connection.execute(
+            delete(self._journal_stats_table).where(
+                self._journal_stats_table.c.journal_ref_id.in_(
+                    [prefix.as_int()]
+                    if isinstance(prefix, EntityId)
+                    else [p.as_int() for p in prefix]
+                )
+            )
+        )
+
     def _row_to_entity(self, row: RowType) -> JournalStats:
         return self._realm_codec_registry.db_decode(
             JournalStats, cast(Mapping[str, RealmThing], row._mapping)
@@ -1,24 +1,111 @@
 """Sqlite implementation of the notes repository."""
 
+from collections.abc import Iterable
+from typing import Final
+
 from jupiter.core.domain.core.archival_reason import ArchivalReason
 from jupiter.core.domain.core.notes.note import (
     Note,
     NoteRepository,
 )
+from jupiter.core.domain.core.notes.note_content_block import note_content_to_text
 from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.realm import RealmCodecRegistry
 from jupiter.core.framework.repository import EntityNotFoundError
 from jupiter.core.impl.repository.sqlite.infra.repository import (
     SqliteLeafEntityRepository,
 )
 from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
     select,
 )
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Each row is five bound parameters, so this stays well within SQLite's limits.
+_INDEX_CHUNK_SIZE: Final[int] = 400
+
+
+def build_note_content_index_table(metadata: MetaData) -> Table:
+    """The FTS5 table with the plain text content of notes, keyed by their ref_id."""
+    return Table(
+        "note_content_index",
+        metadata,
+        Column("rowid", Integer, primary_key=True),
+        Column("note_collection_ref_id", Integer, nullable=False),
+        Column("domain", String, nullable=False),
+        Column("source_entity_ref_id", Integer, nullable=False),
+        Column("content", String, nullable=False),
+        # A reflected FTS5 table doesn't show the rowid, so make sure it's there.
+        extend_existing=True,
+    )
 
 
 class SqliteNoteRepository(SqliteLeafEntityRepository[Note], NoteRepository):
     """A repository of notes."""
 
+    _content_index_table: Final[Table]
+
+    def __init__(
+        self,
+        realm_codec_registry: RealmCodecRegistry,
+        connection: AsyncConnection,
+        metadata: MetaData,
+    ) -> None:
+        """Constructor."""
+        super().__init__(realm_codec_registry, connection, metadata)
+        self._content_index_table = build_note_content_index_table(metadata)
+
+    async def create(self, entity: Note) -> Note:
+        """Create a note, and index its content."""
+        note = await super().create(entity)
+        await self._index_content([note])
+        return note
+
+    async def save(self, entity: Note) -> Note:
+        """Save a note, and reindex its content."""
+        note = await super().save(entity)
+        await self._index_content([note])
+        return note
+
+    async def remove(self, ref_id: EntityId) -> Note:
+        """Hard remove a note, and drop it from the content index."""
+        note = await super().remove(ref_id)
+        await self._unindex_content([ref_id])
+        return note
+
+    async def create_many(self, entities: list[Note]) -> list[Note]:
+        """Create several notes at once, and index their content."""
+        notes = await super().create_many(entities)
+        await self._index_content(notes)
+        return notes
+
+    async def save_many(self, entities: list[Note]) -> list[Note]:
+        """Save several notes at once, and reindex their content."""
+        notes = await super().save_many(entities)
+        await self._index_content(notes)
+        return notes
+
+    async def remove_many(self, ref_ids: list[EntityId]) -> list[Note]:
+        """Hard remove several notes at once, and drop them from the content index."""
+        notes = await super().remove_many(ref_ids)
+        await self._unindex_content(ref_ids)
+        return notes
+
+    async def remove_all_by_parents(self, parent_ref_ids: list[EntityId]) -> None:
+        """Hard remove all notes of the given collections, and drop them from the content index."""
+        ref_ids = await self.find_ref_ids_by_parents(
+            parent_ref_ids, allow_archived=True
+        )
+        await super().remove_all_by_parents(parent_ref_ids)
+        await self._unindex_content(ref_ids)
+
     async def load_for_source(
         self,
         domain: NoteDomain,
@@ -88,3 +175,61 @@ class SqliteNoteRepository(SqliteLeafEntityRepository[Note], NoteRepository):
         if result is None:
             return None
         return self._row_to_entity(result)
+
+    async def reindex_content(
+        self,
+        note_collection_ref_id: EntityId,
+        after_ref_id: EntityId | None,
+        limit: int,
+    ) -> EntityId | None:
+        """Rebuild the content index entries for the next chunk of notes in a collection."""
+        query_stmt = (
+            select(self._table)
+            .where(
+                self._table.c.note_collection_ref_id == note_collection_ref_id.as_int()
+            )
+            .order_by(self._table.c.ref_id)
+            .limit(limit)
+        )
+        if after_ref_id is not None:
+            query_stmt = query_stmt.where(self._table.c.ref_id > after_ref_id.as_int())
+        notes = [
+            self._row_to_entity(row)
+            for row in await self._connection.execute(query_stmt)
+        ]
+        if len(notes) == 0:
+            return None
+        await self._index_content(notes)
+        return notes[-1].ref_id
+
+    async def _index_content(self, notes: Iterable[Note]) -> None:
+        rows = [
+            {
+                "rowid": note.ref_id.as_int(),
+                "note_collection_ref_id": note.note_collection.ref_id.as_int(),
+                "domain": note.domain.value,
+                "source_entity_ref_id": note.source_entity_ref_id.as_int(),
+                "content": note_content_to_text(note.content),
+            }
+            for note in notes
+        ]
+        for chunk_start in range(0, len(rows), _INDEX_CHUNK_SIZE):
+            await self._connection.execute(
+                insert(self._content_index_table).prefix_with("OR REPLACE"),
+                rows[chunk_start : chunk_start + _INDEX_CHUNK_SIZE],
+            )
+
+    async def _unindex_content(self, ref_ids: list[EntityId]) -> None:
+        for chunk_start in range(0, len(ref_ids), _INDEX_CHUNK_SIZE):
+            await self._connection.execute(
+                delete(self._content_index_table).where(
+                    self._content_index_table.c.rowid.in_(
+                        [
+                            ref_id.as_int()
+                            for ref_id in ref_ids[
+                                chunk_start : chunk_start + _INDEX_CHUNK_SIZE
+                            ]
+                        ]
+                    )
+                )
+            )
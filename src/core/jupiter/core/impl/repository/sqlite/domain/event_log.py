@@ -0,0 +1,279 @@
+"""The SQLite implementation of the event log repository."""
+
+import itertools
+from typing import Final, cast
+
+from jupiter.core.domain.event_log_repository import (
+    EventLogBatchOutcome,
+    EventLogRepository,
+)
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.event import EventKind
+from jupiter.core.framework.realm import RealmThing
+from jupiter.core.impl.repository.sqlite.connection import EVENT_ARCHIVE_SCHEMA
+from jupiter.core.impl.repository.sqlite.infra.repository import SqliteRepository
+from sqlalchemy import (
+    JSON,
+    Column,
+    ColumnElement,
+    DateTime,
+    Integer,
+    MetaData,
+    RowMapping,
+    String,
+    Table,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+    tuple_,
+)
+
+_SNAPSHOT_EVENT_NAME: Final[str] = "compact_events"
+
+
+def _event_log_table(name: str, schema: str | None = None) -> Table:
+    # A metadata of its own, so as to not clash with the entity's event table.
+    return Table(
+        name,
+        MetaData(),
+        Column("owner_ref_id", Integer),
+        Column("timestamp", DateTime),
+        Column("session_index", Integer),
+        Column("name", String),
+        Column("source", String),
+        Column("owner_version", Integer),
+        Column("kind", String),
+        Column("data", JSON),
+        schema=schema,
+    )
+
+
+def _version_window_of(event_log: Table, version_window: int) -> ColumnElement[int]:
+    return (event_log.c.owner_version - 1) // version_window
+
+
+class SqliteEventLogRepository(SqliteRepository, EventLogRepository):
+    """The SQLite implementation of the event log repository.
+
+    Each entity table has an event log table next to it, named after it with
+    an _event suffix. The archive is a separate database, attached to the
+    connection, with a table for each event log that's had events moved to it.
+    """
+
+    async def find_all_event_logs(self) -> list[str]:
+        """Find the names of all the event logs."""
+        result = await self._connection.execute(
+            text(
+                """
+                SELECT m.name FROM sqlite_master m
+                WHERE m.type = 'table'
+                AND m.name LIKE '%\\_event' ESCAPE '\\'
+                AND EXISTS (
+                    SELECT 1 FROM pragma_table_info(m.name) WHERE name = 'owner_version'
+                )
+                ORDER BY m.name
+                """
+            )
+        )
+        return list(result.scalars())
+
+    async def has_archive(self) -> bool:
+        """Whether there's an archive to move old events to."""
+        result = await self._connection.execute(text("PRAGMA database_list"))
+        return any(row.name == EVENT_ARCHIVE_SCHEMA for row in result)
+
+    async def find_free_space_bytes(self) -> int:
+        """How much space in the storage is free to be reused."""
+        free_pages: int = (
+            await self._connection.execute(text("PRAGMA main.freelist_count"))
+        ).scalar_one()
+        page_size: int = (
+            await self._connection.execute(text("PRAGMA main.page_size"))
+        ).scalar_one()
+        return cast(int, free_pages * page_size)
+
+    async def compact_before(
+        self,
+        event_log: str,
+        before: Timestamp,
+        version_window: int,
+        batch_size: int,
+    ) -> EventLogBatchOutcome:
+        """Compact the events from before a time, for at most batch_size version windows.
+
+        All the events of an entity from before the time, and in the same window
+        of versions, become a single snapshot event. It records how many events
+        it stands for, when the first of them happened, and the latest value of
+        every argument they were made with. Windows with a single event are left
+        alone, which includes the ones which were already compacted.
+        """
+        events = _event_log_table(event_log)
+        window = _version_window_of(events, version_window)
+        before_ts = self._realm_codec_registry.db_encode(before)
+
+        windows_result = await self._connection.execute(
+            select(events.c.owner_ref_id, window.label("version_window"))
+            .where(events.c.timestamp < before_ts)
+            .group_by(events.c.owner_ref_id, window)
+            .having(func.count() > 1)
+            .limit(batch_size + 1)
+        )
+        windows = {(row.owner_ref_id, row.version_window) for row in windows_result}
+        has_more = len(windows) > batch_size
+        windows = set(itertools.islice(sorted(windows), batch_size))
+        if len(windows) == 0:
+            return EventLogBatchOutcome(
+                events_removed=0, events_added=0, has_more=False
+            )
+
+        # Ordered by window first, so each one's events come out together.
+        events_result = await self._connection.execute(
+            select(events, window.label("version_window"))
+            .where(events.c.timestamp < before_ts)
+            .where(tuple_(events.c.owner_ref_id, window).in_(sorted(windows)))
+            .order_by(
+                events.c.owner_ref_id,
+                window,
+                events.c.timestamp,
+                events.c.session_index,
+                events.c.name,
+            )
+        )
+        snapshot_rows = [
+            self._build_snapshot_row(list(window_events))
+            for _, window_events in itertools.groupby(
+                events_result.mappings(),
+                key=lambda row: (row["owner_ref_id"], row["version_window"]),
+            )
+        ]
+
+        delete_result = await self._connection.execute(
+            delete(events).where(
+                events.c.owner_ref_id == bindparam("window_owner_ref_id"),
+                window == bindparam("window_idx"),
+                events.c.timestamp < bindparam("before_ts", type_=DateTime),
+            ),
+            [
+                {
+                    "window_owner_ref_id": owner_ref_id,
+                    "window_idx": version_window_idx,
+                    "before_ts": before_ts,
+                }
+                for owner_ref_id, version_window_idx in windows
+            ],
+        )
+        await self._connection.execute(insert(events), snapshot_rows)
+
+        return EventLogBatchOutcome(
+            events_removed=delete_result.rowcount,
+            events_added=len(snapshot_rows),
+            has_more=has_more,
+        )
+
+    async def archive_before(
+        self,
+        event_log: str,
+        before: Timestamp,
+        batch_size: int,
+    ) -> EventLogBatchOutcome:
+        """Move at most batch_size events from before a time to the archive."""
+        if not await self.has_archive():
+            raise Exception("There is no event archive to move events to")
+
+        events = _event_log_table(event_log)
+        archived_events = _event_log_table(event_log, schema=EVENT_ARCHIVE_SCHEMA)
+        rowid: ColumnElement[int] = literal_column("rowid")
+
+        rowids_result = await self._connection.execute(
+            select(rowid)
+            .select_from(events)
+            .where(events.c.timestamp < self._realm_codec_registry.db_encode(before))
+            .limit(batch_size + 1)
+        )
+        rowids = list(rowids_result.scalars())
+        has_more = len(rowids) > batch_size
+        rowids = rowids[:batch_size]
+        if len(rowids) == 0:
+            return EventLogBatchOutcome(
+                events_removed=0, events_added=0, has_more=False
+            )
+
+        quote = self._connection.dialect.identifier_preparer.quote
+        await self._connection.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {EVENT_ARCHIVE_SCHEMA}.{quote(event_log)} (
+                    owner_ref_id INTEGER NOT NULL,
+                    timestamp DATETIME NOT NULL,
+                    session_index INTEGER NOT NULL,
+                    name VARCHAR(32) NOT NULL,
+                    source VARCHAR(16) NOT NULL,
+                    owner_version INTEGER NOT NULL,
+                    kind VARCHAR(16) NOT NULL,
+                    data JSON,
+                    PRIMARY KEY (owner_ref_id, timestamp, session_index, name)
+                )
+                """
+            )
+        )  # nosec
+
+        await self._connection.execute(
+            insert(archived_events)
+            .prefix_with("OR IGNORE")
+            .from_select(
+                [c.name for c in events.c],
+                select(*events.c).where(rowid.in_(rowids)),
+            )
+        )
+        delete_result = await self._connection.execute(
+            delete(events).where(rowid.in_(rowids))
+        )
+
+        return EventLogBatchOutcome(
+            events_removed=delete_result.rowcount, events_added=0, has_more=has_more
+        )
+
+    @staticmethod
+    def _build_snapshot_row(window_events: list[RowMapping]) -> dict[str, RealmThing]:
+        compacted_events = 0
+        first_timestamp = None
+        first_owner_version = None
+        frame_args: dict[str, RealmThing] = {}
+        for row in window_events:
+            data = row["data"] or {}
+            if row["kind"] == EventKind.SNAPSHOT.value:
+                compacted_events += data["compacted_events"]
+                row_first_timestamp = data["first_timestamp"]
+                row_first_owner_version = data["first_owner_version"]
+                frame_args.update(data["frame_args"])
+            else:
+                compacted_events += 1
+                row_first_timestamp = row["timestamp"].isoformat(
+                    sep=" ", timespec="microseconds"
+                )
+                row_first_owner_version = row["owner_version"]
+                frame_args.update(data)
+            if first_timestamp is None:
+                first_timestamp = row_first_timestamp
+                first_owner_version = row_first_owner_version
+
+        last_event = window_events[-1]
+        return {
+            "owner_ref_id": last_event["owner_ref_id"],
+            "timestamp": last_event["timestamp"],
+            "session_index": 0,
+            "name": _SNAPSHOT_EVENT_NAME,
+            "source": last_event["source"],
+            "owner_version": last_event["owner_version"],
+            "kind": EventKind.SNAPSHOT.value,
+            "data": {
+                "compacted_events": compacted_events,
+                "first_timestamp": first_timestamp,
+                "first_owner_version": first_owner_version,
+                "frame_args": frame_args,
+            },
+        }
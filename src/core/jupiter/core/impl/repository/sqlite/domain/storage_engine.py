@@ -1,6 +1,7 @@
 """The real implementation of an engine."""
 
-from collections.abc import AsyncIterator, Callable, Iterator
+import dataclasses
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
 from contextlib import asynccontextmanager
 from types import GenericAlias, ModuleType, TracebackType
 from typing import (
@@ -29,6 +30,12 @@ from jupiter.core.framework.entity import (
     StubEntity,
     TrunkEntity,
 )
+from jupiter.core.framework.manifest import (
+    LazyTypeMapping,
+    ManifestSection,
+    import_path,
+    resolve_import_path,
+)
 from jupiter.core.framework.realm import RealmCodecRegistry
 from jupiter.core.framework.record import Record
 from jupiter.core.framework.repository import (
@@ -63,6 +70,7 @@ _StubEntityT = TypeVar("_StubEntityT", bound=StubEntity)
 _TrunkEntityT = TypeVar("_TrunkEntityT", bound=TrunkEntity)
 _CrownEntityT = TypeVar("_CrownEntityT", bound=CrownEntity)
 _RecordT = TypeVar("_RecordT", bound=Record)
+_FactoryT = TypeVar("_FactoryT", bound=SqliteRepository)
 
 
 class SqliteDomainUnitOfWork(DomainUnitOfWork):
@@ -72,25 +80,25 @@ class SqliteDomainUnitOfWork(DomainUnitOfWork):
     _connection: Final[AsyncConnection]
     _metadata: Final[MetaData]
     _entity_repository_factories: Final[
-        dict[type[Entity], type[SqliteEntityRepository[Entity]]]
+        Mapping[type[Entity], type[SqliteEntityRepository[Entity]]]
     ]
     _record_repository_factories: Final[
-        dict[type[Record], type[SqliteRecordRepository[Record, object]]]
+        Mapping[type[Record], type[SqliteRecordRepository[Record, object]]]
     ]
-    _repository_factories: Final[dict[type[Repository], type[SqliteRepository]]]
+    _repository_factories: Final[Mapping[type[Repository], type[SqliteRepository]]]
 
     def __init__(
         self,
         realm_codec_registry: RealmCodecRegistry,
         connection: AsyncConnection,
         metadata: MetaData,
-        entity_repository_factories: dict[
+        entity_repository_factories: Mapping[
             type[Entity], type[SqliteEntityRepository[Entity]]
         ],
-        record_repository_factories: dict[
+        record_repository_factories: Mapping[
             type[Record], type[SqliteRecordRepository[Record, object]]
         ],
-        repository_factories: dict[type[Repository], type[SqliteRepository]],
+        repository_factories: Mapping[type[Repository], type[SqliteRepository]],
     ) -> None:
         """Constructor."""
         self._realm_codec_registry = realm_codec_registry
@@ -284,44 +292,60 @@ class _StandardSqliteCrownEntityRepository(
         )
 
 
+@dataclasses.dataclass
+class _ModuleRootsExploration:
+    """The repositories defined in the modules under some module roots."""
+
+    entity_repository_factories: dict[
+        type[Entity], type[SqliteEntityRepository[Entity]]
+    ]
+    # Entities without an explicit repository, which get a standard one.
+    standard_entity_types: list[type[Entity]]
+    record_repository_factories: dict[
+        type[Record], type[SqliteRecordRepository[Record, object]]
+    ]
+    repository_factories: dict[type[Repository], type[SqliteRepository]]
+
+
 class SqliteDomainStorageEngine(DomainStorageEngine):
     """An Sqlite specific engine."""
 
     _realm_codec_registry: Final[RealmCodecRegistry]
     _sql_engine: Final[AsyncEngine]
-    _metadata: Final[MetaData]
+    _read_sql_engine: Final[AsyncEngine]
+    _sqlite_connection: Final[SqliteConnection]
     _entity_repository_factories: Final[
-        dict[type[Entity], type[SqliteEntityRepository[Entity]]]
+        Mapping[type[Entity], type[SqliteEntityRepository[Entity]]]
     ]
     _record_repository_factories: Final[
-        dict[type[Record], type[SqliteRecordRepository[Record, object]]]
+        Mapping[type[Record], type[SqliteRecordRepository[Record, object]]]
     ]
-    _repository_factories: Final[dict[type[Repository], type[SqliteRepository]]]
+    _repository_factories: Final[Mapping[type[Repository], type[SqliteRepository]]]
 
     def __init__(
         self,
         realm_codec_registry: RealmCodecRegistry,
         connection: SqliteConnection,
-        entity_repository_factories: dict[
+        entity_repository_factories: Mapping[
             type[Entity], type[SqliteEntityRepository[Entity]]
         ],
-        record_repository_factories: dict[
+        record_repository_factories: Mapping[
             type[Record], type[SqliteRecordRepository[Record, object]]
         ],
-        repository_factories: dict[type[Repository], type[SqliteRepository]],
+        repository_factories: Mapping[type[Repository], type[SqliteRepository]],
     ) -> None:
         """Constructor."""
         self._realm_codec_registry = realm_codec_registry
         self._sql_engine = connection.sql_engine
-        self._metadata = MetaData()
+        self._read_sql_engine = connection.read_sql_engine
+        self._sqlite_connection = connection
         self._entity_repository_factories = entity_repository_factories
         self._record_repository_factories = record_repository_factories
         self._repository_factories = repository_factories
 
     async def initialize(self) -> None:
         """Initialize the storage engine."""
-        async with self._sql_engine.connect() as conn:
-            await conn.run_sync(self._metadata.reflect)
+        await self._sqlite_connection.reflect_metadata()
 
     @staticmethod
     def build_from_module_root(
@@ -330,7 +354,116 @@ class SqliteDomainStorageEngine(DomainStorageEngine):
         *module_roots: ModuleType,
     ) -> "SqliteDomainStorageEngine":
         """Build a unit of work from module roots."""
+        exploration = SqliteDomainStorageEngine._explore_module_roots(*module_roots)
+
+        entity_repository_factories = dict(exploration.entity_repository_factories)
+        for entity_type in exploration.standard_entity_types:
+            entity_repository_factories[entity_type] = (
+                _build_standard_entity_repository(entity_type)
+            )
+
+        return SqliteDomainStorageEngine(
+            realm_codec_registry,
+            connection,
+            entity_repository_factories,
+            exploration.record_repository_factories,
+            exploration.repository_factories,
+        )
+
+    @staticmethod
+    def build_manifest_section(*module_roots: ModuleType) -> ManifestSection:
+        """Build the manifest section from which the engine for module roots can be built."""
+        exploration = SqliteDomainStorageEngine._explore_module_roots(*module_roots)
+
+        section: ManifestSection = []
+        for (
+            entity_type,
+            entity_repository_type,
+        ) in exploration.entity_repository_factories.items():
+            section.append(
+                (
+                    "entity-repository",
+                    import_path(entity_type),
+                    import_path(entity_repository_type),
+                )
+            )
+        for entity_type in exploration.standard_entity_types:
+            section.append(("standard-entity-repository", import_path(entity_type)))
+        for (
+            record_type,
+            record_repository_type,
+        ) in exploration.record_repository_factories.items():
+            section.append(
+                (
+                    "record-repository",
+                    import_path(record_type),
+                    import_path(record_repository_type),
+                )
+            )
+        for (
+            abstract_repository_type,
+            repository_type,
+        ) in exploration.repository_factories.items():
+            section.append(
+                (
+                    "repository",
+                    import_path(abstract_repository_type),
+                    import_path(repository_type),
+                )
+            )
+        return section
 
+    @staticmethod
+    def build_from_manifest(
+        realm_codec_registry: RealmCodecRegistry,
+        connection: SqliteConnection,
+        section: ManifestSection,
+    ) -> "SqliteDomainStorageEngine":
+        """Build a unit of work from a manifest section.
+
+        Repositories are only imported the first time they're asked for.
+        """
+        entity_repository_factories: dict[
+            str, Callable[[type[Entity]], type[SqliteEntityRepository[Entity]]]
+        ] = {}
+        record_repository_factories: dict[
+            str,
+            Callable[[type[Record]], type[SqliteRecordRepository[Record, object]]],
+        ] = {}
+        repository_factories: dict[
+            str, Callable[[type[Repository]], type[SqliteRepository]]
+        ] = {}
+
+        for kind, key_path, *factory_paths in section:
+            if kind == "entity-repository":
+                entity_repository_factories[key_path] = _resolve_factory(
+                    factory_paths[0], SqliteEntityRepository
+                )
+            elif kind == "standard-entity-repository":
+                entity_repository_factories[key_path] = (
+                    _build_standard_entity_repository
+                )
+            elif kind == "record-repository":
+                record_repository_factories[key_path] = _resolve_factory(
+                    factory_paths[0], SqliteRecordRepository
+                )
+            elif kind == "repository":
+                repository_factories[key_path] = _resolve_factory(
+                    factory_paths[0], SqliteRepository
+                )
+            else:
+                raise Exception(f"Unknown repository manifest entry kind {kind}")
+
+        return SqliteDomainStorageEngine(
+            realm_codec_registry,
+            connection,
+            LazyTypeMapping(entity_repository_factories),
+            LazyTypeMapping(record_repository_factories),
+            LazyTypeMapping(repository_factories),
+        )
+
+    @staticmethod
+    def _explore_module_roots(*module_roots: ModuleType) -> _ModuleRootsExploration:
         def figure_out_entity(the_type: type[Repository]) -> type[Entity] | None:
             """Figure out the entity type from the repository type."""
             if not hasattr(the_type, "__orig_bases__"):
@@ -561,9 +694,16 @@ class SqliteDomainStorageEngine(DomainStorageEngine):
 
                 yield obj
 
-        entity_repository_factories = {}
-        record_repository_factories = {}
-        repository_factories: dict[type[Repository], type[SqliteRepository]] = {}
+        exploration = _ModuleRootsExploration(
+            entity_repository_factories={},
+            standard_entity_types=[],
+            record_repository_factories={},
+            repository_factories={},
+        )
+        entity_repository_factories = exploration.entity_repository_factories
+        record_repository_factories = exploration.record_repository_factories
+        repository_factories = exploration.repository_factories
+        standard_entity_types = exploration.standard_entity_types
 
         for m in find_all_modules(*module_roots):
             # extract all entity repositories
@@ -572,7 +712,10 @@ class SqliteDomainStorageEngine(DomainStorageEngine):
                 abstract_entity_repository_type,
                 concrete_entity_repository_type,
             ) in extract_entity_repositories(m):
-                if entity_type in entity_repository_factories:
+                if (
+                    entity_type in entity_repository_factories
+                    or entity_type in standard_entity_types
+                ):
                     raise Exception(
                         f"Entity type {entity_type} already has a repository"
                     )
@@ -623,53 +766,81 @@ class SqliteDomainStorageEngine(DomainStorageEngine):
             for entity_type in extract_entities(m):
                 if entity_type in entity_repository_factories:
                     continue
-                if issubclass(entity_type, RootEntity):
-                    entity_repository_factories[entity_type] = type(
-                        f"_StandardSqliteRootEntityRepository_{entity_type.__name__}",
-                        (_StandardSqliteRootEntityRepository,),
-                        {"__init__": _generic_root_init(entity_type)},
-                    )
-                elif issubclass(entity_type, StubEntity):
-                    entity_repository_factories[entity_type] = type(
-                        f"_StandardSqliteStubEntityRepository_{entity_type.__name__}",
-                        (_StandardSqliteStubEntityRepository,),
-                        {"__init__": _generic_stub_init(entity_type)},
-                    )
-                elif issubclass(entity_type, TrunkEntity):
-                    entity_repository_factories[entity_type] = type(
-                        f"_StandardSqliteTrunkEntityRepository_{entity_type.__name__}",
-                        (_StandardSqliteTrunkEntityRepository,),
-                        {"__init__": _generic_trunk_init(entity_type)},
-                    )
-                elif issubclass(entity_type, CrownEntity):
-                    entity_repository_factories[entity_type] = type(
-                        f"_StandardSqliteCrownEntityRepository_{entity_type.__name__}",
-                        (_StandardSqliteCrownEntityRepository,),
-                        {"__init__": _generic_crown_init(entity_type)},
-                    )
-                else:
-                    raise Exception(f"Unknown entity type: {entity_type}")
+                standard_entity_types.append(entity_type)
 
-        return SqliteDomainStorageEngine(
-            realm_codec_registry,
-            connection,
-            entity_repository_factories,
-            record_repository_factories,
-            repository_factories,
-        )
+        return exploration
 
     @asynccontextmanager
     async def get_unit_of_work(self) -> AsyncIterator[DomainUnitOfWork]:
         """Get the unit of work."""
         async with self._sql_engine.begin() as connection:
-            yield SqliteDomainUnitOfWork(
-                realm_codec_registry=self._realm_codec_registry,
-                connection=connection,
-                metadata=self._metadata,
-                entity_repository_factories=self._entity_repository_factories,
-                record_repository_factories=self._record_repository_factories,
-                repository_factories=self._repository_factories,
+            yield self._build_unit_of_work(connection)
+
+    @asynccontextmanager
+    async def get_read_unit_of_work(self) -> AsyncIterator[DomainUnitOfWork]:
+        """Get a unit of work which can only read."""
+        async with self._read_sql_engine.begin() as connection:
+            yield self._build_unit_of_work(connection)
+
+    def _build_unit_of_work(
+        self, connection: AsyncConnection
+    ) -> SqliteDomainUnitOfWork:
+        return SqliteDomainUnitOfWork(
+            realm_codec_registry=self._realm_codec_registry,
+            connection=connection,
+            metadata=self._sqlite_connection.metadata,
+            entity_repository_factories=self._entity_repository_factories,
+            record_repository_factories=self._record_repository_factories,
+            repository_factories=self._repository_factories,
+        )
+
+
+def _build_standard_entity_repository(
+    entity_type: type[Entity],
+) -> type[SqliteEntityRepository[Entity]]:
+    """Build the standard repository for an entity without an explicit one."""
+    if issubclass(entity_type, RootEntity):
+        return type(
+            f"_StandardSqliteRootEntityRepository_{entity_type.__name__}",
+            (_StandardSqliteRootEntityRepository,),
+            {"__init__": _generic_root_init(entity_type)},
+        )
+    elif issubclass(entity_type, StubEntity):
+        return type(
+            f"_StandardSqliteStubEntityRepository_{entity_type.__name__}",
+            (_StandardSqliteStubEntityRepository,),
+            {"__init__": _generic_stub_init(entity_type)},
+        )
+    elif issubclass(entity_type, TrunkEntity):
+        return type(
+            f"_StandardSqliteTrunkEntityRepository_{entity_type.__name__}",
+            (_StandardSqliteTrunkEntityRepository,),
+            {"__init__": _generic_trunk_init(entity_type)},
+        )
+    elif issubclass(entity_type, CrownEntity):
+        return type(
+            f"_StandardSqliteCrownEntityRepository_{entity_type.__name__}",
+            (_StandardSqliteCrownEntityRepository,),
+            {"__init__": _generic_crown_init(entity_type)},
+        )
+    else:
+        raise Exception(f"Unknown entity type: {entity_type}")
+
+
+def _resolve_factory(
+    factory_path: str, factory_base: type[_FactoryT]
+) -> Callable[[type], type[_FactoryT]]:
+    """A resolver for a repository listed in a manifest."""
+
+    def resolve(_key: type) -> type[_FactoryT]:
+        factory = resolve_import_path(factory_path)
+        if not issubclass(factory, factory_base):
+            raise Exception(
+                f"Manifest repository {factory_path} is not a {factory_base}"
             )
+        return factory
+
+    return resolve
 
 
 def _generic_root_init(
@@ -772,7 +943,7 @@ class SqliteSearchStorageEngine(SearchStorageEngine):
 
     _realm_codec_registry: Final[RealmCodecRegistry]
     _sql_engine: Final[AsyncEngine]
-    _metadata: Final[MetaData]
+    _sqlite_connection: Final[SqliteConnection]
 
     def __init__(
         self, realm_codec_registry: RealmCodecRegistry, connection: SqliteConnection
@@ -780,18 +951,19 @@ class SqliteSearchStorageEngine(SearchStorageEngine):
         """Constructor."""
         self._realm_codec_registry = realm_codec_registry
         self._sql_engine = connection.sql_engine
-        self._metadata = MetaData()
+        self._sqlite_connection = connection
 
     async def initialize(self) -> None:
         """Initialize the storage engine."""
-        async with self._sql_engine.connect() as conn:
-            await conn.run_sync(self._metadata.reflect)
+        await self._sqlite_connection.reflect_metadata()
 
     @asynccontextmanager
     async def get_unit_of_work(self) -> AsyncIterator[SearchUnitOfWork]:
         """Get the unit of work."""
         async with self._sql_engine.begin() as connection:
             search_repository = SqliteSearchRepository(
-                self._realm_codec_registry, connection, self._metadata
+                self._realm_codec_registry,
+                connection,
+                self._sqlite_connection.metadata,
             )
             yield SqliteSearchUnitOfWork(search_repository=search_repository)
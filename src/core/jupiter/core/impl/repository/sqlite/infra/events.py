@@ -1,14 +1,18 @@
 """Common toolin for SQLite repositories."""
 
+from collections.abc import Iterable
+
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.entity import Entity
-from jupiter.core.framework.event import Event
+from jupiter.core.framework.event import Event, EventKind
 from jupiter.core.framework.realm import (
     EncoderNotFoundError,
     EventStoreRealm,
     RealmCodecRegistry,
     RealmThing,
 )
+from jupiter.core.framework.value import EnumValue
 from sqlalchemy import (
     JSON,
     Column,
@@ -16,10 +20,12 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     MetaData,
+    Select,
     String,
     Table,
     delete,
     insert,
+    literal,
 )
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -52,25 +58,109 @@ async def upsert_events(
     event_table: Table,
     aggreggate_root: Entity,
 ) -> None:
-    """Upsert all the events for a given entity in an events table."""
-    for event_idx, event in enumerate(aggreggate_root.events):
+    """Upsert the events of a given entity not yet in an events table."""
+    await upsert_events_many(
+        realm_codec_registry, connection, event_table, [aggreggate_root]
+    )
+
+
+async def upsert_events_many(
+    realm_codec_registry: RealmCodecRegistry,
+    connection: AsyncConnection,
+    event_table: Table,
+    aggreggate_roots: Iterable[Entity],
+) -> None:
+    """Upsert the events of several entities not yet in an events table.
+
+    Only the events an entity got since it was last written are encoded and
+    inserted, all with one prepared statement. Afterwards every entity is
+    marked as having all its events persisted.
+    """
+    aggreggate_roots = list(aggreggate_roots)
+    event_rows = [
+        _event_to_row(
+            realm_codec_registry,
+            aggreggate_root,
+            event_idx,
+            aggreggate_root.events[event_idx],
+        )
+        for aggreggate_root in aggreggate_roots
+        for event_idx in range(
+            aggreggate_root.persisted_events_count, len(aggreggate_root.events)
+        )
+    ]
+    if len(event_rows) > 0:
         await connection.execute(
-            insert(event_table)
-            .prefix_with("OR IGNORE")
-            .values(
-                owner_ref_id=aggreggate_root.ref_id.as_int(),
-                timestamp=realm_codec_registry.db_encode(event.timestamp),
-                session_index=event_idx,
-                name=str(event.name),
-                source=str(event.source.value),
-                owner_version=event.entity_version,
-                kind=str(event.kind.value),
-                data=_serialize_event(realm_codec_registry, event),
+            insert(event_table).prefix_with("OR IGNORE"),
+            event_rows,
+        )
+    for aggreggate_root in aggreggate_roots:
+        aggreggate_root.mark_events_persisted()
+
+
+async def upsert_archive_events_from_select(
+    realm_codec_registry: RealmCodecRegistry,
+    connection: AsyncConnection,
+    event_table: Table,
+    owners: Select[tuple[int, int]],
+    ctx: DomainContext,
+    archival_reason: EnumValue,
+) -> None:
+    """Record an archive event for every entity selected by a query, in one statement.
+
+    The query selects the ref_id of each entity and the version it's archived at.
+    The events look like the one `Entity.mark_archived` emits on a freshly
+    loaded entity.
+    """
+    await connection.execute(
+        insert(event_table)
+        .prefix_with("OR IGNORE")
+        .from_select(
+            [
+                "owner_ref_id",
+                "owner_version",
+                "timestamp",
+                "session_index",
+                "name",
+                "source",
+                "kind",
+                "data",
+            ],
+            owners.add_columns(
+                literal(realm_codec_registry.db_encode(ctx.action_timestamp), DateTime),
+                literal(0, Integer),
+                literal("mark_archived", String),
+                literal(str(ctx.event_source.value), String),
+                literal(str(EventKind.ARCHIVE.value), String),
+                literal(
+                    {
+                        "reason": realm_codec_registry.get_encoder(
+                            str, EventStoreRealm
+                        ).encode(str(archival_reason.value))
+                    },
+                    JSON,
+                ),
             ),
-            # .on_conflict_do_nothing(
-            #    index_elements=["owner_ref_id", "timestamp", "session_index", "name"]
-            # )
         )
+    )
+
+
+def _event_to_row(
+    realm_codec_registry: RealmCodecRegistry,
+    aggreggate_root: Entity,
+    event_idx: int,
+    event: Event,
+) -> dict[str, RealmThing]:
+    return {
+        "owner_ref_id": aggreggate_root.ref_id.as_int(),
+        "timestamp": realm_codec_registry.db_encode(event.timestamp),
+        "session_index": event_idx,
+        "name": str(event.name),
+        "source": str(event.source.value),
+        "owner_version": event.entity_version,
+        "kind": str(event.kind.value),
+        "data": _serialize_event(realm_codec_registry, event),
+    }
 
 
 def _serialize_event(
@@ -98,3 +188,18 @@ async def remove_events(
     await connection.execute(
         delete(event_table).where(event_table.c.owner_ref_id == entity_ref_id.as_int()),
     )
+
+
+async def remove_events_many(
+    connection: AsyncConnection,
+    event_table: Table,
+    entity_ref_ids: Iterable[EntityId],
+) -> None:
+    """Remove all the events for several entities in an events table."""
+    await connection.execute(
+        delete(event_table).where(
+            event_table.c.owner_ref_id.in_(
+                [ref_id.as_int() for ref_id in entity_ref_ids]
+            )
+        ),
+    )
@@ -23,12 +23,15 @@ import pendulum
 from jupiter.core.domain.core.archival_reason import ArchivalReason
 from jupiter.core.framework.base.entity_id import BAD_REF_ID, EntityId
 from jupiter.core.framework.base.entity_name import EntityName
+from jupiter.core.framework.base.page_cursor import PageCursor
 from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.entity import (
     BranchEntity,
     CrownEntity,
     Entity,
     EntityLinkFilterCompiled,
+    EntityLinkFiltersCompiled,
     LeafEntity,
     ParentLink,
     RootEntity,
@@ -52,7 +55,10 @@ from jupiter.core.framework.value import (
 from jupiter.core.impl.repository.sqlite.infra.events import (
     build_event_table,
     remove_events,
+    remove_events_many,
+    upsert_archive_events_from_select,
     upsert_events,
+    upsert_events_many,
 )
 from jupiter.core.impl.repository.sqlite.infra.filters import compile_query_relative_to
 from jupiter.core.impl.repository.sqlite.infra.row import RowType
@@ -60,14 +66,17 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    ColumnElement,
     Date,
     DateTime,
     Float,
     ForeignKey,
     Integer,
     MetaData,
+    Select,
     String,
     Table,
+    bindparam,
     delete,
     insert,
     select,
@@ -81,6 +90,12 @@ _RecordT = TypeVar("_RecordT", bound=Record)
 _RecordKeyPrefixT = TypeVar("_RecordKeyPrefixT")
 _ArchivalReasonT = TypeVar("_ArchivalReasonT", bound=EnumValue)
 
+# Bulk statements keep their IN lists under SQLite's bound parameter limit.
+_BULK_CHUNK_SIZE: Final[int] = 500
+# The ref_id column is part of the SET clause of a bulk update, so the WHERE
+# clause needs its own parameter name.
+_BULK_REF_ID_PARAM: Final[str] = "_bulk_ref_id"
+
 
 class SqliteRepository(abc.ABC):
     """A repository for entities backed by SQLite, meant to be used as a mixin."""
@@ -214,6 +229,129 @@ class SqliteEntityRepository(Generic[_EntityT], SqliteRepository, abc.ABC):
         await remove_events(self._connection, self._event_table, ref_id)
         return self._row_to_entity(result)
 
+    async def find_ref_ids_by_parents(
+        self, parent_ref_ids: list[EntityId], allow_archived: bool = False
+    ) -> list[EntityId]:
+        """Find the ids of all entities with one of the given parents."""
+        ref_ids: list[EntityId] = []
+        for parent_ref_ids_chunk in _chunks(parent_ref_ids):
+            query_stmt = select(self._table.c.ref_id).where(
+                self._by_parents_clause(parent_ref_ids_chunk, allow_archived)
+            )
+            ref_ids.extend(
+                EntityId(str(row.ref_id))
+                for row in await self._connection.execute(query_stmt)
+            )
+        return ref_ids
+
+    async def find_all_by_parents(
+        self, parent_ref_ids: list[EntityId], allow_archived: bool = False
+    ) -> list[_EntityT]:
+        """Find all entities with one of the given parents."""
+        entities: list[_EntityT] = []
+        for parent_ref_ids_chunk in _chunks(parent_ref_ids):
+            query_stmt = select(self._table).where(
+                self._by_parents_clause(parent_ref_ids_chunk, allow_archived)
+            )
+            entities.extend(
+                self._row_to_entity(row)
+                for row in await self._connection.execute(query_stmt)
+            )
+        return entities
+
+    async def archive_all_by_parents(
+        self,
+        ctx: DomainContext,
+        parent_ref_ids: list[EntityId],
+        archival_reason: _ArchivalReasonT,
+        exclude_ref_ids: list[EntityId] | None = None,
+    ) -> None:
+        """Archive all unarchived entities with one of the given parents, in bulk."""
+        excluded_ref_ids = {ref_id.as_int() for ref_id in exclude_ref_ids or []}
+        for parent_ref_ids_chunk in _chunks(parent_ref_ids):
+            where_clause = self._by_parents_clause(
+                parent_ref_ids_chunk, allow_archived=False
+            )
+            if len(excluded_ref_ids) == 0:
+                await self._archive_where(ctx, where_clause, archival_reason)
+                continue
+            # The exclusions can be arbitrarily many, so rather than binding
+            # all of them in every statement, they are dropped here and the
+            # rest are archived by ref id, a chunk at a time.
+            ref_ids = [
+                EntityId(str(ref_id))
+                for ref_id in cast(
+                    Iterable[int],
+                    await self._connection.scalars(
+                        select(self._table.c.ref_id).where(where_clause)
+                    ),
+                )
+                if ref_id not in excluded_ref_ids
+            ]
+            for ref_ids_chunk in _chunks(ref_ids):
+                await self._archive_where(
+                    ctx,
+                    self._table.c.ref_id.in_(
+                        [ref_id.as_int() for ref_id in ref_ids_chunk]
+                    )
+                    & self._table.c.archived.is_(False),
+                    archival_reason,
+                )
+
+    async def _archive_where(
+        self,
+        ctx: DomainContext,
+        where_clause: ColumnElement[bool],
+        archival_reason: _ArchivalReasonT,
+    ) -> None:
+        archived_time = self._realm_codec_registry.db_encode(ctx.action_timestamp)
+        # The events go in first, while the where clause still picks out the
+        # entities which are about to be archived.
+        await upsert_archive_events_from_select(
+            self._realm_codec_registry,
+            self._connection,
+            self._event_table,
+            select(self._table.c.ref_id, self._table.c.version + 1).where(where_clause),
+            ctx,
+            archival_reason,
+        )
+        await self._connection.execute(
+            update(self._table)
+            .where(where_clause)
+            .values(
+                version=self._table.c.version + 1,
+                archived=True,
+                archived_time=archived_time,
+                archival_reason=str(archival_reason.value),
+                last_modified_time=archived_time,
+            )
+        )
+
+    async def remove_all_by_parents(self, parent_ref_ids: list[EntityId]) -> None:
+        """Hard remove all entities with one of the given parents - an irreversible operation."""
+        for parent_ref_ids_chunk in _chunks(parent_ref_ids):
+            where_clause = self._by_parents_clause(
+                parent_ref_ids_chunk, allow_archived=True
+            )
+            await self._connection.execute(
+                delete(self._event_table).where(
+                    self._event_table.c.owner_ref_id.in_(
+                        select(self._table.c.ref_id).where(where_clause)
+                    )
+                )
+            )
+            await self._connection.execute(delete(self._table).where(where_clause))
+
+    def _by_parents_clause(
+        self, parent_ref_ids: list[EntityId], allow_archived: bool
+    ) -> ColumnElement[bool]:
+        clause: ColumnElement[bool] = self._table.c[self._get_parent_field_name()].in_(
+            [ref_id.as_int() for ref_id in parent_ref_ids]
+        )
+        if not allow_archived:
+            clause = clause & self._table.c.archived.is_(False)
+        return clause
+
     def _entity_to_row(self, entity: _EntityT) -> RowType:
         encoder = self._realm_codec_registry.get_encoder(
             self._entity_type, DatabaseRealm
@@ -301,7 +439,7 @@ class SqliteEntityRepository(Generic[_EntityT], SqliteRepository, abc.ABC):
         )
 
         for field in all_fields:
-            if field.name in (
+            if not field.init or field.name in (
                 "ref_id",
                 "version",
                 "archived",
@@ -471,6 +609,11 @@ class SqliteEntityRepository(Generic[_EntityT], SqliteRepository, abc.ABC):
         return table
 
 
+def _chunks(ref_ids: list[EntityId]) -> Iterable[list[EntityId]]:
+    for idx in range(0, len(ref_ids), _BULK_CHUNK_SIZE):
+        yield ref_ids[idx : idx + _BULK_CHUNK_SIZE]
+
+
 class _GenericAlias(Protocol):
     __origin__: type[object]
 
@@ -539,6 +682,16 @@ class SqliteRootEntityRepository(
             return None
         return self._row_to_entity(result)
 
+    async def load_version_optional(self, entity_id: EntityId) -> int | None:
+        """Loads just the version of the root entity, or null if there isn't one."""
+        query_stmt = select(self._table.c.version).where(
+            self._table.c.ref_id == entity_id.as_int(),
+        )
+        result = (await self._connection.execute(query_stmt)).first()
+        if result is None:
+            return None
+        return cast(int, result[0])
+
     async def find_all(
         self,
         allow_archived: bool | _ArchivalReasonT | list[_ArchivalReasonT] = False,
@@ -766,6 +919,50 @@ class SqliteCrownEntityRepository(
         **kwargs: EntityLinkFilterCompiled,
     ) -> list[_CrownEntityT]:
         """Find all crowns with generic filters."""
+        query_stmt = self._build_find_all_generic_query(
+            parent_ref_id, allow_archived, kwargs
+        )
+        results = await self._connection.execute(query_stmt)
+        return [self._row_to_entity(row) for row in results]
+
+    async def find_page_generic(
+        self,
+        page_size: int | None,
+        page_cursor: PageCursor | None,
+        /,
+        *,
+        parent_ref_id: EntityId | None = None,
+        allow_archived: bool | _ArchivalReasonT | list[_ArchivalReasonT] = False,
+        **kwargs: EntityLinkFilterCompiled,
+    ) -> list[_CrownEntityT]:
+        """Find a page of crowns with generic filters."""
+        query_stmt = self._build_find_all_generic_query(
+            parent_ref_id, allow_archived, kwargs
+        )
+        if page_cursor is not None:
+            cursor_time = page_cursor.last_modified_time.the_ts
+            query_stmt = query_stmt.where(
+                (self._table.c.last_modified_time > cursor_time)
+                | (
+                    (self._table.c.last_modified_time == cursor_time)
+                    & (self._table.c.ref_id > page_cursor.ref_id.as_int())
+                )
+            )
+        query_stmt = query_stmt.order_by(
+            self._table.c.last_modified_time, self._table.c.ref_id
+        )
+        if page_size is not None:
+            query_stmt = query_stmt.limit(page_size)
+
+        results = await self._connection.execute(query_stmt)
+        return [self._row_to_entity(row) for row in results]
+
+    def _build_find_all_generic_query(
+        self,
+        parent_ref_id: EntityId | None,
+        allow_archived: bool | _ArchivalReasonT | list[_ArchivalReasonT],
+        filters: EntityLinkFiltersCompiled,
+    ) -> Select[tuple[Primitive, ...]]:
         query_stmt = select(self._table)
 
         if parent_ref_id is not None:
@@ -790,12 +987,120 @@ class SqliteCrownEntityRepository(
                 )
             )
 
-        query_stmt = compile_query_relative_to(
-            self._realm_codec_registry, query_stmt, self._table, kwargs
+        return compile_query_relative_to(
+            self._realm_codec_registry, query_stmt, self._table, filters
         )
 
-        results = await self._connection.execute(query_stmt)
-        return [self._row_to_entity(row) for row in results]
+    async def create_many(self, entities: list[_CrownEntityT]) -> list[_CrownEntityT]:
+        """Create several crowns at once, returning them with their ref ids assigned."""
+        if len(entities) == 0:
+            return []
+        if any(entity.ref_id != BAD_REF_ID for entity in entities):
+            raise Exception("Cannot create an entity with a ref_id already set")
+        entities_for_db = []
+        for entity in entities:
+            entity_for_db = cast(dict[str, RealmThing], self._entity_to_row(entity))
+            del entity_for_db["ref_id"]
+            entities_for_db.append(entity_for_db)
+        try:
+            result = await self._connection.execute(
+                insert(self._table).returning(
+                    self._table.c.ref_id, sort_by_parameter_order=True
+                ),
+                entities_for_db,
+            )
+        except IntegrityError as err:
+            raise self._already_exists_err_cls(
+                f"Entity of type {self._entity_type.__name__} with one of the names {', '.join(str(e.name) for e in entities)} already exists",
+            ) from err
+        new_entities = [
+            entity.assign_ref_id(EntityId(str(row.ref_id)))
+            for entity, row in zip(entities, result.all(), strict=True)
+        ]
+        await upsert_events_many(
+            self._realm_codec_registry,
+            self._connection,
+            self._event_table,
+            new_entities,
+        )
+        return new_entities
+
+    async def save_many(self, entities: list[_CrownEntityT]) -> list[_CrownEntityT]:
+        """Save several crowns at once."""
+        if len(entities) == 0:
+            return []
+        entities_for_db = []
+        for entity in entities:
+            entity_for_db = cast(dict[str, RealmThing], self._entity_to_row(entity))
+            entity_for_db[_BULK_REF_ID_PARAM] = entity.ref_id.as_int()
+            entities_for_db.append(entity_for_db)
+        try:
+            result = await self._connection.execute(
+                update(self._table).where(
+                    self._table.c.ref_id == bindparam(_BULK_REF_ID_PARAM)
+                ),
+                entities_for_db,
+            )
+        except IntegrityError as err:
+            raise self._already_exists_err_cls(
+                f"Entity of type {self._entity_type.__name__} with one of the names {', '.join(str(e.name) for e in entities)} already exists",
+            ) from err
+        if result.rowcount != len(entities):
+            existing_ref_ids = await self._find_existing_ref_ids(
+                [entity.ref_id for entity in entities]
+            )
+            missing_entity = next(
+                e for e in entities if e.ref_id.as_int() not in existing_ref_ids
+            )
+            raise self._not_found_err_cls(
+                f"Entity of type {missing_entity.__class__} and id {missing_entity.ref_id!s} not found."
+            )
+        await upsert_events_many(
+            self._realm_codec_registry,
+            self._connection,
+            self._event_table,
+            entities,
+        )
+        return entities
+
+    async def remove_many(self, ref_ids: list[EntityId]) -> list[_CrownEntityT]:
+        """Hard remove several crowns at once - an irreversible operation."""
+        if len(ref_ids) == 0:
+            return []
+        entities_by_ref_id: dict[EntityId, _CrownEntityT] = {}
+        for ref_ids_chunk in _chunks(ref_ids):
+            query_stmt = select(self._table).where(
+                self._table.c.ref_id.in_([ref_id.as_int() for ref_id in ref_ids_chunk])
+            )
+            for row in await self._connection.execute(query_stmt):
+                entity = self._row_to_entity(row)
+                entities_by_ref_id[entity.ref_id] = entity
+        for ref_id in ref_ids:
+            if ref_id not in entities_by_ref_id:
+                raise self._not_found_err_cls(
+                    f"Entity of type {self._entity_type.__name__} identified by {ref_id} does not exist"
+                )
+        for ref_ids_chunk in _chunks(ref_ids):
+            await self._connection.execute(
+                delete(self._table).where(
+                    self._table.c.ref_id.in_(
+                        [ref_id.as_int() for ref_id in ref_ids_chunk]
+                    )
+                ),
+            )
+            await remove_events_many(self._connection, self._event_table, ref_ids_chunk)
+        return [entities_by_ref_id[ref_id] for ref_id in ref_ids]
+
+    async def _find_existing_ref_ids(self, ref_ids: list[EntityId]) -> set[int]:
+        existing_ref_ids: set[int] = set()
+        for ref_ids_chunk in _chunks(ref_ids):
+            query_stmt = select(self._table.c.ref_id).where(
+                self._table.c.ref_id.in_([ref_id.as_int() for ref_id in ref_ids_chunk])
+            )
+            existing_ref_ids.update(
+                row.ref_id for row in await self._connection.execute(query_stmt)
+            )
+        return existing_ref_ids
 
 
 _BranchEntityT = TypeVar("_BranchEntityT", bound=BranchEntity)
@@ -17,7 +17,6 @@ from jupiter.core.use_cases.infra.storage_engine import (
     UseCaseStorageEngine,
     UseCaseUnitOfWork,
 )
-from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 
@@ -62,7 +61,7 @@ class SqliteUseCaseStorageEngine(UseCaseStorageEngine):
 
     _realm_codec_registry: Final[RealmCodecRegistry]
     _sql_engine: Final[AsyncEngine]
-    _metadata: Final[MetaData]
+    _sqlite_connection: Final[SqliteConnection]
 
     def __init__(
         self, realm_codec_registry: RealmCodecRegistry, connection: SqliteConnection
@@ -70,12 +69,11 @@ class SqliteUseCaseStorageEngine(UseCaseStorageEngine):
         """Constructor."""
         self._realm_codec_registry = realm_codec_registry
         self._sql_engine = connection.sql_engine
-        self._metadata = MetaData()
+        self._sqlite_connection = connection
 
     async def initialize(self) -> None:
         """Initialize the storage engine."""
-        async with self._sql_engine.connect() as conn:
-            await conn.run_sync(self._metadata.reflect)
+        await self._sqlite_connection.reflect_metadata()
 
     @asynccontextmanager
     async def get_unit_of_work(self) -> AsyncIterator[UseCaseUnitOfWork]:
@@ -85,7 +83,7 @@ class SqliteUseCaseStorageEngine(UseCaseStorageEngine):
                 SqliteMutationUseCaseInvocationRecordRepository(
                     self._realm_codec_registry,
                     connection,
-                    self._metadata,
+                    self._sqlite_connection.metadata,
                 )
             )
             yield SqliteUseCaseUnitOfWork(
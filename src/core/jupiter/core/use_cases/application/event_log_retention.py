@@ -0,0 +1,142 @@
+"""The command for keeping the event logs of entities from growing without bound."""
+
+import logging
+from typing import Final
+
+from jupiter.core.domain.event_log_repository import (
+    EventLogBatchOutcome,
+    EventLogRepository,
+)
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.use_case import EmptyContext
+from jupiter.core.framework.use_case_io import (
+    UseCaseArgsBase,
+    UseCaseResultBase,
+    use_case_args,
+    use_case_result,
+)
+from jupiter.core.use_cases.infra.use_cases import SysBackgroundMutationUseCase
+
+LOGGER = logging.getLogger(__name__)
+
+# A batch is a transaction of its own, so this bounds how long a run holds up
+# other writers. Whatever's left over gets picked up by the next run.
+_MAX_BATCHES_PER_RUN: Final[int] = 100
+
+
+@use_case_args
+class EventLogRetentionArgs(UseCaseArgsBase):
+    """EventLogRetentionArgs."""
+
+
+@use_case_result
+class EventLogRetentionResult(UseCaseResultBase):
+    """EventLogRetentionResult."""
+
+    events_compacted: int
+    snapshots_written: int
+    events_archived: int
+    bytes_reclaimed: int
+
+
+class EventLogRetentionUseCase(
+    SysBackgroundMutationUseCase[EventLogRetentionArgs, EventLogRetentionResult]
+):
+    """The command for keeping the event logs of entities from growing without bound.
+
+    Events older than EVENT_COMPACT_AFTER_DAYS get compacted into one snapshot
+    per window of EVENT_COMPACT_VERSION_WINDOW entity versions. Events older
+    than EVENT_ARCHIVE_AFTER_DAYS get moved out to the archive database at
+    EVENT_ARCHIVE_DB_PATH. Either is skipped when it's not configured.
+    """
+
+    async def _execute(
+        self,
+        context: EmptyContext,
+        args: EventLogRetentionArgs,
+    ) -> EventLogRetentionResult:
+        """Execute the command's action."""
+        global_properties = self._global_properties
+        now = self._time_provider.get_current_time()
+
+        async with self._domain_storage_engine.get_unit_of_work() as uow:
+            event_log_repository = uow.get(EventLogRepository)
+            event_logs = await event_log_repository.find_all_event_logs()
+            has_archive = await event_log_repository.has_archive()
+            free_space_bytes_before = await event_log_repository.find_free_space_bytes()
+
+        if global_properties.event_archive_after_days is not None and not has_archive:
+            LOGGER.warning(
+                "Events are meant to be archived, but there is no archive database"
+            )
+
+        events_compacted = 0
+        snapshots_written = 0
+        events_archived = 0
+        batches_left = _MAX_BATCHES_PER_RUN
+
+        for event_log in event_logs:
+            if global_properties.event_compact_after_days is not None:
+                compact_before = self._days_before(
+                    now, global_properties.event_compact_after_days
+                )
+                has_more = True
+                while has_more and batches_left > 0:
+                    async with self._domain_storage_engine.get_unit_of_work() as uow:
+                        outcome = await uow.get(EventLogRepository).compact_before(
+                            event_log,
+                            compact_before,
+                            global_properties.event_compact_version_window,
+                            global_properties.event_retention_batch_size,
+                        )
+                    batches_left -= self._batches_used(outcome)
+                    events_compacted += outcome.events_removed
+                    snapshots_written += outcome.events_added
+                    has_more = outcome.has_more
+
+            if global_properties.event_archive_after_days is not None and has_archive:
+                archive_before = self._days_before(
+                    now, global_properties.event_archive_after_days
+                )
+                has_more = True
+                while has_more and batches_left > 0:
+                    async with self._domain_storage_engine.get_unit_of_work() as uow:
+                        outcome = await uow.get(EventLogRepository).archive_before(
+                            event_log,
+                            archive_before,
+                            global_properties.event_retention_batch_size,
+                        )
+                    batches_left -= self._batches_used(outcome)
+                    events_archived += outcome.events_removed
+                    has_more = outcome.has_more
+
+        async with self._domain_storage_engine.get_unit_of_work() as uow:
+            free_space_bytes_after = await uow.get(
+                EventLogRepository
+            ).find_free_space_bytes()
+
+        result = EventLogRetentionResult(
+            events_compacted=events_compacted,
+            snapshots_written=snapshots_written,
+            events_archived=events_archived,
+            bytes_reclaimed=max(0, free_space_bytes_after - free_space_bytes_before),
+        )
+        LOGGER.info(
+            "Compacted %s events into %s snapshots, archived %s events, and reclaimed %s bytes%s",
+            result.events_compacted,
+            result.snapshots_written,
+            result.events_archived,
+            result.bytes_reclaimed,
+            " - there's more left for the next run" if batches_left <= 0 else "",
+        )
+        return result
+
+    @staticmethod
+    def _days_before(now: Timestamp, days: int) -> Timestamp:
+        return Timestamp.from_date_and_time(now.value.subtract(days=days))
+
+    @staticmethod
+    def _batches_used(outcome: EventLogBatchOutcome) -> int:
+        # Finding out there's nothing to do for an event log is cheap next to
+        # doing some work, so only the latter counts.
+        return 1 if outcome.events_removed > 0 else 0
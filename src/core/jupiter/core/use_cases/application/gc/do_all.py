@@ -9,6 +9,10 @@ from jupiter.core.domain.concept.workspaces.workspace import Workspace
 from jupiter.core.domain.infer_sync_targets import (
     infer_sync_targets_for_enabled_features,
 )
+from jupiter.core.domain.storage_engine import (
+    DomainStorageEngine,
+    SearchStorageEngine,
+)
 from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.event import EventSource
 from jupiter.core.framework.use_case import (
@@ -34,7 +38,7 @@ class GCDoAllUseCase(SysBackgroundMutationUseCase[GCDoAllArgs, None]):
         args: GCDoAllArgs,
     ) -> None:
         """Execute the command's action."""
-        async with self._domain_storage_engine.get_unit_of_work() as uow:
+        async with self._domain_storage_engine.get_read_unit_of_work() as uow:
             workspaces = await uow.get_for(Workspace).find_all(allow_archived=False)
             users = await uow.get_for(User).find_all(allow_archived=False)
             users_by_id = {u.ref_id: u for u in users}
@@ -49,29 +53,31 @@ class GCDoAllUseCase(SysBackgroundMutationUseCase[GCDoAllArgs, None]):
             EventSource.GC_CRON, self._time_provider.get_current_time()
         )
 
-        gc_service = GCService(
-            time_provider=self._time_provider,
-            domain_storage_engine=self._domain_storage_engine,
-        )
-
-        for workspace in workspaces:
+        async def gc_for_workspace(
+            workspace: Workspace,
+            domain_storage_engine: DomainStorageEngine,
+            search_storage_engine: SearchStorageEngine,
+        ) -> None:
             progress_reporter = self._progress_reporter_factory.new_reporter(context)
             user = users_by_id[users_id_by_workspace_id[workspace.ref_id]]
             gc_targets = infer_sync_targets_for_enabled_features(user, workspace, None)
-            await gc_service.do_it(ctx, progress_reporter, workspace, gc_targets)
 
-            async with self._search_storage_engine.get_unit_of_work() as search_uow:
-                for created_entity in progress_reporter.created_entities:
-                    await search_uow.search_repository.upsert(
-                        workspace.ref_id, created_entity
-                    )
+            gc_service = GCService(
+                time_provider=self._time_provider,
+                domain_storage_engine=domain_storage_engine,
+            )
+            await gc_service.do_it(ctx, progress_reporter, workspace, gc_targets)
 
-                for updated_entity in progress_reporter.updated_entities:
-                    await search_uow.search_repository.upsert(
-                        workspace.ref_id, updated_entity
-                    )
+            async with search_storage_engine.get_unit_of_work() as search_uow:
+                await search_uow.search_repository.upsert_many(
+                    workspace.ref_id,
+                    [
+                        *progress_reporter.created_entities,
+                        *progress_reporter.updated_entities,
+                    ],
+                )
+                await search_uow.search_repository.remove_many(
+                    workspace.ref_id, progress_reporter.removed_entities
+                )
 
-                for removed_entity in progress_reporter.removed_entities:
-                    await search_uow.search_repository.remove(
-                        workspace.ref_id, removed_entity
-                    )
+        await self._for_each_workspace(workspaces, gc_for_workspace)
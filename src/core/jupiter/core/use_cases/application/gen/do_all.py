@@ -9,6 +9,10 @@ from jupiter.core.domain.concept.workspaces.workspace import Workspace
 from jupiter.core.domain.infer_sync_targets import (
     infer_sync_targets_for_enabled_features,
 )
+from jupiter.core.domain.storage_engine import (
+    DomainStorageEngine,
+    SearchStorageEngine,
+)
 from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.event import EventSource
 from jupiter.core.framework.use_case import (
@@ -30,7 +34,7 @@ class GenDoAllUseCase(SysBackgroundMutationUseCase[GenDoAllArgs, None]):
 
     async def _execute(self, context: EmptyContext, args: GenDoAllArgs) -> None:
         """Execute the command's action."""
-        async with self._domain_storage_engine.get_unit_of_work() as uow:
+        async with self._domain_storage_engine.get_read_unit_of_work() as uow:
             workspaces = await uow.get_for(Workspace).find_all(allow_archived=False)
             users = await uow.get_for(User).find_all(allow_archived=False)
             users_by_id = {u.ref_id: u for u in users}
@@ -45,17 +49,21 @@ class GenDoAllUseCase(SysBackgroundMutationUseCase[GenDoAllArgs, None]):
             EventSource.GEN_CRON, self._time_provider.get_current_time()
         )
 
-        gen_service = GenService(
-            domain_storage_engine=self._domain_storage_engine,
-        )
-
         today = self._time_provider.get_current_date()
 
-        for workspace in workspaces:
+        async def gen_for_workspace(
+            workspace: Workspace,
+            domain_storage_engine: DomainStorageEngine,
+            search_storage_engine: SearchStorageEngine,
+        ) -> None:
             progress_reporter = self._progress_reporter_factory.new_reporter(context)
             user = users_by_id[users_id_by_workspace_id[workspace.ref_id]]
             gen_targets = infer_sync_targets_for_enabled_features(user, workspace, None)
 
+            gen_service = GenService(
+                domain_storage_engine=domain_storage_engine,
+            )
+
             await gen_service.do_it(
                 ctx=ctx,
                 user=user,
@@ -74,18 +82,16 @@ class GenDoAllUseCase(SysBackgroundMutationUseCase[GenDoAllArgs, None]):
                 filter_email_task_ref_ids=None,
             )
 
-            async with self._search_storage_engine.get_unit_of_work() as search_uow:
-                for created_entity in progress_reporter.created_entities:
-                    await search_uow.search_repository.upsert(
-                        workspace.ref_id, created_entity
-                    )
-
-                for updated_entity in progress_reporter.updated_entities:
-                    await search_uow.search_repository.upsert(
-                        workspace.ref_id, updated_entity
-                    )
+            async with search_storage_engine.get_unit_of_work() as search_uow:
+                await search_uow.search_repository.upsert_many(
+                    workspace.ref_id,
+                    [
+                        *progress_reporter.created_entities,
+                        *progress_reporter.updated_entities,
+                    ],
+                )
+                await search_uow.search_repository.remove_many(
+                    workspace.ref_id, progress_reporter.removed_entities
+                )
 
-                for removed_entity in progress_reporter.removed_entities:
-                    await search_uow.search_repository.remove(
-                        workspace.ref_id, removed_entity
-                    )
+        await self._for_each_workspace(workspaces, gen_for_workspace)
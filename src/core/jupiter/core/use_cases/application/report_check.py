@@ -0,0 +1,160 @@
+"""Use case for checking the rollups which reports are computed from."""
+
+from collections import Counter
+
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import (
+    InboxTask,
+    InboxTaskRepository,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_collection import (
+    InboxTaskCollection,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollup,
+    InboxTaskReportRollupKind,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.use_case_io import (
+    UseCaseArgsBase,
+    UseCaseResultBase,
+    use_case_args,
+    use_case_result,
+    use_case_result_part,
+)
+from jupiter.core.use_cases.infra.use_cases import (
+    AppLoggedInReadonlyUseCase,
+    AppLoggedInReadonlyUseCaseContext,
+    readonly_use_case,
+)
+
+
+@use_case_args
+class ReportCheckArgs(UseCaseArgsBase):
+    """Report check args."""
+
+
+@use_case_result_part
+class ReportCheckMismatch(UseCaseResultBase):
+    """A rollup which doesn't hold the count of inbox tasks it should."""
+
+    rollup: InboxTaskReportRollup
+    expected_count: int
+
+
+@use_case_result
+class ReportCheckResult(UseCaseResultBase):
+    """Report check result."""
+
+    inbox_tasks_cnt: int
+    rollups_cnt: int
+    mismatches: list[ReportCheckMismatch]
+
+
+@readonly_use_case()
+class ReportCheckUseCase(
+    AppLoggedInReadonlyUseCase[ReportCheckArgs, ReportCheckResult]
+):
+    """Use case for checking the rollups which reports are computed from.
+
+    Recounts all the inbox tasks the way reports used to, by scanning the tasks
+    and grouping them in Python, and compares with the rollups.
+    """
+
+    async def _execute(
+        self,
+        context: AppLoggedInReadonlyUseCaseContext,
+        args: ReportCheckArgs,
+    ) -> ReportCheckResult:
+        """Execute the command."""
+        async with self._domain_storage_engine.get_unit_of_work() as uow:
+            inbox_task_collection = await uow.get_for(
+                InboxTaskCollection
+            ).load_by_parent(context.workspace.ref_id)
+            inbox_tasks = await uow.get(InboxTaskRepository).find_modified_in_range(
+                parent_ref_id=inbox_task_collection.ref_id,
+                allow_archived=True,
+            )
+            rollups = await uow.get(InboxTaskRepository).find_report_rollups(
+                parent_ref_id=inbox_task_collection.ref_id,
+                by_modified_day=True,
+                by_event_day=True,
+                by_project=True,
+                by_source_entity=True,
+            )
+
+        expected_counts: Counter[InboxTaskReportRollup] = Counter()
+        for inbox_task in inbox_tasks:
+            for kind, event_time in _counted_events(inbox_task):
+                expected_counts[
+                    InboxTaskReportRollup(
+                        modified_day=ADate.from_date(
+                            inbox_task.last_modified_time.as_date()
+                        ),
+                        event_day=ADate.from_date(event_time.as_date()),
+                        project_ref_id=inbox_task.project_ref_id,
+                        source=inbox_task.source,
+                        source_entity_ref_id=inbox_task.source_entity_ref_id,
+                        kind=kind,
+                        count=0,
+                    )
+                ] += 1
+
+        actual_counts: Counter[InboxTaskReportRollup] = Counter()
+        for rollup in rollups:
+            actual_counts[rollup.with_count(0)] += rollup.count
+
+        mismatches = [
+            ReportCheckMismatch(
+                rollup=bucket.with_count(actual_counts[bucket]),
+                expected_count=expected_counts[bucket],
+            )
+            for bucket in sorted(
+                expected_counts.keys() | actual_counts.keys(), key=_bucket_sort_key
+            )
+            if expected_counts[bucket] != actual_counts[bucket]
+        ]
+
+        return ReportCheckResult(
+            inbox_tasks_cnt=len(inbox_tasks),
+            rollups_cnt=len(rollups),
+            mismatches=mismatches,
+        )
+
+
+def _counted_events(
+    inbox_task: InboxTask,
+) -> list[tuple[InboxTaskReportRollupKind, Timestamp]]:
+    # The same classification the report used when it scanned the tasks.
+    events = [
+        (InboxTaskReportRollupKind.TOUCHED, inbox_task.last_modified_time),
+        (InboxTaskReportRollupKind.CREATED, inbox_task.created_time),
+    ]
+    if inbox_task.status.is_completed and inbox_task.completed_time is not None:
+        if inbox_task.status == InboxTaskStatus.DONE:
+            events.append((InboxTaskReportRollupKind.DONE, inbox_task.completed_time))
+        else:
+            events.append(
+                (InboxTaskReportRollupKind.NOT_DONE, inbox_task.completed_time)
+            )
+    elif inbox_task.status.is_working and inbox_task.working_time is not None:
+        events.append((InboxTaskReportRollupKind.WORKING, inbox_task.working_time))
+    return events
+
+
+def _bucket_sort_key(
+    bucket: InboxTaskReportRollup,
+) -> tuple[str, str, int, str, int, str]:
+    return (
+        str(bucket.modified_day),
+        str(bucket.event_day),
+        bucket.project_ref_id.as_int() if bucket.project_ref_id is not None else -1,
+        bucket.source.value,
+        (
+            bucket.source_entity_ref_id.as_int()
+            if bucket.source_entity_ref_id is not None
+            else -1
+        ),
+        bucket.kind.value,
+    )
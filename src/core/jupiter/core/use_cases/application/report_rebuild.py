@@ -0,0 +1,56 @@
+"""Use case for rebuilding the rollups which reports are computed from."""
+
+from typing import Final
+
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTaskRepository
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_collection import (
+    InboxTaskCollection,
+)
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.use_case import ProgressReporter
+from jupiter.core.framework.use_case_io import UseCaseArgsBase, use_case_args
+from jupiter.core.use_cases.infra.use_cases import (
+    AppLoggedInMutationUseCase,
+    AppLoggedInMutationUseCaseContext,
+    mutation_use_case,
+)
+
+_CHUNK_SIZE: Final[int] = 500
+
+
+@use_case_args
+class ReportRebuildArgs(UseCaseArgsBase):
+    """Report rebuild args."""
+
+
+@mutation_use_case()
+class ReportRebuildUseCase(AppLoggedInMutationUseCase[ReportRebuildArgs, None]):
+    """Use case for rebuilding the rollups which reports are computed from.
+
+    The rollups are kept up to date as inbox tasks change, so this is only needed
+    if they've drifted, which the report check use case can tell.
+    """
+
+    async def _perform_mutation(
+        self,
+        progress_reporter: ProgressReporter,
+        context: AppLoggedInMutationUseCaseContext,
+        args: ReportRebuildArgs,
+    ) -> None:
+        """Execute the command's action."""
+        # Unlike the search index, rollups are updated by deltas, so a save
+        # landing between chunks would be counted twice. Hence one transaction.
+        async with self._domain_storage_engine.get_unit_of_work() as uow:
+            inbox_task_collection = await uow.get_for(
+                InboxTaskCollection
+            ).load_by_parent(context.workspace_ref_id)
+
+            after_ref_id: EntityId | None = None
+            while True:
+                after_ref_id = await uow.get(
+                    InboxTaskRepository
+                ).rebuild_report_rollups(
+                    inbox_task_collection.ref_id, after_ref_id, _CHUNK_SIZE
+                )
+                if after_ref_id is None:
+                    break
@@ -0,0 +1,53 @@
+"""Use case for rebuilding the search index over the content of notes."""
+
+from typing import Final
+
+from jupiter.core.domain.core.notes.note import NoteRepository
+from jupiter.core.domain.core.notes.note_collection import NoteCollection
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.use_case import ProgressReporter
+from jupiter.core.framework.use_case_io import UseCaseArgsBase, use_case_args
+from jupiter.core.use_cases.infra.use_cases import (
+    AppLoggedInMutationUseCase,
+    AppLoggedInMutationUseCaseContext,
+    mutation_use_case,
+)
+
+_CHUNK_SIZE: Final[int] = 200
+
+
+@use_case_args
+class SearchReindexArgs(UseCaseArgsBase):
+    """Search reindex args."""
+
+
+@mutation_use_case()
+class SearchReindexUseCase(AppLoggedInMutationUseCase[SearchReindexArgs, None]):
+    """Use case for rebuilding the search index over the content of notes.
+
+    Notes are indexed as they are created and updated, so this is only needed
+    once for notes that predate the index.
+    """
+
+    async def _perform_mutation(
+        self,
+        progress_reporter: ProgressReporter,
+        context: AppLoggedInMutationUseCaseContext,
+        args: SearchReindexArgs,
+    ) -> None:
+        """Execute the command's action."""
+        async with self._domain_storage_engine.get_unit_of_work() as uow:
+            note_collection = await uow.get_for(NoteCollection).load_by_parent(
+                context.workspace_ref_id
+            )
+
+        # Each chunk gets its own transaction, so a large workspace doesn't hold
+        # the write lock, or all of its notes in memory, for the whole run.
+        after_ref_id: EntityId | None = None
+        while True:
+            async with self._domain_storage_engine.get_unit_of_work() as uow:
+                after_ref_id = await uow.get(NoteRepository).reindex_content(
+                    note_collection.ref_id, after_ref_id, _CHUNK_SIZE
+                )
+            if after_ref_id is None:
+                break
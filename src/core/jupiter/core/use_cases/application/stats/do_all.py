@@ -9,6 +9,10 @@ from jupiter.core.domain.concept.workspaces.workspace import Workspace
 from jupiter.core.domain.infer_sync_targets import (
     infer_sync_targets_for_enabled_features,
 )
+from jupiter.core.domain.storage_engine import (
+    DomainStorageEngine,
+    SearchStorageEngine,
+)
 from jupiter.core.framework.context import DomainContext
 from jupiter.core.framework.event import EventSource
 from jupiter.core.framework.use_case import (
@@ -34,7 +38,7 @@ class StatsDoAllUseCase(SysBackgroundMutationUseCase[StatsDoAllArgs, None]):
         args: StatsDoAllArgs,
     ) -> None:
         """Execute the command's action."""
-        async with self._domain_storage_engine.get_unit_of_work() as uow:
+        async with self._domain_storage_engine.get_read_unit_of_work() as uow:
             workspaces = await uow.get_for(Workspace).find_all(allow_archived=False)
             users = await uow.get_for(User).find_all(allow_archived=False)
             users_by_id = {u.ref_id: u for u in users}
@@ -49,31 +53,38 @@ class StatsDoAllUseCase(SysBackgroundMutationUseCase[StatsDoAllArgs, None]):
             EventSource.STATS_CRON, self._time_provider.get_current_time()
         )
 
-        stats_service = StatsService(
-            domain_storage_engine=self._domain_storage_engine,
-        )
+        today = self._time_provider.get_current_date()
 
-        for workspace in workspaces:
+        async def stats_for_workspace(
+            workspace: Workspace,
+            domain_storage_engine: DomainStorageEngine,
+            search_storage_engine: SearchStorageEngine,
+        ) -> None:
             progress_reporter = self._progress_reporter_factory.new_reporter(context)
             user = users_by_id[users_id_by_workspace_id[workspace.ref_id]]
             stats_targets = infer_sync_targets_for_enabled_features(
                 user, workspace, None
             )
 
+            stats_service = StatsService(
+                domain_storage_engine=domain_storage_engine,
+            )
+
             await stats_service.do_it(
                 ctx=ctx,
                 progress_reporter=progress_reporter,
                 user=user,
                 workspace=workspace,
-                today=self._time_provider.get_current_date(),
+                today=today,
                 stats_targets=stats_targets,
                 filter_habit_ref_ids=None,
                 filter_big_plan_ref_ids=None,
                 filter_journal_ref_ids=None,
             )
 
-            async with self._search_storage_engine.get_unit_of_work() as search_uow:
-                for updated_entity in progress_reporter.updated_entities:
-                    await search_uow.search_repository.upsert(
-                        workspace.ref_id, updated_entity
-                    )
+            async with search_storage_engine.get_unit_of_work() as search_uow:
+                await search_uow.search_repository.upsert_many(
+                    workspace.ref_id, progress_reporter.updated_entities
+                )
+
+        await self._for_each_workspace(workspaces, stats_for_workspace)
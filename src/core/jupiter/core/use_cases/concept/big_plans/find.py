@@ -27,8 +27,12 @@ from jupiter.core.domain.features import (
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -42,7 +46,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class BigPlanFindArgs(UseCaseArgsBase):
+class BigPlanFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -69,7 +73,7 @@ class BigPlanFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class BigPlanFindResult(UseCaseResultBase):
+class BigPlanFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult."""
 
     entries: list[BigPlanFindResultEntry]
@@ -122,7 +126,9 @@ class BigPlanFindUseCase(
             workspace.ref_id,
         )
 
-        big_plans = await uow.get_for(BigPlan).find_all_generic(
+        big_plans, next_cursor = await find_page(
+            uow.get_for(BigPlan),
+            args,
             parent_ref_id=big_plan_collection.ref_id,
             allow_archived=args.allow_archived,
             ref_id=args.filter_ref_ids or NoFilter(),
@@ -206,4 +212,5 @@ class BigPlanFindUseCase(
                 )
                 for bp in big_plans
             ],
+            next_cursor=next_cursor,
         )
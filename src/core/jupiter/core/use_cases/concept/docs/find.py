@@ -6,14 +6,17 @@ from jupiter.core.domain.app import AppCore
 from jupiter.core.domain.concept.docs.doc import Doc
 from jupiter.core.domain.concept.docs.doc_collection import DocCollection
 from jupiter.core.domain.core.notes.note import Note
-from jupiter.core.domain.core.notes.note_collection import NoteCollection
-from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.domain.features import WorkspaceFeature
+from jupiter.core.domain.infra.generic_batch_loader import generic_batch_loader
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -27,7 +30,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class DocFindArgs(UseCaseArgsBase):
+class DocFindArgs(PaginatedUseCaseArgsBase):
     """DocFind args."""
 
     include_notes: bool
@@ -46,7 +49,7 @@ class DocFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class DocFindResult(UseCaseResultBase):
+class DocFindResult(PaginatedUseCaseResultBase):
     """The result."""
 
     entries: list[DocFindResultEntry]
@@ -70,27 +73,23 @@ class DocFindUseCase(
             workspace.ref_id
         )
 
-        docs = await uow.get_for(Doc).find_all_generic(
+        docs, next_cursor = await find_page(
+            uow.get_for(Doc),
+            args,
             parent_ref_id=doc_collection.ref_id,
             allow_archived=args.allow_archived,
             ref_id=args.filter_ref_ids or NoFilter(),
             parent_doc_ref_id=NoFilter(),
         )
 
-        notes_by_doc_ref_id: defaultdict[EntityId, Note] = defaultdict(None)
+        notes_by_doc_ref_id: dict[EntityId, list[Note]] = {}
         if args.include_notes:
-            note_collection = await uow.get_for(NoteCollection).load_by_parent(
-                workspace.ref_id
-            )
-            notes = await uow.get_for(Note).find_all_generic(
-                parent_ref_id=note_collection.ref_id,
-                domain=NoteDomain.DOC,
-                allow_archived=True,
-                source_entity_ref_id=[d.ref_id for d in docs],
+            notes_by_doc_ref_id = await generic_batch_loader(
+                uow, docs, Doc.note, allow_archived=True
             )
-            for n in notes:
-                notes_by_doc_ref_id[n.source_entity_ref_id] = n
 
+        # Docs don't have an entity link to their subdocs, so these are loaded
+        # directly, still with one query for all the docs.
         subdocs_by_parent_ref_id = defaultdict(list)
         if args.include_subdocs:
             subdocs = await uow.get_for(Doc).find_all_generic(
@@ -107,9 +106,10 @@ class DocFindUseCase(
             entries=[
                 DocFindResultEntry(
                     doc=doc,
-                    note=notes_by_doc_ref_id.get(doc.ref_id, None),
+                    note=next(iter(notes_by_doc_ref_id.get(doc.ref_id, [])), None),
                     subdocs=subdocs_by_parent_ref_id.get(doc.ref_id, None),
                 )
                 for doc in docs
-            ]
+            ],
+            next_cursor=next_cursor,
         )
@@ -21,8 +21,12 @@ from jupiter.core.domain.features import (
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -36,7 +40,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class HabitFindArgs(UseCaseArgsBase):
+class HabitFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -58,7 +62,7 @@ class HabitFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class HabitFindResult(UseCaseResultBase):
+class HabitFindResult(PaginatedUseCaseResultBase):
     """The result."""
 
     entries: list[HabitFindResultEntry]
@@ -106,7 +110,9 @@ class HabitFindUseCase(
             workspace.ref_id,
         )
 
-        habits = await uow.get_for(Habit).find_all_generic(
+        habits, next_cursor = await find_page(
+            uow.get_for(Habit),
+            args,
             parent_ref_id=habit_collection.ref_id,
             allow_archived=args.allow_archived,
             ref_id=args.filter_ref_ids or NoFilter(),
@@ -160,4 +166,5 @@ class HabitFindUseCase(
                 )
                 for rt in habits
             ],
+            next_cursor=next_cursor,
         )
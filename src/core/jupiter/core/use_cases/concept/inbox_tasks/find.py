@@ -40,8 +40,6 @@ from jupiter.core.domain.concept.working_mem.working_mem_collection import (
     WorkingMemCollection,
 )
 from jupiter.core.domain.core.notes.note import Note
-from jupiter.core.domain.core.notes.note_collection import NoteCollection
-from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.domain.core.time_events.time_event_domain import TimeEventDomain
 from jupiter.core.domain.core.time_events.time_event_in_day_block import (
     TimeEventInDayBlock,
@@ -51,12 +49,17 @@ from jupiter.core.domain.features import (
     FeatureUnavailableError,
     WorkspaceFeature,
 )
+from jupiter.core.domain.infra.generic_batch_loader import generic_batch_loader
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
 from jupiter.core.framework.errors import InputValidationError
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -70,7 +73,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class InboxTaskFindArgs(UseCaseArgsBase):
+class InboxTaskFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -106,7 +109,7 @@ class InboxTaskFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class InboxTaskFindResult(UseCaseResultBase):
+class InboxTaskFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult."""
 
     entries: list[InboxTaskFindResultEntry]
@@ -212,7 +215,9 @@ class InboxTaskFindUseCase(
         )
         project_by_ref_id = {p.ref_id: p for p in projects}
 
-        inbox_tasks = await uow.get_for(InboxTask).find_all_generic(
+        inbox_tasks, next_cursor = await find_page(
+            uow.get_for(InboxTask),
+            args,
             parent_ref_id=inbox_task_collection.ref_id,
             allow_archived=args.allow_archived,
             ref_id=args.filter_ref_ids or NoFilter(),
@@ -222,6 +227,9 @@ class InboxTaskFindUseCase(
             source_entity_ref_id=args.filter_source_entity_ref_ids or NoFilter(),
         )
 
+        # The source of an inbox task can be one of many entity types, and no
+        # entity link describes that, so generic_batch_loader can't load them.
+        # Each type is still loaded for all the inbox tasks with one query.
         working_mems = await uow.get_for(WorkingMem).find_all(
             parent_ref_id=working_mem_collection.ref_id,
             allow_archived=True,
@@ -333,19 +341,11 @@ class InboxTaskFindUseCase(
         )
         email_tasks_by_ref_id = {p.ref_id: p for p in email_tasks}
 
-        notes_by_inbox_task_ref_id: defaultdict[EntityId, Note] = defaultdict(None)
+        notes_by_inbox_task_ref_id: dict[EntityId, list[Note]] = {}
         if args.include_notes:
-            note_collection = await uow.get_for(NoteCollection).load_by_parent(
-                workspace.ref_id
-            )
-            notes = await uow.get_for(Note).find_all_generic(
-                parent_ref_id=note_collection.ref_id,
-                domain=NoteDomain.INBOX_TASK,
-                allow_archived=True,
-                source_entity_ref_id=[it.ref_id for it in inbox_tasks],
+            notes_by_inbox_task_ref_id = await generic_batch_loader(
+                uow, inbox_tasks, InboxTask.note, allow_archived=True
             )
-            for note in notes:
-                notes_by_inbox_task_ref_id[note.source_entity_ref_id] = note
 
         time_event_blocks_by_inbox_task_ref_id: defaultdict[
             EntityId, list[TimeEventInDayBlock]
@@ -421,13 +421,16 @@ class InboxTaskFindUseCase(
                         if it.source == InboxTaskSource.EMAIL_TASK
                         else None
                     ),
-                    note=notes_by_inbox_task_ref_id.get(it.ref_id, None),
+                    note=next(
+                        iter(notes_by_inbox_task_ref_id.get(it.ref_id, [])), None
+                    ),
                     time_event_blocks=time_event_blocks_by_inbox_task_ref_id.get(
                         it.ref_id, None
                     ),
                 )
                 for it in inbox_tasks
             ],
+            next_cursor=next_cursor,
         )
 
     def _filter_sources_for_generated_tasks(
@@ -17,8 +17,13 @@ from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -32,7 +37,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class JournalFindArgs(UseCaseArgsBase):
+class JournalFindArgs(PaginatedUseCaseArgsBase):
     """Args."""
 
     allow_archived: bool
@@ -53,7 +58,7 @@ class JournalFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class JournalFindResult(UseCaseResultBase):
+class JournalFindResult(PaginatedUseCaseResultBase):
     """Result."""
 
     entries: list[JournalFindResultEntry]
@@ -83,10 +88,14 @@ class JournalFindUseCase(
         note_collection = await uow.get_for(NoteCollection).load_by_parent(
             workspace.ref_id,
         )
-        journals = await uow.get_for(Journal).find_all(
+        journals, next_cursor = await find_page(
+            uow.get_for(Journal),
+            args,
             parent_ref_id=journal_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         notes_by_journal_ref_id = {}
@@ -136,5 +145,6 @@ class JournalFindUseCase(
                     ),
                 )
                 for journal in journals
-            ]
+            ],
+            next_cursor=next_cursor,
         )
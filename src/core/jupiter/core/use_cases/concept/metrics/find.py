@@ -1,14 +1,9 @@
 """The command for finding metrics."""
 
-import itertools
 from collections import defaultdict
 from typing import cast
 
 from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTask
-from jupiter.core.domain.concept.inbox_tasks.inbox_task_collection import (
-    InboxTaskCollection,
-)
-from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
 from jupiter.core.domain.concept.metrics.metric import Metric
 from jupiter.core.domain.concept.metrics.metric_collection import MetricCollection
 from jupiter.core.domain.concept.metrics.metric_entry import MetricEntry
@@ -17,10 +12,16 @@ from jupiter.core.domain.core.notes.note import Note
 from jupiter.core.domain.core.notes.note_collection import NoteCollection
 from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.domain.features import WorkspaceFeature
+from jupiter.core.domain.infra.generic_batch_loader import generic_batch_loader
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -34,7 +35,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class MetricFindArgs(UseCaseArgsBase):
+class MetricFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -58,7 +59,7 @@ class MetricFindResponseEntry(UseCaseResultBase):
 
 
 @use_case_result
-class MetricFindResult(UseCaseResultBase):
+class MetricFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult object."""
 
     collection_project: Project
@@ -83,10 +84,14 @@ class MetricFindUseCase(
         metric_collection = await uow.get_for(MetricCollection).load_by_parent(
             workspace.ref_id,
         )
-        metrics = await uow.get_for(Metric).find_all(
+        metrics, next_cursor = await find_page(
+            uow.get_for(Metric),
+            args,
             parent_ref_id=metric_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         collection_project = await uow.get_for(Project).load_by_id(
@@ -107,55 +112,25 @@ class MetricFindUseCase(
             for n in all_notes:
                 all_notes_by_metric_ref_id[n.source_entity_ref_id] = n
 
+        metric_entries_by_ref_ids: dict[EntityId, list[MetricEntry]] = {}
         if args.include_entries:
-            metric_entries_raw = []
-            for metric in metrics:
-                metric_entries_raw.append(
-                    await uow.get_for(MetricEntry).find_all(
-                        parent_ref_id=metric.ref_id,
-                        allow_archived=args.allow_archived,
-                        filter_ref_ids=args.filter_entry_ref_ids,
-                    ),
-                )
-            metric_entries = itertools.chain(*metric_entries_raw)
-
-            metric_entries_by_ref_ids: dict[EntityId, list[MetricEntry]] = {}
-
-            for metric_entry in metric_entries:
-                if metric_entry.metric.ref_id not in metric_entries_by_ref_ids:
-                    metric_entries_by_ref_ids[metric_entry.metric.ref_id] = [
-                        metric_entry,
-                    ]
-                else:
-                    metric_entries_by_ref_ids[metric_entry.metric.ref_id].append(
-                        metric_entry,
-                    )
-        else:
-            metric_entries_by_ref_ids = {}
+            metric_entries_by_ref_ids = await generic_batch_loader(
+                uow,
+                metrics,
+                Metric.entries,
+                allow_archived=args.allow_archived,
+                ref_id=(
+                    args.filter_entry_ref_ids
+                    if args.filter_entry_ref_ids is not None
+                    else NoFilter()
+                ),
+            )
 
+        metric_collection_inbox_tasks_by_ref_id: dict[EntityId, list[InboxTask]] = {}
         if args.include_collection_inbox_tasks:
-            metric_collection_inbox_tasks_by_ref_id: defaultdict[
-                EntityId,
-                list[InboxTask],
-            ] = defaultdict(list)
-            inbox_task_collection = await uow.get_for(
-                InboxTaskCollection
-            ).load_by_parent(
-                workspace.ref_id,
+            metric_collection_inbox_tasks_by_ref_id = await generic_batch_loader(
+                uow, metrics, Metric.collection_tasks, allow_archived=True
             )
-            all_inbox_tasks = await uow.get_for(InboxTask).find_all_generic(
-                parent_ref_id=inbox_task_collection.ref_id,
-                allow_archived=True,
-                source=[InboxTaskSource.METRIC],
-                source_entity_ref_id=[m.ref_id for m in metrics],
-            )
-
-            for inbox_task in all_inbox_tasks:
-                metric_collection_inbox_tasks_by_ref_id[
-                    inbox_task.source_entity_ref_id_for_sure
-                ].append(inbox_task)
-        else:
-            metric_collection_inbox_tasks_by_ref_id = defaultdict(list)
 
         all_notes_by_metric_entry_ref_id: defaultdict[EntityId, Note] = defaultdict(
             None
@@ -168,7 +143,11 @@ class MetricFindUseCase(
                 parent_ref_id=note_collection.ref_id,
                 domain=NoteDomain.METRIC_ENTRY,
                 allow_archived=True,
-                source_entity_ref_id=[me.ref_id for me in metric_entries],
+                source_entity_ref_id=[
+                    me.ref_id
+                    for entries in metric_entries_by_ref_ids.values()
+                    for me in entries
+                ],
             )
             for n in all_notes:
                 all_notes_by_metric_entry_ref_id[
@@ -183,7 +162,7 @@ class MetricFindUseCase(
                     note=all_notes_by_metric_ref_id.get(m.ref_id, None),
                     metric_entries=(
                         metric_entries_by_ref_ids.get(m.ref_id, [])
-                        if len(metric_entries_by_ref_ids) > 0
+                        if args.include_entries
                         else None
                     ),
                     metric_collection_inbox_tasks=(
@@ -191,7 +170,7 @@ class MetricFindUseCase(
                             m.ref_id,
                             [],
                         )
-                        if len(metric_collection_inbox_tasks_by_ref_id) > 0
+                        if args.include_collection_inbox_tasks
                         else None
                     ),
                     metric_entry_notes=[
@@ -202,4 +181,5 @@ class MetricFindUseCase(
                 )
                 for m in metrics
             ],
+            next_cursor=next_cursor,
         )
@@ -22,8 +22,13 @@ from jupiter.core.domain.core.time_events.time_event_namespace import TimeEventN
 from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -37,7 +42,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class PersonFindArgs(UseCaseArgsBase):
+class PersonFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -60,7 +65,7 @@ class PersonFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class PersonFindResult(UseCaseResultBase):
+class PersonFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult."""
 
     catch_up_project: Project
@@ -94,10 +99,16 @@ class PersonFindUseCase(
         catch_up_project = await uow.get_for(Project).load_by_id(
             person_collection.catch_up_project_ref_id,
         )
-        persons = await uow.get_for(Person).find_all(
+        persons, next_cursor = await find_page(
+            uow.get_for(Person),
+            args,
             parent_ref_id=person_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_person_ref_ids,
+            ref_id=(
+                args.filter_person_ref_ids
+                if args.filter_person_ref_ids is not None
+                else NoFilter()
+            ),
         )
 
         all_notes_by_person_ref_id: defaultdict[EntityId, Note] = defaultdict(None)
@@ -182,4 +193,5 @@ class PersonFindUseCase(
                 )
                 for p in persons
             ],
+            next_cursor=next_cursor,
         )
@@ -11,8 +11,12 @@ from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -25,7 +29,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class ProjectFindArgs(UseCaseArgsBase):
+class ProjectFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -42,7 +46,7 @@ class ProjectFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class ProjectFindResult(UseCaseResultBase):
+class ProjectFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult object."""
 
     entries: list[ProjectFindResultEntry]
@@ -66,7 +70,9 @@ class ProjectFindUseCase(
         project_collection = await uow.get_for(ProjectCollection).load_by_parent(
             workspace.ref_id,
         )
-        projects = await uow.get_for(Project).find_all_generic(
+        projects, next_cursor = await find_page(
+            uow.get_for(Project),
+            args,
             parent_ref_id=project_collection.ref_id,
             allow_archived=args.allow_archived,
             ref_id=args.filter_ref_ids or NoFilter(),
@@ -93,5 +99,6 @@ class ProjectFindUseCase(
                     note=notes_by_project_ref_id.get(project.ref_id, None),
                 )
                 for project in projects
-            ]
+            ],
+            next_cursor=next_cursor,
         )
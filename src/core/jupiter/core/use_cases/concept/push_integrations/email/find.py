@@ -16,8 +16,13 @@ from jupiter.core.domain.concept.push_integrations.group.push_integration_group
 from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -31,7 +36,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class EmailTaskFindArgs(UseCaseArgsBase):
+class EmailTaskFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -48,7 +53,7 @@ class EmailTaskFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class EmailTaskFindResult(UseCaseResultBase):
+class EmailTaskFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult."""
 
     generation_project: Project
@@ -79,10 +84,14 @@ class EmailTaskFindUseCase(
         email_task_collection = await uow.get_for(EmailTaskCollection).load_by_parent(
             push_integration_group.ref_id,
         )
-        email_tasks = await uow.get_for(EmailTask).find_all(
+        email_tasks, next_cursor = await find_page(
+            uow.get_for(EmailTask),
+            args,
             parent_ref_id=email_task_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         generation_project = await uow.get_for(Project).load_by_id(
@@ -115,4 +124,5 @@ class EmailTaskFindUseCase(
                 )
                 for st in email_tasks
             ],
+            next_cursor=next_cursor,
         )
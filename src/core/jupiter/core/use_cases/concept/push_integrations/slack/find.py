@@ -16,8 +16,13 @@ from jupiter.core.domain.concept.push_integrations.slack.slack_task_collection i
 from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -31,7 +36,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class SlackTaskFindArgs(UseCaseArgsBase):
+class SlackTaskFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -48,7 +53,7 @@ class SlackTaskFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class SlackTaskFindResult(UseCaseResultBase):
+class SlackTaskFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult."""
 
     generation_project: Project
@@ -80,10 +85,14 @@ class SlackTaskFindUseCase(
             push_integration_group.ref_id,
         )
 
-        slack_tasks = await uow.get_for(SlackTask).find_all(
+        slack_tasks, next_cursor = await find_page(
+            uow.get_for(SlackTask),
+            args,
             parent_ref_id=slack_task_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         generation_project = await uow.get_for(Project).load_by_id(
@@ -116,4 +125,5 @@ class SlackTaskFindUseCase(
                 )
                 for st in slack_tasks
             ],
+            next_cursor=next_cursor,
         )
@@ -42,6 +42,7 @@ class ScheduleExternalSyncDoUseCase(
             time_provider=self._time_provider,
             realm_codec_registry=self._realm_codec_registry,
             domain_storage_engine=self._domain_storage_engine,
+            ical_fetcher=self._ical_fetcher,
         )
         today = args.today or self._time_provider.get_current_date()
         await sync_service.do_it(
@@ -39,6 +39,7 @@ class ScheduleExternalSyncDoAllUseCase(
             time_provider=self._time_provider,
             realm_codec_registry=self._realm_codec_registry,
             domain_storage_engine=self._domain_storage_engine,
+            ical_fetcher=self._ical_fetcher,
         )
 
         for workspace in workspaces:
@@ -53,17 +54,13 @@ class ScheduleExternalSyncDoAllUseCase(
             )
 
             async with self._search_storage_engine.get_unit_of_work() as search_uow:
-                for created_entity in progress_reporter.created_entities:
-                    await search_uow.search_repository.upsert(
-                        workspace.ref_id, created_entity
-                    )
-
-                for updated_entity in progress_reporter.updated_entities:
-                    await search_uow.search_repository.upsert(
-                        workspace.ref_id, updated_entity
-                    )
-
-                for deleted_entity in progress_reporter.removed_entities:
-                    await search_uow.search_repository.remove(
-                        workspace.ref_id, deleted_entity
-                    )
+                await search_uow.search_repository.upsert_many(
+                    workspace.ref_id,
+                    [
+                        *progress_reporter.created_entities,
+                        *progress_reporter.updated_entities,
+                    ],
+                )
+                await search_uow.search_repository.remove_many(
+                    workspace.ref_id, progress_reporter.removed_entities
+                )
@@ -1,7 +1,7 @@
 """Use case for creating a schedule stream from an external iCal."""
 
-import requests
 from icalendar import Calendar
+from jupiter.core.domain.concept.schedule.ical_fetcher import ICalFetchError
 from jupiter.core.domain.concept.schedule.schedule_domain import ScheduleDomain
 from jupiter.core.domain.concept.schedule.schedule_stream import ScheduleStream
 from jupiter.core.domain.concept.schedule.schedule_stream_color import (
@@ -65,22 +65,12 @@ class ScheduleStreamCreateForExternalIcalUseCase(
         )
 
         try:
-            calendar_ical_response = requests.get(
-                args.source_ical_url.the_url, timeout=10
+            fetch_result = await self._ical_fetcher.fetch(
+                args.source_ical_url, etag=None, last_modified=None
             )
-            if calendar_ical_response.status_code != 200:
-                raise InputValidationError(
-                    f"Failed to fetch iCal from {args.source_ical_url} (error {calendar_ical_response.status_code})"
-                )
-            calendar_ical = calendar_ical_response.text
-        except requests.exceptions.Timeout as err:
-            raise InputValidationError(
-                f"Failed to fetch iCal from {args.source_ical_url} (timeout)"
-            ) from err
-        except requests.RequestException as err:
-            raise InputValidationError(
-                f"Failed to fetch iCal from {args.source_ical_url} ({err})"
-            ) from err
+        except ICalFetchError as err:
+            raise InputValidationError(f"{err}") from err
+        calendar_ical = fetch_result.content or ""
 
         try:
             calendar = Calendar.from_ical(calendar_ical)
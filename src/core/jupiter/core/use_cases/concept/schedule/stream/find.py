@@ -11,8 +11,12 @@ from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -26,7 +30,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class ScheduleStreamFindArgs(UseCaseArgsBase):
+class ScheduleStreamFindArgs(PaginatedUseCaseArgsBase):
     """Args."""
 
     include_notes: bool
@@ -43,7 +47,7 @@ class ScheduleStreamFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class ScheduleStreamFindResult(UseCaseResultBase):
+class ScheduleStreamFindResult(PaginatedUseCaseResultBase):
     """The result."""
 
     entries: list[ScheduleStreamFindResultEntry]
@@ -68,7 +72,9 @@ class ScheduleStreamFindUseCase(
         schedule_domain = await uow.get_for(ScheduleDomain).load_by_parent(
             workspace.ref_id
         )
-        schedule_streams = await uow.get_for(ScheduleStream).find_all_generic(
+        schedule_streams, next_cursor = await find_page(
+            uow.get_for(ScheduleStream),
+            args,
             parent_ref_id=schedule_domain.ref_id,
             allow_archived=args.allow_archived,
             ref_id=args.filter_ref_ids or NoFilter(),
@@ -95,5 +101,6 @@ class ScheduleStreamFindUseCase(
                     note=notes_by_schedule_stream_ref_id.get(cs.ref_id, None),
                 )
                 for cs in schedule_streams
-            ]
+            ],
+            next_cursor=next_cursor,
         )
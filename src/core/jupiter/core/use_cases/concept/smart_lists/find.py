@@ -13,11 +13,16 @@ from jupiter.core.domain.core.notes.note_collection import NoteCollection
 from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.domain.core.tags.tag_name import TagName
 from jupiter.core.domain.features import WorkspaceFeature
+from jupiter.core.domain.infra.generic_batch_loader import generic_batch_loader
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -31,7 +36,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class SmartListFindArgs(UseCaseArgsBase):
+class SmartListFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -58,7 +63,7 @@ class SmartListFindResponseEntry(UseCaseResultBase):
 
 
 @use_case_result
-class SmartListFindResult(UseCaseResultBase):
+class SmartListFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult object."""
 
     entries: list[SmartListFindResponseEntry]
@@ -83,10 +88,14 @@ class SmartListFindUseCase(
             workspace.ref_id,
         )
 
-        smart_lists = await uow.get_for(SmartList).find_all(
+        smart_lists, next_cursor = await find_page(
+            uow.get_for(SmartList),
+            args,
             parent_ref_id=smart_list_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         all_notes_by_smart_list_ref_id: defaultdict[EntityId, Note] = defaultdict(None)
@@ -103,56 +112,36 @@ class SmartListFindUseCase(
             for note in all_smart_list_notes:
                 all_notes_by_smart_list_ref_id[note.source_entity_ref_id] = note
 
+        smart_list_tags_by_smart_list_ref_ids: dict[EntityId, list[SmartListTag]] | None
         if args.include_tags:
-            smart_list_tags_by_smart_list_ref_ids = {}
-            for smart_list in smart_lists:
-                for smart_list_tag in await uow.get_for(SmartListTag).find_all_generic(
-                    parent_ref_id=smart_list.ref_id,
-                    allow_archived=args.allow_archived,
-                    tag_name=args.filter_tag_names or NoFilter(),
-                    ref_id=args.filter_tag_ref_id or NoFilter(),
-                ):
-                    if (
-                        smart_list_tag.smart_list.ref_id
-                        not in smart_list_tags_by_smart_list_ref_ids
-                    ):
-                        smart_list_tags_by_smart_list_ref_ids[
-                            smart_list_tag.smart_list.ref_id
-                        ] = [smart_list_tag]
-                    else:
-                        smart_list_tags_by_smart_list_ref_ids[
-                            smart_list_tag.smart_list.ref_id
-                        ].append(smart_list_tag)
+            smart_list_tags_by_smart_list_ref_ids = await generic_batch_loader(
+                uow,
+                smart_lists,
+                SmartList.tags,
+                allow_archived=args.allow_archived,
+                tag_name=args.filter_tag_names or NoFilter(),
+                ref_id=args.filter_tag_ref_id or NoFilter(),
+            )
         else:
             smart_list_tags_by_smart_list_ref_ids = None
 
+        smart_list_items_by_smart_list_ref_ids: (
+            dict[EntityId, list[SmartListItem]] | None
+        )
         if args.include_items:
-            smart_list_items_by_smart_list_ref_ids = {}
-            for smart_list in smart_lists:
-                for smart_list_item in await uow.get_for(
-                    SmartListItem
-                ).find_all_generic(
-                    parent_ref_id=smart_list.ref_id,
-                    allow_archived=args.allow_archived,
-                    ref_id=args.filter_item_ref_id,
-                    is_done=(
-                        args.filter_is_done
-                        if args.filter_is_done is not None
-                        else NoFilter()
-                    ),
-                    tag_ref_id=args.filter_tag_ref_id or NoFilter(),
-                ):
-                    if (
-                        smart_list_item.smart_list.ref_id
-                        not in smart_list_items_by_smart_list_ref_ids
-                    ):
-                        smart_list_items_by_smart_list_ref_ids[
-                            smart_list_item.smart_list.ref_id
-                        ] = [smart_list_item]
-                    else:
-                        smart_list_items_by_smart_list_ref_ids[
-                            smart_list_item.smart_list.ref_id
-                        ].append(smart_list_item)
+            smart_list_items_by_smart_list_ref_ids = await generic_batch_loader(
+                uow,
+                smart_lists,
+                SmartList.items,
+                allow_archived=args.allow_archived,
+                ref_id=args.filter_item_ref_id or NoFilter(),
+                is_done=(
+                    args.filter_is_done
+                    if args.filter_is_done is not None
+                    else NoFilter()
+                ),
+                tag_ref_id=args.filter_tag_ref_id or NoFilter(),
+            )
         else:
             smart_list_items_by_smart_list_ref_ids = None
 
@@ -200,4 +189,5 @@ class SmartListFindUseCase(
                 )
                 for sl in smart_lists
             ],
+            next_cursor=next_cursor,
         )
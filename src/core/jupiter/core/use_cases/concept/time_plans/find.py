@@ -13,8 +13,13 @@ from jupiter.core.domain.core.notes.note_domain import NoteDomain
 from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -28,7 +33,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class TimePlanFindArgs(UseCaseArgsBase):
+class TimePlanFindArgs(PaginatedUseCaseArgsBase):
     """Args."""
 
     allow_archived: bool
@@ -47,7 +52,7 @@ class TimePlanFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class TimePlanFindResult(UseCaseResultBase):
+class TimePlanFindResult(PaginatedUseCaseResultBase):
     """Result."""
 
     entries: list[TimePlanFindResultEntry]
@@ -77,10 +82,14 @@ class TimePlanFindUseCase(
         note_collection = await uow.get_for(NoteCollection).load_by_parent(
             workspace.ref_id,
         )
-        time_plans = await uow.get_for(TimePlan).find_all(
+        time_plans, next_cursor = await find_page(
+            uow.get_for(TimePlan),
+            args,
             parent_ref_id=time_plan_domain.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         notes_by_time_plan_ref_id = {}
@@ -116,5 +125,6 @@ class TimePlanFindUseCase(
                     ),
                 )
                 for time_plan in time_plans
-            ]
+            ],
+            next_cursor=next_cursor,
         )
@@ -15,8 +15,13 @@ from jupiter.core.domain.core.time_events.time_event_namespace import TimeEventN
 from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -29,7 +34,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class VacationFindArgs(UseCaseArgsBase):
+class VacationFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -48,7 +53,7 @@ class VacationFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class VacationFindResult(UseCaseResultBase):
+class VacationFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult object."""
 
     entries: list[VacationFindResultEntry]
@@ -72,10 +77,14 @@ class VacationFindUseCase(
         vacation_collection = await uow.get_for(VacationCollection).load_by_parent(
             workspace.ref_id,
         )
-        vacations = await uow.get_for(Vacation).find_all(
+        vacations, next_cursor = await find_page(
+            uow.get_for(Vacation),
+            args,
             parent_ref_id=vacation_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         notes_by_vacation_ref_id: defaultdict[EntityId, Note] = defaultdict(None)
@@ -122,5 +131,6 @@ class VacationFindUseCase(
                     ),
                 )
                 for vacation in vacations
-            ]
+            ],
+            next_cursor=next_cursor,
         )
@@ -19,8 +19,12 @@ from jupiter.core.domain.features import WorkspaceFeature
 from jupiter.core.domain.storage_engine import DomainUnitOfWork
 from jupiter.core.framework.base.entity_id import EntityId
 from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+    find_page,
+)
 from jupiter.core.framework.use_case_io import (
-    UseCaseArgsBase,
     UseCaseResultBase,
     use_case_args,
     use_case_result,
@@ -33,7 +37,7 @@ from jupiter.core.use_cases.infra.use_cases import (
 
 
 @use_case_args
-class WorkingMemFindArgs(UseCaseArgsBase):
+class WorkingMemFindArgs(PaginatedUseCaseArgsBase):
     """PersonFindArgs."""
 
     allow_archived: bool
@@ -52,7 +56,7 @@ class WorkingMemFindResultEntry(UseCaseResultBase):
 
 
 @use_case_result
-class WorkingMemFindResult(UseCaseResultBase):
+class WorkingMemFindResult(PaginatedUseCaseResultBase):
     """PersonFindResult object."""
 
     entries: list[WorkingMemFindResultEntry]
@@ -76,10 +80,14 @@ class WorkingMemFindUseCase(
         working_mem_collection = await uow.get_for(WorkingMemCollection).load_by_parent(
             workspace.ref_id,
         )
-        working_mems = await uow.get_for(WorkingMem).find_all(
+        working_mems, next_cursor = await find_page(
+            uow.get_for(WorkingMem),
+            args,
             parent_ref_id=working_mem_collection.ref_id,
             allow_archived=args.allow_archived,
-            filter_ref_ids=args.filter_ref_ids,
+            ref_id=(
+                args.filter_ref_ids if args.filter_ref_ids is not None else NoFilter()
+            ),
         )
 
         notes_by_working_mem_ref_id: defaultdict[EntityId, Note] = defaultdict(None)
@@ -135,5 +143,6 @@ class WorkingMemFindUseCase(
                     ),
                 )
                 for working_mem in working_mems
-            ]
+            ],
+            next_cursor=next_cursor,
         )
@@ -0,0 +1,96 @@
+"""A short lived cache of the user and workspace behind a logged-in session."""
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Final
+
+from jupiter.core.domain.concept.user.user import User
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.framework.base.entity_id import EntityId
+
+
+@dataclass(frozen=True)
+class _Entry:
+    user: User
+    workspace: Workspace
+    expires_at: float
+
+
+class LoggedInContextCache:
+    """A short lived cache of the user and workspace behind a logged-in session.
+
+    A single page load in the web UI fires many requests for the same user,
+    and each would otherwise load the user and its workspace on its own.
+    Entries are keyed by the user's ref id and expire after a short TTL.
+    An entry is only good for as long as the user and workspace are at the
+    versions it was cached at, so callers check those with `get_if_current`
+    and the cache never hides a change, whoever made it.
+    """
+
+    _ttl_secs: Final[float]
+    _clock: Final[Callable[[], float]]
+    _entries: Final[dict[EntityId, _Entry]]
+
+    def __init__(
+        self, ttl_secs: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Constructor."""
+        self._ttl_secs = ttl_secs
+        self._clock = clock
+        self._entries = {}
+
+    def get(self, user_ref_id: EntityId) -> tuple[User, Workspace] | None:
+        """The cached user and workspace for a user, if there is a fresh entry."""
+        entry = self._fresh_entry(user_ref_id)
+        if entry is None:
+            return None
+        return entry.user, entry.workspace
+
+    async def get_if_current(
+        self,
+        user_ref_id: EntityId,
+        load_versions: Callable[
+            [EntityId, EntityId], Awaitable[tuple[int | None, int | None]]
+        ],
+    ) -> tuple[User, Workspace] | None:
+        """The cached user and workspace for a user, if they're still at their current versions.
+
+        The current versions of the user and workspace are only loaded, via
+        `load_versions`, when there is a fresh entry to check them against.
+        """
+        entry = self._fresh_entry(user_ref_id)
+        if entry is None:
+            return None
+        user_version, workspace_version = await load_versions(
+            entry.user.ref_id, entry.workspace.ref_id
+        )
+        if (
+            entry.user.version != user_version
+            or entry.workspace.version != workspace_version
+        ):
+            # Other requests for the same user could have evicted the entry,
+            # or put a newer one, while the versions were loading.
+            if self._entries.get(user_ref_id) is entry:
+                del self._entries[user_ref_id]
+            return None
+        return entry.user, entry.workspace
+
+    def _fresh_entry(self, user_ref_id: EntityId) -> _Entry | None:
+        entry = self._entries.get(user_ref_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[user_ref_id]
+            return None
+        return entry
+
+    def put(self, user: User, workspace: Workspace) -> None:
+        """Cache the user and workspace for a user."""
+        now = self._clock()
+        for user_ref_id, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[user_ref_id]
+        self._entries[user.ref_id] = _Entry(
+            user=user, workspace=workspace, expires_at=now + self._ttl_secs
+        )
@@ -2,15 +2,19 @@
 
 import abc
 import dataclasses
+import threading
 import types
 import typing
+from collections import OrderedDict
 from collections.abc import Iterator, Mapping
 from datetime import date, datetime
 from types import GenericAlias, ModuleType
 from typing import (
+    ClassVar,
     Final,
     ForwardRef,
     Generic,
+    TypeAlias,
     TypeVar,
     cast,
     get_args,
@@ -29,6 +33,11 @@ from jupiter.core.framework.base.entity_name import (
     EntityNameDatabaseDecoder,
     EntityNameDatabaseEncoder,
 )
+from jupiter.core.framework.base.page_cursor import (
+    PageCursor,
+    PageCursorDatabaseDecoder,
+    PageCursorDatabaseEncoder,
+)
 from jupiter.core.framework.base.timestamp import (
     Timestamp,
     TimestampDatabaseDecoder,
@@ -41,6 +50,11 @@ from jupiter.core.framework.errors import (
     MultiInputValidationError,
 )
 from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.manifest import (
+    ManifestSection,
+    import_path,
+    resolve_import_path,
+)
 from jupiter.core.framework.optional import normalize_optional
 from jupiter.core.framework.primitive import Primitive
 from jupiter.core.framework.realm import (
@@ -87,6 +101,28 @@ _RecordT = TypeVar("_RecordT", bound=Record)
 _UseCaseArgsT = TypeVar("_UseCaseArgsT", bound=UseCaseArgsBase)
 _UseCaseResultT = TypeVar("_UseCaseResultT", bound=UseCaseResultBase)
 
+# Entity codecs are compiled into flat plans, one entry per field, with the field
+# codec already looked up. A None codec marks a ParentLink stored as "<field>_ref_id".
+_EntityEncodePlan: TypeAlias = tuple[
+    tuple[str, str, RealmEncoder[DomainThing, Realm] | None], ...
+]
+_EntityDecodePlan: TypeAlias = tuple[
+    tuple[str, str | None, RealmDecoder[DomainThing, Realm] | None], ...
+]
+
+_ENTITY_BASE_FIELDS: Final[frozenset[str]] = frozenset(
+    (
+        "ref_id",
+        "version",
+        "archived",
+        "archival_reason",
+        "created_time",
+        "last_modified_time",
+        "archived_time",
+        "events",
+    )
+)
+
 
 # What can we handle with the things here, let's take a look!
 #
@@ -251,6 +287,7 @@ class _UnionEncoder(Generic[_RealmT], RealmEncoder[DomainThing, _RealmT]):
     _root_type: type[DomainThing] | None
     _the_types: list[type[DomainThing] | ForwardRef | str]
     _realm: type[_RealmT]
+    _encoders: list[RealmEncoder[DomainThing, _RealmT] | None] | None
 
     def __init__(
         self,
@@ -263,14 +300,17 @@ class _UnionEncoder(Generic[_RealmT], RealmEncoder[DomainThing, _RealmT]):
         self._root_type = root_type
         self._the_types = the_types
         self._realm = realm
+        self._encoders = None
 
     def encode(self, value: DomainThing) -> RealmThing:
         """Encode a realm to a string."""
-        for attempt_type in self._the_types:
+        if self._encoders is None:
+            self._encoders = [self._try_get_encoder(t) for t in self._the_types]
+
+        for encoder in self._encoders:
+            if encoder is None:
+                continue
             try:
-                encoder = self._realm_codec_registry.get_encoder(
-                    attempt_type, self._realm, self._root_type
-                )
                 return encoder.encode(value)
             except (RealmDecodingError, Exception):
                 pass
@@ -279,6 +319,16 @@ class _UnionEncoder(Generic[_RealmT], RealmEncoder[DomainThing, _RealmT]):
             f"Could not encode value {value} of type {value.__class__.__name__}"
         )
 
+    def _try_get_encoder(
+        self, attempt_type: type[DomainThing] | ForwardRef | str
+    ) -> RealmEncoder[DomainThing, _RealmT] | None:
+        try:
+            return self._realm_codec_registry.get_encoder(
+                attempt_type, self._realm, self._root_type
+            )
+        except EncoderNotFoundError:
+            return None
+
 
 class _UnionDecoder(Generic[_RealmT], RealmDecoder[DomainThing, _RealmT]):
     """An ecnoder for unions."""
@@ -287,6 +337,7 @@ class _UnionDecoder(Generic[_RealmT], RealmDecoder[DomainThing, _RealmT]):
     _root_type: type[DomainThing] | None
     _the_types: list[type[DomainThing] | ForwardRef | str]
     _realm: type[_RealmT]
+    _decoders: list[RealmDecoder[DomainThing, _RealmT]] | None
 
     def __init__(
         self,
@@ -299,14 +350,20 @@ class _UnionDecoder(Generic[_RealmT], RealmDecoder[DomainThing, _RealmT]):
         self._root_type = root_type
         self._the_types = the_types
         self._realm = realm
+        self._decoders = None
 
     def decode(self, value: RealmThing) -> DomainThing:
         """Decode a realm from a string."""
-        for attempt_type in self._the_types:
-            try:
-                the_decoder = self._realm_codec_registry.get_decoder(
+        if self._decoders is None:
+            self._decoders = [
+                self._realm_codec_registry.get_decoder(
                     attempt_type, self._realm, self._root_type
                 )
+                for attempt_type in self._the_types
+            ]
+
+        for the_decoder in self._decoders:
+            try:
                 the_val = the_decoder.decode(value)
 
                 return the_val
@@ -325,6 +382,7 @@ class _ListEncoder(Generic[_RealmT], RealmEncoder[list[DomainThing], _RealmT]):
     _root_type: type[DomainThing] | None
     _the_type: type[DomainThing] | ForwardRef | str
     _realm: type[_RealmT]
+    _item_encoder: RealmEncoder[DomainThing, _RealmT] | None
 
     def __init__(
         self,
@@ -337,12 +395,15 @@ class _ListEncoder(Generic[_RealmT], RealmEncoder[list[DomainThing], _RealmT]):
         self._root_type = root_type
         self._the_type = the_type
         self._realm = realm
+        self._item_encoder = None
 
     def encode(self, value: list[DomainThing]) -> RealmThing:
         """Encode a realm to a string."""
-        encoder = self._realm_codec_registry.get_encoder(
-            self._the_type, self._realm, self._root_type
-        )
+        if self._item_encoder is None:
+            self._item_encoder = self._realm_codec_registry.get_encoder(
+                self._the_type, self._realm, self._root_type
+            )
+        encoder = self._item_encoder
         return [encoder.encode(v) for v in value]
 
 
@@ -353,6 +414,7 @@ class _ListDecoder(Generic[_RealmT], RealmDecoder[list[DomainThing], _RealmT]):
     _root_type: type[DomainThing] | None
     _the_type: type[DomainThing] | ForwardRef | str
     _realm: type[_RealmT]
+    _item_decoder: RealmDecoder[DomainThing, _RealmT] | None
 
     def __init__(
         self,
@@ -365,6 +427,7 @@ class _ListDecoder(Generic[_RealmT], RealmDecoder[list[DomainThing], _RealmT]):
         self._root_type = root_type
         self._the_type = the_type
         self._realm = realm
+        self._item_decoder = None
 
     def decode(self, value: RealmThing) -> list[DomainThing]:
         """Decode a realm from a string."""
@@ -372,9 +435,11 @@ class _ListDecoder(Generic[_RealmT], RealmDecoder[list[DomainThing], _RealmT]):
             raise RealmDecodingError(
                 f"Expected value for {value.__class__.__name__} to be a list"
             )
-        decoder = self._realm_codec_registry.get_decoder(
-            self._the_type, self._realm, self._root_type
-        )
+        if self._item_decoder is None:
+            self._item_decoder = self._realm_codec_registry.get_decoder(
+                self._the_type, self._realm, self._root_type
+            )
+        decoder = self._item_decoder
         return [decoder.decode(v) for v in value]
 
 
@@ -385,6 +450,7 @@ class _SetEncoder(Generic[_RealmT], RealmEncoder[set[DomainThing], _RealmT]):
     _root_type: type[DomainThing] | None
     _the_type: type[DomainThing] | ForwardRef | str
     _realm: type[_RealmT]
+    _item_encoder: RealmEncoder[DomainThing, _RealmT] | None
 
     def __init__(
         self,
@@ -397,12 +463,15 @@ class _SetEncoder(Generic[_RealmT], RealmEncoder[set[DomainThing], _RealmT]):
         self._root_type = root_type
         self._the_type = the_type
         self._realm = realm
+        self._item_encoder = None
 
     def encode(self, value: set[DomainThing]) -> RealmThing:
         """Encode a realm to a string."""
-        encoder = self._realm_codec_registry.get_encoder(
-            self._the_type, self._realm, self._root_type
-        )
+        if self._item_encoder is None:
+            self._item_encoder = self._realm_codec_registry.get_encoder(
+                self._the_type, self._realm, self._root_type
+            )
+        encoder = self._item_encoder
         return [encoder.encode(v) for v in value]
 
 
@@ -413,6 +482,7 @@ class _SetDecoder(Generic[_RealmT], RealmDecoder[set[DomainThing], _RealmT]):
     _root_type: type[DomainThing] | None
     _the_type: type[DomainThing] | ForwardRef | str
     _realm: type[_RealmT]
+    _item_decoder: RealmDecoder[DomainThing, _RealmT] | None
 
     def __init__(
         self,
@@ -425,6 +495,7 @@ class _SetDecoder(Generic[_RealmT], RealmDecoder[set[DomainThing], _RealmT]):
         self._root_type = root_type
         self._the_type = the_type
         self._realm = realm
+        self._item_decoder = None
 
     def decode(self, value: RealmThing) -> set[DomainThing]:
         """Decode a realm from a string."""
@@ -432,9 +503,11 @@ class _SetDecoder(Generic[_RealmT], RealmDecoder[set[DomainThing], _RealmT]):
             raise RealmDecodingError(
                 f"Expected value for {value.__class__.__name__} to be a list"
             )
-        decoder = self._realm_codec_registry.get_decoder(
-            self._the_type, self._realm, self._root_type
-        )
+        if self._item_decoder is None:
+            self._item_decoder = self._realm_codec_registry.get_decoder(
+                self._the_type, self._realm, self._root_type
+            )
+        decoder = self._item_decoder
         return {decoder.decode(v) for v in value}
 
 
@@ -448,6 +521,8 @@ class _DictEncoder(
     _the_key_type: type[DomainThing] | ForwardRef | str
     _the_value_type: type[DomainThing] | ForwardRef | str
     _realm: type[_RealmT]
+    _key_encoder: RealmEncoder[DomainThing, _RealmT] | None
+    _value_encoder: RealmEncoder[DomainThing, _RealmT] | None
 
     def __init__(
         self,
@@ -462,15 +537,20 @@ class _DictEncoder(
         self._the_key_type = the_key_type
         self._the_value_type = the_value_type
         self._realm = realm
+        self._key_encoder = None
+        self._value_encoder = None
 
     def encode(self, value: dict[DomainThing, DomainThing]) -> RealmThing:
         """Encode a realm to a string."""
-        key_encoder = self._realm_codec_registry.get_encoder(
-            self._the_key_type, self._realm, self._root_type
-        )
-        value_encoder = self._realm_codec_registry.get_encoder(
-            self._the_value_type, self._realm, self._root_type
-        )
+        if self._key_encoder is None or self._value_encoder is None:
+            self._key_encoder = self._realm_codec_registry.get_encoder(
+                self._the_key_type, self._realm, self._root_type
+            )
+            self._value_encoder = self._realm_codec_registry.get_encoder(
+                self._the_value_type, self._realm, self._root_type
+            )
+        key_encoder = self._key_encoder
+        value_encoder = self._value_encoder
         result = {}
         for k, v in value.items():
             encoded_key = key_encoder.encode(k)
@@ -493,6 +573,8 @@ class _DictDecoder(
     _the_key_type: type[DomainThing] | ForwardRef | str
     _the_value_type: type[DomainThing] | ForwardRef | str
     _realm: type[_RealmT]
+    _key_decoder: RealmDecoder[DomainThing, _RealmT] | None
+    _value_decoder: RealmDecoder[DomainThing, _RealmT] | None
 
     def __init__(
         self,
@@ -507,6 +589,8 @@ class _DictDecoder(
         self._the_key_type = the_key_type
         self._the_value_type = the_value_type
         self._realm = realm
+        self._key_decoder = None
+        self._value_decoder = None
 
     def decode(self, value: RealmThing) -> dict[DomainThing, DomainThing]:
         """Decode a realm from a string."""
@@ -514,12 +598,15 @@ class _DictDecoder(
             raise RealmDecodingError(
                 f"Expected value of {value.__class__.__name__} to be a dict object"
             )
-        key_decoder = self._realm_codec_registry.get_decoder(
-            self._the_key_type, self._realm, self._root_type
-        )
-        value_decoder = self._realm_codec_registry.get_decoder(
-            self._the_value_type, self._realm, self._root_type
-        )
+        if self._key_decoder is None or self._value_decoder is None:
+            self._key_decoder = self._realm_codec_registry.get_decoder(
+                self._the_key_type, self._realm, self._root_type
+            )
+            self._value_decoder = self._realm_codec_registry.get_decoder(
+                self._the_value_type, self._realm, self._root_type
+            )
+        key_decoder = self._key_decoder
+        value_decoder = self._value_decoder
         return {
             key_decoder.decode(k): value_decoder.decode(v) for k, v in value.items()
         }
@@ -765,6 +852,7 @@ class _StandardEntityEncoder(
     _realm_codec_registry: Final[RealmCodecRegistry]
     _the_type: type[_EntityT]
     _realm: type[_RealmT]
+    _plan: _EntityEncodePlan | None
 
     def __init__(
         self,
@@ -775,25 +863,45 @@ class _StandardEntityEncoder(
         self._realm_codec_registry = realm_codec_registry
         self._the_type = the_type
         self._realm = realm
+        self._plan = None
 
-    def encode(self, value: _EntityT) -> RealmThing:
-        """Encode an entity."""
-        result: dict[str, RealmThing] = {}
-        all_fields = dataclasses.fields(value.__class__)
+    def compile(self) -> None:
+        """Resolve the field encoders once, so encoding is just a walk over a plan."""
+        plan: list[tuple[str, str, RealmEncoder[DomainThing, Realm] | None]] = []
 
-        for field in all_fields:
-            field_value = getattr(value, field.name)
-            if field.name == "events":
+        for field in dataclasses.fields(self._the_type):
+            if field.name == "events" or not field.init:
                 continue
 
-            if isinstance(field_value, ParentLink):
-                result[field.name + "_ref_id"] = field_value.as_int()
+            if field.type is ParentLink:
+                plan.append((field.name, field.name + "_ref_id", None))
             else:
-                encoder = self._realm_codec_registry.get_encoder(
-                    field.type, self._realm, self._the_type
+                plan.append(
+                    (
+                        field.name,
+                        field.name,
+                        self._realm_codec_registry.get_encoder(
+                            field.type, self._realm, self._the_type
+                        ),
+                    )
                 )
 
-                result[field.name] = encoder.encode(field_value)
+        self._plan = tuple(plan)
+
+    def encode(self, value: _EntityT) -> RealmThing:
+        """Encode an entity."""
+        if self._plan is None:
+            self.compile()
+        plan = cast(_EntityEncodePlan, self._plan)
+
+        result: dict[str, RealmThing] = {}
+
+        for field_name, column_name, encoder in plan:
+            field_value = getattr(value, field_name)
+            if encoder is None:
+                result[column_name] = cast(ParentLink, field_value).as_int()
+            else:
+                result[column_name] = encoder.encode(field_value)
 
         return result
 
@@ -806,6 +914,9 @@ class _StandardEntityDecoder(
     _realm_codec_registry: Final[RealmCodecRegistry]
     _the_type: type[_EntityT]
     _realm: type[_RealmT]
+    _entity_id_decoder: RealmDecoder[EntityId, Realm] | None
+    _timestamp_decoder: RealmDecoder[Timestamp, Realm] | None
+    _plan: _EntityDecodePlan | None
 
     def __init__(
         self,
@@ -816,21 +927,52 @@ class _StandardEntityDecoder(
         self._realm_codec_registry = realm_codec_registry
         self._the_type = the_type
         self._realm = realm
+        self._entity_id_decoder = None
+        self._timestamp_decoder = None
+        self._plan = None
 
-    def decode(self, value: RealmThing) -> _EntityT:
-        if not isinstance(value, Mapping):
-            raise RealmDecodingError("Expected value to be a dictonary object")
+    def compile(self) -> None:
+        """Resolve the field decoders once, so decoding is just a walk over a plan."""
+        plan: list[tuple[str, str | None, RealmDecoder[DomainThing, Realm] | None]] = []
 
-        all_fields = dataclasses.fields(self._the_type)
+        for field in dataclasses.fields(self._the_type):
+            if field.name in _ENTITY_BASE_FIELDS or not field.init:
+                continue
 
-        ctor_args: dict[str, DomainThing | ParentLink] = {}
+            if field.type is ParentLink:
+                plan.append((field.name, field.name + "_ref_id", None))
+            else:
+                plan.append(
+                    (
+                        field.name,
+                        None,
+                        self._realm_codec_registry.get_decoder(
+                            field.type, self._realm, self._the_type
+                        ),
+                    )
+                )
 
-        entity_id_decoder = self._realm_codec_registry.get_decoder(
+        self._entity_id_decoder = self._realm_codec_registry.get_decoder(
             EntityId, self._realm
         )
-        timestamp_decoder = self._realm_codec_registry.get_decoder(
+        self._timestamp_decoder = self._realm_codec_registry.get_decoder(
             Timestamp, self._realm
         )
+        self._plan = tuple(plan)
+
+    def decode(self, value: RealmThing) -> _EntityT:
+        if not isinstance(value, Mapping):
+            raise RealmDecodingError("Expected value to be a dictonary object")
+
+        if self._plan is None:
+            self.compile()
+        plan = cast(_EntityDecodePlan, self._plan)
+        entity_id_decoder = cast(RealmDecoder[EntityId, Realm], self._entity_id_decoder)
+        timestamp_decoder = cast(
+            RealmDecoder[Timestamp, Realm], self._timestamp_decoder
+        )
+
+        ctor_args: dict[str, DomainThing | ParentLink] = {}
 
         if "ref_id" not in value:
             raise RealmDecodingError(
@@ -887,41 +1029,26 @@ class _StandardEntityDecoder(
             else None
         )
 
-        for field in all_fields:
-            if field.name in (
-                "ref_id",
-                "version",
-                "archived",
-                "archival_reason",
-                "created_time",
-                "last_modified_time",
-                "archived_time",
-                "events",
-            ):
-                continue
-
-            if field.name == "name" and ("name" not in value or value["name"] is None):
-                ctor_args[field.name] = NOT_USED_NAME
+        for field_name, parent_column_name, decoder in plan:
+            if field_name == "name" and ("name" not in value or value["name"] is None):
+                ctor_args[field_name] = NOT_USED_NAME
                 continue
 
-            if field.name in value:
-                field_value = value[field.name]
-            elif field.type is ParentLink and field.name + "_ref_id" in value:
-                field_value = value[field.name + "_ref_id"]
+            if field_name in value:
+                field_value = value[field_name]
+            elif parent_column_name is not None and parent_column_name in value:
+                field_value = value[parent_column_name]
             else:
                 raise RealmDecodingError(
-                    f"Expected value of type {self._the_type.__name__} to have field {field.name}"
+                    f"Expected value of type {self._the_type.__name__} to have field {field_name}"
                 )
 
-            if field.type is ParentLink:
-                ctor_args[field.name] = ParentLink(
+            if decoder is None:
+                ctor_args[field_name] = ParentLink(
                     entity_id_decoder.decode(field_value)
                 )
             else:
-                decoder = self._realm_codec_registry.get_decoder(
-                    field.type, self._realm, self._the_type
-                )
-                ctor_args[field.name] = decoder.decode(field_value)
+                ctor_args[field_name] = decoder.decode(field_value)
 
         return self._the_type(
             ref_id=ref_id,
@@ -1231,131 +1358,317 @@ class _StandardUseCaseResultWebEncoder(
         return result
 
 
+@dataclasses.dataclass(frozen=True)
+class CodecCacheStats:
+    """Counters for the structural codec cache of a registry."""
+
+    hits: int
+    misses: int
+    encoders: int
+    decoders: int
+    max_size: int
+
+
+_CodecCacheKey: TypeAlias = tuple[
+    type[DomainThing] | ForwardRef | str, type[Realm], type[DomainThing] | None
+]
+
+_STANDARD_CODEC_REALMS: Final[tuple[type[Realm], ...]] = (
+    DatabaseRealm,
+    CliRealm,
+    WebRealm,
+)
+
+
+@dataclasses.dataclass
+class _ModuleRootsExploration:
+    """The codecs and things defined in the modules under some module roots."""
+
+    encoders: list[
+        tuple[type[Concept], type[Realm], type[RealmEncoder[Concept, Realm]]]
+    ]
+    decoders: list[
+        tuple[type[Concept], type[Realm], type[RealmDecoder[Concept, Realm]]]
+    ]
+    thing_types: list[type[Thing]]
+
+
+@dataclasses.dataclass
+class _PendingCodecs:
+    """The codecs of a thing which a manifest lists, as import paths of realms and codecs."""
+
+    encoders: list[tuple[str, str]]
+    decoders: list[tuple[str, str]]
+    is_thing: bool
+
+
 class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
     """A registry for realm codecs constructed by exploring a module tree."""
 
+    DEFAULT_CODEC_CACHE_MAX_SIZE: ClassVar[int] = 4096
+
     _encoders_registry: Final[
         dict[tuple[type[Thing], type[Realm]], RealmEncoder[Thing, Realm]]
     ]
     _decoders_registry: Final[
         dict[tuple[type[Thing], type[Realm]], RealmDecoder[Thing, Realm]]
     ]
+    # Codecs for structural types (unions, lists, sets, dicts, literals, update
+    # actions) are built on demand, so they are kept in a bounded LRU cache.
+    _encoders_cache: Final[OrderedDict[_CodecCacheKey, RealmEncoder[Thing, Realm]]]
+    _decoders_cache: Final[OrderedDict[_CodecCacheKey, RealmDecoder[Thing, Realm]]]
+    _codec_cache_lock: Final[threading.Lock]
+    _codec_cache_max_size: Final[int]
+    _codec_cache_hits: int
+    _codec_cache_misses: int
+    # When built from a manifest, the codecs of a thing are only added the first
+    # time they're asked for. These are keyed by the import path of the thing.
+    _pending_codecs: Final[dict[str, _PendingCodecs]]
+    _settled_types: Final[set[type]]
 
     def __init__(
         self,
+        codec_cache_max_size: int = DEFAULT_CODEC_CACHE_MAX_SIZE,
     ) -> None:
         """Initialize the registry."""
         self._encoders_registry = {}
         self._decoders_registry = {}
+        self._encoders_cache = OrderedDict()
+        self._decoders_cache = OrderedDict()
+        self._codec_cache_lock = threading.Lock()
+        self._codec_cache_max_size = codec_cache_max_size
+        self._codec_cache_hits = 0
+        self._codec_cache_misses = 0
+        self._pending_codecs = {}
+        self._settled_types = set()
 
     @staticmethod
     def build_from_module_root(
         *module_roots: ModuleType,
     ) -> "ModuleExplorerRealmCodecRegistry":
         """Build a registry from a module root using magick."""
+        exploration = ModuleExplorerRealmCodecRegistry._explore_module_roots(
+            *module_roots
+        )
 
-        def extract_atomic_values(
-            the_module: ModuleType,
-        ) -> Iterator[type[AtomicValue[Primitive]]]:
-            for _name, obj in the_module.__dict__.items():
-                if not (isinstance(obj, type) and issubclass(obj, AtomicValue)):
-                    continue
+        registry = ModuleExplorerRealmCodecRegistry._build_with_framework_codecs()
 
-                if obj.__module__ != the_module.__name__:
-                    # This is an import, and not a definition!
-                    continue
+        # First add all the concept encoders and decoders that are explicitly defined.
+        for concept_type, realm_type, encoder_type in exploration.encoders:
+            registry._add_encoder(
+                concept_type, realm_type, registry._build_encoder(encoder_type)
+            )
+        for concept_type, realm_type, decoder_type in exploration.decoders:
+            registry._add_decoder(
+                concept_type, realm_type, registry._build_decoder(decoder_type)
+            )
 
-                yield obj
+        # Then for those that aren't, we'll try to figure out the encoders and decoders
+        for thing_type in exploration.thing_types:
+            registry._add_standard_codecs(thing_type)
+
+        # Now that every codec is known, resolve the per-field plans for the
+        # entity codecs the repositories use, so no lookups happen per row.
+        for (_, realm), encoder in registry._encoders_registry.items():
+            if realm is DatabaseRealm and isinstance(encoder, _StandardEntityEncoder):
+                encoder.compile()
+        for (_, realm), decoder in registry._decoders_registry.items():
+            if realm is DatabaseRealm and isinstance(decoder, _StandardEntityDecoder):
+                decoder.compile()
 
-        def extract_composite_values(
-            the_module: ModuleType,
-        ) -> Iterator[type[CompositeValue]]:
-            for _name, obj in the_module.__dict__.items():
-                if not (isinstance(obj, type) and issubclass(obj, CompositeValue)):
-                    continue
+        return registry
 
-                if obj.__module__ != the_module.__name__:
-                    # This is an import, and not a definition!
-                    continue
+    @staticmethod
+    def build_manifest_section(*module_roots: ModuleType) -> ManifestSection:
+        """Build the manifest section from which the registry for a module root can be built."""
+        exploration = ModuleExplorerRealmCodecRegistry._explore_module_roots(
+            *module_roots
+        )
 
-                yield obj
+        section: ManifestSection = []
+        for concept_type, realm_type, encoder_type in exploration.encoders:
+            section.append(
+                (
+                    "encoder",
+                    import_path(concept_type),
+                    import_path(realm_type),
+                    import_path(encoder_type),
+                )
+            )
+        for concept_type, realm_type, decoder_type in exploration.decoders:
+            section.append(
+                (
+                    "decoder",
+                    import_path(concept_type),
+                    import_path(realm_type),
+                    import_path(decoder_type),
+                )
+            )
+        for thing_type in exploration.thing_types:
+            section.append(("thing", import_path(thing_type)))
+        return section
 
-        def extract_enum_values(
-            the_module: ModuleType,
-        ) -> Iterator[type[EnumValue]]:
-            for _name, obj in the_module.__dict__.items():
-                if not (isinstance(obj, type) and issubclass(obj, EnumValue)):
-                    continue
+    @staticmethod
+    def build_from_manifest(
+        section: ManifestSection,
+    ) -> "ModuleExplorerRealmCodecRegistry":
+        """Build a registry from a manifest section.
 
-                if obj.__module__ != the_module.__name__:
-                    # This is an import, and not a definition!
-                    continue
+        The codecs of a type are only built, and the modules they live in only
+        imported, the first time one of them is asked for.
+        """
+        registry = ModuleExplorerRealmCodecRegistry._build_with_framework_codecs()
 
-                yield obj
+        for kind, thing_path, *codec_paths in section:
+            pending_codecs = registry._pending_codecs.setdefault(
+                thing_path, _PendingCodecs(encoders=[], decoders=[], is_thing=False)
+            )
+            if kind == "encoder":
+                realm_path, encoder_path = codec_paths
+                pending_codecs.encoders.append((realm_path, encoder_path))
+            elif kind == "decoder":
+                realm_path, decoder_path = codec_paths
+                pending_codecs.decoders.append((realm_path, decoder_path))
+            elif kind == "thing":
+                pending_codecs.is_thing = True
+            else:
+                raise Exception(f"Unknown codec manifest entry kind {kind}")
 
-        def extract_entities(
-            the_module: ModuleType,
-        ) -> Iterator[type[Entity]]:
-            for _name, obj in the_module.__dict__.items():
-                if not (isinstance(obj, type) and issubclass(obj, Entity)):
-                    continue
+        return registry
 
-                if obj.__module__ != the_module.__name__:
-                    # This is an import, and not a definition!
-                    continue
+    @staticmethod
+    def _build_with_framework_codecs() -> "ModuleExplorerRealmCodecRegistry":
+        registry = ModuleExplorerRealmCodecRegistry()
 
-                yield obj
+        registry._add_encoder(
+            type(None), DatabaseRealm, _StandardPrimitiveDatabaseEncoder(type(None))
+        )
+        registry._add_decoder(
+            type(None), DatabaseRealm, _StandardPrimitiveDatabaseDecoder(type(None))
+        )
 
-        def extract_records(
-            the_module: ModuleType,
-        ) -> Iterator[type[Record]]:
-            for _name, obj in the_module.__dict__.items():
-                if not (isinstance(obj, type) and issubclass(obj, Record)):
-                    continue
+        registry._add_encoder(
+            bool, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(bool)
+        )
+        registry._add_decoder(
+            bool, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(bool)
+        )
 
-                if obj.__module__ != the_module.__name__:
-                    # This is an import, and not a definition!
-                    continue
+        registry._add_encoder(
+            int, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(int)
+        )
+        registry._add_decoder(
+            int, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(int)
+        )
 
-                yield obj
+        registry._add_encoder(
+            float, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(float)
+        )
+        registry._add_decoder(
+            float, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(float)
+        )
 
-        def extract_use_case_args(
-            the_module: ModuleType,
-        ) -> Iterator[type[UseCaseArgsBase]]:
-            for _name, obj in the_module.__dict__.items():
-                if not (isinstance(obj, type) and issubclass(obj, UseCaseArgsBase)):
-                    continue
+        registry._add_encoder(
+            str, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(str)
+        )
+        registry._add_decoder(
+            str, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(str)
+        )
 
-                if obj.__module__ != the_module.__name__:
-                    # This is an import, and not a definition!
-                    continue
+        registry._add_encoder(
+            date, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(date)
+        )
+        registry._add_decoder(
+            date, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(date)
+        )
 
-                yield obj
+        registry._add_encoder(
+            datetime, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(datetime)
+        )
+        registry._add_decoder(
+            datetime, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(datetime)
+        )
 
-        def extract_use_case_result(
-            the_module: ModuleType,
-        ) -> Iterator[type[UseCaseResultBase]]:
-            for _name, obj in the_module.__dict__.items():
-                if not (isinstance(obj, type) and issubclass(obj, UseCaseResultBase)):
-                    continue
+        registry._add_encoder(
+            Date, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(Date)
+        )
+        registry._add_decoder(
+            Date, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(Date)
+        )
 
-                if obj.__module__ != the_module.__name__:
-                    # This is an import, and not a definition!
-                    continue
+        registry._add_encoder(
+            DateTime, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(DateTime)
+        )
+        registry._add_decoder(
+            DateTime, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(DateTime)
+        )
 
-                yield obj
+        registry._add_encoder(EntityId, DatabaseRealm, EntityIdDatabaseEncoder())
+        registry._add_encoder(EntityId, WebRealm, EntityIdWebEncoder())
+        registry._add_decoder(EntityId, DatabaseRealm, EntityIdDatabaseDecoder())
 
-        def figure_out_realm(the_type: type) -> type[Realm] | None:
-            if not hasattr(the_type, "__orig_bases__"):
-                return None
+        registry._add_encoder(
+            EntityName, DatabaseRealm, EntityNameDatabaseEncoder(EntityName)
+        )
+        registry._add_decoder(
+            EntityName, DatabaseRealm, EntityNameDatabaseDecoder(EntityName)
+        )
 
-            for base in the_type.__orig_bases__:
-                base_args = get_args(base)
-                if len(base_args) == 0:
-                    continue
-                for base_arg in base_args:
-                    if isinstance(base_arg, type) and issubclass(base_arg, Realm):
-                        return base_arg
+        registry._add_encoder(Timestamp, DatabaseRealm, TimestampDatabaseEncoder())
+        registry._add_decoder(Timestamp, DatabaseRealm, TimestampDatabaseDecoder())
+
+        registry._add_encoder(PageCursor, DatabaseRealm, PageCursorDatabaseEncoder())
+        registry._add_decoder(PageCursor, DatabaseRealm, PageCursorDatabaseDecoder())
+
+        registry._add_encoder(
+            EventSource, DatabaseRealm, _StandardEnumValueDatabaseEncoder(EventSource)
+        )
+        registry._add_decoder(
+            EventSource, DatabaseRealm, _StandardEnumValueDatabaseDecoder(EventSource)
+        )
+
+        return registry
+
+    @staticmethod
+    def _explore_module_roots(*module_roots: ModuleType) -> _ModuleRootsExploration:
+        def extract_things(
+            the_module: ModuleType,
+        ) -> Iterator[type[Thing]]:
+            for _name, obj in the_module.__dict__.items():
+                if not (
+                    isinstance(obj, type)
+                    and issubclass(
+                        obj,
+                        (
+                            AtomicValue,
+                            CompositeValue,
+                            EnumValue,
+                            Entity,
+                            Record,
+                            UseCaseArgsBase,
+                            UseCaseResultBase,
+                        ),
+                    )
+                ):
+                    continue
+
+                if obj.__module__ != the_module.__name__:
+                    # This is an import, and not a definition!
+                    continue
+
+                yield obj
+
+        def figure_out_realm(the_type: type) -> type[Realm] | None:
+            if not hasattr(the_type, "__orig_bases__"):
+                return None
+
+            for base in the_type.__orig_bases__:
+                base_args = get_args(base)
+                if len(base_args) == 0:
+                    continue
+                for base_arg in base_args:
+                    if isinstance(base_arg, type) and issubclass(base_arg, Realm):
+                        return base_arg
 
                 origin_base = cast(type | GenericAlias, get_origin(base))
                 if origin_base != base:
@@ -1473,349 +1786,177 @@ class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
 
                 yield concept_type, realm_type, cast(type, obj)
 
-        registry = ModuleExplorerRealmCodecRegistry()
-
-        registry._add_encoder(
-            type(None), DatabaseRealm, _StandardPrimitiveDatabaseEncoder(type(None))
-        )
-        registry._add_decoder(
-            type(None), DatabaseRealm, _StandardPrimitiveDatabaseDecoder(type(None))
-        )
-
-        registry._add_encoder(
-            bool, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(bool)
-        )
-        registry._add_decoder(
-            bool, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(bool)
-        )
-
-        registry._add_encoder(
-            int, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(int)
-        )
-        registry._add_decoder(
-            int, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(int)
-        )
-
-        registry._add_encoder(
-            float, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(float)
-        )
-        registry._add_decoder(
-            float, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(float)
-        )
-
-        registry._add_encoder(
-            str, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(str)
-        )
-        registry._add_decoder(
-            str, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(str)
-        )
-
-        registry._add_encoder(
-            date, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(date)
-        )
-        registry._add_decoder(
-            date, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(date)
-        )
-
-        registry._add_encoder(
-            datetime, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(datetime)
-        )
-        registry._add_decoder(
-            datetime, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(datetime)
-        )
-
-        registry._add_encoder(
-            Date, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(Date)
-        )
-        registry._add_decoder(
-            Date, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(Date)
-        )
-
-        registry._add_encoder(
-            DateTime, DatabaseRealm, _StandardPrimitiveDatabaseEncoder(DateTime)
-        )
-        registry._add_decoder(
-            DateTime, DatabaseRealm, _StandardPrimitiveDatabaseDecoder(DateTime)
-        )
-
-        registry._add_encoder(EntityId, DatabaseRealm, EntityIdDatabaseEncoder())
-        registry._add_encoder(EntityId, WebRealm, EntityIdWebEncoder())
-        registry._add_decoder(EntityId, DatabaseRealm, EntityIdDatabaseDecoder())
-
-        registry._add_encoder(
-            EntityName, DatabaseRealm, EntityNameDatabaseEncoder(EntityName)
-        )
-        registry._add_decoder(
-            EntityName, DatabaseRealm, EntityNameDatabaseDecoder(EntityName)
-        )
-
-        registry._add_encoder(Timestamp, DatabaseRealm, TimestampDatabaseEncoder())
-        registry._add_decoder(Timestamp, DatabaseRealm, TimestampDatabaseDecoder())
-
-        registry._add_encoder(
-            EventSource, DatabaseRealm, _StandardEnumValueDatabaseEncoder(EventSource)
-        )
-        registry._add_decoder(
-            EventSource, DatabaseRealm, _StandardEnumValueDatabaseDecoder(EventSource)
-        )
-
-        # First look at all the concept encoders and decoders that are
-        # explicitly defined.
+        exploration = _ModuleRootsExploration(encoders=[], decoders=[], thing_types=[])
         for m in find_all_modules(*module_roots):
-            for concept_type, realm_type, encoder_type in extract_concept_encoders(m):
-                registry._add_encoder(
-                    concept_type, realm_type, registry._build_encoder(encoder_type)
+            exploration.encoders.extend(extract_concept_encoders(m))
+            exploration.decoders.extend(extract_concept_decoders(m))
+            exploration.thing_types.extend(extract_things(m))
+        return exploration
+
+    def _add_standard_codecs(self, thing_type: type[Thing]) -> None:
+        """Add the standard codecs for a thing, in the realms it has no explicit ones for."""
+        if issubclass(thing_type, AtomicValue) and allowed_in_realm(
+            thing_type, DatabaseRealm
+        ):
+            if not self._has_encoder(thing_type, DatabaseRealm):
+                if not issubclass(thing_type, EntityName):
+                    raise EncoderNotFoundError(f"No encoder for {thing_type}")
+                self._add_encoder(
+                    thing_type, DatabaseRealm, EntityNameDatabaseEncoder(thing_type)
                 )
 
-            for concept_type, realm_type, decoder_type in extract_concept_decoders(m):
-                registry._add_decoder(
-                    concept_type, realm_type, registry._build_decoder(decoder_type)
+            if not self._has_decoder(thing_type, DatabaseRealm):
+                if not issubclass(thing_type, EntityName):
+                    raise DecoderNotFoundError(f"No decoder for {thing_type}")
+                self._add_decoder(
+                    thing_type, DatabaseRealm, EntityNameDatabaseDecoder(thing_type)
                 )
 
-        # Then for those that aren't, we'll try to figure out the encoders and decoders
-        for m in find_all_modules(*module_roots):
-            for atomic_value_type in extract_atomic_values(m):
-                if not allowed_in_realm(atomic_value_type, DatabaseRealm):
-                    continue
-
-                if not registry._has_encoder(atomic_value_type, DatabaseRealm):
-                    if issubclass(atomic_value_type, EntityName):
-                        registry._add_encoder(
-                            atomic_value_type,
-                            DatabaseRealm,
-                            EntityNameDatabaseEncoder(atomic_value_type),
-                        )
-                    elif registry._has_encoder(atomic_value_type, DatabaseRealm):
-                        continue
-                    else:
-                        raise EncoderNotFoundError(
-                            f"No encoder for {atomic_value_type}"
-                        )
-
-                if not registry._has_decoder(atomic_value_type, DatabaseRealm):
-                    if issubclass(atomic_value_type, EntityName):
-                        registry._add_decoder(
-                            atomic_value_type,
-                            DatabaseRealm,
-                            EntityNameDatabaseDecoder(atomic_value_type),
-                        )
-                    elif registry._has_decoder(atomic_value_type, DatabaseRealm):
-                        continue
-                    else:
-                        raise DecoderNotFoundError(
-                            f"No decoder for {atomic_value_type}"
-                        )
-
-            for composite_value_type in extract_composite_values(m):
-                if not allowed_in_realm(composite_value_type, DatabaseRealm):
-                    continue
-
-                if not registry._has_encoder(composite_value_type, DatabaseRealm):
-                    registry._add_encoder(
-                        composite_value_type,
-                        DatabaseRealm,
-                        _StandardCompositeValueEncoder(
-                            registry, composite_value_type, DatabaseRealm
-                        ),
-                    )
-
-                if not registry._has_encoder(composite_value_type, CliRealm):
-                    registry._add_encoder(
-                        composite_value_type,
-                        CliRealm,
-                        _StandardCompositeValueEncoder(
-                            registry, composite_value_type, CliRealm
-                        ),
-                    )
-
-                if not registry._has_encoder(composite_value_type, WebRealm):
-                    registry._add_encoder(
-                        composite_value_type,
-                        WebRealm,
-                        _StandardCompositeValueEncoder(
-                            registry, composite_value_type, WebRealm
-                        ),
-                    )
-
-                if not registry._has_decoder(composite_value_type, DatabaseRealm):
-                    registry._add_decoder(
-                        composite_value_type,
-                        DatabaseRealm,
-                        _StandardCompositeValueDecoder(
-                            registry, composite_value_type, DatabaseRealm
-                        ),
-                    )
-
-                if not registry._has_decoder(composite_value_type, CliRealm):
-                    registry._add_decoder(
-                        composite_value_type,
-                        CliRealm,
-                        _StandardCompositeValueDecoder(
-                            registry, composite_value_type, CliRealm
-                        ),
-                    )
-
-                if not registry._has_decoder(composite_value_type, WebRealm):
-                    registry._add_decoder(
-                        composite_value_type,
-                        WebRealm,
-                        _StandardCompositeValueDecoder(
-                            registry, composite_value_type, WebRealm
-                        ),
-                    )
-
-            for enum_value_type in extract_enum_values(m):
-                if not allowed_in_realm(enum_value_type, DatabaseRealm):
-                    continue
-
-                if not registry._has_encoder(enum_value_type, DatabaseRealm):
-                    registry._add_encoder(
-                        enum_value_type,
-                        DatabaseRealm,
-                        _StandardEnumValueDatabaseEncoder(enum_value_type),
-                    )
-
-                if not registry._has_decoder(enum_value_type, DatabaseRealm):
-                    registry._add_decoder(
-                        enum_value_type,
-                        DatabaseRealm,
-                        _StandardEnumValueDatabaseDecoder(enum_value_type),
-                    )
-
-            for entity in extract_entities(m):
-                if not allowed_in_realm(entity, DatabaseRealm):
-                    continue
-
-                if not registry._has_encoder(entity, DatabaseRealm):
-                    registry._add_encoder(
-                        entity,
-                        DatabaseRealm,
-                        _StandardEntityEncoder(registry, entity, DatabaseRealm),
-                    )
-
-                if not registry._has_encoder(entity, CliRealm):
-                    registry._add_encoder(
-                        entity,
-                        CliRealm,
-                        _StandardEntityEncoder(registry, entity, CliRealm),
-                    )
-
-                if not registry._has_encoder(entity, WebRealm):
-                    registry._add_encoder(
-                        entity,
-                        WebRealm,
-                        _StandardEntityEncoder(registry, entity, WebRealm),
-                    )
-
-                if not registry._has_decoder(entity, DatabaseRealm):
-                    registry._add_decoder(
-                        entity,
-                        DatabaseRealm,
-                        _StandardEntityDecoder(registry, entity, DatabaseRealm),
-                    )
-
-                if not registry._has_decoder(entity, CliRealm):
-                    registry._add_decoder(
-                        entity,
-                        CliRealm,
-                        _StandardEntityDecoder(registry, entity, CliRealm),
-                    )
-
-                if not registry._has_decoder(entity, WebRealm):
-                    registry._add_decoder(
-                        entity,
-                        WebRealm,
-                        _StandardEntityDecoder(registry, entity, WebRealm),
+        if issubclass(thing_type, CompositeValue) and allowed_in_realm(
+            thing_type, DatabaseRealm
+        ):
+            for realm in _STANDARD_CODEC_REALMS:
+                if not self._has_encoder(thing_type, realm):
+                    self._add_encoder(
+                        thing_type,
+                        realm,
+                        _StandardCompositeValueEncoder(self, thing_type, realm),
                     )
-
-            for record in extract_records(m):
-                if not allowed_in_realm(record, DatabaseRealm):
-                    continue
-
-                if not registry._has_encoder(record, DatabaseRealm):
-                    registry._add_encoder(
-                        record,
-                        DatabaseRealm,
-                        _StandardRecordEncoder(registry, record, DatabaseRealm),
+                if not self._has_decoder(thing_type, realm):
+                    self._add_decoder(
+                        thing_type,
+                        realm,
+                        _StandardCompositeValueDecoder(self, thing_type, realm),
                     )
 
-                if not registry._has_encoder(record, CliRealm):
-                    registry._add_encoder(
-                        record,
-                        CliRealm,
-                        _StandardRecordEncoder(registry, record, CliRealm),
-                    )
+        if issubclass(thing_type, EnumValue) and allowed_in_realm(
+            thing_type, DatabaseRealm
+        ):
+            if not self._has_encoder(thing_type, DatabaseRealm):
+                self._add_encoder(
+                    thing_type,
+                    DatabaseRealm,
+                    _StandardEnumValueDatabaseEncoder(thing_type),
+                )
+            if not self._has_decoder(thing_type, DatabaseRealm):
+                self._add_decoder(
+                    thing_type,
+                    DatabaseRealm,
+                    _StandardEnumValueDatabaseDecoder(thing_type),
+                )
 
-                if not registry._has_encoder(record, WebRealm):
-                    registry._add_encoder(
-                        record,
-                        WebRealm,
-                        _StandardRecordEncoder(registry, record, WebRealm),
+        if issubclass(thing_type, Entity) and allowed_in_realm(
+            thing_type, DatabaseRealm
+        ):
+            for realm in _STANDARD_CODEC_REALMS:
+                if not self._has_encoder(thing_type, realm):
+                    self._add_encoder(
+                        thing_type,
+                        realm,
+                        _StandardEntityEncoder(self, thing_type, realm),
                     )
-
-                if not registry._has_decoder(record, DatabaseRealm):
-                    registry._add_decoder(
-                        record,
-                        DatabaseRealm,
-                        _StandardRecordDecoder(registry, record, DatabaseRealm),
+                if not self._has_decoder(thing_type, realm):
+                    self._add_decoder(
+                        thing_type,
+                        realm,
+                        _StandardEntityDecoder(self, thing_type, realm),
                     )
 
-                if not registry._has_decoder(record, CliRealm):
-                    registry._add_decoder(
-                        record,
-                        CliRealm,
-                        _StandardRecordDecoder(registry, record, CliRealm),
+        if issubclass(thing_type, Record) and allowed_in_realm(
+            thing_type, DatabaseRealm
+        ):
+            for realm in _STANDARD_CODEC_REALMS:
+                if not self._has_encoder(thing_type, realm):
+                    self._add_encoder(
+                        thing_type,
+                        realm,
+                        _StandardRecordEncoder(self, thing_type, realm),
                     )
-
-                if not registry._has_decoder(record, WebRealm):
-                    registry._add_decoder(
-                        record,
-                        WebRealm,
-                        _StandardRecordDecoder(registry, record, WebRealm),
+                if not self._has_decoder(thing_type, realm):
+                    self._add_decoder(
+                        thing_type,
+                        realm,
+                        _StandardRecordDecoder(self, thing_type, realm),
                     )
 
-            for use_case_args in extract_use_case_args(m):
-                if not allowed_in_realm(use_case_args, CliRealm):
-                    continue
-
-                if not registry._has_encoder(use_case_args, EventStoreRealm):
-                    registry._add_encoder(
-                        use_case_args,
-                        EventStoreRealm,
-                        _StandardUseCaseArgsEventStoreEncoder(registry, use_case_args),
-                    )
+        if issubclass(thing_type, UseCaseArgsBase) and allowed_in_realm(
+            thing_type, CliRealm
+        ):
+            if not self._has_encoder(thing_type, EventStoreRealm):
+                self._add_encoder(
+                    thing_type,
+                    EventStoreRealm,
+                    _StandardUseCaseArgsEventStoreEncoder(self, thing_type),
+                )
+            if not self._has_decoder(thing_type, CliRealm):
+                self._add_decoder(
+                    thing_type,
+                    CliRealm,
+                    _StandardUseCaseArgsCliDecoder(self, thing_type),
+                )
+            if not self._has_decoder(thing_type, WebRealm):
+                self._add_decoder(
+                    thing_type,
+                    WebRealm,
+                    _StandardUseCaseArgsWebDecoder(self, thing_type),
+                )
 
-                if not registry._has_decoder(use_case_args, CliRealm):
-                    registry._add_decoder(
-                        use_case_args,
-                        CliRealm,
-                        _StandardUseCaseArgsCliDecoder(registry, use_case_args),
-                    )
+        if issubclass(thing_type, UseCaseResultBase) and allowed_in_realm(
+            thing_type, WebRealm
+        ):
+            if not self._has_encoder(thing_type, WebRealm):
+                self._add_encoder(
+                    thing_type,
+                    WebRealm,
+                    _StandardUseCaseResultWebEncoder(self, thing_type),
+                )
 
-                if not registry._has_decoder(use_case_args, WebRealm):
-                    registry._add_decoder(
-                        use_case_args,
-                        WebRealm,
-                        _StandardUseCaseArgsWebDecoder(registry, use_case_args),
+    def _load_pending_codecs(self, thing_type: type[Thing]) -> None:
+        """Add the codecs of a thing listed in the manifest the registry was built from."""
+        if not self._pending_codecs or thing_type in self._settled_types:
+            return
+        self._settled_types.add(thing_type)
+
+        pending_codecs = self._pending_codecs.pop(import_path(thing_type), None)
+        if pending_codecs is None:
+            return
+
+        for realm_path, encoder_path in pending_codecs.encoders:
+            self._add_encoder(
+                cast(type[Concept], thing_type),
+                cast(type[Realm], resolve_import_path(realm_path)),
+                self._build_encoder(
+                    cast(
+                        type[RealmEncoder[Concept, Realm]],
+                        resolve_import_path(encoder_path),
                     )
-
-            for use_case_result in extract_use_case_result(m):
-                if not allowed_in_realm(use_case_args, WebRealm):
-                    continue
-
-                if not registry._has_encoder(use_case_result, WebRealm):
-                    registry._add_encoder(
-                        use_case_result,
-                        WebRealm,
-                        _StandardUseCaseResultWebEncoder(registry, use_case_result),
+                ),
+            )
+        for realm_path, decoder_path in pending_codecs.decoders:
+            self._add_decoder(
+                cast(type[Concept], thing_type),
+                cast(type[Realm], resolve_import_path(realm_path)),
+                self._build_decoder(
+                    cast(
+                        type[RealmDecoder[Concept, Realm]],
+                        resolve_import_path(decoder_path),
                     )
+                ),
+            )
+        if pending_codecs.is_thing:
+            self._add_standard_codecs(thing_type)
 
-        return registry
+    def _load_all_pending_codecs(self) -> None:
+        for thing_path in list(self._pending_codecs):
+            self._load_pending_codecs(
+                cast(type[Thing], resolve_import_path(thing_path))
+            )
 
     def get_all_registered_types(
         self, base_type: type[_DomainThingT], realm: type[Realm]
     ) -> Iterator[type[_DomainThingT]]:
         r"""Get all types registered that derive from base type."""
+        self._load_all_pending_codecs()
         yielded_types: set[type[Thing]] = set()
 
         for the_type, type_realm in self._encoders_registry.keys():
@@ -1840,6 +1981,17 @@ class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
                 yielded_types.add(the_type)
                 yield the_type
 
+    def codec_cache_stats(self) -> CodecCacheStats:
+        """Get the hit and miss counters for the structural codec cache."""
+        with self._codec_cache_lock:
+            return CodecCacheStats(
+                hits=self._codec_cache_hits,
+                misses=self._codec_cache_misses,
+                encoders=len(self._encoders_cache),
+                decoders=len(self._decoders_cache),
+                max_size=self._codec_cache_max_size,
+            )
+
     def get_encoder(
         self,
         thing_type: type[_DomainThingT] | ForwardRef | str,
@@ -1848,10 +2000,7 @@ class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
     ) -> RealmEncoder[_DomainThingT, _RealmT]:
         """Get a codec for a realm and a thing type."""
         if isinstance(thing_type, typing._GenericAlias) and thing_type.__name__ == "Literal":  # type: ignore
-            return cast(
-                RealmEncoder[_DomainThingT, _RealmT],
-                _LiteralEncoder(thing_type.__args__, realm),
-            )  # type: ignore
+            return self._get_structural_encoder(thing_type, realm, root_type)
         elif isinstance(thing_type, ForwardRef):
             if root_type is None:
                 raise Exception("Cannot infer the type of a string without a root type")
@@ -1873,6 +2022,7 @@ class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
                 cast(type[_DomainThingT], root_type), realm, root_type
             )
         elif is_thing_ish_type(thing_type):
+            self._load_pending_codecs(cast(type[Thing], thing_type))
             if (thing_type, realm) not in self._encoders_registry:
                 if (thing_type, DatabaseRealm) not in self._encoders_registry:
                     raise EncoderNotFoundError(
@@ -1892,6 +2042,106 @@ class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
                     cast(tuple[type[Thing], type[Realm]], (thing_type, realm))
                 ],
             )
+        elif get_origin(thing_type) is not None:
+            return self._get_structural_encoder(thing_type, realm, root_type)
+        else:
+            raise EncoderNotFoundError(
+                f"Could not find encoder for realm {realm} and thing {thing_type.__name__}"
+            )
+
+    def get_decoder(
+        self,
+        thing_type: type[_DomainThingT] | ForwardRef | str,
+        realm: type[_RealmT],
+        root_type: type[DomainThing] | None = None,
+    ) -> RealmDecoder[_DomainThingT, _RealmT]:
+        """Get a codec for a realm and a thing type."""
+        if isinstance(thing_type, typing._GenericAlias) and thing_type.__name__ == "Literal":  # type: ignore
+            return self._get_structural_decoder(thing_type, realm, root_type)
+        elif isinstance(thing_type, ForwardRef):
+            if root_type is None:
+                raise Exception("Cannot infer the type of a string without a root type")
+            if f"'{root_type.__name__}'" not in str(thing_type):
+                raise Exception(
+                    f"Recursive types are only allowed to be encoded as root types, but {thing_type} is not the root type {root_type.__name__}"
+                )
+            return self.get_decoder(
+                cast(type[_DomainThingT], root_type), realm, root_type
+            )
+        elif isinstance(thing_type, str):
+            if root_type is None:
+                raise Exception("Cannot infer the type of a string without a root type")
+            if thing_type != root_type.__name__:
+                raise Exception(
+                    f"Recursive types are only allowed to be encoded as root types, but {thing_type} is not the root type {root_type.__name__}"
+                )
+            return self.get_decoder(
+                cast(type[_DomainThingT], root_type), realm, root_type
+            )
+        elif is_thing_ish_type(thing_type):
+            self._load_pending_codecs(cast(type[Thing], thing_type))
+            if (thing_type, realm) not in self._decoders_registry:
+                if (thing_type, DatabaseRealm) not in self._decoders_registry:
+                    raise DecoderNotFoundError(
+                        f"Could not find decoder for realm {realm} and thing {thing_type.__name__}"
+                    )
+                return cast(
+                    RealmDecoder[_DomainThingT, _RealmT],
+                    self._decoders_registry[
+                        cast(
+                            tuple[type[Thing], type[Realm]], (thing_type, DatabaseRealm)
+                        )
+                    ],
+                )
+            return cast(
+                RealmDecoder[_DomainThingT, _RealmT],
+                self._decoders_registry[
+                    cast(tuple[type[Thing], type[Realm]], (thing_type, realm))
+                ],
+            )
+        elif get_origin(thing_type) is not None:
+            return self._get_structural_decoder(thing_type, realm, root_type)
+        else:
+            raise DecoderNotFoundError(
+                f"Could not find decoder for realm {realm} and thing {thing_type.__name__}"
+            )
+
+    def _get_structural_encoder(
+        self,
+        thing_type: type[_DomainThingT] | ForwardRef | str,
+        realm: type[_RealmT],
+        root_type: type[DomainThing] | None,
+    ) -> RealmEncoder[_DomainThingT, _RealmT]:
+        """Get an encoder for a structural type, going through the codec cache."""
+        key = cast(_CodecCacheKey, (thing_type, realm, root_type))
+        with self._codec_cache_lock:
+            cached_encoder = self._encoders_cache.get(key)
+            if cached_encoder is not None:
+                self._encoders_cache.move_to_end(key)
+                self._codec_cache_hits += 1
+                return cast(RealmEncoder[_DomainThingT, _RealmT], cached_encoder)
+            self._codec_cache_misses += 1
+
+        new_encoder = self._build_structural_encoder(thing_type, realm, root_type)
+
+        with self._codec_cache_lock:
+            self._encoders_cache[key] = cast(RealmEncoder[Thing, Realm], new_encoder)
+            if len(self._encoders_cache) > self._codec_cache_max_size:
+                self._encoders_cache.popitem(last=False)
+
+        return new_encoder
+
+    def _build_structural_encoder(
+        self,
+        thing_type: type[_DomainThingT] | ForwardRef | str,
+        realm: type[_RealmT],
+        root_type: type[DomainThing] | None,
+    ) -> RealmEncoder[_DomainThingT, _RealmT]:
+        if isinstance(thing_type, typing._GenericAlias) and thing_type.__name__ == "Literal":  # type: ignore
+            return cast(
+                RealmEncoder[_DomainThingT, _RealmT],
+                _LiteralEncoder(thing_type.__args__, realm),
+            )  # type: ignore
         elif (thing_type_origin := get_origin(thing_type)) is not None:
             if thing_type_origin is typing.Union or (
                 isinstance(thing_type_origin, type)
@@ -1967,62 +2217,46 @@ class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
                 )
             else:
                 raise EncoderNotFoundError(
-                    f"Could not find encoder for realm {realm} and thing {thing_type.__name__}"
+                    f"Could not find encoder for realm {realm} and thing {thing_type}"
                 )
         else:
             raise EncoderNotFoundError(
-                f"Could not find encoder for realm {realm} and thing {thing_type.__name__}"
+                f"Could not find encoder for realm {realm} and thing {thing_type}"
             )
 
-    def get_decoder(
+    def _get_structural_decoder(
         self,
         thing_type: type[_DomainThingT] | ForwardRef | str,
         realm: type[_RealmT],
-        root_type: type[DomainThing] | None = None,
+        root_type: type[DomainThing] | None,
+    ) -> RealmDecoder[_DomainThingT, _RealmT]:
+        """Get a decoder for a structural type, going through the codec cache."""
+        key = cast(_CodecCacheKey, (thing_type, realm, root_type))
+        with self._codec_cache_lock:
+            cached_decoder = self._decoders_cache.get(key)
+            if cached_decoder is not None:
+                self._decoders_cache.move_to_end(key)
+                self._codec_cache_hits += 1
+                return cast(RealmDecoder[_DomainThingT, _RealmT], cached_decoder)
+            self._codec_cache_misses += 1
+
+        new_decoder = self._build_structural_decoder(thing_type, realm, root_type)
+
+        with self._codec_cache_lock:
+            self._decoders_cache[key] = cast(RealmDecoder[Thing, Realm], new_decoder)
+            if len(self._decoders_cache) > self._codec_cache_max_size:
+                self._decoders_cache.popitem(last=False)
+
+        return new_decoder
+
+    def _build_structural_decoder(
+        self,
+        thing_type: type[_DomainThingT] | ForwardRef | str,
+        realm: type[_RealmT],
+        root_type: type[DomainThing] | None,
     ) -> RealmDecoder[_DomainThingT, _RealmT]:
-        """Get a codec for a realm and a thing type."""
         if isinstance(thing_type, typing._GenericAlias) and thing_type.__name__ == "Literal":  # type: ignore
             return cast(RealmDecoder[_DomainThingT, _RealmT], _LiteralDecoder(thing_type.__args__, realm))  # type: ignore
-        elif isinstance(thing_type, ForwardRef):
-            if root_type is None:
-                raise Exception("Cannot infer the type of a string without a root type")
-            if f"'{root_type.__name__}'" not in str(thing_type):
-                raise Exception(
-                    f"Recursive types are only allowed to be encoded as root types, but {thing_type} is not the root type {root_type.__name__}"
-                )
-            return self.get_decoder(
-                cast(type[_DomainThingT], root_type), realm, root_type
-            )
-        elif isinstance(thing_type, str):
-            if root_type is None:
-                raise Exception("Cannot infer the type of a string without a root type")
-            if thing_type != root_type.__name__:
-                raise Exception(
-                    f"Recursive types are only allowed to be encoded as root types, but {thing_type} is not the root type {root_type.__name__}"
-                )
-            return self.get_decoder(
-                cast(type[_DomainThingT], root_type), realm, root_type
-            )
-        elif is_thing_ish_type(thing_type):
-            if (thing_type, realm) not in self._decoders_registry:
-                if (thing_type, DatabaseRealm) not in self._decoders_registry:
-                    raise DecoderNotFoundError(
-                        f"Could not find decoder for realm {realm} and thing {thing_type.__name__}"
-                    )
-                return cast(
-                    RealmDecoder[_DomainThingT, _RealmT],
-                    self._decoders_registry[
-                        cast(
-                            tuple[type[Thing], type[Realm]], (thing_type, DatabaseRealm)
-                        )
-                    ],
-                )
-            return cast(
-                RealmDecoder[_DomainThingT, _RealmT],
-                self._decoders_registry[
-                    cast(tuple[type[Thing], type[Realm]], (thing_type, realm))
-                ],
-            )
         elif (thing_type_origin := get_origin(thing_type)) is not None:
             if thing_type_origin is typing.Union or (
                 isinstance(thing_type_origin, type)
@@ -2098,11 +2332,11 @@ class ModuleExplorerRealmCodecRegistry(RealmCodecRegistry):
                 )
             else:
                 raise DecoderNotFoundError(
-                    f"Could not find decoder for realm {realm} and thing {thing_type.__name__}"
+                    f"Could not find decoder for realm {realm} and thing {thing_type}"
                 )
         else:
             raise DecoderNotFoundError(
-                f"Could not find decoder for realm {realm} and thing {thing_type.__name__}"
+                f"Could not find decoder for realm {realm} and thing {thing_type}"
             )
 
     def _has_encoder(
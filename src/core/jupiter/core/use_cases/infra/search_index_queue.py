@@ -0,0 +1,249 @@
+"""A queue of search index changes, applied in batches off the request path."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+from jupiter.core.domain.named_entity_tag import NamedEntityTag
+from jupiter.core.domain.storage_engine import SearchStorageEngine
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.entity import CrownEntity
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_COALESCE_DELAY_SECS: Final[float] = 0.05
+DEFAULT_RETRY_DELAY_SECS: Final[float] = 1.0
+MAX_RETRY_DELAY_SECS: Final[float] = 60.0
+DEFAULT_MAX_ATTEMPTS: Final[int] = 8
+
+
+@dataclass(frozen=True)
+class _PendingChange:
+    entity: CrownEntity
+    remove: bool
+
+
+_ChangeKey = tuple[EntityId, NamedEntityTag, EntityId]
+
+
+class SearchIndexQueue:
+    """A queue of search index changes, applied in batches off the request path.
+
+    Mutations enqueue the entities they created, updated or removed. A
+    background worker waits a little for more changes to arrive, keeps only
+    the last change for each entity, and applies what's left with a couple of
+    bulk statements per workspace.
+
+    When a batch fails, it is retried a workspace at a time, and then an
+    entity at a time for the workspaces which still fail, so one bad entity
+    doesn't hold up the rest. The entities which fail on their own are tried
+    again later, backing off, and dropped after `max_attempts` tries.
+    """
+
+    _search_storage_engine: Final[SearchStorageEngine]
+    _coalesce_delay_secs: Final[float]
+    _retry_delay_secs: Final[float]
+    _max_attempts: Final[int]
+    _pending: dict[_ChangeKey, _PendingChange]
+    _attempts: Final[dict[_ChangeKey, int]]
+    _failed_batches_in_a_row: int
+    _apply_lock: Final[asyncio.Lock]
+    _wake_up: Final[asyncio.Event]
+    _stopping: Final[asyncio.Event]
+    _worker: asyncio.Task[None] | None
+
+    def __init__(
+        self,
+        search_storage_engine: SearchStorageEngine,
+        coalesce_delay_secs: float = DEFAULT_COALESCE_DELAY_SECS,
+        retry_delay_secs: float = DEFAULT_RETRY_DELAY_SECS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        """Constructor."""
+        self._search_storage_engine = search_storage_engine
+        self._coalesce_delay_secs = coalesce_delay_secs
+        self._retry_delay_secs = retry_delay_secs
+        self._max_attempts = max_attempts
+        self._pending = {}
+        self._attempts = {}
+        self._failed_batches_in_a_row = 0
+        self._apply_lock = asyncio.Lock()
+        self._wake_up = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._worker = None
+
+    def start(self) -> None:
+        """Start applying changes in the background."""
+        if self._worker is None:
+            self._stopping.clear()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background worker, after applying everything still queued."""
+        if self._worker is not None:
+            # The worker finishes the batch it is on, if any, and exits, rather
+            # than being cancelled halfway through a transaction.
+            self._stopping.set()
+            self._wake_up.set()
+            await self._worker
+            self._worker = None
+        await self.flush()
+
+    def enqueue(
+        self,
+        workspace_ref_id: EntityId,
+        upserted: Iterable[CrownEntity],
+        removed: Iterable[CrownEntity],
+    ) -> None:
+        """Queue up changes to the index for a workspace."""
+        for entity in upserted:
+            self._replace(workspace_ref_id, entity, remove=False)
+        for entity in removed:
+            self._replace(workspace_ref_id, entity, remove=True)
+        self._wake_up.set()
+
+    async def flush(self) -> None:
+        """Apply every change queued so far, and wait for it to land.
+
+        This includes a batch the worker is applying right now, which is
+        why the loop also waits on the apply lock. Changes which keep failing
+        are retried without backing off, so this ends after at most
+        `max_attempts` rounds.
+        """
+        while len(self._pending) > 0 or self._apply_lock.locked():
+            await self._apply_pending()
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            await self._wake_up.wait()
+            self._wake_up.clear()
+            # Waiting to coalesce changes, or backing off, ends early on stop.
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self._next_delay_secs()
+                )
+            try:
+                await self._apply_pending()
+            except Exception:
+                LOGGER.exception("Failed to apply search index changes")
+
+    def _next_delay_secs(self) -> float:
+        if self._failed_batches_in_a_row == 0:
+            return self._coalesce_delay_secs
+        return min(
+            self._retry_delay_secs * 2.0 ** (self._failed_batches_in_a_row - 1),
+            MAX_RETRY_DELAY_SECS,
+        )
+
+    async def _apply_pending(self) -> None:
+        async with self._apply_lock:
+            batch, self._pending = self._pending, {}
+            if len(batch) == 0:
+                return
+
+            try:
+                failed = await self._apply_with_fallbacks(batch)
+            except BaseException:
+                # Put the batch back, unless a newer change for the same entity
+                # came in the meantime. This covers being cancelled too.
+                for key, change in batch.items():
+                    self._pending.setdefault(key, change)
+                self._wake_up.set()
+                raise
+
+            for key in batch.keys() - failed.keys():
+                self._attempts.pop(key, None)
+            self._park(failed)
+
+    async def _apply_with_fallbacks(
+        self, batch: dict[_ChangeKey, _PendingChange]
+    ) -> dict[_ChangeKey, _PendingChange]:
+        """Apply a batch, falling back to smaller pieces of it, and return what failed."""
+        try:
+            await self._apply(batch)
+            return {}
+        except Exception:  # noqa: BLE001
+            LOGGER.warning(
+                "Failed to apply a batch of search index changes, retrying it piecewise",
+                exc_info=True,
+            )
+
+        by_workspace: dict[EntityId, dict[_ChangeKey, _PendingChange]] = {}
+        for key, change in batch.items():
+            by_workspace.setdefault(key[0], {})[key] = change
+
+        failed: dict[_ChangeKey, _PendingChange] = {}
+        for workspace_batch in by_workspace.values():
+            try:
+                await self._apply(workspace_batch)
+            except Exception:  # noqa: BLE001
+                failed.update(await self._apply_one_by_one(workspace_batch))
+        return failed
+
+    async def _apply_one_by_one(
+        self, batch: dict[_ChangeKey, _PendingChange]
+    ) -> dict[_ChangeKey, _PendingChange]:
+        failed: dict[_ChangeKey, _PendingChange] = {}
+        for key, change in batch.items():
+            try:
+                await self._apply({key: change})
+            except Exception:  # noqa: BLE001
+                LOGGER.warning(
+                    "Failed to apply the search index change for %s",
+                    key,
+                    exc_info=True,
+                )
+                failed[key] = change
+        return failed
+
+    async def _apply(self, batch: dict[_ChangeKey, _PendingChange]) -> None:
+        upserted: dict[EntityId, list[CrownEntity]] = {}
+        removed: dict[EntityId, list[CrownEntity]] = {}
+        for (workspace_ref_id, _, _), change in batch.items():
+            target = removed if change.remove else upserted
+            target.setdefault(workspace_ref_id, []).append(change.entity)
+
+        async with self._search_storage_engine.get_unit_of_work() as uow:
+            for workspace_ref_id, entities in removed.items():
+                await uow.search_repository.remove_many(workspace_ref_id, entities)
+            for workspace_ref_id, entities in upserted.items():
+                await uow.search_repository.upsert_many(workspace_ref_id, entities)
+
+    def _park(self, failed: dict[_ChangeKey, _PendingChange]) -> None:
+        """Queue the changes which failed to be tried again, or drop those out of tries."""
+        if len(failed) == 0:
+            self._failed_batches_in_a_row = 0
+            return
+
+        self._failed_batches_in_a_row += 1
+        for key, change in failed.items():
+            if key in self._pending:
+                # A newer change for the same entity came in the meantime,
+                # and it gets its own tries.
+                continue
+            attempts = self._attempts.get(key, 0) + 1
+            if attempts >= self._max_attempts:
+                LOGGER.error(
+                    "Dropping the search index change for %s after %d attempts",
+                    key,
+                    attempts,
+                )
+                self._attempts.pop(key, None)
+                continue
+            self._attempts[key] = attempts
+            self._pending[key] = change
+        self._wake_up.set()
+
+    def _replace(
+        self, workspace_ref_id: EntityId, entity: CrownEntity, remove: bool
+    ) -> None:
+        key = self._key(workspace_ref_id, entity)
+        self._pending[key] = _PendingChange(entity=entity, remove=remove)
+        self._attempts.pop(key, None)
+
+    @staticmethod
+    def _key(workspace_ref_id: EntityId, entity: CrownEntity) -> _ChangeKey:
+        return (workspace_ref_id, NamedEntityTag.from_entity(entity), entity.ref_id)
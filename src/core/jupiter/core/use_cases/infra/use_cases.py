@@ -1,7 +1,11 @@
 """jupiter specific use cases classes."""
 
 import abc
-from collections.abc import Callable
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any, Final, Generic, TypeVar, Union
 
@@ -19,6 +23,7 @@ from jupiter.core.domain.concept.auth.auth_token import (
 )
 from jupiter.core.domain.concept.auth.auth_token_ext import AuthTokenExt
 from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.schedule.ical_fetcher import ICalFetcher
 from jupiter.core.domain.concept.user.user import User
 from jupiter.core.domain.concept.user_workspace_link.user_workspace_link import (
     UserWorkspaceLinkRepository,
@@ -36,6 +41,7 @@ from jupiter.core.domain.storage_engine import (
     DomainStorageEngine,
     DomainUnitOfWork,
     SearchStorageEngine,
+    SearchUnitOfWork,
 )
 from jupiter.core.framework import use_case as uc
 from jupiter.core.framework.base.entity_id import EntityId
@@ -54,6 +60,10 @@ from jupiter.core.framework.use_case import (
     UseCaseSessionBase,
 )
 from jupiter.core.framework.use_case_io import UseCaseArgsBase, UseCaseResultBase
+from jupiter.core.use_cases.infra.logged_in_context_cache import (
+    LoggedInContextCache,
+)
+from jupiter.core.use_cases.infra.search_index_queue import SearchIndexQueue
 from jupiter.core.use_cases.infra.storage_engine import UseCaseStorageEngine
 from jupiter.core.utils.global_properties import GlobalProperties
 from jupiter.core.utils.time_provider import TimeProvider
@@ -194,6 +204,26 @@ class AppGuestMutationUseCase(
         )
 
 
+class _ReadOnlyDomainStorageEngine(DomainStorageEngine):
+    """A domain storage engine which only hands out units of work that can read."""
+
+    _inner: Final[DomainStorageEngine]
+
+    def __init__(self, inner: DomainStorageEngine) -> None:
+        """Constructor."""
+        self._inner = inner
+
+    def get_unit_of_work(self) -> AbstractAsyncContextManager[DomainUnitOfWork]:
+        """Build a unit of work which can only read."""
+        return self._inner.get_read_unit_of_work()
+
+    def get_read_unit_of_work(
+        self,
+    ) -> AbstractAsyncContextManager[DomainUnitOfWork]:
+        """Build a unit of work which can only read."""
+        return self._inner.get_read_unit_of_work()
+
+
 @dataclass(frozen=True)
 class AppGuestReadonlyUseCaseContext(AppGuestUseCaseContext):
     """The applicatin context to use for guest-OK interactions."""
@@ -231,7 +261,9 @@ class AppGuestReadonlyUseCase(
         self._global_properties = global_properties
         self._time_provider = time_provider
         self._auth_token_stamper = auth_token_stamper
-        self._domain_storage_engine = domain_storage_engine
+        self._domain_storage_engine = _ReadOnlyDomainStorageEngine(
+            domain_storage_engine
+        )
         self._search_storage_engine = search_storage_engine
 
     async def _build_context(
@@ -320,6 +352,45 @@ class AppLoggedInMutationUseCaseContext(AppLoggedInUseCaseContext):
     domain_context: DomainContext
 
 
+async def _load_user_and_workspace(
+    domain_storage_engine: DomainStorageEngine,
+    logged_in_context_cache: LoggedInContextCache | None,
+    user_ref_id: EntityId,
+) -> tuple[User, Workspace]:
+    async with domain_storage_engine.get_read_unit_of_work() as uow:
+        if logged_in_context_cache is not None:
+
+            async def load_versions(
+                user_ref_id: EntityId, workspace_ref_id: EntityId
+            ) -> tuple[int | None, int | None]:
+                return (
+                    await uow.get_for(User).load_version_optional(user_ref_id),
+                    await uow.get_for(Workspace).load_version_optional(
+                        workspace_ref_id
+                    ),
+                )
+
+            # Writers bump the versions, so checking them is enough to
+            # know the cached entities are current.
+            cached = await logged_in_context_cache.get_if_current(
+                user_ref_id, load_versions
+            )
+            if cached is not None:
+                return cached
+
+        user = await uow.get_for(User).load_by_id(user_ref_id)
+        user_workspace_link = await uow.get(UserWorkspaceLinkRepository).load_by_user(
+            user_ref_id
+        )
+        workspace = await uow.get_for(Workspace).load_by_id(
+            user_workspace_link.workspace_ref_id
+        )
+
+    if logged_in_context_cache is not None:
+        logged_in_context_cache.put(user, workspace)
+    return user, workspace
+
+
 class AppLoggedInMutationUseCase(
     Generic[UseCaseArgs, UseCaseResult],
     MutationUseCase[
@@ -338,6 +409,9 @@ class AppLoggedInMutationUseCase(
     _search_storage_engine: Final[SearchStorageEngine]
     _use_case_storage_engine: Final[UseCaseStorageEngine]
     _crm: Final[CRM]
+    _ical_fetcher: Final[ICalFetcher]
+    _logged_in_context_cache: Final[LoggedInContextCache | None]
+    _search_index_queue: Final[SearchIndexQueue | None]
 
     @staticmethod
     def get_scoped_to_feature() -> FeatureScope:
@@ -368,6 +442,9 @@ class AppLoggedInMutationUseCase(
         search_storage_engine: SearchStorageEngine,
         use_case_storage_engine: UseCaseStorageEngine,
         crm: CRM,
+        ical_fetcher: ICalFetcher,
+        logged_in_context_cache: LoggedInContextCache | None = None,
+        search_index_queue: SearchIndexQueue | None = None,
     ) -> None:
         """Constructor."""
         super().__init__(
@@ -382,6 +459,9 @@ class AppLoggedInMutationUseCase(
         self._search_storage_engine = search_storage_engine
         self._use_case_storage_engine = use_case_storage_engine
         self._crm = crm
+        self._ical_fetcher = ical_fetcher
+        self._logged_in_context_cache = logged_in_context_cache
+        self._search_index_queue = search_index_queue
 
     async def _build_context(
         self, session: AppLoggedInUseCaseSession
@@ -389,44 +469,41 @@ class AppLoggedInMutationUseCase(
         auth_token = self._auth_token_stamper.verify_auth_token_general(
             session.auth_token_ext
         )
-        async with self._domain_storage_engine.get_unit_of_work() as uow:
-            user = await uow.get_for(User).load_by_id(auth_token.user_ref_id)
-            user_workspace_link = await uow.get(
-                UserWorkspaceLinkRepository
-            ).load_by_user(auth_token.user_ref_id)
-            workspace = await uow.get_for(Workspace).load_by_id(
-                user_workspace_link.workspace_ref_id
-            )
+        user, workspace = await _load_user_and_workspace(
+            self._domain_storage_engine,
+            self._logged_in_context_cache,
+            auth_token.user_ref_id,
+        )
 
-            scoped_feature = self.get_scoped_to_feature()
-            if scoped_feature is not None:
-                if isinstance(scoped_feature, UserFeature):
-                    if not user.is_feature_available(scoped_feature):
-                        raise FeatureUnavailableError(scoped_feature)
-                elif isinstance(scoped_feature, WorkspaceFeature):
-                    if not workspace.is_feature_available(scoped_feature):
-                        raise FeatureUnavailableError(scoped_feature)
-                else:
-                    for feature in scoped_feature:
-                        if isinstance(feature, UserFeature):
-                            if not user.is_feature_available(feature):
-                                raise FeatureUnavailableError(feature)
-                        elif isinstance(feature, WorkspaceFeature):
-                            if not workspace.is_feature_available(feature):
-                                raise FeatureUnavailableError(feature)
-
-            return AppLoggedInMutationUseCaseContext(
-                user=user,
-                workspace=workspace,
-                domain_context=DomainContext.from_app(
-                    session.app_client_version,
-                    session.app_core,
-                    session.app_shell,
-                    session.app_platform,
-                    session.app_distribution,
-                    self._time_provider.get_current_time(),
-                ),
-            )
+        scoped_feature = self.get_scoped_to_feature()
+        if scoped_feature is not None:
+            if isinstance(scoped_feature, UserFeature):
+                if not user.is_feature_available(scoped_feature):
+                    raise FeatureUnavailableError(scoped_feature)
+            elif isinstance(scoped_feature, WorkspaceFeature):
+                if not workspace.is_feature_available(scoped_feature):
+                    raise FeatureUnavailableError(scoped_feature)
+            else:
+                for feature in scoped_feature:
+                    if isinstance(feature, UserFeature):
+                        if not user.is_feature_available(feature):
+                            raise FeatureUnavailableError(feature)
+                    elif isinstance(feature, WorkspaceFeature):
+                        if not workspace.is_feature_available(feature):
+                            raise FeatureUnavailableError(feature)
+
+        return AppLoggedInMutationUseCaseContext(
+            user=user,
+            workspace=workspace,
+            domain_context=DomainContext.from_app(
+                session.app_client_version,
+                session.app_core,
+                session.app_shell,
+                session.app_platform,
+                session.app_distribution,
+                self._time_provider.get_current_time(),
+            ),
+        )
 
     async def _execute(
         self,
@@ -438,20 +515,22 @@ class AppLoggedInMutationUseCase(
         result = await self._perform_mutation(progress_reporter, context, args)
 
         # Register all entities that were created/changed/removed with the search index.
-        async with self._search_storage_engine.get_unit_of_work() as uow:
-            for created_entity in progress_reporter.created_entities:
-                await uow.search_repository.upsert(
-                    context.workspace_ref_id, created_entity
-                )
-
-            for updated_entity in progress_reporter.updated_entities:
-                await uow.search_repository.upsert(
-                    context.workspace_ref_id, updated_entity
+        upserted = [
+            *progress_reporter.created_entities,
+            *progress_reporter.updated_entities,
+        ]
+        removed = list(progress_reporter.removed_entities)
+        if self._search_index_queue is not None:
+            self._search_index_queue.enqueue(
+                context.workspace_ref_id, upserted, removed
+            )
+        else:
+            async with self._search_storage_engine.get_unit_of_work() as uow:
+                await uow.search_repository.upsert_many(
+                    context.workspace_ref_id, upserted
                 )
-
-            for removed_entity in progress_reporter.removed_entities:
-                await uow.search_repository.remove(
-                    context.workspace_ref_id, removed_entity
+                await uow.search_repository.remove_many(
+                    context.workspace_ref_id, removed
                 )
 
         return result
@@ -529,6 +608,7 @@ class AppLoggedInReadonlyUseCase(
     _auth_token_stamper: Final[AuthTokenStamper]
     _domain_storage_engine: Final[DomainStorageEngine]
     _search_storage_engine: Final[SearchStorageEngine]
+    _logged_in_context_cache: Final[LoggedInContextCache | None]
 
     @staticmethod
     def get_scoped_to_feature() -> FeatureScope:
@@ -553,14 +633,18 @@ class AppLoggedInReadonlyUseCase(
         auth_token_stamper: AuthTokenStamper,
         domain_storage_engine: DomainStorageEngine,
         search_storage_engine: SearchStorageEngine,
+        logged_in_context_cache: LoggedInContextCache | None = None,
     ) -> None:
         """Constructor."""
         super().__init__(realm_codec_registry)
         self._global_properties = global_properties
         self._time_provider = time_provider
         self._auth_token_stamper = auth_token_stamper
-        self._domain_storage_engine = domain_storage_engine
+        self._domain_storage_engine = _ReadOnlyDomainStorageEngine(
+            domain_storage_engine
+        )
         self._search_storage_engine = search_storage_engine
+        self._logged_in_context_cache = logged_in_context_cache
 
     async def _build_context(
         self, session: AppLoggedInUseCaseSession
@@ -568,33 +652,30 @@ class AppLoggedInReadonlyUseCase(
         auth_token = self._auth_token_stamper.verify_auth_token_general(
             session.auth_token_ext
         )
-        async with self._domain_storage_engine.get_unit_of_work() as uow:
-            user = await uow.get_for(User).load_by_id(auth_token.user_ref_id)
-            user_workspace_link = await uow.get(
-                UserWorkspaceLinkRepository
-            ).load_by_user(auth_token.user_ref_id)
-            workspace = await uow.get_for(Workspace).load_by_id(
-                user_workspace_link.workspace_ref_id
-            )
+        user, workspace = await _load_user_and_workspace(
+            self._domain_storage_engine,
+            self._logged_in_context_cache,
+            auth_token.user_ref_id,
+        )
 
-            scoped_feature = self.get_scoped_to_feature()
-            if scoped_feature is not None:
-                if isinstance(scoped_feature, UserFeature):
-                    if not user.is_feature_available(scoped_feature):
-                        raise FeatureUnavailableError(scoped_feature)
-                elif isinstance(scoped_feature, WorkspaceFeature):
-                    if not workspace.is_feature_available(scoped_feature):
-                        raise FeatureUnavailableError(scoped_feature)
-                else:
-                    for feature in scoped_feature:
-                        if isinstance(feature, UserFeature):
-                            if not user.is_feature_available(feature):
-                                raise FeatureUnavailableError(feature)
-                        elif isinstance(feature, WorkspaceFeature):
-                            if not workspace.is_feature_available(feature):
-                                raise FeatureUnavailableError(feature)
-
-            return AppLoggedInReadonlyUseCaseContext(user=user, workspace=workspace)
+        scoped_feature = self.get_scoped_to_feature()
+        if scoped_feature is not None:
+            if isinstance(scoped_feature, UserFeature):
+                if not user.is_feature_available(scoped_feature):
+                    raise FeatureUnavailableError(scoped_feature)
+            elif isinstance(scoped_feature, WorkspaceFeature):
+                if not workspace.is_feature_available(scoped_feature):
+                    raise FeatureUnavailableError(scoped_feature)
+            else:
+                for feature in scoped_feature:
+                    if isinstance(feature, UserFeature):
+                        if not user.is_feature_available(feature):
+                            raise FeatureUnavailableError(feature)
+                    elif isinstance(feature, WorkspaceFeature):
+                        if not workspace.is_feature_available(feature):
+                            raise FeatureUnavailableError(feature)
+
+        return AppLoggedInReadonlyUseCaseContext(user=user, workspace=workspace)
 
 
 class AppTransactionalLoggedInReadOnlyUseCase(
@@ -623,6 +704,108 @@ class AppTransactionalLoggedInReadOnlyUseCase(
         """Execute the command's action."""
 
 
+DEFAULT_WORKSPACE_CONCURRENCY: Final[int] = 4
+
+
+@dataclass(frozen=True)
+class WorkspaceRunOutcome:
+    """How processing a single workspace went for a background use case."""
+
+    workspace_ref_id: EntityId
+    duration_secs: float
+    error: Exception | None
+
+
+class WorkspaceRunsFailedError(Exception):
+    """Raised when a background use case failed for some of the workspaces."""
+
+    failed_outcomes: Final[list[WorkspaceRunOutcome]]
+
+    def __init__(self, failed_outcomes: list[WorkspaceRunOutcome]) -> None:
+        """Constructor."""
+        super().__init__(
+            f"Failed for workspaces {', '.join(str(o.workspace_ref_id) for o in failed_outcomes)}"
+        )
+        self.failed_outcomes = failed_outcomes
+
+
+class _SerializedTransactions:
+    """Lets only one transaction at a time through, as SQLite has a single writer.
+
+    A task which already holds the lock can open nested units of work freely.
+    """
+
+    _lock: Final[asyncio.Lock]
+    _holds_lock: Final[ContextVar[bool]]
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._lock = asyncio.Lock()
+        self._holds_lock = ContextVar("holds_lock", default=False)
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        """Hold the right to run a transaction."""
+        if self._holds_lock.get():
+            yield
+            return
+        async with self._lock:
+            token = self._holds_lock.set(True)
+            try:
+                yield
+            finally:
+                self._holds_lock.reset(token)
+
+
+class _SerializedDomainStorageEngine(DomainStorageEngine):
+    """A domain storage engine whose units of work run one at a time."""
+
+    _inner: Final[DomainStorageEngine]
+    _transactions: Final[_SerializedTransactions]
+
+    def __init__(
+        self, inner: DomainStorageEngine, transactions: _SerializedTransactions
+    ) -> None:
+        """Constructor."""
+        self._inner = inner
+        self._transactions = transactions
+
+    @asynccontextmanager
+    async def get_unit_of_work(self) -> AsyncIterator[DomainUnitOfWork]:
+        """Build a unit of work."""
+        async with self._transactions.hold():
+            async with self._inner.get_unit_of_work() as uow:
+                yield uow
+
+    def get_read_unit_of_work(
+        self,
+    ) -> AbstractAsyncContextManager[DomainUnitOfWork]:
+        """Build a unit of work which can only read."""
+        # Readers don't contend with the writer, so they skip the lock.
+        return self._inner.get_read_unit_of_work()
+
+
+class _SerializedSearchStorageEngine(SearchStorageEngine):
+    """A search storage engine whose units of work run one at a time."""
+
+    _inner: Final[SearchStorageEngine]
+    _transactions: Final[_SerializedTransactions]
+
+    def __init__(
+        self, inner: SearchStorageEngine, transactions: _SerializedTransactions
+    ) -> None:
+        """Constructor."""
+        self._inner = inner
+        self._transactions = transactions
+
+    @asynccontextmanager
+    async def get_unit_of_work(self) -> AsyncIterator[SearchUnitOfWork]:
+        """Build a unit of work."""
+        async with self._transactions.hold():
+            async with self._inner.get_unit_of_work() as uow:
+                yield uow
+
+
 class SysBackgroundMutationUseCase(
     Generic[UseCaseArgs, UseCaseResult],
     UseCase[EmptySession, EmptyContext, UseCaseArgs, UseCaseResult],
@@ -630,29 +813,40 @@ class SysBackgroundMutationUseCase(
 ):
     """A command which does some sort of mutation for the app in the background."""
 
+    _global_properties: Final[GlobalProperties]
     _time_provider: Final[TimeProvider]
     _realm_codec_registry: Final[RealmCodecRegistry]
     _progress_reporter_factory: ProgressReporterFactory[EmptyContext]
     _domain_storage_engine: Final[DomainStorageEngine]
     _search_storage_engine: Final[SearchStorageEngine]
     _crm: Final[CRM]
+    _ical_fetcher: Final[ICalFetcher]
+    _workspace_concurrency: Final[int]
 
     def __init__(
         self,
+        global_properties: GlobalProperties,
         time_provider: TimeProvider,
         realm_codec_registry: RealmCodecRegistry,
         progress_reporter_factory: ProgressReporterFactory[EmptyContext],
         domain_storage_engine: DomainStorageEngine,
         search_storage_engine: SearchStorageEngine,
         crm: CRM,
+        ical_fetcher: ICalFetcher,
+        workspace_concurrency: int = DEFAULT_WORKSPACE_CONCURRENCY,
     ) -> None:
         """Constructor."""
+        if workspace_concurrency < 1:
+            raise Exception("Workspace concurrency must be at least 1")
+        self._global_properties = global_properties
         self._time_provider = time_provider
         self._realm_codec_registry = realm_codec_registry
         self._progress_reporter_factory = progress_reporter_factory
         self._domain_storage_engine = domain_storage_engine
         self._search_storage_engine = search_storage_engine
         self._crm = crm
+        self._ical_fetcher = ical_fetcher
+        self._workspace_concurrency = workspace_concurrency
 
     async def _build_context(self, session: EmptySession) -> EmptyContext:
         """Construct the context for the use case."""
@@ -680,6 +874,67 @@ class SysBackgroundMutationUseCase(
     ) -> UseCaseResult:
         """Execute the command's action."""
 
+    async def _for_each_workspace(
+        self,
+        workspaces: list[Workspace],
+        do_for_workspace: Callable[
+            [Workspace, DomainStorageEngine, SearchStorageEngine], Awaitable[None]
+        ],
+    ) -> None:
+        """Run an action for every workspace, with several workspaces in flight at once.
+
+        The action should use the storage engines it is given. Their units of
+        work are serialised, but read units of work are not, so one workspace's
+        transactions overlap with the loading and planning other workspaces do
+        in read units of work. A failing workspace does not stop the others,
+        but the use case still fails once all of them are done.
+        """
+        transactions = _SerializedTransactions()
+        domain_storage_engine = _SerializedDomainStorageEngine(
+            self._domain_storage_engine, transactions
+        )
+        search_storage_engine = _SerializedSearchStorageEngine(
+            self._search_storage_engine, transactions
+        )
+        semaphore = asyncio.Semaphore(self._workspace_concurrency)
+
+        async def run_for_workspace(workspace: Workspace) -> WorkspaceRunOutcome:
+            async with semaphore:
+                start = time.perf_counter()
+                error: Exception | None = None
+                try:
+                    await do_for_workspace(
+                        workspace, domain_storage_engine, search_storage_engine
+                    )
+                # One workspace's failure must not stop the others. It is
+                # logged here and re-raised for all of them once they are done.
+                except Exception as err:  # noqa: BLE001
+                    uc.LOGGER.exception(
+                        f"Background mutation command {self.__class__.__name__} failed for workspace {workspace.ref_id}"
+                    )
+                    error = err
+                duration_secs = time.perf_counter() - start
+                uc.LOGGER.info(
+                    f"Background mutation command {self.__class__.__name__} took {duration_secs:.3f}s for workspace {workspace.ref_id}"
+                )
+                return WorkspaceRunOutcome(
+                    workspace_ref_id=workspace.ref_id,
+                    duration_secs=duration_secs,
+                    error=error,
+                )
+
+        outcomes = await asyncio.gather(
+            *(run_for_workspace(workspace) for workspace in workspaces)
+        )
+
+        failed_outcomes = [o for o in outcomes if o.error is not None]
+        slowest_secs = max((o.duration_secs for o in outcomes), default=0.0)
+        uc.LOGGER.info(
+            f"Background mutation command {self.__class__.__name__} ran for {len(outcomes)} workspaces, {len(failed_outcomes)} failed, slowest took {slowest_secs:.3f}s"
+        )
+        if len(failed_outcomes) > 0:
+            raise WorkspaceRunsFailedError(failed_outcomes)
+
 
 _MutationUseCaseT = TypeVar("_MutationUseCaseT", bound=AppLoggedInMutationUseCase[Any, Any])  # type: ignore
 
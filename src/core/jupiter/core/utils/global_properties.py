@@ -31,6 +31,13 @@ class GlobalProperties:
     wix_api_key: str
     wix_account_id: str
     wix_site_id: str
+    cron_workspace_concurrency: int
+    logged_in_context_cache_ttl_secs: float
+    event_compact_after_days: int | None
+    event_compact_version_window: int
+    event_archive_after_days: int | None
+    event_archive_db_path: Path | None
+    event_retention_batch_size: int
 
     @property
     def sync_sqlite_db_url(self) -> str:
@@ -76,6 +83,26 @@ def build_global_properties() -> GlobalProperties:
     wix_api_key = cast(str, os.getenv("WIX_API_KEY"))
     wix_account_id = cast(str, os.getenv("WIX_ACCOUNT_ID"))
     wix_site_id = cast(str, os.getenv("WIX_SITE_ID"))
+    # Only the webapi runs the crons, so the other apps can go with the default.
+    cron_workspace_concurrency = int(os.getenv("CRON_WORKSPACE_CONCURRENCY", "4"))
+    logged_in_context_cache_ttl_secs = float(
+        os.getenv("LOGGED_IN_CONTEXT_CACHE_TTL_SECS", "10")
+    )
+    # Leaving either of the day counts empty turns that part of retention off.
+    raw_event_compact_after_days = os.getenv("EVENT_COMPACT_AFTER_DAYS", "90")
+    event_compact_after_days = (
+        int(raw_event_compact_after_days) if raw_event_compact_after_days else None
+    )
+    event_compact_version_window = int(os.getenv("EVENT_COMPACT_VERSION_WINDOW", "50"))
+    raw_event_archive_after_days = os.getenv("EVENT_ARCHIVE_AFTER_DAYS", "")
+    event_archive_after_days = (
+        int(raw_event_archive_after_days) if raw_event_archive_after_days else None
+    )
+    raw_event_archive_db_path = os.getenv("EVENT_ARCHIVE_DB_PATH", "")
+    event_archive_db_path = (
+        Path(raw_event_archive_db_path) if raw_event_archive_db_path else None
+    )
+    event_retention_batch_size = int(os.getenv("EVENT_RETENTION_BATCH_SIZE", "200"))
 
     if not alembic_ini_path.is_absolute():
         alembic_ini_path = find_up_the_dir_tree(alembic_ini_path)
@@ -98,4 +125,11 @@ def build_global_properties() -> GlobalProperties:
         wix_api_key=wix_api_key,
         wix_account_id=wix_account_id,
         wix_site_id=wix_site_id,
+        cron_workspace_concurrency=cron_workspace_concurrency,
+        logged_in_context_cache_ttl_secs=logged_in_context_cache_ttl_secs,
+        event_compact_after_days=event_compact_after_days,
+        event_compact_version_window=event_compact_version_window,
+        event_archive_after_days=event_archive_after_days,
+        event_archive_db_path=event_archive_db_path,
+        event_retention_batch_size=event_retention_batch_size,
     )
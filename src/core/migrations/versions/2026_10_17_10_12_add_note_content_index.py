@@ -0,0 +1,36 @@
+"""Add note content index
+
+Revision ID: b46d268f783c
+Revises: 7d744f5e0d53
+Create Date: 2026-10-17 10:12:41.305912
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b46d268f783c"
+down_revision = "7d744f5e0d53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The rowid is the note's ref_id. Existing notes are indexed by running
+    # the search reindex command for each workspace.
+    op.execute(
+        """
+    CREATE VIRTUAL TABLE note_content_index USING fts5(
+        note_collection_ref_id UNINDEXED,
+        domain UNINDEXED,
+        source_entity_ref_id UNINDEXED,
+        content,
+        tokenize="porter unicode61 remove_diacritics 1"
+    );
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE note_content_index")
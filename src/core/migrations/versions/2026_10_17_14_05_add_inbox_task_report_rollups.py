@@ -0,0 +1,113 @@
+"""Add inbox task report rollups
+
+Revision ID: 3c9e51a7d2b4
+Revises: b46d268f783c
+Create Date: 2026-10-17 14:05:12.518204
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3c9e51a7d2b4"
+down_revision = "b46d268f783c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE inbox_task_report_rollup (
+            inbox_task_collection_ref_id INTEGER NOT NULL,
+            modified_day DATE NOT NULL,
+            event_day DATE NOT NULL,
+            project_ref_id INTEGER NOT NULL,
+            source VARCHAR NOT NULL,
+            source_entity_ref_id INTEGER NOT NULL,
+            kind VARCHAR NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (
+                inbox_task_collection_ref_id,
+                modified_day,
+                event_day,
+                project_ref_id,
+                source,
+                source_entity_ref_id,
+                kind
+            )
+        ) WITHOUT ROWID;
+    """
+    )
+    # Seed the rollups from the existing inbox tasks. This mirrors what
+    # InboxTask.report_rollups counts, and a missing source entity is 0.
+    op.execute(
+        """
+        INSERT INTO inbox_task_report_rollup
+        SELECT
+            inbox_task_collection_ref_id,
+            modified_day,
+            event_day,
+            project_ref_id,
+            source,
+            source_entity_ref_id,
+            kind,
+            count(*)
+        FROM (
+            SELECT
+                inbox_task_collection_ref_id,
+                date(last_modified_time) AS modified_day,
+                date(last_modified_time) AS event_day,
+                project_ref_id,
+                source,
+                coalesce(source_entity_ref_id, 0) AS source_entity_ref_id,
+                'touched' AS kind
+            FROM inbox_task
+            UNION ALL
+            SELECT
+                inbox_task_collection_ref_id,
+                date(last_modified_time),
+                date(created_time),
+                project_ref_id,
+                source,
+                coalesce(source_entity_ref_id, 0),
+                'created'
+            FROM inbox_task
+            UNION ALL
+            SELECT
+                inbox_task_collection_ref_id,
+                date(last_modified_time),
+                date(completed_time),
+                project_ref_id,
+                source,
+                coalesce(source_entity_ref_id, 0),
+                status
+            FROM inbox_task
+            WHERE status IN ('done', 'not-done') AND completed_time IS NOT NULL
+            UNION ALL
+            SELECT
+                inbox_task_collection_ref_id,
+                date(last_modified_time),
+                date(working_time),
+                project_ref_id,
+                source,
+                coalesce(source_entity_ref_id, 0),
+                'working'
+            FROM inbox_task
+            WHERE status IN ('in-progress', 'blocked') AND working_time IS NOT NULL
+        )
+        GROUP BY
+            inbox_task_collection_ref_id,
+            modified_day,
+            event_day,
+            project_ref_id,
+            source,
+            source_entity_ref_id,
+            kind;
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE inbox_task_report_rollup")
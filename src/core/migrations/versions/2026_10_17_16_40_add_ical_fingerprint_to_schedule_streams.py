@@ -0,0 +1,29 @@
+"""Add iCal fingerprint to schedule streams
+
+Revision ID: 5e8a0c3f91d7
+Revises: 3c9e51a7d2b4
+Create Date: 2026-10-17 16:40:27.104385
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e8a0c3f91d7"
+down_revision = "3c9e51a7d2b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("schedule_stream") as batch_op:
+        batch_op.add_column(
+            sa.Column("source_ical_fingerprint", sa.JSON, nullable=True)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("schedule_stream") as batch_op:
+        batch_op.drop_column("source_ical_fingerprint")
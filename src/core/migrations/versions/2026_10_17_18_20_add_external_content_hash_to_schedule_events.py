@@ -0,0 +1,57 @@
+"""Add external content hash to schedule events
+
+Revision ID: 8b4d2f6e1a93
+Revises: 5e8a0c3f91d7
+Create Date: 2026-10-17 18:20:51.639201
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8b4d2f6e1a93"
+down_revision = "5e8a0c3f91d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("schedule_event_in_day") as batch_op:
+        batch_op.add_column(
+            sa.Column("external_content_hash", sa.String(), nullable=True)
+        )
+    with op.batch_alter_table("schedule_event_full_days") as batch_op:
+        batch_op.add_column(
+            sa.Column("external_content_hash", sa.String(), nullable=True)
+        )
+    op.execute(
+        """
+        update schedule_external_sync_log_entry
+        set per_stream_results = (
+            select json_group_array(
+                json_set(json(result.value), '$.unchanged_events_cnt', null)
+            )
+            from json_each(schedule_external_sync_log_entry.per_stream_results) as result
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        update schedule_external_sync_log_entry
+        set per_stream_results = (
+            select json_group_array(
+                json_remove(json(result.value), '$.unchanged_events_cnt')
+            )
+            from json_each(schedule_external_sync_log_entry.per_stream_results) as result
+        )
+        """
+    )
+    with op.batch_alter_table("schedule_event_full_days") as batch_op:
+        batch_op.drop_column("external_content_hash")
+    with op.batch_alter_table("schedule_event_in_day") as batch_op:
+        batch_op.drop_column("external_content_hash")
@@ -0,0 +1,42 @@
+"""Create indices for keyset pagination
+
+Revision ID: 2c7e9a4d5b18
+Revises: 8b4d2f6e1a93
+Create Date: 2026-10-17 20:05:12.408317
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "2c7e9a4d5b18"
+down_revision = "8b4d2f6e1a93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """CREATE INDEX ix_inbox_task_keyset_pagination ON inbox_task (inbox_task_collection_ref_id, last_modified_time, ref_id);"""
+    )
+    op.execute(
+        """CREATE INDEX ix_big_plan_keyset_pagination ON big_plan (big_plan_collection_ref_id, last_modified_time, ref_id);"""
+    )
+    op.execute(
+        """CREATE INDEX ix_doc_keyset_pagination ON doc (doc_collection_ref_id, last_modified_time, ref_id);"""
+    )
+    op.execute(
+        """CREATE INDEX ix_journal_keyset_pagination ON journal (journal_collection_ref_id, last_modified_time, ref_id);"""
+    )
+    op.execute(
+        """CREATE INDEX ix_time_plan_keyset_pagination ON time_plan (time_plan_domain_ref_id, last_modified_time, ref_id);"""
+    )
+
+
+def downgrade() -> None:
+    op.execute("""DROP INDEX IF EXISTS ix_time_plan_keyset_pagination;""")
+    op.execute("""DROP INDEX IF EXISTS ix_journal_keyset_pagination;""")
+    op.execute("""DROP INDEX IF EXISTS ix_doc_keyset_pagination;""")
+    op.execute("""DROP INDEX IF EXISTS ix_big_plan_keyset_pagination;""")
+    op.execute("""DROP INDEX IF EXISTS ix_inbox_task_keyset_pagination;""")
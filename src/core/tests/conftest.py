@@ -0,0 +1,27 @@
+"""Fixtures for the tests."""
+
+from pathlib import Path
+
+import jupiter.core.domain
+import jupiter.core.use_cases
+import pytest
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+
+from tests.sqlite_storage import SqliteTestStorage
+
+
+@pytest.fixture(scope="session")
+def realm_codec_registry() -> RealmCodecRegistry:
+    """The codec registry for all the domain and use case types."""
+    return ModuleExplorerRealmCodecRegistry.build_from_module_root(
+        jupiter.core.domain, jupiter.core.use_cases
+    )
+
+
+@pytest.fixture()
+def sqlite_storage(
+    realm_codec_registry: RealmCodecRegistry, tmp_path: Path
+) -> SqliteTestStorage:
+    """A throwaway SQLite database, without any tables yet."""
+    return SqliteTestStorage(realm_codec_registry, tmp_path)
@@ -0,0 +1,234 @@
+"""Tests for recording scores, one task at a time and in bulk."""
+
+import asyncio
+import random
+from types import SimpleNamespace
+
+from jupiter.core.domain.application.gamification.score_log import ScoreLog
+from jupiter.core.domain.application.gamification.score_log_entry import ScoreLogEntry
+from jupiter.core.domain.application.gamification.score_period_best import (
+    ScorePeriodBest,
+    ScorePeriodBestRepository,
+)
+from jupiter.core.domain.application.gamification.score_stats import (
+    ScoreStats,
+    ScoreStatsRepository,
+)
+from jupiter.core.domain.application.gamification.service.record_score_service import (
+    RecordScoreService,
+)
+from jupiter.core.domain.concept.big_plans.big_plan import BigPlan
+from jupiter.core.domain.concept.big_plans.big_plan_name import BigPlanName
+from jupiter.core.domain.concept.big_plans.big_plan_status import BigPlanStatus
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTask
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.repository import EntityAlreadyExistsError
+from pendulum import UTC, DateTime
+
+_CTX = DomainContext.from_sys(
+    EventSource.STATS_CRON, Timestamp(DateTime(2024, 3, 14, 12, tzinfo=UTC))
+)
+_USER = SimpleNamespace(ref_id=EntityId("1"))
+
+
+class _ScoreLogRepository:
+    def __init__(self) -> None:
+        self.score_log = ScoreLog.new_score_log(_CTX, _USER.ref_id).assign_ref_id(
+            EntityId("1")
+        )
+
+    async def load_by_parent(self, parent_ref_id: EntityId) -> ScoreLog:
+        return self.score_log
+
+
+class _ScoreLogEntryRepository:
+    def __init__(self) -> None:
+        self.entries: dict[object, ScoreLogEntry] = {}
+
+    async def create(self, entry: ScoreLogEntry) -> ScoreLogEntry:
+        if (entry.source, entry.task_ref_id) in self.entries:
+            raise EntityAlreadyExistsError
+        self.entries[(entry.source, entry.task_ref_id)] = entry
+        return entry
+
+    async def create_many(self, entries: list[ScoreLogEntry]) -> list[ScoreLogEntry]:
+        return [await self.create(entry) for entry in entries]
+
+    async def find_all_generic(
+        self,
+        parent_ref_id: EntityId,
+        allow_archived: bool,
+        task_ref_id: list[EntityId],
+    ) -> list[ScoreLogEntry]:
+        return [e for e in self.entries.values() if e.task_ref_id in task_ref_id]
+
+
+class _RecordRepository:
+    def __init__(self) -> None:
+        self.records: dict[object, ScoreStats | ScorePeriodBest] = {}
+
+    async def load_by_key_optional(
+        self, key: object
+    ) -> ScoreStats | ScorePeriodBest | None:
+        return self.records.get(key)
+
+    async def create(
+        self, record: ScoreStats | ScorePeriodBest
+    ) -> ScoreStats | ScorePeriodBest:
+        assert record.key not in self.records
+        self.records[record.key] = record
+        return record
+
+    async def save(
+        self, record: ScoreStats | ScorePeriodBest
+    ) -> ScoreStats | ScorePeriodBest:
+        assert record.key in self.records
+        self.records[record.key] = record
+        return record
+
+    async def upsert_many(self, records: list[ScoreStats | ScorePeriodBest]) -> None:
+        for record in records:
+            self.records[record.key] = record
+
+
+class _UnitOfWork:
+    def __init__(self) -> None:
+        self.score_log_repository = _ScoreLogRepository()
+        self.score_log_entry_repository = _ScoreLogEntryRepository()
+        self.score_stats_repository = _RecordRepository()
+        self.score_period_best_repository = _RecordRepository()
+
+    def get_for(self, the_type: type) -> object:
+        return {
+            ScoreLog: self.score_log_repository,
+            ScoreLogEntry: self.score_log_entry_repository,
+        }[the_type]
+
+    def get(self, the_type: type) -> object:
+        repositories: dict[type, object] = {
+            ScoreStatsRepository: self.score_stats_repository,
+            ScorePeriodBestRepository: self.score_period_best_repository,
+        }
+        return repositories[the_type]
+
+    def scores(self) -> dict[str, object]:
+        return {
+            "entries": {
+                key: (entry.score, entry.has_lucky_puppy_bonus)
+                for key, entry in self.score_log_entry_repository.entries.items()
+            },
+            "stats": {
+                key: (r.total_score, r.inbox_task_cnt, r.big_plan_cnt)
+                for key, r in self.score_stats_repository.records.items()
+            },
+            "bests": {
+                key: (r.total_score, r.inbox_task_cnt, r.big_plan_cnt)
+                for key, r in self.score_period_best_repository.records.items()
+            },
+        }
+
+
+def _build_tasks() -> list[InboxTask | BigPlan]:
+    rnd = random.Random(42)
+    tasks: list[InboxTask | BigPlan] = []
+    for idx in range(60):
+        if idx % 10 == 9:
+            big_plan = BigPlan.new_big_plan(
+                _CTX,
+                big_plan_collection_ref_id=EntityId("1"),
+                project_ref_id=EntityId("1"),
+                name=BigPlanName(f"Big Plan {idx}"),
+                status=rnd.choice(
+                    [
+                        BigPlanStatus.DONE,
+                        BigPlanStatus.NOT_DONE,
+                        BigPlanStatus.IN_PROGRESS,
+                    ]
+                ),
+                is_key=rnd.random() < 0.3,
+                eisen=Eisen.REGULAR,
+                difficulty=rnd.choice(list(Difficulty)),
+                actionable_date=None,
+                due_date=None,
+            )
+            tasks.append(big_plan.assign_ref_id(EntityId(str(idx + 1))))
+        else:
+            inbox_task = InboxTask.new_inbox_task(
+                _CTX,
+                inbox_task_collection_ref_id=EntityId("1"),
+                name=InboxTaskName(f"Task {idx}"),
+                status=rnd.choice(
+                    [
+                        InboxTaskStatus.DONE,
+                        InboxTaskStatus.DONE,
+                        InboxTaskStatus.NOT_DONE,
+                        InboxTaskStatus.IN_PROGRESS,
+                    ]
+                ),
+                is_key=rnd.random() < 0.3,
+                eisen=Eisen.REGULAR,
+                difficulty=rnd.choice(list(Difficulty)),
+                actionable_date=None,
+                due_date=None,
+                project_ref_id=EntityId("1"),
+                big_plan_ref_id=None,
+                big_plan_project_ref_id=None,
+                big_plan_actionable_date=None,
+                big_plan_due_date=None,
+            )
+            tasks.append(inbox_task.assign_ref_id(EntityId(str(idx + 1))))
+    return tasks
+
+
+async def _record_one_by_one(
+    uow: _UnitOfWork, tasks: list[InboxTask | BigPlan]
+) -> None:
+    for task in tasks:
+        await RecordScoreService().record_task(_CTX, uow, _USER, task)  # type: ignore
+
+
+def test_recording_many_tasks_matches_recording_them_one_by_one() -> None:
+    tasks = _build_tasks()
+    one_by_one_uow = _UnitOfWork()
+    in_bulk_uow = _UnitOfWork()
+
+    # Both start out with some tasks already recorded, which are then seen again.
+    random.seed(7)
+    asyncio.run(_record_one_by_one(one_by_one_uow, tasks[:15]))
+    random.seed(7)
+    asyncio.run(_record_one_by_one(in_bulk_uow, tasks[:15]))
+
+    random.seed(11)
+    asyncio.run(_record_one_by_one(one_by_one_uow, tasks))
+    random.seed(11)
+    recorded_tasks = asyncio.run(
+        RecordScoreService().record_many_tasks(_CTX, in_bulk_uow, _USER, tasks)  # type: ignore
+    )
+
+    assert in_bulk_uow.scores() == one_by_one_uow.scores()
+    assert [t.ref_id for t in recorded_tasks] == [
+        t.ref_id for t in tasks[15:] if t.status.is_completed
+    ]
+
+
+def test_recording_many_tasks_clamps_scores_at_zero_like_one_by_one() -> None:
+    # Failing tasks first, so the totals hit zero before going up again.
+    tasks = sorted(_build_tasks(), key=lambda t: t.status.value != "not-done")
+    one_by_one_uow = _UnitOfWork()
+    in_bulk_uow = _UnitOfWork()
+
+    random.seed(3)
+    asyncio.run(_record_one_by_one(one_by_one_uow, tasks))
+    random.seed(3)
+    asyncio.run(
+        RecordScoreService().record_many_tasks(_CTX, in_bulk_uow, _USER, tasks)  # type: ignore
+    )
+
+    assert in_bulk_uow.scores() == one_by_one_uow.scores()
@@ -0,0 +1,192 @@
+"""Tests for the task generation service."""
+
+import asyncio
+from pathlib import Path
+
+import jupiter.core.domain.application.gen.service.gen_service as gen_service_module
+import pytest
+from jupiter.core.domain.application.gen.gen_log_entry import GenLogEntry
+from jupiter.core.domain.application.gen.service.gen_service import _GenWriteBatch
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTask
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.domain.sync_target import SyncTarget
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.framework.use_case import ProgressReporter
+from jupiter.core.utils.progress_reporter import NoOpProgressReporter
+from pendulum import UTC, DateTime
+from sqlalchemy import select
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_CTX = DomainContext.from_sys(
+    EventSource.GEN_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+_INBOX_TASK_COLLECTION_REF_ID = EntityId("1")
+
+_Rows = list[tuple[object, ...]]
+
+
+def _new_chore_task(name: str) -> InboxTask:
+    return InboxTask.new_inbox_task_for_chore(
+        _CTX,
+        inbox_task_collection_ref_id=_INBOX_TASK_COLLECTION_REF_ID,
+        name=InboxTaskName(name),
+        is_key=False,
+        eisen=Eisen.REGULAR,
+        difficulty=Difficulty.EASY,
+        actionable_date=None,
+        due_date=ADate.from_str("2026-10-20"),
+        project_ref_id=EntityId("1"),
+        chore_ref_id=EntityId("1"),
+        recurring_task_timeline=f"timeline-{name}",
+        recurring_task_gen_right_now=_CTX.action_timestamp,
+    )
+
+
+def _relink_chore_task(inbox_task: InboxTask) -> InboxTask:
+    return inbox_task.update_link_to_chore(
+        _CTX,
+        project_ref_id=inbox_task.project_ref_id,
+        name=InboxTaskName(f"{inbox_task.name} again"),
+        timeline=inbox_task.recurring_timeline or "",
+        is_key=True,
+        actionable_date=None,
+        due_date=ADate.from_str("2026-10-21"),
+        eisen=Eisen.IMPORTANT,
+        difficulty=Difficulty.HARD,
+    )
+
+
+def _new_gen_log_entry() -> GenLogEntry:
+    return GenLogEntry.new_log_entry(
+        _CTX,
+        gen_log_ref_id=EntityId("1"),
+        gen_even_if_not_modified=False,
+        today=ADate.from_str("2026-10-17"),
+        gen_targets=[SyncTarget.CHORES],
+        period=None,
+        filter_project_ref_ids=None,
+        filter_habit_ref_ids=None,
+        filter_chore_ref_ids=None,
+        filter_metric_ref_ids=None,
+        filter_person_ref_ids=None,
+        filter_slack_task_ref_ids=None,
+        filter_email_task_ref_ids=None,
+    )
+
+
+async def _flush_batched(
+    storage: SqliteTestStorage,
+    progress_reporter: ProgressReporter,
+    existing: InboxTask,
+    new_inbox_tasks: list[InboxTask],
+) -> GenLogEntry:
+    batch = _GenWriteBatch()
+    for inbox_task in new_inbox_tasks:
+        batch.plan_create(inbox_task)
+    batch.plan_update(_relink_chore_task(existing))
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        return await batch.flush(_CTX, uow, progress_reporter, _new_gen_log_entry())
+
+
+async def _flush_one_by_one(
+    storage: SqliteTestStorage,
+    progress_reporter: ProgressReporter,
+    existing: InboxTask,
+    new_inbox_tasks: list[InboxTask],
+) -> GenLogEntry:
+    """How generation used to write, in a unit of work for every task."""
+    gen_log_entry = _new_gen_log_entry()
+    for inbox_task in new_inbox_tasks:
+        async with storage.domain_storage_engine.get_unit_of_work() as uow:
+            inbox_task = await uow.get_for(InboxTask).create(inbox_task)
+        await progress_reporter.mark_created(inbox_task)
+        gen_log_entry = gen_log_entry.add_entity_created(_CTX, inbox_task)
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        updated = await uow.get_for(InboxTask).save(_relink_chore_task(existing))
+    await progress_reporter.mark_updated(updated)
+    return gen_log_entry.add_entity_updated(_CTX, updated)
+
+
+async def _gen(
+    storage: SqliteTestStorage, batched: bool
+) -> tuple[GenLogEntry, NoOpProgressReporter, _Rows, _Rows]:
+    await storage.create_tables(InboxTask)
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        existing = await uow.get_for(InboxTask).create(_new_chore_task("Existing"))
+    new_inbox_tasks = [_new_chore_task(name) for name in ("A", "B", "C")]
+    progress_reporter = NoOpProgressReporter()
+
+    if batched:
+        gen_log_entry = await _flush_batched(
+            storage, progress_reporter, existing, new_inbox_tasks
+        )
+    else:
+        gen_log_entry = await _flush_one_by_one(
+            storage, progress_reporter, existing, new_inbox_tasks
+        )
+
+    tables = storage.connection.metadata.tables
+    async with storage.connection.sql_engine.connect() as connection:
+        inbox_task_rows = [
+            tuple(row)
+            for row in await connection.execute(
+                select(tables["inbox_task"]).order_by(tables["inbox_task"].c.ref_id)
+            )
+        ]
+        event_table = tables["inbox_task_event"]
+        event_rows = [
+            tuple(row)
+            for row in await connection.execute(
+                select(event_table).order_by(
+                    event_table.c.owner_ref_id, event_table.c.owner_version
+                )
+            )
+        ]
+    await storage.dispose()
+    return gen_log_entry, progress_reporter, inbox_task_rows, event_rows
+
+
+def test_batched_writes_match_writing_one_entity_at_a_time(
+    tmp_path: Path,
+    realm_codec_registry: RealmCodecRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # So the creates get split across more than one chunk.
+    monkeypatch.setattr(gen_service_module, "_FLUSH_CHUNK_SIZE", 2)
+    (tmp_path / "batched").mkdir()
+    (tmp_path / "one-by-one").mkdir()
+
+    batched = asyncio.run(
+        _gen(SqliteTestStorage(realm_codec_registry, tmp_path / "batched"), True)
+    )
+    one_by_one = asyncio.run(
+        _gen(SqliteTestStorage(realm_codec_registry, tmp_path / "one-by-one"), False)
+    )
+
+    batched_entry, batched_reporter, batched_tasks, batched_events = batched
+    one_by_one_entry, one_by_one_reporter, one_by_one_tasks, one_by_one_events = (
+        one_by_one
+    )
+    assert batched_tasks == one_by_one_tasks
+    assert len(batched_tasks) == 4
+    assert batched_events == one_by_one_events
+    assert (
+        batched_entry.entity_created_records == one_by_one_entry.entity_created_records
+    )
+    assert (
+        batched_entry.entity_updated_records == one_by_one_entry.entity_updated_records
+    )
+    assert list(batched_reporter.created_entities) == list(
+        one_by_one_reporter.created_entities
+    )
+    assert list(batched_reporter.updated_entities) == list(
+        one_by_one_reporter.updated_entities
+    )
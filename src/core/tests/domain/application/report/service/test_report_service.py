@@ -0,0 +1,362 @@
+"""Tests for the domain service which constructs a report."""
+
+import asyncio
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+
+from jupiter.core.domain.application.report.report_breakdown import ReportBreakdown
+from jupiter.core.domain.application.report.report_period_result import (
+    InboxTasksSummary,
+    NestedResult,
+    ReportPeriodResult,
+)
+from jupiter.core.domain.application.report.service.report_service import (
+    ReportService,
+)
+from jupiter.core.domain.concept.big_plans.big_plan import BigPlan
+from jupiter.core.domain.concept.big_plans.big_plan_collection import BigPlanCollection
+from jupiter.core.domain.concept.chores.chore import Chore
+from jupiter.core.domain.concept.chores.chore_collection import ChoreCollection
+from jupiter.core.domain.concept.habits.habit import Habit
+from jupiter.core.domain.concept.habits.habit_collection import HabitCollection
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import (
+    InboxTask,
+    InboxTaskRepository,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_collection import (
+    InboxTaskCollection,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_source import InboxTaskSource
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.concept.metrics.metric import Metric
+from jupiter.core.domain.concept.metrics.metric_collection import MetricCollection
+from jupiter.core.domain.concept.persons.person import Person
+from jupiter.core.domain.concept.persons.person_collection import PersonCollection
+from jupiter.core.domain.concept.projects.project import Project
+from jupiter.core.domain.concept.projects.project_collection import (
+    ProjectCollection,
+)
+from jupiter.core.domain.concept.projects.project_name import ProjectName
+from jupiter.core.domain.concept.user.user import User
+from jupiter.core.domain.concept.user.user_name import UserName
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.concept.workspaces.workspace_name import WorkspaceName
+from jupiter.core.domain.core import schedules
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.domain.core.email_address import EmailAddress
+from jupiter.core.domain.core.recurring_task_period import RecurringTaskPeriod
+from jupiter.core.domain.core.schedules import Schedule
+from jupiter.core.domain.core.timezone import Timezone
+from jupiter.core.domain.features import (
+    BASIC_WORKSPACE_FEATURE_FLAGS,
+    LOCAL_WORKSPACE_FEATURE_FLAGS_CONTROLS,
+    USER_FEATURE_FLAGS_CONTROLS,
+    UserFeature,
+    WorkspaceFeature,
+)
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.entity_name import EntityName
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.update_action import UpdateAction
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_WORKSPACE_REF_ID = EntityId("1")
+_TODAY = ADate.from_str("2026-10-17")
+
+_Counts = dict[str, dict[InboxTaskSource, int]]
+
+
+def _ctx(month: int, day: int) -> DomainContext:
+    return DomainContext.from_sys(
+        EventSource.GEN_CRON, Timestamp(DateTime(2026, month, day, 12, tzinfo=UTC))
+    )
+
+
+def _new_inbox_task(
+    inbox_task_collection_ref_id: EntityId,
+    project_ref_id: EntityId,
+    name: str,
+    month: int,
+    day: int,
+) -> InboxTask:
+    return InboxTask.new_inbox_task(
+        _ctx(month, day),
+        inbox_task_collection_ref_id=inbox_task_collection_ref_id,
+        name=InboxTaskName(name),
+        status=InboxTaskStatus.NOT_STARTED,
+        is_key=False,
+        eisen=Eisen.REGULAR,
+        difficulty=Difficulty.EASY,
+        actionable_date=None,
+        due_date=None,
+        project_ref_id=project_ref_id,
+        big_plan_ref_id=None,
+        big_plan_project_ref_id=None,
+        big_plan_actionable_date=None,
+        big_plan_due_date=None,
+    )
+
+
+def _change_status(
+    inbox_task: InboxTask, month: int, day: int, status: InboxTaskStatus
+) -> InboxTask:
+    return inbox_task.update(
+        _ctx(month, day),
+        name=UpdateAction.do_nothing(),
+        status=UpdateAction.change_to(status),
+        project_ref_id=UpdateAction.do_nothing(),
+        big_plan_ref_id=UpdateAction.do_nothing(),
+        is_key=UpdateAction.do_nothing(),
+        actionable_date=UpdateAction.do_nothing(),
+        due_date=UpdateAction.do_nothing(),
+        eisen=UpdateAction.do_nothing(),
+        difficulty=UpdateAction.do_nothing(),
+    )
+
+
+def _scan_counts(schedule: Schedule, inbox_tasks: list[InboxTask]) -> _Counts:
+    """Count the inbox tasks the way the report did before it used rollups."""
+    counts: _Counts = {
+        kind: defaultdict(int)
+        for kind in ("created", "not_started", "working", "not_done", "done")
+    }
+    for inbox_task in inbox_tasks:
+        if schedule.contains_timestamp(inbox_task.created_time):
+            counts["created"][inbox_task.source] += 1
+
+        if (
+            inbox_task.status.is_completed
+            and inbox_task.completed_time is not None
+            and schedule.contains_timestamp(inbox_task.completed_time)
+        ):
+            if inbox_task.status == InboxTaskStatus.DONE:
+                counts["done"][inbox_task.source] += 1
+            else:
+                counts["not_done"][inbox_task.source] += 1
+        elif (
+            inbox_task.status.is_working
+            and inbox_task.working_time is not None
+            and schedule.contains_timestamp(inbox_task.working_time)
+        ):
+            counts["working"][inbox_task.source] += 1
+        else:
+            counts["not_started"][inbox_task.source] += 1
+    return {kind: dict(per_source) for kind, per_source in counts.items()}
+
+
+def _summary_counts(summary: InboxTasksSummary) -> _Counts:
+    def per_source(result: NestedResult) -> dict[InboxTaskSource, int]:
+        counts = {r.source: r.count for r in result.per_source_cnt}
+        assert result.total_cnt == sum(counts.values())
+        return counts
+
+    return {
+        "created": per_source(summary.created),
+        "not_started": per_source(summary.not_started),
+        "working": per_source(summary.working),
+        "not_done": per_source(summary.not_done),
+        "done": per_source(summary.done),
+    }
+
+
+def _get_schedule(period: RecurringTaskPeriod, name: str, right_now: ADate) -> Schedule:
+    return schedules.get_schedule(
+        period,
+        EntityName(name),
+        right_now.to_timestamp_at_end_of_day(),
+        None,
+        None,
+        None,
+        None,
+        None,
+    )
+
+
+async def _report_and_scan(
+    storage: SqliteTestStorage,
+) -> tuple[ReportPeriodResult, list[InboxTask], list[Project]]:
+    await storage.create_tables(
+        ProjectCollection,
+        Project,
+        MetricCollection,
+        Metric,
+        PersonCollection,
+        Person,
+        InboxTaskCollection,
+        InboxTask,
+        HabitCollection,
+        Habit,
+        ChoreCollection,
+        Chore,
+        BigPlanCollection,
+        BigPlan,
+    )
+    engine = storage.domain_storage_engine
+    ctx = _ctx(9, 1)
+    async with engine.get_unit_of_work() as uow:
+        project_collection = await uow.get_for(ProjectCollection).create(
+            ProjectCollection.new_project_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        root_project = await uow.get_for(Project).create(
+            Project.new_root_project(
+                ctx, project_collection.ref_id, ProjectName("Life")
+            )
+        )
+        work_project = await uow.get_for(Project).create(
+            Project.new_project(
+                ctx, project_collection.ref_id, root_project.ref_id, ProjectName("Work")
+            )
+        )
+        await uow.get_for(MetricCollection).create(
+            MetricCollection.new_metric_collection(
+                ctx, _WORKSPACE_REF_ID, root_project.ref_id
+            )
+        )
+        await uow.get_for(PersonCollection).create(
+            PersonCollection.new_person_collection(
+                ctx, _WORKSPACE_REF_ID, root_project.ref_id
+            )
+        )
+        await uow.get_for(HabitCollection).create(
+            HabitCollection.new_habit_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        await uow.get_for(ChoreCollection).create(
+            ChoreCollection.new_chore_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        await uow.get_for(BigPlanCollection).create(
+            BigPlanCollection.new_big_plan_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        inbox_task_collection = await uow.get_for(InboxTaskCollection).create(
+            InboxTaskCollection.new_inbox_task_collection(ctx, _WORKSPACE_REF_ID)
+        )
+
+        repository = uow.get(InboxTaskRepository)
+        inbox_tasks = await repository.create_many(
+            [
+                _new_inbox_task(
+                    inbox_task_collection.ref_id, project_ref_id, name, month, day
+                )
+                for project_ref_id, name, month, day in [
+                    (root_project.ref_id, "Untouched", 9, 20),
+                    (root_project.ref_id, "Done from September", 9, 25),
+                    (work_project.ref_id, "Not done from September", 9, 28),
+                    (root_project.ref_id, "New", 10, 2),
+                    (work_project.ref_id, "Working", 10, 3),
+                    (work_project.ref_id, "Done", 10, 6),
+                ]
+            ]
+        )
+        await repository.save_many(
+            [
+                _change_status(inbox_tasks[1], 10, 5, InboxTaskStatus.DONE),
+                _change_status(inbox_tasks[2], 10, 12, InboxTaskStatus.NOT_DONE),
+                _change_status(inbox_tasks[4], 10, 9, InboxTaskStatus.IN_PROGRESS),
+                _change_status(
+                    _change_status(inbox_tasks[5], 10, 7, InboxTaskStatus.IN_PROGRESS),
+                    10,
+                    14,
+                    InboxTaskStatus.DONE,
+                ),
+            ]
+        )
+
+    user = User.new_standard_user(
+        _ctx(1, 1),
+        email_address=EmailAddress("user@example.com"),
+        name=UserName("User"),
+        timezone=Timezone("Europe/Paris"),
+        feature_flag_controls=USER_FEATURE_FLAGS_CONTROLS,
+        feature_flags={UserFeature.GAMIFICATION: False},
+    )
+    workspace = Workspace.new_workspace(
+        _ctx(1, 1),
+        name=WorkspaceName("Workspace"),
+        feature_flag_controls=LOCAL_WORKSPACE_FEATURE_FLAGS_CONTROLS,
+        feature_flags={
+            **BASIC_WORKSPACE_FEATURE_FLAGS,
+            WorkspaceFeature.PROJECTS: True,
+        },
+    ).assign_ref_id(_WORKSPACE_REF_ID)
+
+    report = await ReportService(engine).do_it(
+        user,
+        workspace,
+        _TODAY,
+        RecurringTaskPeriod.MONTHLY,
+        breakdowns=[
+            ReportBreakdown.GLOBAL,
+            ReportBreakdown.PROJECTS,
+            ReportBreakdown.PERIODS,
+        ],
+    )
+
+    schedule = _get_schedule(RecurringTaskPeriod.MONTHLY, "Helper", _TODAY)
+    async with engine.get_unit_of_work() as uow:
+        scanned_inbox_tasks = await uow.get(InboxTaskRepository).find_modified_in_range(
+            parent_ref_id=inbox_task_collection.ref_id,
+            allow_archived=True,
+            filter_sources=workspace.infer_sources_for_enabled_features(None),
+            filter_last_modified_time_start=schedule.first_day,
+            filter_last_modified_time_end=schedule.end_day.next_day(),
+        )
+    await storage.dispose()
+
+    return report, scanned_inbox_tasks, [root_project, work_project]
+
+
+def test_the_report_matches_a_scan_of_the_inbox_tasks(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    report, scanned_inbox_tasks, projects = asyncio.run(
+        _report_and_scan(sqlite_storage)
+    )
+    schedule = _get_schedule(RecurringTaskPeriod.MONTHLY, "Helper", _TODAY)
+
+    assert len(scanned_inbox_tasks) == 5
+    assert _summary_counts(report.global_inbox_tasks_summary) == _scan_counts(
+        schedule, scanned_inbox_tasks
+    )
+    assert _summary_counts(report.global_inbox_tasks_summary) == {
+        "created": {InboxTaskSource.USER: 3},
+        "not_started": {InboxTaskSource.USER: 1},
+        "working": {InboxTaskSource.USER: 1},
+        "not_done": {InboxTaskSource.USER: 1},
+        "done": {InboxTaskSource.USER: 2},
+    }
+
+    project_names = {p.ref_id: p.name for p in projects}
+    assert {
+        item.name: _summary_counts(item.inbox_tasks_summary)
+        for item in report.per_project_breakdown
+    } == {
+        name: _scan_counts(schedule, [it for _, it in group])
+        for name, group in groupby(
+            sorted(
+                ((project_names[it.project_ref_id], it) for it in scanned_inbox_tasks),
+                key=itemgetter(0),
+            ),
+            key=itemgetter(0),
+        )
+    }
+
+    sub_schedules: dict[InboxTaskName, Schedule] = {}
+    day = schedule.first_day
+    while day <= schedule.end_day and day <= _TODAY:
+        sub_schedule = _get_schedule(RecurringTaskPeriod.WEEKLY, "Sub-period", day)
+        sub_schedules[sub_schedule.full_name] = sub_schedule
+        day = day.next_day()
+    assert {
+        str(item.name): _summary_counts(item.inbox_tasks_summary)
+        for item in report.per_period_breakdown
+    } == {
+        str(name): _scan_counts(sub_schedule, scanned_inbox_tasks)
+        for name, sub_schedule in sub_schedules.items()
+    }
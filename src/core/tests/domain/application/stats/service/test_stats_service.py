@@ -0,0 +1,333 @@
+"""Tests for the domain service which computes stats for a workspace."""
+
+import asyncio
+
+from jupiter.core.domain.application.report.report_period_result import (
+    ReportPeriodResult,
+)
+from jupiter.core.domain.application.report.service.report_service import (
+    ReportService,
+)
+from jupiter.core.domain.application.stats.service.stats_service import StatsService
+from jupiter.core.domain.application.stats.stats_log import StatsLog
+from jupiter.core.domain.application.stats.stats_log_entry import StatsLogEntry
+from jupiter.core.domain.concept.big_plans.big_plan import BigPlan
+from jupiter.core.domain.concept.big_plans.big_plan_collection import BigPlanCollection
+from jupiter.core.domain.concept.chores.chore import Chore
+from jupiter.core.domain.concept.chores.chore_collection import ChoreCollection
+from jupiter.core.domain.concept.habits.habit import Habit
+from jupiter.core.domain.concept.habits.habit_collection import HabitCollection
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import (
+    InboxTask,
+    InboxTaskRepository,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_collection import (
+    InboxTaskCollection,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.concept.journals.journal import Journal
+from jupiter.core.domain.concept.journals.journal_collection import JournalCollection
+from jupiter.core.domain.concept.journals.journal_generation_approach import (
+    JournalGenerationApproach,
+)
+from jupiter.core.domain.concept.journals.journal_stats import JournalStatsRepository
+from jupiter.core.domain.concept.metrics.metric import Metric
+from jupiter.core.domain.concept.metrics.metric_collection import MetricCollection
+from jupiter.core.domain.concept.persons.person import Person
+from jupiter.core.domain.concept.persons.person_collection import PersonCollection
+from jupiter.core.domain.concept.projects.project import Project
+from jupiter.core.domain.concept.projects.project_collection import (
+    ProjectCollection,
+)
+from jupiter.core.domain.concept.projects.project_name import ProjectName
+from jupiter.core.domain.concept.user.user import User
+from jupiter.core.domain.concept.user.user_name import UserName
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.concept.workspaces.workspace_name import WorkspaceName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.domain.core.email_address import EmailAddress
+from jupiter.core.domain.core.recurring_task_period import RecurringTaskPeriod
+from jupiter.core.domain.core.timezone import Timezone
+from jupiter.core.domain.features import (
+    BASIC_WORKSPACE_FEATURE_FLAGS,
+    LOCAL_WORKSPACE_FEATURE_FLAGS_CONTROLS,
+    USER_FEATURE_FLAGS_CONTROLS,
+    UserFeature,
+    WorkspaceFeature,
+)
+from jupiter.core.domain.sync_target import SyncTarget
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import DatabaseRealm, RealmCodecRegistry, RealmThing
+from jupiter.core.framework.update_action import UpdateAction
+from jupiter.core.utils.progress_reporter import NoOpProgressReporter
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_WORKSPACE_REF_ID = EntityId("1")
+_TODAY = ADate.from_str("2026-10-17")
+
+# Journals whose periods overlap, so a single snapshot serves all of them.
+_JOURNALS = [
+    ("2026-10-14", RecurringTaskPeriod.DAILY),
+    ("2026-10-06", RecurringTaskPeriod.WEEKLY),
+    ("2026-10-14", RecurringTaskPeriod.WEEKLY),
+    ("2026-10-17", RecurringTaskPeriod.MONTHLY),
+]
+
+_Run = tuple[list[tuple[EntityId, RealmThing]], dict[EntityId, RealmThing]]
+
+
+def _ctx(month: int, day: int) -> DomainContext:
+    return DomainContext.from_sys(
+        EventSource.GEN_CRON, Timestamp(DateTime(2026, month, day, 12, tzinfo=UTC))
+    )
+
+
+def _new_inbox_task(
+    inbox_task_collection_ref_id: EntityId,
+    project_ref_id: EntityId,
+    name: str,
+    day: int,
+) -> InboxTask:
+    return InboxTask.new_inbox_task(
+        _ctx(10, day),
+        inbox_task_collection_ref_id=inbox_task_collection_ref_id,
+        name=InboxTaskName(name),
+        status=InboxTaskStatus.NOT_STARTED,
+        is_key=False,
+        eisen=Eisen.REGULAR,
+        difficulty=Difficulty.EASY,
+        actionable_date=None,
+        due_date=None,
+        project_ref_id=project_ref_id,
+        big_plan_ref_id=None,
+        big_plan_project_ref_id=None,
+        big_plan_actionable_date=None,
+        big_plan_due_date=None,
+    )
+
+
+def _change_status(
+    inbox_task: InboxTask, day: int, status: InboxTaskStatus
+) -> InboxTask:
+    return inbox_task.update(
+        _ctx(10, day),
+        name=UpdateAction.do_nothing(),
+        status=UpdateAction.change_to(status),
+        project_ref_id=UpdateAction.do_nothing(),
+        big_plan_ref_id=UpdateAction.do_nothing(),
+        is_key=UpdateAction.do_nothing(),
+        actionable_date=UpdateAction.do_nothing(),
+        due_date=UpdateAction.do_nothing(),
+        eisen=UpdateAction.do_nothing(),
+        difficulty=UpdateAction.do_nothing(),
+    )
+
+
+async def _run_stats(
+    realm_codec_registry: RealmCodecRegistry,
+    storage: SqliteTestStorage,
+    user: User,
+    workspace: Workspace,
+    journals: list[Journal],
+    ctx: DomainContext,
+) -> _Run:
+    """Run the stats, and also build each journal's report on its own.
+
+    The reports are compared in their stored form, since decoding them loses
+    the exact entity name types.
+    """
+    engine = storage.domain_storage_engine
+    encoder = realm_codec_registry.get_encoder(ReportPeriodResult, DatabaseRealm)
+    await StatsService(engine).do_it(
+        ctx,
+        NoOpProgressReporter(),
+        user,
+        workspace,
+        _TODAY,
+        [SyncTarget.JOURNALS],
+    )
+
+    async with engine.get_read_unit_of_work() as uow:
+        stored = [
+            (stats.journal.ref_id, encoder.encode(stats.report))
+            for stats in await uow.get(JournalStatsRepository).find_all(
+                [journal.ref_id for journal in journals]
+            )
+        ]
+    report_service = ReportService(engine)
+    expected = {
+        journal.ref_id: encoder.encode(
+            await report_service.do_it(
+                user, workspace, journal.right_now, journal.period
+            )
+        )
+        for journal in journals
+    }
+    return stored, expected
+
+
+async def _run_stats_twice(
+    realm_codec_registry: RealmCodecRegistry,
+    storage: SqliteTestStorage,
+) -> tuple[_Run, _Run]:
+    await storage.create_tables(
+        ProjectCollection,
+        Project,
+        MetricCollection,
+        Metric,
+        PersonCollection,
+        Person,
+        InboxTaskCollection,
+        InboxTask,
+        HabitCollection,
+        Habit,
+        ChoreCollection,
+        Chore,
+        BigPlanCollection,
+        BigPlan,
+        JournalCollection,
+        Journal,
+        StatsLog,
+        StatsLogEntry,
+        repository_types=(JournalStatsRepository,),
+    )
+    engine = storage.domain_storage_engine
+    ctx = _ctx(9, 1)
+    async with engine.get_unit_of_work() as uow:
+        project_collection = await uow.get_for(ProjectCollection).create(
+            ProjectCollection.new_project_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        root_project = await uow.get_for(Project).create(
+            Project.new_root_project(
+                ctx, project_collection.ref_id, ProjectName("Life")
+            )
+        )
+        await uow.get_for(MetricCollection).create(
+            MetricCollection.new_metric_collection(
+                ctx, _WORKSPACE_REF_ID, root_project.ref_id
+            )
+        )
+        await uow.get_for(PersonCollection).create(
+            PersonCollection.new_person_collection(
+                ctx, _WORKSPACE_REF_ID, root_project.ref_id
+            )
+        )
+        await uow.get_for(HabitCollection).create(
+            HabitCollection.new_habit_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        await uow.get_for(ChoreCollection).create(
+            ChoreCollection.new_chore_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        await uow.get_for(BigPlanCollection).create(
+            BigPlanCollection.new_big_plan_collection(ctx, _WORKSPACE_REF_ID)
+        )
+        await uow.get_for(StatsLog).create(
+            StatsLog.new_stats_log(ctx, _WORKSPACE_REF_ID)
+        )
+        journal_collection = await uow.get_for(JournalCollection).create(
+            JournalCollection.new_journal_collection(
+                ctx,
+                _WORKSPACE_REF_ID,
+                periods={period for _, period in _JOURNALS},
+                generation_approach=JournalGenerationApproach.NONE,
+                generation_in_advance_days={},
+                writing_task_project_ref_id=root_project.ref_id,
+                writing_task_eisen=None,
+                writing_task_difficulty=None,
+            )
+        )
+        journals = [
+            await uow.get_for(Journal).create(
+                Journal.new_journal_for_user(
+                    ctx,
+                    journal_collection.ref_id,
+                    ADate.from_str(right_now),
+                    period,
+                )
+            )
+            for right_now, period in _JOURNALS
+        ]
+        inbox_task_collection = await uow.get_for(InboxTaskCollection).create(
+            InboxTaskCollection.new_inbox_task_collection(ctx, _WORKSPACE_REF_ID)
+        )
+
+        repository = uow.get(InboxTaskRepository)
+        inbox_tasks = await repository.create_many(
+            [
+                _new_inbox_task(
+                    inbox_task_collection.ref_id, root_project.ref_id, name, day
+                )
+                for name, day in [
+                    ("Early", 2),
+                    ("Started", 7),
+                    ("Same day", 14),
+                    ("Late", 16),
+                ]
+            ]
+        )
+        await repository.save_many(
+            [
+                _change_status(inbox_tasks[0], 5, InboxTaskStatus.DONE),
+                _change_status(inbox_tasks[1], 14, InboxTaskStatus.IN_PROGRESS),
+            ]
+        )
+
+    user = User.new_standard_user(
+        _ctx(1, 1),
+        email_address=EmailAddress("user@example.com"),
+        name=UserName("User"),
+        timezone=Timezone("Europe/Paris"),
+        feature_flag_controls=USER_FEATURE_FLAGS_CONTROLS,
+        feature_flags={UserFeature.GAMIFICATION: False},
+    )
+    workspace = Workspace.new_workspace(
+        _ctx(1, 1),
+        name=WorkspaceName("Workspace"),
+        feature_flag_controls=LOCAL_WORKSPACE_FEATURE_FLAGS_CONTROLS,
+        feature_flags={
+            **BASIC_WORKSPACE_FEATURE_FLAGS,
+            WorkspaceFeature.PROJECTS: True,
+            WorkspaceFeature.JOURNALS: True,
+        },
+    ).assign_ref_id(_WORKSPACE_REF_ID)
+
+    first_run = await _run_stats(
+        realm_codec_registry, storage, user, workspace, journals, _ctx(10, 16)
+    )
+
+    # Change what the reports hold, so the rerun has something to overwrite.
+    async with engine.get_unit_of_work() as uow:
+        await uow.get(InboxTaskRepository).save(
+            _change_status(inbox_tasks[2], 14, InboxTaskStatus.DONE)
+        )
+    second_run = await _run_stats(
+        realm_codec_registry, storage, user, workspace, journals, _ctx(10, 17)
+    )
+
+    await storage.dispose()
+
+    return first_run, second_run
+
+
+def test_journal_stats_from_a_shared_snapshot_match_per_journal_reports(
+    realm_codec_registry: RealmCodecRegistry,
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    (first_stored, first_expected), (second_stored, second_expected) = asyncio.run(
+        _run_stats_twice(realm_codec_registry, sqlite_storage)
+    )
+
+    assert dict(first_stored) == first_expected
+    assert dict(second_stored) == second_expected
+    assert first_expected != second_expected
+    # The rerun overwrote each journal's stats, rather than adding to them.
+    assert len(first_stored) == len(_JOURNALS)
+    assert len(second_stored) == len(_JOURNALS)
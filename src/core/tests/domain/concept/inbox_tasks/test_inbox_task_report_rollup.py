@@ -0,0 +1,113 @@
+"""Tests for what inbox tasks contribute to the report rollups."""
+
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import InboxTask
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollupKind,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.update_action import UpdateAction
+from pendulum import UTC, DateTime
+
+
+def _ctx(day: int) -> DomainContext:
+    return DomainContext.from_sys(
+        EventSource.GEN_CRON, Timestamp(DateTime(2024, 3, day, 12, tzinfo=UTC))
+    )
+
+
+def _new_inbox_task(status: InboxTaskStatus) -> InboxTask:
+    return InboxTask.new_inbox_task(
+        _ctx(1),
+        inbox_task_collection_ref_id=EntityId("1"),
+        name=InboxTaskName("Task"),
+        status=status,
+        is_key=False,
+        eisen=Eisen.REGULAR,
+        difficulty=Difficulty.EASY,
+        actionable_date=None,
+        due_date=None,
+        project_ref_id=EntityId("2"),
+        big_plan_ref_id=None,
+        big_plan_project_ref_id=None,
+        big_plan_actionable_date=None,
+        big_plan_due_date=None,
+    )
+
+
+def _change_status(
+    inbox_task: InboxTask, day: int, status: InboxTaskStatus
+) -> InboxTask:
+    return inbox_task.update(
+        _ctx(day),
+        name=UpdateAction.do_nothing(),
+        status=UpdateAction.change_to(status),
+        project_ref_id=UpdateAction.do_nothing(),
+        big_plan_ref_id=UpdateAction.do_nothing(),
+        is_key=UpdateAction.do_nothing(),
+        actionable_date=UpdateAction.do_nothing(),
+        due_date=UpdateAction.do_nothing(),
+        eisen=UpdateAction.do_nothing(),
+        difficulty=UpdateAction.do_nothing(),
+    )
+
+
+def test_new_inbox_task_is_touched_and_created() -> None:
+    inbox_task = _new_inbox_task(InboxTaskStatus.NOT_STARTED)
+
+    assert [(r.kind, r.event_day) for r in inbox_task.report_rollups] == [
+        (InboxTaskReportRollupKind.TOUCHED, ADate.from_str("2024-03-01")),
+        (InboxTaskReportRollupKind.CREATED, ADate.from_str("2024-03-01")),
+    ]
+    assert all(r.count == 1 for r in inbox_task.report_rollups)
+
+
+def test_inbox_task_counts_the_day_it_was_worked_on() -> None:
+    inbox_task = _change_status(
+        _new_inbox_task(InboxTaskStatus.NOT_STARTED), 3, InboxTaskStatus.IN_PROGRESS
+    )
+
+    assert [
+        (r.kind, r.modified_day, r.event_day) for r in inbox_task.report_rollups
+    ] == [
+        (
+            InboxTaskReportRollupKind.TOUCHED,
+            ADate.from_str("2024-03-03"),
+            ADate.from_str("2024-03-03"),
+        ),
+        (
+            InboxTaskReportRollupKind.CREATED,
+            ADate.from_str("2024-03-03"),
+            ADate.from_str("2024-03-01"),
+        ),
+        (
+            InboxTaskReportRollupKind.WORKING,
+            ADate.from_str("2024-03-03"),
+            ADate.from_str("2024-03-03"),
+        ),
+    ]
+
+
+def test_completed_inbox_task_counts_only_the_completion() -> None:
+    inbox_task = _change_status(
+        _change_status(
+            _new_inbox_task(InboxTaskStatus.NOT_STARTED),
+            3,
+            InboxTaskStatus.IN_PROGRESS,
+        ),
+        5,
+        InboxTaskStatus.NOT_DONE,
+    )
+
+    assert [(r.kind, r.event_day) for r in inbox_task.report_rollups] == [
+        (InboxTaskReportRollupKind.TOUCHED, ADate.from_str("2024-03-05")),
+        (InboxTaskReportRollupKind.CREATED, ADate.from_str("2024-03-01")),
+        (InboxTaskReportRollupKind.NOT_DONE, ADate.from_str("2024-03-05")),
+    ]
@@ -0,0 +1,100 @@
+"""Tests for diffing external iCal events against the synced ones."""
+
+import dataclasses
+
+from jupiter.core.domain.concept.schedule.schedule_event_full_days import (
+    ScheduleEventFullDays,
+)
+from jupiter.core.domain.concept.schedule.schedule_event_name import ScheduleEventName
+from jupiter.core.domain.concept.schedule.schedule_external_uid import (
+    ScheduleExternalUid,
+)
+from jupiter.core.domain.concept.schedule.service.external_event_reconciler import (
+    ExternalFullDaysEvent,
+    diff_external_events,
+)
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from pendulum import UTC, Date, DateTime
+
+_CTX = DomainContext.from_sys(
+    EventSource.GEN_CRON, Timestamp(DateTime(2026, 10, 17, 12, tzinfo=UTC))
+)
+
+
+def _external_event(
+    uid: str, name: str = "Holiday", description: str | None = None
+) -> ExternalFullDaysEvent:
+    return ExternalFullDaysEvent(
+        uid=ScheduleExternalUid.from_string(uid),
+        name=ScheduleEventName(name),
+        start_date=ADate.from_date(Date(2026, 10, 20)),
+        duration_days=1,
+        description=description,
+    )
+
+
+def _schedule_event(
+    external_event: ExternalFullDaysEvent, content_hash: str | None
+) -> ScheduleEventFullDays:
+    schedule_event = (
+        ScheduleEventFullDays.new_schedule_full_days_block_from_external_ical(
+            _CTX,
+            schedule_domain_ref_id=EntityId("1"),
+            schedule_stream_ref_id=EntityId("2"),
+            name=external_event.name,
+            external_uid=external_event.uid,
+            external_content_hash=external_event.content_hash,
+        )
+    )
+    return dataclasses.replace(schedule_event, external_content_hash=content_hash)
+
+
+def test_diff_splits_events_by_what_needs_doing() -> None:
+    same = _external_event("same")
+    changed = _external_event("changed", name="Holiday moved")
+    created = _external_event("created")
+    same_event = _schedule_event(same, same.content_hash)
+    changed_event = _schedule_event(changed, _external_event("changed").content_hash)
+    missing_event = _schedule_event(_external_event("missing"), "hash")
+
+    diff = diff_external_events(
+        [same, changed, created],
+        [same_event, changed_event, missing_event],
+        force_update=False,
+    )
+
+    assert diff.to_create == [created]
+    assert diff.to_update == [(changed_event, changed)]
+    assert diff.unchanged == [same_event]
+    assert diff.missing == [missing_event]
+
+
+def test_diff_updates_events_synced_without_a_hash() -> None:
+    legacy = _external_event("legacy")
+    legacy_event = _schedule_event(legacy, None)
+
+    diff = diff_external_events([legacy], [legacy_event], force_update=False)
+
+    assert diff.to_update == [(legacy_event, legacy)]
+    assert diff.unchanged == []
+
+
+def test_diff_updates_unchanged_events_when_forced() -> None:
+    same = _external_event("same")
+    same_event = _schedule_event(same, same.content_hash)
+
+    diff = diff_external_events([same], [same_event], force_update=True)
+
+    assert diff.to_update == [(same_event, same)]
+    assert diff.unchanged == []
+
+
+def test_content_hash_tells_a_missing_description_from_an_empty_one() -> None:
+    assert (
+        _external_event("a", description=None).content_hash
+        != _external_event("a", description="").content_hash
+    )
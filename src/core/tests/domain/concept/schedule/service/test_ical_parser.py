@@ -0,0 +1,128 @@
+"""Tests for parsing iCals into the events to sync."""
+
+import asyncio
+import datetime as dt
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from jupiter.core.domain.concept.schedule.service import ical_parser
+from jupiter.core.domain.concept.schedule.service.ical_parser import (
+    ParsedICalEvent,
+    parse_ical,
+    parse_ical_in_worker,
+    shutdown_ical_parse_workers,
+)
+
+
+def _calendar(*events: str) -> str:
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:test\r\nX-WR-CALNAME:Work\r\n"
+        + "".join(f"BEGIN:VEVENT\r\n{event}END:VEVENT\r\n" for event in events)
+        + "END:VCALENDAR\r\n"
+    )
+
+
+_WINDOW = (dt.date(2025, 1, 1), dt.date(2026, 12, 31))
+
+
+def test_parse_full_days_and_in_day_events() -> None:
+    parsed = parse_ical(
+        _calendar(
+            "UID:holiday\r\nSUMMARY:Holiday\r\nDESCRIPTION:Beach\r\n"
+            "DTSTART;VALUE=DATE:20260301\r\nDTEND;VALUE=DATE:20260303\r\n",
+            "UID:meeting\r\nSUMMARY:Meeting\r\nLAST-MODIFIED:20260201T080000Z\r\n"
+            "DTSTART:20260302T100000Z\r\nDTEND:20260302T110000Z\r\n",
+        ),
+        *_WINDOW,
+    )
+
+    assert parsed.name == "Work"
+    assert parsed.unexpected_event is None
+    assert parsed.events == [
+        ParsedICalEvent(
+            uid="holiday",
+            summary="Holiday",
+            start=dt.date(2026, 3, 1),
+            end=dt.date(2026, 3, 3),
+            is_full_days=True,
+            recurrence_id=dt.date(2026, 3, 1),
+            last_modified=None,
+            description="Beach",
+        ),
+        ParsedICalEvent(
+            uid="meeting",
+            summary="Meeting",
+            start=dt.datetime(2026, 3, 2, 10, tzinfo=dt.UTC),
+            end=dt.datetime(2026, 3, 2, 11, tzinfo=dt.UTC),
+            is_full_days=False,
+            recurrence_id=dt.datetime(2026, 3, 2, 10, tzinfo=dt.UTC),
+            last_modified=dt.datetime(2026, 2, 1, 8, tzinfo=dt.UTC),
+            description=None,
+        ),
+    ]
+
+
+def test_parse_expands_recurring_events_within_the_window() -> None:
+    parsed = parse_ical(
+        _calendar(
+            "UID:standup\r\nSUMMARY:Standup\r\nRRULE:FREQ=YEARLY\r\n"
+            "DTSTART:20240105T090000Z\r\nDTEND:20240105T091500Z\r\n",
+        ),
+        *_WINDOW,
+    )
+
+    assert [event.start for event in parsed.events] == [
+        dt.datetime(2025, 1, 5, 9, tzinfo=dt.UTC),
+        dt.datetime(2026, 1, 5, 9, tzinfo=dt.UTC),
+    ]
+    assert [event.recurrence_id for event in parsed.events] == [
+        event.start for event in parsed.events
+    ]
+
+
+def test_parse_skips_malformed_events() -> None:
+    parsed = parse_ical(
+        _calendar(
+            "UID:no-summary\r\nDTSTART:20260302T100000Z\r\nDTEND:20260302T110000Z\r\n"
+        ),
+        *_WINDOW,
+    )
+
+    assert parsed.events == []
+    assert parsed.unexpected_event is None
+
+
+def test_parse_in_worker_starts_a_fresh_pool_after_a_worker_dies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    broken_executor = ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    )
+    with pytest.raises(BrokenProcessPool):
+        broken_executor.submit(os._exit, 1).result()
+
+    monkeypatch.setattr(ical_parser, "_parse_executor", broken_executor)
+
+    async def run() -> list[str]:
+        with pytest.raises(BrokenProcessPool):
+            await parse_ical_in_worker(_calendar(), *_WINDOW)
+        assert ical_parser._parse_executor is None
+
+        parsed = await parse_ical_in_worker(
+            _calendar(
+                "UID:meeting\r\nSUMMARY:Meeting\r\n"
+                "DTSTART:20260302T100000Z\r\nDTEND:20260302T110000Z\r\n"
+            ),
+            *_WINDOW,
+        )
+        return [event.uid for event in parsed.events]
+
+    try:
+        assert asyncio.run(run()) == ["meeting"]
+    finally:
+        shutdown_ical_parse_workers()
+
+    assert ical_parser._parse_executor is None
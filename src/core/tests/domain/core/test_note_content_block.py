@@ -0,0 +1,47 @@
+"""Tests for note content blocks."""
+
+from jupiter.core.domain.core.notes.note_content_block import (
+    BulletedListBlock,
+    ChecklistBlock,
+    ChecklistItem,
+    CorrelationId,
+    DividerBlock,
+    HeadingBlock,
+    ListItem,
+    OneOfNoteContentBlock,
+    ParagraphBlock,
+    TableBlock,
+    note_content_to_text,
+)
+
+
+def test_note_content_to_text() -> None:
+    correlation_id = CorrelationId("1")
+    content: list[OneOfNoteContentBlock] = [
+        HeadingBlock(
+            kind="heading", correlation_id=correlation_id, text="Plan", level=1
+        ),
+        ParagraphBlock(kind="paragraph", correlation_id=correlation_id, text=""),
+        BulletedListBlock(
+            kind="bulleted-list",
+            correlation_id=correlation_id,
+            items=[ListItem(text="Outer", items=[ListItem(text="Inner", items=[])])],
+        ),
+        ChecklistBlock(
+            kind="checklist",
+            correlation_id=correlation_id,
+            items=[ChecklistItem(text="Pack", checked=True)],
+        ),
+        DividerBlock(kind="divider", correlation_id=correlation_id),
+        TableBlock(
+            kind="table",
+            correlation_id=correlation_id,
+            with_header=False,
+            contents=[["a", "b"]],
+        ),
+    ]
+    assert note_content_to_text(content) == "Plan\nOuter\nInner\nPack\na b"
+
+
+def test_note_content_to_text_empty() -> None:
+    assert note_content_to_text([]) == ""
@@ -0,0 +1,226 @@
+"""Tests for the batched loader of linked entities."""
+
+import asyncio
+
+from jupiter.core.domain.concept.metrics.metric import Metric
+from jupiter.core.domain.concept.metrics.metric_entry import MetricEntry
+from jupiter.core.domain.concept.metrics.metric_name import MetricName
+from jupiter.core.domain.concept.smart_lists.smart_list import SmartList
+from jupiter.core.domain.concept.smart_lists.smart_list_item import SmartListItem
+from jupiter.core.domain.concept.smart_lists.smart_list_item_name import (
+    SmartListItemName,
+)
+from jupiter.core.domain.concept.smart_lists.smart_list_name import SmartListName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.notes.note import Note
+from jupiter.core.domain.core.notes.note_domain import NoteDomain
+from jupiter.core.domain.infra.generic_batch_loader import generic_batch_loader
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.entity import NoFilter
+from jupiter.core.framework.event import EventSource
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+_COLLECTION_REF_ID = EntityId("1")
+
+_Names = dict[str, list[str]]
+
+
+def _names_by_owner(
+    owners: list[SmartList] | list[Metric],
+    linked: dict[EntityId, list[SmartListItem]] | dict[EntityId, list[MetricEntry]],
+) -> _Names:
+    return {
+        str(owner.name): sorted(str(e.name) for e in linked[owner.ref_id])
+        for owner in owners
+    }
+
+
+async def _load_smart_list_items(storage: SqliteTestStorage) -> list[_Names]:
+    await storage.create_tables(SmartList, SmartListItem)
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        smart_lists = await uow.get_for(SmartList).create_many(
+            [
+                SmartList.new_smart_list(
+                    _CTX, _COLLECTION_REF_ID, SmartListName(name), None
+                )
+                for name in ("Books", "Films", "Empty")
+            ]
+        )
+        await uow.get_for(SmartListItem).create_many(
+            [
+                SmartListItem.new_smart_list_item(
+                    _CTX,
+                    smart_list.ref_id,
+                    SmartListItemName(name),
+                    is_done=is_done,
+                    tags_ref_id=[],
+                    url=None,
+                )
+                for smart_list, name, is_done in [
+                    (smart_lists[0], "Dune", True),
+                    (smart_lists[0], "Emma", False),
+                    (smart_lists[1], "Alien", False),
+                ]
+            ]
+        )
+
+        results = [
+            await generic_batch_loader(uow, smart_lists, SmartList.items),
+            # No ref id filter means every item, not the items with a NULL ref id.
+            await generic_batch_loader(
+                uow, smart_lists, SmartList.items, ref_id=NoFilter()
+            ),
+            await generic_batch_loader(
+                uow, smart_lists, SmartList.items, is_done=False
+            ),
+        ]
+    await storage.dispose()
+    return [_names_by_owner(smart_lists, result) for result in results]
+
+
+def test_loads_the_linked_entities_of_each_entity(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    every_item, no_ref_id_filter, not_done = asyncio.run(
+        _load_smart_list_items(sqlite_storage)
+    )
+
+    assert every_item == {
+        "Books": ["Dune", "Emma"],
+        "Films": ["Alien"],
+        "Empty": [],
+    }
+    assert no_ref_id_filter == every_item
+    assert not_done == {"Books": ["Emma"], "Films": ["Alien"], "Empty": []}
+
+
+async def _load_metric_entries_and_their_notes(
+    storage: SqliteTestStorage,
+) -> tuple[_Names, list[EntityId]]:
+    await storage.create_tables(Metric, MetricEntry, Note)
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        metrics = await uow.get_for(Metric).create_many(
+            [
+                Metric.new_metric(
+                    _CTX,
+                    _COLLECTION_REF_ID,
+                    MetricName(name),
+                    is_key=False,
+                    icon=None,
+                    collection_params=None,
+                    metric_unit=None,
+                )
+                for name in ("Weight", "Steps")
+            ]
+        )
+        entries = await uow.get_for(MetricEntry).create_many(
+            [
+                MetricEntry.new_metric_entry(
+                    _CTX, metric.ref_id, ADate.from_str(day), value
+                )
+                for metric, day, value in [
+                    (metrics[0], "2026-10-01", 70.0),
+                    (metrics[0], "2026-10-02", 71.0),
+                    (metrics[1], "2026-10-01", 9000.0),
+                ]
+            ]
+        )
+        await uow.get_for(Note).create_many(
+            [
+                Note.new_note(
+                    _CTX, _COLLECTION_REF_ID, NoteDomain.METRIC_ENTRY, entry.ref_id, []
+                )
+                for entry in entries[1:]
+            ]
+        )
+
+        entries_by_metric_ref_id = await generic_batch_loader(
+            uow, metrics, Metric.entries
+        )
+        # The result is read again to find the notes of the entries, so it
+        # must not be a one-shot iterator.
+        notes = await uow.get_for(Note).find_all_generic(
+            parent_ref_id=_COLLECTION_REF_ID,
+            domain=NoteDomain.METRIC_ENTRY,
+            allow_archived=True,
+            source_entity_ref_id=[
+                entry.ref_id
+                for entries_of_metric in entries_by_metric_ref_id.values()
+                for entry in entries_of_metric
+            ],
+        )
+    await storage.dispose()
+    return _names_by_owner(metrics, entries_by_metric_ref_id), sorted(
+        (n.source_entity_ref_id for n in notes), key=lambda r: r.as_int()
+    )
+
+
+def test_the_loaded_entities_can_be_used_for_further_queries(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    entries, note_source_ref_ids = asyncio.run(
+        _load_metric_entries_and_their_notes(sqlite_storage)
+    )
+
+    assert list(entries) == ["Weight", "Steps"]
+    assert len(entries["Weight"]) == 2
+    assert len(entries["Steps"]) == 1
+    assert note_source_ref_ids == [EntityId("2"), EntityId("3")]
+
+
+async def _load_notes_of_metrics(
+    storage: SqliteTestStorage,
+) -> dict[EntityId, list[NoteDomain]]:
+    await storage.create_tables(Metric, Note)
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        metrics = await uow.get_for(Metric).create_many(
+            [
+                Metric.new_metric(
+                    _CTX,
+                    _COLLECTION_REF_ID,
+                    MetricName(name),
+                    is_key=False,
+                    icon=None,
+                    collection_params=None,
+                    metric_unit=None,
+                )
+                for name in ("Weight", "Steps")
+            ]
+        )
+        await uow.get_for(Note).create_many(
+            [
+                Note.new_note(
+                    _CTX, _COLLECTION_REF_ID, NoteDomain.METRIC, metrics[0].ref_id, []
+                ),
+                # Same source ref id, but it belongs to some other kind of entity.
+                Note.new_note(
+                    _CTX, _COLLECTION_REF_ID, NoteDomain.DOC, metrics[1].ref_id, []
+                ),
+            ]
+        )
+        notes_by_metric_ref_id = await generic_batch_loader(
+            uow, metrics, Metric.note, allow_archived=True
+        )
+        empty = await generic_batch_loader(uow, [], Metric.note)
+    await storage.dispose()
+    assert empty == {}
+    return {
+        ref_id: [n.domain for n in notes]
+        for ref_id, notes in notes_by_metric_ref_id.items()
+    }
+
+
+def test_the_static_filters_of_the_link_apply(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    assert asyncio.run(_load_notes_of_metrics(sqlite_storage)) == {
+        EntityId("1"): [NoteDomain.METRIC],
+        EntityId("2"): [],
+    }
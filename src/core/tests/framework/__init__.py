@@ -0,0 +1 @@
+"""Framework tests."""
@@ -0,0 +1,46 @@
+"""Tests for page cursor."""
+
+import pytest
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.page_cursor import (
+    PageCursor,
+    PageCursorDatabaseDecoder,
+    PageCursorDatabaseEncoder,
+)
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.errors import InputValidationError
+from jupiter.core.framework.realm import RealmDecodingError
+from pendulum import UTC, DateTime
+
+
+def test_cursor_round_trips() -> None:
+    cursor = PageCursor(
+        last_modified_time=Timestamp(
+            DateTime(2026, 10, 17, 12, 30, 5, 123456, tzinfo=UTC)
+        ),
+        ref_id=EntityId("42"),
+    )
+
+    encoded = PageCursorDatabaseEncoder().encode(cursor)
+
+    assert isinstance(encoded, str)
+    assert PageCursorDatabaseDecoder().decode(encoded) == cursor
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [
+        "not-base64!",
+        "WyJ4Il0=",  # ["x"]
+        "WyIyMDI2LTEwLTE3IiwgImFiYyJd",  # ["2026-10-17", "abc"]
+        "WyJub3QgYSB0aW1lIiwgIjEiXQ==",  # ["not a time", "1"]
+    ],
+)
+def test_malformed_cursors_are_rejected(encoded: str) -> None:
+    with pytest.raises(InputValidationError):
+        PageCursorDatabaseDecoder().decode(encoded)
+
+
+def test_non_string_cursors_are_not_decoded() -> None:
+    with pytest.raises(RealmDecodingError):
+        PageCursorDatabaseDecoder().decode(None)
@@ -0,0 +1,147 @@
+"""Tests for the registry manifests."""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from jupiter.core.framework.manifest import (
+    MANIFEST_FORMAT_VERSION,
+    LazyTypeMapping,
+    Manifest,
+    fingerprint_module_roots,
+    import_path,
+    load_manifest,
+    resolve_import_path,
+    save_manifest,
+)
+
+_PACKAGE_NAME = "_manifest_test_package"
+
+
+@pytest.fixture()
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    package_path = tmp_path / _PACKAGE_NAME
+    package_path.mkdir()
+    (package_path / "__init__.py").write_text("")
+    (package_path / "things.py").write_text("class Thing:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for module_name in [_PACKAGE_NAME, f"{_PACKAGE_NAME}.things"]:
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+    return importlib.import_module(_PACKAGE_NAME)
+
+
+def _manifest_for(package: ModuleType) -> Manifest:
+    return Manifest(
+        fingerprint=fingerprint_module_roots(package),
+        sections={"things": [("thing", f"{_PACKAGE_NAME}.things:Thing")]},
+    )
+
+
+def test_manifest_round_trips(package: ModuleType, tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    save_manifest(manifest_path, _manifest_for(package))
+
+    manifest = load_manifest(manifest_path, package)
+
+    assert manifest == _manifest_for(package)
+    assert manifest.section("things") == [("thing", f"{_PACKAGE_NAME}.things:Thing")]
+
+
+def test_manifest_is_stale_once_a_module_changes(
+    package: ModuleType, tmp_path: Path
+) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    save_manifest(manifest_path, _manifest_for(package))
+
+    (tmp_path / _PACKAGE_NAME / "things.py").write_text(
+        "class Thing:\n    pass\n\n\nclass OtherThing:\n    pass\n"
+    )
+
+    assert load_manifest(manifest_path, package) is None
+
+
+def test_manifest_is_stale_once_a_module_is_added(
+    package: ModuleType, tmp_path: Path
+) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    save_manifest(manifest_path, _manifest_for(package))
+
+    (tmp_path / _PACKAGE_NAME / "more_things.py").write_text("")
+
+    assert load_manifest(manifest_path, package) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        None,
+        "{not json",
+        json.dumps([]),
+        json.dumps(
+            {"version": MANIFEST_FORMAT_VERSION + 1, "fingerprint": "", "sections": {}}
+        ),
+    ],
+)
+def test_missing_or_bad_manifests_are_not_loaded(
+    package: ModuleType, tmp_path: Path, content: str | None
+) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    if content is not None:
+        manifest_path.write_text(content)
+
+    assert load_manifest(manifest_path, package) is None
+
+
+def test_missing_sections_are_an_error(package: ModuleType) -> None:
+    with pytest.raises(Exception, match="no section repositories"):
+        _manifest_for(package).section("repositories")
+
+
+def test_import_paths_round_trip() -> None:
+    assert resolve_import_path(import_path(LazyTypeMapping)) is LazyTypeMapping
+    assert resolve_import_path(import_path(Manifest)) is Manifest
+
+
+def test_import_paths_must_point_to_types() -> None:
+    with pytest.raises(Exception, match="does not point to a type"):
+        resolve_import_path("jupiter.core.framework.manifest:MANIFEST_FORMAT_VERSION")
+
+
+def test_lazy_type_mapping_resolves_on_first_lookup() -> None:
+    calls: list[type] = []
+
+    def resolve(key: type) -> str:
+        calls.append(key)
+        return key.__name__
+
+    mapping = LazyTypeMapping[object, str](
+        {import_path(Manifest): resolve, import_path(LazyTypeMapping): resolve}
+    )
+
+    assert len(mapping) == 2
+    assert calls == []
+    assert mapping[Manifest] == "Manifest"
+    assert mapping[Manifest] == "Manifest"
+    assert calls == [Manifest]
+    assert len(mapping) == 2
+
+
+def test_lazy_type_mapping_misses_unknown_keys() -> None:
+    mapping = LazyTypeMapping[object, str]({import_path(Manifest): str})
+
+    assert ModuleType not in mapping
+    with pytest.raises(KeyError):
+        mapping[ModuleType]
+
+
+def test_lazy_type_mapping_imports_modules_when_iterated(package: ModuleType) -> None:
+    module_name = f"{_PACKAGE_NAME}.things"
+    mapping = LazyTypeMapping[object, str](
+        {f"{module_name}:Thing": lambda key: key.__qualname__}
+    )
+
+    assert module_name not in sys.modules
+    assert dict(mapping.items()) == {sys.modules[module_name].Thing: "Thing"}
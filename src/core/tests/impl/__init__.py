@@ -0,0 +1 @@
+"""Implementation tests."""
@@ -0,0 +1 @@
+"""Tests for iCal fetchers."""
@@ -0,0 +1,141 @@
+"""Tests for the iCal fetchers, against a local stub server."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import aiohttp
+import pytest
+from aiohttp import web
+from jupiter.core.domain.concept.schedule.ical_fetcher import (
+    ICalFetcher,
+    ICalFetchError,
+    ICalFetchResult,
+)
+from jupiter.core.domain.core.url import URL
+from jupiter.core.impl.ical.aiohttp_fetcher import AiohttpICalFetcher
+from jupiter.core.impl.ical.requests_fetcher import RequestsICalFetcher
+
+_CALENDAR = "BEGIN:VCALENDAR\r\nX-WR-CALNAME:Work\r\nEND:VCALENDAR\r\n"
+_ETAG = '"v1"'
+_LAST_MODIFIED = "Wed, 14 Oct 2026 10:00:00 GMT"
+
+
+async def _calendar(request: web.Request) -> web.Response:
+    headers = {"ETag": _ETAG, "Last-Modified": _LAST_MODIFIED}
+    if (
+        request.headers.get("If-None-Match") == _ETAG
+        or request.headers.get("If-Modified-Since") == _LAST_MODIFIED
+    ):
+        return web.Response(status=304, headers=headers)
+    return web.Response(text=_CALENDAR, headers=headers)
+
+
+async def _missing(request: web.Request) -> web.Response:
+    return web.Response(status=404)
+
+
+async def _with_stub_server(
+    use: Callable[[ICalFetcher, str], Awaitable[ICalFetchResult]],
+    fetcher_type: type[ICalFetcher],
+) -> ICalFetchResult:
+    app = web.Application()
+    app.router.add_get("/calendar.ics", _calendar)
+    app.router.add_get("/missing.ics", _missing)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        async with aiohttp.ClientSession() as session:
+            fetcher = (
+                AiohttpICalFetcher(session)
+                if fetcher_type is AiohttpICalFetcher
+                else RequestsICalFetcher()
+            )
+            return await use(fetcher, f"http://127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture(params=[AiohttpICalFetcher, RequestsICalFetcher])
+def fetcher_type(request: pytest.FixtureRequest) -> type[ICalFetcher]:
+    return request.param  # type: ignore
+
+
+def test_fetch_returns_content_and_validators(
+    fetcher_type: type[ICalFetcher],
+) -> None:
+    result = asyncio.run(
+        _with_stub_server(
+            lambda fetcher, base: fetcher.fetch(
+                URL(f"{base}/calendar.ics"), etag=None, last_modified=None
+            ),
+            fetcher_type,
+        )
+    )
+
+    assert result == ICalFetchResult(
+        content=_CALENDAR, etag=_ETAG, last_modified=_LAST_MODIFIED
+    )
+    assert not result.not_modified
+
+
+def test_fetch_with_matching_etag_is_not_modified(
+    fetcher_type: type[ICalFetcher],
+) -> None:
+    result = asyncio.run(
+        _with_stub_server(
+            lambda fetcher, base: fetcher.fetch(
+                URL(f"{base}/calendar.ics"), etag=_ETAG, last_modified=None
+            ),
+            fetcher_type,
+        )
+    )
+
+    assert result.not_modified
+    assert result.etag == _ETAG
+
+
+def test_fetch_with_matching_last_modified_is_not_modified(
+    fetcher_type: type[ICalFetcher],
+) -> None:
+    result = asyncio.run(
+        _with_stub_server(
+            lambda fetcher, base: fetcher.fetch(
+                URL(f"{base}/calendar.ics"), etag=None, last_modified=_LAST_MODIFIED
+            ),
+            fetcher_type,
+        )
+    )
+
+    assert result.not_modified
+    assert result.last_modified == _LAST_MODIFIED
+
+
+def test_fetch_with_stale_etag_returns_content(
+    fetcher_type: type[ICalFetcher],
+) -> None:
+    result = asyncio.run(
+        _with_stub_server(
+            lambda fetcher, base: fetcher.fetch(
+                URL(f"{base}/calendar.ics"), etag='"v0"', last_modified=None
+            ),
+            fetcher_type,
+        )
+    )
+
+    assert result.content == _CALENDAR
+    assert result.etag == _ETAG
+
+
+def test_fetch_of_missing_calendar_fails(fetcher_type: type[ICalFetcher]) -> None:
+    with pytest.raises(ICalFetchError, match="error 404"):
+        asyncio.run(
+            _with_stub_server(
+                lambda fetcher, base: fetcher.fetch(
+                    URL(f"{base}/missing.ics"), etag=None, last_modified=None
+                ),
+                fetcher_type,
+            )
+        )
@@ -0,0 +1,160 @@
+"""Tests for the SQLite gamification repositories."""
+
+import asyncio
+import dataclasses
+
+from jupiter.core.domain.application.gamification.score_period_best import (
+    ScorePeriodBest,
+    ScorePeriodBestRepository,
+)
+from jupiter.core.domain.application.gamification.score_stats import (
+    ScoreStats,
+    ScoreStatsRepository,
+)
+from jupiter.core.domain.core.recurring_task_period import RecurringTaskPeriod
+from jupiter.core.domain.core.timeline import infer_timeline
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_RIGHT_NOW = Timestamp(DateTime(2026, 10, 17, 12, tzinfo=UTC))
+_LAST_YEAR = Timestamp(DateTime(2025, 3, 2, 12, tzinfo=UTC))
+_CTX = DomainContext.from_sys(EventSource.GEN_CRON, _RIGHT_NOW)
+_SCORE_LOG_REF_ID = EntityId("1")
+_OTHER_SCORE_LOG_REF_ID = EntityId("2")
+
+_PERIODS: list[RecurringTaskPeriod | None] = [*RecurringTaskPeriod, None]
+# Left out on purpose, to check missing stats stay missing.
+_PERIODS_WITHOUT_STATS: list[RecurringTaskPeriod | None] = [RecurringTaskPeriod.MONTHLY]
+
+_StatsKey = tuple[EntityId, RecurringTaskPeriod | None, str]
+_BestKey = tuple[EntityId, RecurringTaskPeriod | None, str, RecurringTaskPeriod]
+
+
+def _score_stats(
+    score_log_ref_id: EntityId,
+    period: RecurringTaskPeriod | None,
+    right_now: Timestamp,
+    total_score: int,
+) -> ScoreStats:
+    return dataclasses.replace(
+        ScoreStats.new_score_stats(
+            _CTX, score_log_ref_id, period, infer_timeline(period, right_now)
+        ),
+        total_score=total_score,
+    )
+
+
+def _score_period_best(
+    score_log_ref_id: EntityId,
+    period: RecurringTaskPeriod | None,
+    right_now: Timestamp,
+    sub_period: RecurringTaskPeriod,
+    total_score: int,
+) -> ScorePeriodBest:
+    return dataclasses.replace(
+        ScorePeriodBest.new_score_period_best(
+            _CTX,
+            score_log_ref_id,
+            period,
+            infer_timeline(period, right_now),
+            sub_period,
+        ),
+        total_score=total_score,
+    )
+
+
+async def _load_both_ways(
+    storage: SqliteTestStorage,
+) -> tuple[
+    dict[_StatsKey, int],
+    dict[_StatsKey, int],
+    dict[_BestKey, int],
+    dict[_BestKey, int],
+]:
+    await storage.create_tables(
+        repository_types=(ScoreStatsRepository, ScorePeriodBestRepository)
+    )
+    timelines = {period: infer_timeline(period, _RIGHT_NOW) for period in _PERIODS}
+    best_pairs = [
+        (period, sub_period)
+        for period in _PERIODS
+        for sub_period in RecurringTaskPeriod
+        if period is None or sub_period < period
+    ]
+
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        stats_repository = uow.get(ScoreStatsRepository)
+        best_repository = uow.get(ScorePeriodBestRepository)
+        await stats_repository.upsert_many(
+            [
+                _score_stats(score_log_ref_id, period, right_now, score + idx)
+                for idx, period in enumerate(_PERIODS)
+                if period not in _PERIODS_WITHOUT_STATS
+                for score_log_ref_id, right_now, score in [
+                    (_SCORE_LOG_REF_ID, _RIGHT_NOW, 10),
+                    (_SCORE_LOG_REF_ID, _LAST_YEAR, 100),
+                    (_OTHER_SCORE_LOG_REF_ID, _RIGHT_NOW, 1000),
+                ]
+            ]
+        )
+        await best_repository.upsert_many(
+            [
+                _score_period_best(
+                    score_log_ref_id, period, right_now, sub_period, score + idx
+                )
+                for idx, (period, sub_period) in enumerate(best_pairs)
+                for score_log_ref_id, right_now, score in [
+                    (_SCORE_LOG_REF_ID, _RIGHT_NOW, 10),
+                    (_SCORE_LOG_REF_ID, _LAST_YEAR, 100),
+                    (_OTHER_SCORE_LOG_REF_ID, _RIGHT_NOW, 1000),
+                ]
+            ]
+        )
+
+        # The lifetime period is stored as NULL, so its rows don't clash on
+        # the key and the last year's one is kept too. The first row wins, as
+        # in the overview service.
+        stats_overview: dict[_StatsKey, int] = {}
+        for stats in await stats_repository.load_overview(_SCORE_LOG_REF_ID, timelines):
+            stats_overview.setdefault(stats.key, stats.total_score)
+        stats_one_by_one = {}
+        for period, timeline in timelines.items():
+            one_stats = await stats_repository.load_by_key_optional(
+                (_SCORE_LOG_REF_ID, period, timeline)
+            )
+            if one_stats is not None:
+                stats_one_by_one[one_stats.key] = one_stats.total_score
+
+        bests_overview: dict[_BestKey, int] = {}
+        for best in await best_repository.load_overview(_SCORE_LOG_REF_ID, timelines):
+            bests_overview.setdefault(best.key, best.total_score)
+        bests_one_by_one = {}
+        for period, sub_period in best_pairs:
+            one_best = await best_repository.load_by_key_optional(
+                (_SCORE_LOG_REF_ID, period, timelines[period], sub_period)
+            )
+            if one_best is not None:
+                bests_one_by_one[one_best.key] = one_best.total_score
+    await storage.dispose()
+
+    return stats_overview, stats_one_by_one, bests_overview, bests_one_by_one
+
+
+def test_load_overview_matches_loading_each_key(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    stats_overview, stats_one_by_one, bests_overview, bests_one_by_one = asyncio.run(
+        _load_both_ways(sqlite_storage)
+    )
+
+    assert stats_overview == stats_one_by_one
+    assert len(stats_overview) == len(_PERIODS) - len(_PERIODS_WITHOUT_STATS)
+    assert all(10 <= score < 100 for score in stats_overview.values())
+    assert bests_overview == bests_one_by_one
+    assert len(bests_overview) > 0
+    assert all(10 <= score < 100 for score in bests_overview.values())
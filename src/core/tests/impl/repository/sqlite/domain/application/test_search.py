@@ -0,0 +1,22 @@
+"""Tests for the SQLite search repository."""
+
+from jupiter.core.impl.repository.sqlite.domain.application.search import (
+    _relative_rank,
+)
+
+
+def test_ranks_are_relative_to_the_best_match() -> None:
+    assert _relative_rank(-8.0, -8.0) == -1.0
+    assert _relative_rank(-2.0, -8.0) == -0.25
+    assert _relative_rank(0.0, -8.0) == 0.0
+
+
+def test_ranks_from_tables_on_different_scales_line_up() -> None:
+    name_ranks = [_relative_rank(r, -2.0) for r in (-2.0, -1.0)]
+    content_ranks = [_relative_rank(r, -20.0) for r in (-20.0, -10.0)]
+
+    assert name_ranks == content_ranks
+
+
+def test_ranks_without_a_negative_best_are_all_equal() -> None:
+    assert _relative_rank(0.0, 0.0) == -1.0
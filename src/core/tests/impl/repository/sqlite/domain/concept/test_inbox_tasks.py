@@ -0,0 +1,232 @@
+"""Tests for the SQLite inbox task repository."""
+
+import asyncio
+from collections import Counter
+
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import (
+    InboxTask,
+    InboxTaskRepository,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollup,
+    InboxTaskReportRollupKind,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.archival_reason import ArchivalReason
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.domain.storage_engine import DomainUnitOfWork
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.update_action import UpdateAction
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_COLLECTION_REF_ID = EntityId("1")
+_OTHER_COLLECTION_REF_ID = EntityId("2")
+_PROJECT_REF_ID = EntityId("3")
+
+_Kinds = dict[InboxTaskReportRollupKind, int]
+
+
+def _ctx(day: int) -> DomainContext:
+    return DomainContext.from_sys(
+        EventSource.GEN_CRON, Timestamp(DateTime(2026, 10, day, 12, tzinfo=UTC))
+    )
+
+
+def _new_inbox_task(
+    name: str, inbox_task_collection_ref_id: EntityId = _COLLECTION_REF_ID
+) -> InboxTask:
+    return InboxTask.new_inbox_task(
+        _ctx(1),
+        inbox_task_collection_ref_id=inbox_task_collection_ref_id,
+        name=InboxTaskName(name),
+        status=InboxTaskStatus.NOT_STARTED,
+        is_key=False,
+        eisen=Eisen.REGULAR,
+        difficulty=Difficulty.EASY,
+        actionable_date=None,
+        due_date=None,
+        project_ref_id=_PROJECT_REF_ID,
+        big_plan_ref_id=None,
+        big_plan_project_ref_id=None,
+        big_plan_actionable_date=None,
+        big_plan_due_date=None,
+    )
+
+
+def _change_status(
+    inbox_task: InboxTask, day: int, status: InboxTaskStatus
+) -> InboxTask:
+    return inbox_task.update(
+        _ctx(day),
+        name=UpdateAction.do_nothing(),
+        status=UpdateAction.change_to(status),
+        project_ref_id=UpdateAction.do_nothing(),
+        big_plan_ref_id=UpdateAction.do_nothing(),
+        is_key=UpdateAction.do_nothing(),
+        actionable_date=UpdateAction.do_nothing(),
+        due_date=UpdateAction.do_nothing(),
+        eisen=UpdateAction.do_nothing(),
+        difficulty=UpdateAction.do_nothing(),
+    )
+
+
+async def _check_rollups(
+    uow: DomainUnitOfWork, inbox_task_collection_ref_id: EntityId
+) -> _Kinds:
+    """Check the rollups hold exactly what the stored tasks contribute to them."""
+    repository = uow.get(InboxTaskRepository)
+    expected: Counter[InboxTaskReportRollup] = Counter()
+    for inbox_task in await repository.find_all_generic(
+        parent_ref_id=inbox_task_collection_ref_id, allow_archived=True
+    ):
+        for rollup in inbox_task.report_rollups:
+            expected[rollup.with_count(0)] += rollup.count
+    actual: Counter[InboxTaskReportRollup] = Counter()
+    for rollup in await repository.find_report_rollups(
+        inbox_task_collection_ref_id,
+        by_modified_day=True,
+        by_event_day=True,
+        by_project=True,
+        by_source_entity=True,
+    ):
+        actual[rollup.with_count(0)] += rollup.count
+    assert actual == expected
+
+    return {
+        rollup.kind: rollup.count
+        for rollup in await repository.find_report_rollups(inbox_task_collection_ref_id)
+    }
+
+
+async def _save_through_the_lifecycle(
+    storage: SqliteTestStorage,
+) -> list[_Kinds]:
+    await storage.create_tables(InboxTask)
+    steps = []
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        repository = uow.get(InboxTaskRepository)
+        first, second, third = await repository.create_many(
+            [_new_inbox_task(name) for name in ("First", "Second", "Third")]
+        )
+        steps.append(await _check_rollups(uow, _COLLECTION_REF_ID))
+
+        first = await repository.save(
+            _change_status(first, 3, InboxTaskStatus.IN_PROGRESS)
+        )
+        steps.append(await _check_rollups(uow, _COLLECTION_REF_ID))
+
+        # Saving without a change leaves the rollups as they are.
+        first = await repository.save(first)
+        steps.append(await _check_rollups(uow, _COLLECTION_REF_ID))
+
+        await repository.save_many(
+            [
+                _change_status(first, 5, InboxTaskStatus.DONE),
+                _change_status(second, 5, InboxTaskStatus.NOT_DONE),
+            ]
+        )
+        steps.append(await _check_rollups(uow, _COLLECTION_REF_ID))
+
+        await repository.remove(third.ref_id)
+        steps.append(await _check_rollups(uow, _COLLECTION_REF_ID))
+    await storage.dispose()
+    return steps
+
+
+def test_save_and_save_many_move_inbox_tasks_between_rollups(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    touched, created, working, done, not_done = (
+        InboxTaskReportRollupKind.TOUCHED,
+        InboxTaskReportRollupKind.CREATED,
+        InboxTaskReportRollupKind.WORKING,
+        InboxTaskReportRollupKind.DONE,
+        InboxTaskReportRollupKind.NOT_DONE,
+    )
+
+    assert asyncio.run(_save_through_the_lifecycle(sqlite_storage)) == [
+        {touched: 3, created: 3},
+        {touched: 3, created: 3, working: 1},
+        {touched: 3, created: 3, working: 1},
+        {touched: 3, created: 3, done: 1, not_done: 1},
+        {touched: 2, created: 2, done: 1, not_done: 1},
+    ]
+
+
+async def _archive_and_remove_by_parents(
+    storage: SqliteTestStorage,
+) -> tuple[list[ADate | None], _Kinds, _Kinds]:
+    await storage.create_tables(InboxTask)
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        repository = uow.get(InboxTaskRepository)
+        inbox_tasks = await repository.create_many(
+            [
+                _new_inbox_task("First"),
+                _new_inbox_task("Second"),
+                _new_inbox_task("Third"),
+                _new_inbox_task("Other", _OTHER_COLLECTION_REF_ID),
+            ]
+        )
+        # Tasks at every stage, so each kind of rollup moves on archival.
+        await repository.save_many(
+            [
+                _change_status(inbox_tasks[0], 3, InboxTaskStatus.IN_PROGRESS),
+                _change_status(inbox_tasks[2], 5, InboxTaskStatus.DONE),
+                _change_status(inbox_tasks[3], 5, InboxTaskStatus.NOT_DONE),
+            ]
+        )
+
+        await repository.archive_all_by_parents(
+            _ctx(7),
+            [_COLLECTION_REF_ID, _OTHER_COLLECTION_REF_ID],
+            ArchivalReason.GC,
+            exclude_ref_ids=[inbox_tasks[1].ref_id],
+        )
+        await _check_rollups(uow, _COLLECTION_REF_ID)
+        await _check_rollups(uow, _OTHER_COLLECTION_REF_ID)
+        touched_days = sorted(
+            (
+                rollup.modified_day
+                for rollup in await repository.find_report_rollups(
+                    _COLLECTION_REF_ID, by_modified_day=True
+                )
+                if rollup.kind == InboxTaskReportRollupKind.TOUCHED
+                for _ in range(rollup.count)
+            ),
+            key=str,
+        )
+
+        await repository.remove_all_by_parents([_COLLECTION_REF_ID])
+        after_remove = await _check_rollups(uow, _COLLECTION_REF_ID)
+        other_after_remove = await _check_rollups(uow, _OTHER_COLLECTION_REF_ID)
+    await storage.dispose()
+    return touched_days, after_remove, other_after_remove
+
+
+def test_archive_and_remove_all_by_parents_keep_the_rollups_in_step(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    touched_days, after_remove, other_after_remove = asyncio.run(
+        _archive_and_remove_by_parents(sqlite_storage)
+    )
+
+    # The excluded task is still touched on the day it was created.
+    assert touched_days == [
+        ADate.from_str("2026-10-01"),
+        ADate.from_str("2026-10-07"),
+        ADate.from_str("2026-10-07"),
+    ]
+    assert after_remove == {}
+    assert other_after_remove == {
+        InboxTaskReportRollupKind.TOUCHED: 1,
+        InboxTaskReportRollupKind.CREATED: 1,
+        InboxTaskReportRollupKind.NOT_DONE: 1,
+    }
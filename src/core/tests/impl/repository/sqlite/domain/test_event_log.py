@@ -0,0 +1,256 @@
+"""Tests for the SQLite event log repository."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import jupiter.core.domain
+import jupiter.core.use_cases
+from jupiter.core.domain.event_log_repository import EventLogBatchOutcome
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.impl.repository.sqlite.connection import SqliteConnection
+from jupiter.core.impl.repository.sqlite.domain.event_log import (
+    SqliteEventLogRepository,
+)
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+from pendulum import UTC, DateTime
+from sqlalchemy import MetaData, text
+
+_MIGRATIONS_PATH = Path(__file__).parents[5] / "migrations"
+_REALM_CODEC_REGISTRY = ModuleExplorerRealmCodecRegistry.build_from_module_root(
+    jupiter.core.domain, jupiter.core.use_cases
+)
+_CUTOFF = Timestamp(DateTime(2026, 1, 1, tzinfo=UTC))
+
+
+def _build_connection(tmp_path: Path, with_archive: bool) -> SqliteConnection:
+    return SqliteConnection(
+        SqliteConnection.Config(
+            sqlite_db_url=f"sqlite+aiosqlite:///{tmp_path / 'jupiter.sqlite'}",
+            alembic_ini_path=_MIGRATIONS_PATH / "alembic.ini",
+            alembic_migrations_path=_MIGRATIONS_PATH,
+            tuning=SqliteConnection.Tuning.sqlite_defaults(),
+            event_archive_db_path=(
+                tmp_path / "archive.sqlite" if with_archive else None
+            ),
+        )
+    )
+
+
+async def _insert_events(
+    connection: SqliteConnection, events: list[tuple[int, str, int, str]]
+) -> None:
+    """Insert (owner_ref_id, timestamp, owner_version, status) events for things."""
+    async with connection.sql_engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE thing (ref_id INTEGER PRIMARY KEY)"))
+        await conn.execute(
+            text(
+                """
+                CREATE TABLE thing_event (
+                    owner_ref_id INTEGER NOT NULL,
+                    timestamp DATETIME NOT NULL,
+                    session_index INTEGER NOT NULL,
+                    name VARCHAR(32) NOT NULL,
+                    source VARCHAR(16) NOT NULL,
+                    owner_version INTEGER NOT NULL,
+                    kind VARCHAR(16) NOT NULL,
+                    data JSON,
+                    PRIMARY KEY (owner_ref_id, timestamp, session_index, name)
+                )
+                """
+            )
+        )
+        for owner_ref_id, timestamp, owner_version, status in events:
+            await conn.execute(
+                text(
+                    "INSERT INTO thing_event VALUES (:owner_ref_id, :timestamp, 0, 'update', 'app', :owner_version, 'Updated', :data)"
+                ),
+                {
+                    "owner_ref_id": owner_ref_id,
+                    "timestamp": timestamp,
+                    "owner_version": owner_version,
+                    "data": json.dumps({"status": status}),
+                },
+            )
+
+
+async def _compact(
+    connection: SqliteConnection, version_window: int, batch_size: int
+) -> EventLogBatchOutcome:
+    async with connection.sql_engine.begin() as conn:
+        repository = SqliteEventLogRepository(_REALM_CODEC_REGISTRY, conn, MetaData())
+        return await repository.compact_before(
+            "thing_event", _CUTOFF, version_window, batch_size
+        )
+
+
+async def _read_events(
+    connection: SqliteConnection, table_name: str
+) -> list[tuple[int, int, str, str]]:
+    async with connection.sql_engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                f"SELECT owner_ref_id, owner_version, kind, data FROM {table_name} ORDER BY owner_ref_id, owner_version"  # nosec
+            )
+        )
+        return [tuple(row) for row in result]  # type: ignore[misc]
+
+
+def test_old_events_get_compacted_into_a_snapshot_per_version_window(
+    tmp_path: Path,
+) -> None:
+    connection = _build_connection(tmp_path, with_archive=False)
+
+    async def run() -> (
+        tuple[list[EventLogBatchOutcome], list[tuple[int, int, str, str]]]
+    ):
+        await _insert_events(
+            connection,
+            [
+                (1, "2025-01-01 10:00:00.000000", 1, "a"),
+                (1, "2025-01-02 10:00:00.000000", 2, "b"),
+                (1, "2025-01-03 10:00:00.000000", 3, "c"),
+                # In the next version window.
+                (1, "2025-01-04 10:00:00.000000", 4, "d"),
+                (1, "2025-01-05 10:00:00.000000", 5, "e"),
+                # Too recent to be compacted.
+                (1, "2026-02-01 10:00:00.000000", 6, "f"),
+                # Alone in its window.
+                (2, "2025-01-01 10:00:00.000000", 1, "x"),
+            ],
+        )
+        outcomes = [
+            await _compact(connection, version_window=3, batch_size=1),
+            await _compact(connection, version_window=3, batch_size=1),
+            await _compact(connection, version_window=3, batch_size=1),
+        ]
+        events = await _read_events(connection, "thing_event")
+        await connection.dispose()
+        return outcomes, events
+
+    outcomes, events = asyncio.run(run())
+
+    assert outcomes == [
+        EventLogBatchOutcome(events_removed=3, events_added=1, has_more=True),
+        EventLogBatchOutcome(events_removed=2, events_added=1, has_more=False),
+        EventLogBatchOutcome(events_removed=0, events_added=0, has_more=False),
+    ]
+    assert [(e[0], e[1], e[2]) for e in events] == [
+        (1, 3, "Snapshot"),
+        (1, 5, "Snapshot"),
+        (1, 6, "Updated"),
+        (2, 1, "Updated"),
+    ]
+    assert json.loads(events[0][3]) == {
+        "compacted_events": 3,
+        "first_timestamp": "2025-01-01 10:00:00.000000",
+        "first_owner_version": 1,
+        "frame_args": {"status": "c"},
+    }
+
+
+def test_snapshots_absorb_later_events_in_their_window(tmp_path: Path) -> None:
+    connection = _build_connection(tmp_path, with_archive=False)
+
+    async def run() -> list[tuple[int, int, str, str]]:
+        await _insert_events(
+            connection,
+            [
+                (1, "2025-01-01 10:00:00.000000", 1, "a"),
+                (1, "2025-01-02 10:00:00.000000", 2, "b"),
+            ],
+        )
+        await _compact(connection, version_window=10, batch_size=10)
+        async with connection.sql_engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO thing_event VALUES (1, '2025-01-03 10:00:00.000000', 0, 'update', 'app', 3, 'Updated', '{\"status\": \"c\"}')"
+                )
+            )
+        await _compact(connection, version_window=10, batch_size=10)
+        events = await _read_events(connection, "thing_event")
+        await connection.dispose()
+        return events
+
+    events = asyncio.run(run())
+
+    assert len(events) == 1
+    assert json.loads(events[0][3]) == {
+        "compacted_events": 3,
+        "first_timestamp": "2025-01-01 10:00:00.000000",
+        "first_owner_version": 1,
+        "frame_args": {"status": "c"},
+    }
+
+
+def test_compaction_groups_events_by_window_even_when_they_interleave(
+    tmp_path: Path,
+) -> None:
+    connection = _build_connection(tmp_path, with_archive=False)
+
+    async def run() -> tuple[EventLogBatchOutcome, list[tuple[int, int, str, str]]]:
+        await _insert_events(
+            connection,
+            [
+                (1, "2025-01-01 10:00:00.000000", 1, "a"),
+                (1, "2025-01-02 10:00:00.000000", 4, "d"),
+                (1, "2025-01-03 10:00:00.000000", 2, "b"),
+                (1, "2025-01-04 10:00:00.000000", 5, "e"),
+            ],
+        )
+        outcome = await _compact(connection, version_window=3, batch_size=10)
+        events = await _read_events(connection, "thing_event")
+        await connection.dispose()
+        return outcome, events
+
+    outcome, events = asyncio.run(run())
+
+    assert outcome == EventLogBatchOutcome(
+        events_removed=4, events_added=2, has_more=False
+    )
+    assert [(e[0], e[1], e[2]) for e in events] == [
+        (1, 2, "Snapshot"),
+        (1, 5, "Snapshot"),
+    ]
+    assert [json.loads(e[3])["compacted_events"] for e in events] == [2, 2]
+
+
+def test_old_events_get_moved_to_the_archive(tmp_path: Path) -> None:
+    connection = _build_connection(tmp_path, with_archive=True)
+
+    async def run() -> tuple[
+        list[EventLogBatchOutcome],
+        list[tuple[int, int, str, str]],
+        list[tuple[int, int, str, str]],
+    ]:
+        await _insert_events(
+            connection,
+            [
+                (1, "2025-01-01 10:00:00.000000", 1, "a"),
+                (1, "2025-01-02 10:00:00.000000", 2, "b"),
+                (1, "2026-02-01 10:00:00.000000", 3, "c"),
+            ],
+        )
+        outcomes = []
+        for _ in range(2):
+            async with connection.sql_engine.begin() as conn:
+                repository = SqliteEventLogRepository(
+                    _REALM_CODEC_REGISTRY, conn, MetaData()
+                )
+                assert await repository.has_archive()
+                outcomes.append(
+                    await repository.archive_before("thing_event", _CUTOFF, 1)
+                )
+        events = await _read_events(connection, "thing_event")
+        archived_events = await _read_events(connection, "event_archive.thing_event")
+        await connection.dispose()
+        return outcomes, events, archived_events
+
+    outcomes, events, archived_events = asyncio.run(run())
+
+    assert outcomes == [
+        EventLogBatchOutcome(events_removed=1, events_added=0, has_more=True),
+        EventLogBatchOutcome(events_removed=1, events_added=0, has_more=False),
+    ]
+    assert [e[1] for e in events] == [3]
+    assert [e[1] for e in archived_events] == [1, 2]
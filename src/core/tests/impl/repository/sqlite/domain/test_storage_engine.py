@@ -0,0 +1,166 @@
+"""Tests for the SQLite domain storage engine."""
+
+import asyncio
+from pathlib import Path
+from typing import cast
+
+import jupiter.core.domain
+import jupiter.core.impl.repository.sqlite.domain
+import pytest
+from jupiter.core.domain.concept.vacations.vacation import Vacation
+from jupiter.core.domain.concept.vacations.vacation_name import VacationName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.storage_engine import DomainUnitOfWork
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.entity import CrownEntity
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.manifest import (
+    ManifestSection,
+    import_path,
+    resolve_import_path,
+)
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.framework.record import Record
+from jupiter.core.framework.repository import Repository
+from jupiter.core.impl.repository.sqlite.domain.storage_engine import (
+    SqliteDomainStorageEngine,
+)
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_CTX = DomainContext.from_sys(
+    EventSource.GEN_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+
+
+@pytest.fixture(scope="module")
+def manifest_section() -> ManifestSection:
+    return SqliteDomainStorageEngine.build_manifest_section(
+        jupiter.core.impl.repository.sqlite.domain, jupiter.core.domain
+    )
+
+
+def _repository_type_names(
+    uow: DomainUnitOfWork, section: ManifestSection
+) -> dict[str, str]:
+    """The name of the repository the unit of work gives for each manifest entry."""
+    names = {}
+    for kind, key_path, *_ in section:
+        # The scan also picks up the generic standard repositories themselves,
+        # which only get built for a particular entity.
+        if key_path.startswith("jupiter.core.framework."):
+            continue
+        key = resolve_import_path(key_path)
+        repository: object
+        if kind in ("entity-repository", "standard-entity-repository"):
+            repository = uow.get_for(cast(type[CrownEntity], key))
+        elif kind == "record-repository":
+            repository = uow.get_for_record(cast(type[Record], key))
+        else:
+            repository = uow.get(cast(type[Repository], key))
+        names[f"{kind}:{key_path}"] = type(repository).__qualname__
+    return names
+
+
+async def _repository_type_names_of(
+    storage: SqliteTestStorage, section: ManifestSection
+) -> dict[str, str]:
+    async with storage.domain_storage_engine.get_unit_of_work() as uow:
+        names = _repository_type_names(uow, section)
+    await storage.dispose()
+    return names
+
+
+def test_manifest_section_lists_every_repository(
+    manifest_section: ManifestSection,
+) -> None:
+    assert (
+        "standard-entity-repository",
+        import_path(Vacation),
+    ) in manifest_section
+    assert {entry[0] for entry in manifest_section} == {
+        "entity-repository",
+        "standard-entity-repository",
+        "record-repository",
+        "repository",
+    }
+
+
+def test_engine_from_manifest_gives_the_same_repositories_as_scanning(
+    manifest_section: ManifestSection,
+    realm_codec_registry: RealmCodecRegistry,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "scanned").mkdir()
+    (tmp_path / "manifest").mkdir()
+
+    scanned_names = asyncio.run(
+        _repository_type_names_of(
+            SqliteTestStorage(realm_codec_registry, tmp_path / "scanned"),
+            manifest_section,
+        )
+    )
+    manifest_names = asyncio.run(
+        _repository_type_names_of(
+            SqliteTestStorage(
+                realm_codec_registry, tmp_path / "manifest", manifest_section
+            ),
+            manifest_section,
+        )
+    )
+
+    assert f"standard-entity-repository:{import_path(Vacation)}" in manifest_names
+    assert manifest_names == scanned_names
+
+
+def test_engine_from_manifest_stores_entities(
+    manifest_section: ManifestSection,
+    realm_codec_registry: RealmCodecRegistry,
+    tmp_path: Path,
+) -> None:
+    async def run() -> tuple[Vacation, Vacation]:
+        storage = SqliteTestStorage(realm_codec_registry, tmp_path, manifest_section)
+        await storage.create_tables(Vacation)
+        async with storage.domain_storage_engine.get_unit_of_work() as uow:
+            vacation = await uow.get_for(Vacation).create(
+                Vacation.new_vacation(
+                    _CTX,
+                    EntityId("1"),
+                    VacationName("Holiday"),
+                    ADate.from_str("2026-01-01"),
+                    ADate.from_str("2026-01-10"),
+                )
+            )
+        async with storage.domain_storage_engine.get_unit_of_work() as uow:
+            loaded = await uow.get_for(Vacation).load_by_id(vacation.ref_id)
+        await storage.dispose()
+        return vacation, loaded
+
+    vacation, loaded = asyncio.run(run())
+
+    assert loaded == vacation
+
+
+def test_engine_from_manifest_misses_unlisted_repositories(
+    realm_codec_registry: RealmCodecRegistry, tmp_path: Path
+) -> None:
+    async def run() -> None:
+        storage = SqliteTestStorage(realm_codec_registry, tmp_path, [])
+        async with storage.domain_storage_engine.get_unit_of_work() as uow:
+            with pytest.raises(ValueError, match="No repository for entity type"):
+                uow.get_for(Vacation)
+        await storage.dispose()
+
+    asyncio.run(run())
+
+
+def test_engine_from_manifest_rejects_unknown_entries(
+    realm_codec_registry: RealmCodecRegistry, tmp_path: Path
+) -> None:
+    with pytest.raises(Exception, match="Unknown repository manifest entry kind"):
+        SqliteTestStorage(
+            realm_codec_registry, tmp_path, [("widget", import_path(Vacation))]
+        )
@@ -0,0 +1,119 @@
+"""Tests for the SQLite event store."""
+
+import asyncio
+
+import jupiter.core.domain
+import jupiter.core.use_cases
+from jupiter.core.domain.concept.vacations.vacation import Vacation
+from jupiter.core.domain.concept.vacations.vacation_name import VacationName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.entity import (
+    RootEntity,
+    create_entity_action,
+    entity,
+    update_entity_action,
+)
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import DatabaseRealm
+from jupiter.core.impl.repository.sqlite.infra.events import (
+    build_event_table,
+    upsert_events,
+)
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+from pendulum import UTC, DateTime
+from sqlalchemy import Column, Integer, MetaData, Table, delete, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+_REALM_CODEC_REGISTRY = ModuleExplorerRealmCodecRegistry.build_from_module_root(
+    jupiter.core.domain, jupiter.core.use_cases
+)
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+
+
+@entity
+class _Thing(RootEntity):
+    label: str
+
+    @staticmethod
+    @create_entity_action
+    def new_thing(ctx: DomainContext, label: str) -> "_Thing":
+        return _Thing._create(ctx, label=label)
+
+    @update_entity_action
+    def relabel(self, ctx: DomainContext, label: str) -> "_Thing":
+        return self._new_version(ctx, label=label)
+
+
+async def _save_and_read_session_indices(things: list[_Thing]) -> list[list[int]]:
+    metadata = MetaData()
+    thing_table = Table("thing", metadata, Column("ref_id", Integer, primary_key=True))
+    event_table = build_event_table(thing_table, metadata)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_indices: list[list[int]] = []
+    async with engine.begin() as connection:
+        await connection.run_sync(event_table.metadata.create_all)
+        for thing in things:
+            await upsert_events(_REALM_CODEC_REGISTRY, connection, event_table, thing)
+            result = await connection.execute(
+                select(event_table.c.session_index).order_by(
+                    event_table.c.session_index
+                )
+            )
+            session_indices.append(list(result.scalars()))
+            await connection.execute(delete(event_table))
+    await engine.dispose()
+    return session_indices
+
+
+def test_saving_writes_only_the_new_events() -> None:
+    thing = _Thing.new_thing(_CTX, label="a").assign_ref_id(EntityId("1"))
+
+    session_indices = asyncio.run(_save_and_read_session_indices([thing, thing]))
+
+    assert session_indices == [[0], []]
+    assert thing.persisted_events_count == 1
+
+
+def test_new_versions_keep_track_of_the_events_already_written() -> None:
+    thing = _Thing.new_thing(_CTX, label="a").assign_ref_id(EntityId("1"))
+
+    asyncio.run(_save_and_read_session_indices([thing]))
+    relabeled = thing.relabel(_CTX, label="b").relabel(_CTX, label="c")
+    session_indices = asyncio.run(_save_and_read_session_indices([relabeled]))
+
+    assert session_indices == [[1, 2]]
+    assert relabeled.persisted_events_count == 3
+
+
+def test_unsaved_versions_write_all_their_events() -> None:
+    thing = _Thing.new_thing(_CTX, label="a").assign_ref_id(EntityId("1"))
+    relabeled = thing.relabel(_CTX, label="b")
+
+    session_indices = asyncio.run(_save_and_read_session_indices([thing, relabeled]))
+
+    assert session_indices == [[0], [0, 1]]
+
+
+def test_the_persisted_events_count_stays_out_of_comparisons_and_realms() -> None:
+    vacation = Vacation.new_vacation(
+        _CTX,
+        EntityId("1"),
+        VacationName("Holiday"),
+        ADate.from_str("2026-01-01"),
+        ADate.from_str("2026-01-10"),
+    ).assign_ref_id(EntityId("2"))
+    saved_vacation = vacation.assign_ref_id(EntityId("2"))
+    saved_vacation.mark_events_persisted()
+
+    assert saved_vacation.persisted_events_count == 1
+    assert vacation.persisted_events_count == 0
+    assert saved_vacation == vacation
+    assert repr(saved_vacation) == repr(vacation)
+    encoder = _REALM_CODEC_REGISTRY.get_encoder(Vacation, DatabaseRealm)
+    assert encoder.encode(saved_vacation) == encoder.encode(vacation)
+    assert "_persisted_events_count" not in str(encoder.encode(saved_vacation))
@@ -0,0 +1,456 @@
+"""Tests for the SQLite entity repositories."""
+
+import asyncio
+import sqlite3
+from collections.abc import Awaitable, Callable
+from contextlib import closing
+from pathlib import Path
+from typing import TypeVar
+
+import jupiter.core.impl.repository.sqlite.infra.repository as repository_module
+import pytest
+from jupiter.core.domain.concept.vacations.vacation import Vacation
+from jupiter.core.domain.concept.vacations.vacation_name import VacationName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.archival_reason import ArchivalReason
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.page_cursor import PageCursor
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.errors import InputValidationError
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.pagination import PaginatedUseCaseArgsBase, find_page
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.framework.repository import (
+    EntityNotFoundError,
+    LeafEntityRepository,
+)
+from jupiter.core.framework.update_action import UpdateAction
+from jupiter.core.impl.repository.sqlite.connection import SqliteConnection
+from jupiter.core.impl.repository.sqlite.infra.repository import (
+    SqliteLeafEntityRepository,
+)
+from pendulum import UTC, DateTime
+from sqlalchemy import Column, Integer, MetaData, Table, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+_CTX = DomainContext.from_sys(
+    EventSource.GEN_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+_ARCHIVE_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 18, tzinfo=UTC))
+)
+_VACATION_COLLECTION_REF_ID = EntityId("1")
+_OTHER_VACATION_COLLECTION_REF_ID = EntityId("2")
+_MIGRATIONS_PATH = Path(__file__).parents[5] / "migrations"
+
+_T = TypeVar("_T")
+
+
+class _VacationRepository(
+    SqliteLeafEntityRepository[Vacation], LeafEntityRepository[Vacation]
+):
+    pass
+
+
+def _new_vacation(
+    name: str, vacation_collection_ref_id: EntityId = _VACATION_COLLECTION_REF_ID
+) -> Vacation:
+    return Vacation.new_vacation(
+        _CTX,
+        vacation_collection_ref_id,
+        VacationName(name),
+        ADate.from_str("2026-01-01"),
+        ADate.from_str("2026-01-10"),
+    )
+
+
+def _rename(vacation: Vacation, name: str, ctx: DomainContext = _CTX) -> Vacation:
+    return vacation.update(
+        ctx,
+        name=UpdateAction.change_to(VacationName(name)),
+        start_date=UpdateAction.do_nothing(),
+        end_date=UpdateAction.do_nothing(),
+    )
+
+
+def _run_with_repository(
+    tmp_path: Path,
+    realm_codec_registry: RealmCodecRegistry,
+    action: Callable[[_VacationRepository, AsyncConnection], Awaitable[_T]],
+) -> _T:
+    async def run() -> _T:
+        sqlite_connection = SqliteConnection(
+            SqliteConnection.Config(
+                sqlite_db_url=f"sqlite+aiosqlite:///{tmp_path / 'jupiter.sqlite'}",
+                alembic_ini_path=_MIGRATIONS_PATH / "alembic.ini",
+                alembic_migrations_path=_MIGRATIONS_PATH,
+                tuning=SqliteConnection.Tuning.sqlite_defaults(),
+            )
+        )
+        metadata = MetaData()
+        Table(
+            "vacation_collection",
+            metadata,
+            Column("ref_id", Integer, primary_key=True),
+        )
+        try:
+            async with sqlite_connection.sql_engine.begin() as connection:
+                repository = _VacationRepository(
+                    realm_codec_registry, connection, metadata
+                )
+                await connection.run_sync(metadata.create_all)
+                return await action(repository, connection)
+        finally:
+            await sqlite_connection.dispose()
+
+    return asyncio.run(run())
+
+
+async def _read_events(
+    repository: _VacationRepository, connection: AsyncConnection
+) -> list[tuple[int, int, str]]:
+    event_table = repository._event_table
+    result = await connection.execute(
+        select(
+            event_table.c.owner_ref_id,
+            event_table.c.owner_version,
+            event_table.c.name,
+        ).order_by(event_table.c.owner_ref_id, event_table.c.owner_version)
+    )
+    return [(row.owner_ref_id, row.owner_version, row.name) for row in result]
+
+
+def test_create_many_assigns_ref_ids_in_order_and_writes_events(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> tuple[list[Vacation], list[Vacation], list[tuple[int, int, str]]]:
+        created = await repository.create_many(
+            [_new_vacation("A"), _new_vacation("B"), _new_vacation("C")]
+        )
+        loaded = await repository.find_all(_VACATION_COLLECTION_REF_ID)
+        return created, loaded, await _read_events(repository, connection)
+
+    created, loaded, events = _run_with_repository(
+        tmp_path, realm_codec_registry, action
+    )
+
+    assert [(v.ref_id, str(v.name)) for v in created] == [
+        (EntityId("1"), "A"),
+        (EntityId("2"), "B"),
+        (EntityId("3"), "C"),
+    ]
+    assert sorted(loaded, key=lambda v: v.ref_id.as_int()) == created
+    assert events == [
+        (1, 1, "new_vacation"),
+        (2, 1, "new_vacation"),
+        (3, 1, "new_vacation"),
+    ]
+
+
+def test_create_many_rejects_entities_which_already_exist(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> None:
+        (created,) = await repository.create_many([_new_vacation("A")])
+        await repository.create_many([created])
+
+    with pytest.raises(Exception, match="ref_id already set"):
+        _run_with_repository(tmp_path, realm_codec_registry, action)
+
+
+def test_save_many_writes_new_versions_and_their_events(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> tuple[list[Vacation], list[tuple[int, int, str]]]:
+        created = await repository.create_many([_new_vacation("A"), _new_vacation("B")])
+        await repository.save_many([_rename(v, f"{v.name}2") for v in created])
+        loaded = await repository.find_all(_VACATION_COLLECTION_REF_ID)
+        return loaded, await _read_events(repository, connection)
+
+    loaded, events = _run_with_repository(tmp_path, realm_codec_registry, action)
+
+    assert sorted((str(v.name), v.version) for v in loaded) == [("A2", 2), ("B2", 2)]
+    assert events == [
+        (1, 1, "new_vacation"),
+        (1, 2, "update"),
+        (2, 1, "new_vacation"),
+        (2, 2, "update"),
+    ]
+
+
+def test_save_many_reports_the_missing_entity(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> None:
+        (created,) = await repository.create_many([_new_vacation("A")])
+        missing = _new_vacation("B").assign_ref_id(EntityId("42"))
+        await repository.save_many([created, missing])
+
+    with pytest.raises(EntityNotFoundError, match="id 42 not found"):
+        _run_with_repository(tmp_path, realm_codec_registry, action)
+
+
+def test_remove_many_removes_entities_and_events_across_chunks(
+    tmp_path: Path,
+    realm_codec_registry: RealmCodecRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(repository_module, "_BULK_CHUNK_SIZE", 2)
+
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> tuple[list[Vacation], list[Vacation], list[tuple[int, int, str]]]:
+        created = await repository.create_many(
+            [_new_vacation(name) for name in "ABCDE"]
+        )
+        removed = await repository.remove_many(
+            [created[4].ref_id, created[0].ref_id, created[2].ref_id]
+        )
+        remaining = await repository.find_all(_VACATION_COLLECTION_REF_ID)
+        return removed, remaining, await _read_events(repository, connection)
+
+    removed, remaining, events = _run_with_repository(
+        tmp_path, realm_codec_registry, action
+    )
+
+    assert [str(v.name) for v in removed] == ["E", "A", "C"]
+    assert sorted(str(v.name) for v in remaining) == ["B", "D"]
+    assert events == [(2, 1, "new_vacation"), (4, 1, "new_vacation")]
+
+
+def test_remove_many_removes_nothing_when_an_entity_is_missing(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> tuple[str, list[Vacation]]:
+        (created,) = await repository.create_many([_new_vacation("A")])
+        try:
+            await repository.remove_many([created.ref_id, EntityId("42")])
+        except EntityNotFoundError as err:
+            error = str(err)
+        else:
+            error = ""
+        return error, await repository.find_all(_VACATION_COLLECTION_REF_ID)
+
+    error, remaining = _run_with_repository(tmp_path, realm_codec_registry, action)
+
+    assert "identified by 42 does not exist" in error
+    assert [str(v.name) for v in remaining] == ["A"]
+
+
+_Rows = list[tuple[object, ...]]
+
+
+async def _archive_fixture(repository: _VacationRepository) -> list[Vacation]:
+    created = await repository.create_many(
+        [
+            *(_new_vacation(name) for name in "ABCDE"),
+            _new_vacation("F", _OTHER_VACATION_COLLECTION_REF_ID),
+            _new_vacation("G", EntityId("3")),
+        ]
+    )
+    # Already archived entities are left alone.
+    await repository.save(created[3].mark_archived(_CTX, ArchivalReason.USER))
+    return created
+
+
+async def _read_rows(
+    repository: _VacationRepository, connection: AsyncConnection
+) -> tuple[_Rows, _Rows]:
+    entity_rows = await connection.execute(
+        select(repository._table).order_by(repository._table.c.ref_id)
+    )
+    event_table = repository._event_table
+    event_rows = await connection.execute(
+        select(event_table).order_by(
+            event_table.c.owner_ref_id, event_table.c.owner_version
+        )
+    )
+    return [tuple(r) for r in entity_rows], [tuple(r) for r in event_rows]
+
+
+def test_archive_all_by_parents_matches_archiving_one_entity_at_a_time(
+    tmp_path: Path,
+    realm_codec_registry: RealmCodecRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(repository_module, "_BULK_CHUNK_SIZE", 2)
+    parent_ref_ids = [_VACATION_COLLECTION_REF_ID, _OTHER_VACATION_COLLECTION_REF_ID]
+
+    async def in_bulk(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> tuple[_Rows, _Rows, list[str]]:
+        created = await _archive_fixture(repository)
+        await repository.archive_all_by_parents(
+            _ARCHIVE_CTX,
+            parent_ref_ids,
+            ArchivalReason.GC,
+            exclude_ref_ids=[created[1].ref_id, created[4].ref_id, EntityId("42")],
+        )
+        rows, events = await _read_rows(repository, connection)
+        archived = await repository.find_all_by_parents(
+            [*parent_ref_ids, EntityId("3")], allow_archived=True
+        )
+        return rows, events, sorted(str(v.name) for v in archived if v.archived)
+
+    async def one_at_a_time(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> tuple[_Rows, _Rows]:
+        created = await _archive_fixture(repository)
+        excluded = {created[1].ref_id, created[4].ref_id}
+        for parent_ref_id in parent_ref_ids:
+            for vacation in await repository.find_all(parent_ref_id):
+                if vacation.ref_id in excluded:
+                    continue
+                await repository.save(
+                    vacation.mark_archived(_ARCHIVE_CTX, ArchivalReason.GC)
+                )
+        return await _read_rows(repository, connection)
+
+    (tmp_path / "bulk").mkdir()
+    (tmp_path / "one").mkdir()
+    bulk_rows, bulk_events, archived_names = _run_with_repository(
+        tmp_path / "bulk", realm_codec_registry, in_bulk
+    )
+    one_rows, one_events = _run_with_repository(
+        tmp_path / "one", realm_codec_registry, one_at_a_time
+    )
+
+    assert archived_names == ["A", "C", "D", "F"]
+    assert bulk_rows == one_rows
+    assert bulk_events == one_events
+
+
+def _sqlite_bound_parameters_limit() -> int:
+    with closing(sqlite3.connect(":memory:")) as connection:
+        return connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+
+
+def test_archive_all_by_parents_handles_more_exclusions_than_sqlite_can_bind(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> list[tuple[str, bool]]:
+        created = await repository.create_many([_new_vacation("A"), _new_vacation("B")])
+        await repository.archive_all_by_parents(
+            _ARCHIVE_CTX,
+            [_VACATION_COLLECTION_REF_ID],
+            ArchivalReason.GC,
+            exclude_ref_ids=[
+                created[0].ref_id,
+                *(
+                    EntityId(str(idx))
+                    for idx in range(100, 100 + _sqlite_bound_parameters_limit())
+                ),
+            ],
+        )
+        vacations = await repository.find_all(
+            _VACATION_COLLECTION_REF_ID, allow_archived=True
+        )
+        return sorted((str(v.name), v.archived) for v in vacations)
+
+    assert _run_with_repository(tmp_path, realm_codec_registry, action) == [
+        ("A", False),
+        ("B", True),
+    ]
+
+
+async def _walk_pages(
+    repository: _VacationRepository, page_size: int
+) -> list[list[str]]:
+    pages = []
+    cursor: PageCursor | None = None
+    while True:
+        page, cursor = await find_page(
+            repository,
+            PaginatedUseCaseArgsBase(page_size=page_size, cursor=cursor),
+            parent_ref_id=_VACATION_COLLECTION_REF_ID,
+        )
+        pages.append([str(v.name) for v in page])
+        if cursor is None:
+            return pages
+
+
+def test_find_page_breaks_ties_in_modification_time_by_ref_id(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> list[list[str]]:
+        created = await repository.create_many(
+            [_new_vacation(name) for name in ("A", "B", "C", "D", "E")]
+        )
+        await repository.save(_rename(created[1], "B2", _ARCHIVE_CTX))
+        return await _walk_pages(repository, page_size=2)
+
+    pages = _run_with_repository(tmp_path, realm_codec_registry, action)
+
+    # All but B2 were last modified at the same time.
+    assert pages == [["A", "C"], ["D", "E"], ["B2"]]
+
+
+def test_find_page_has_no_next_cursor_on_a_full_last_page(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> list[list[str]]:
+        await repository.create_many(
+            [_new_vacation(name) for name in ("A", "B", "C", "D")]
+        )
+        return await _walk_pages(repository, page_size=2)
+
+    assert _run_with_repository(tmp_path, realm_codec_registry, action) == [
+        ["A", "B"],
+        ["C", "D"],
+    ]
+
+
+def test_find_page_past_the_end_or_of_nothing_is_empty(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> tuple[list[Vacation], list[Vacation], list[list[str]]]:
+        created = await repository.create_many([_new_vacation("A")])
+        past_the_end = await repository.find_page_generic(
+            2,
+            PageCursor.after_entity(created[0]),
+            parent_ref_id=_VACATION_COLLECTION_REF_ID,
+        )
+        of_nothing = await repository.find_page_generic(
+            2, None, parent_ref_id=_OTHER_VACATION_COLLECTION_REF_ID
+        )
+        return past_the_end, of_nothing, await _walk_pages(repository, page_size=1)
+
+    past_the_end, of_nothing, pages = _run_with_repository(
+        tmp_path, realm_codec_registry, action
+    )
+
+    assert past_the_end == []
+    assert of_nothing == []
+    assert pages == [["A"]]
+
+
+@pytest.mark.parametrize("page_size", [0, 1001])
+def test_find_page_rejects_bad_page_sizes(
+    tmp_path: Path, realm_codec_registry: RealmCodecRegistry, page_size: int
+) -> None:
+    async def action(
+        repository: _VacationRepository, connection: AsyncConnection
+    ) -> None:
+        await _walk_pages(repository, page_size=page_size)
+
+    with pytest.raises(InputValidationError, match="Page size must be between"):
+        _run_with_repository(tmp_path, realm_codec_registry, action)
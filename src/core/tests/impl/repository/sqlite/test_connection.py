@@ -0,0 +1,237 @@
+"""Tests for the SQLite connection."""
+
+import asyncio
+from pathlib import Path
+from typing import cast
+
+import pytest
+import sqlalchemy.exc
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.vacations.vacation import Vacation
+from jupiter.core.domain.concept.vacations.vacation_name import VacationName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.storage_engine import SearchStorageEngine
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.framework.use_case_io import UseCaseArgsBase, use_case_args
+from jupiter.core.impl.repository.sqlite.connection import SqliteConnection
+from jupiter.core.use_cases.infra.use_cases import (
+    AppGuestReadonlyUseCase,
+    AppGuestReadonlyUseCaseContext,
+)
+from jupiter.core.utils.global_properties import GlobalProperties
+from jupiter.core.utils.time_provider import TimeProvider
+from pendulum import UTC, DateTime
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_MIGRATIONS_PATH = Path(__file__).parents[4] / "migrations"
+
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+
+
+def _alembic_head() -> str:
+    alembic_cfg = Config(str(_MIGRATIONS_PATH / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(_MIGRATIONS_PATH))
+    head = ScriptDirectory.from_config(alembic_cfg).get_current_head()
+    assert head is not None
+    return head
+
+
+def _connection_for(sqlite_db_url: str) -> SqliteConnection:
+    return SqliteConnection(
+        SqliteConnection.Config(
+            sqlite_db_url=sqlite_db_url,
+            alembic_ini_path=_MIGRATIONS_PATH / "alembic.ini",
+            alembic_migrations_path=_MIGRATIONS_PATH,
+            tuning=SqliteConnection.Tuning.sqlite_defaults(),
+        )
+    )
+
+
+async def _prepare_at_revision(
+    tmp_path: Path, revision: str, migrations: list[str]
+) -> SqliteConnection:
+    connection = _connection_for(f"sqlite+aiosqlite:///{tmp_path / 'jupiter.sqlite'}")
+    async with connection.sql_engine.begin() as conn:
+        await conn.execute(
+            text("CREATE TABLE IF NOT EXISTS alembic_version (version_num TEXT)")
+        )
+        await conn.execute(text("DELETE FROM alembic_version"))
+        await conn.execute(
+            text("INSERT INTO alembic_version VALUES (:revision)"),
+            {"revision": revision},
+        )
+
+    async def _migrate() -> None:
+        migrations.append(revision)
+
+    connection._migrate = _migrate  # type: ignore[method-assign]
+    await connection.prepare()
+    return connection
+
+
+def test_prepare_skips_migrations_at_head(tmp_path: Path) -> None:
+    async def _run() -> list[str]:
+        migrations: list[str] = []
+        connection = await _prepare_at_revision(tmp_path, _alembic_head(), migrations)
+        await connection.dispose()
+        return migrations
+
+    assert asyncio.run(_run()) == []
+
+
+def test_prepare_migrates_behind_head(tmp_path: Path) -> None:
+    async def _run() -> list[str]:
+        migrations: list[str] = []
+        connection = await _prepare_at_revision(tmp_path, "0123456789ab", migrations)
+        await connection.dispose()
+        return migrations
+
+    assert asyncio.run(_run()) == ["0123456789ab"]
+
+
+def test_reflected_schema_is_reused_until_the_revision_changes(
+    tmp_path: Path,
+) -> None:
+    async def _reflect(revision: str) -> list[str]:
+        connection = await _prepare_at_revision(tmp_path, revision, [])
+        await connection.reflect_metadata()
+        await connection.dispose()
+        return sorted(connection.metadata.tables)
+
+    async def _drop_thing() -> None:
+        connection = await _prepare_at_revision(tmp_path, _alembic_head(), [])
+        async with connection.sql_engine.begin() as conn:
+            await conn.execute(text("DROP TABLE thing"))
+        await connection.dispose()
+
+    async def _run() -> tuple[list[str], list[str], list[str]]:
+        connection = await _prepare_at_revision(tmp_path, _alembic_head(), [])
+        async with connection.sql_engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE thing (ref_id INTEGER PRIMARY KEY)"))
+        await connection.dispose()
+
+        reflected = await _reflect(_alembic_head())
+        await _drop_thing()
+        from_snapshot = await _reflect(_alembic_head())
+        reflected_again = await _reflect("0123456789ab")
+        return reflected, from_snapshot, reflected_again
+
+    reflected, from_snapshot, reflected_again = asyncio.run(_run())
+
+    assert reflected == ["alembic_version", "thing"]
+    assert from_snapshot == ["alembic_version", "thing"]
+    assert reflected_again == ["alembic_version"]
+
+
+async def _is_query_only(sql_engine: AsyncEngine) -> bool:
+    async with sql_engine.connect() as conn:
+        return bool((await conn.execute(text("PRAGMA query_only"))).scalar_one())
+
+
+def test_file_backed_databases_get_a_separate_query_only_read_engine(
+    tmp_path: Path,
+) -> None:
+    async def _run() -> tuple[bool, bool, bool]:
+        connection = _connection_for(
+            f"sqlite+aiosqlite:///{tmp_path / 'jupiter.sqlite'}"
+        )
+        is_separate = connection.read_sql_engine is not connection.sql_engine
+        reads_are_query_only = await _is_query_only(connection.read_sql_engine)
+        writes_are_query_only = await _is_query_only(connection.sql_engine)
+        await connection.dispose()
+        return is_separate, reads_are_query_only, writes_are_query_only
+
+    is_separate, reads_are_query_only, writes_are_query_only = asyncio.run(_run())
+
+    assert is_separate
+    assert reads_are_query_only
+    assert not writes_are_query_only
+
+
+@pytest.mark.parametrize(
+    "sqlite_db_url", ["sqlite+aiosqlite://", "sqlite+aiosqlite:///:memory:"]
+)
+def test_in_memory_databases_share_the_one_engine(sqlite_db_url: str) -> None:
+    async def _run() -> tuple[bool, bool]:
+        connection = _connection_for(sqlite_db_url)
+        is_shared = connection.read_sql_engine is connection.sql_engine
+        is_query_only = await _is_query_only(connection.read_sql_engine)
+        await connection.dispose()
+        return is_shared, is_query_only
+
+    is_shared, is_query_only = asyncio.run(_run())
+
+    assert is_shared
+    assert not is_query_only
+
+
+@use_case_args
+class _ReadArgs(UseCaseArgsBase):
+    """_ReadArgs."""
+
+
+class _ReadUseCase(AppGuestReadonlyUseCase[_ReadArgs, None]):
+    async def _execute(
+        self, context: AppGuestReadonlyUseCaseContext, args: _ReadArgs
+    ) -> None:
+        raise NotImplementedError
+
+
+def _vacation(name: str) -> Vacation:
+    return Vacation.new_vacation(
+        _CTX,
+        vacation_collection_ref_id=EntityId("1"),
+        name=VacationName(name),
+        start_date=ADate.from_str("2026-10-20"),
+        end_date=ADate.from_str("2026-10-25"),
+    )
+
+
+def test_readonly_use_cases_cannot_write(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    async def _run() -> list[VacationName]:
+        await sqlite_storage.create_tables(Vacation)
+        use_case = _ReadUseCase(
+            global_properties=cast(GlobalProperties, None),
+            time_provider=cast(TimeProvider, None),
+            realm_codec_registry=cast(RealmCodecRegistry, None),
+            auth_token_stamper=cast(AuthTokenStamper, None),
+            domain_storage_engine=sqlite_storage.domain_storage_engine,
+            search_storage_engine=cast(SearchStorageEngine, None),
+        )
+
+        async with sqlite_storage.domain_storage_engine.get_unit_of_work() as uow:
+            await uow.get_for(Vacation).create(_vacation("Written"))
+
+        # Both ways of getting a unit of work hand out query only connections.
+        read_storage_engine = use_case._domain_storage_engine
+        for get_unit_of_work in (
+            read_storage_engine.get_unit_of_work,
+            read_storage_engine.get_read_unit_of_work,
+        ):
+            with pytest.raises(
+                sqlalchemy.exc.OperationalError, match="attempt to write"
+            ):
+                async with get_unit_of_work() as uow:
+                    await uow.get_for(Vacation).create(_vacation("Not written"))
+
+        async with read_storage_engine.get_read_unit_of_work() as uow:
+            vacations = await uow.get_for(Vacation).find_all(
+                parent_ref_id=EntityId("1")
+            )
+        await sqlite_storage.dispose()
+        return [vacation.name for vacation in vacations]
+
+    assert asyncio.run(_run()) == [VacationName("Written")]
@@ -0,0 +1,86 @@
+"""A throwaway SQLite database for the tests which need real repositories."""
+
+from pathlib import Path
+from typing import Final
+
+import jupiter.core.domain
+import jupiter.core.impl.repository.sqlite.domain
+from jupiter.core.framework.entity import Entity
+from jupiter.core.framework.manifest import ManifestSection
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.framework.repository import Repository
+from jupiter.core.impl.repository.sqlite.connection import SqliteConnection
+from jupiter.core.impl.repository.sqlite.domain.storage_engine import (
+    SqliteDomainStorageEngine,
+)
+from sqlalchemy import Column, Integer, Table
+
+_MIGRATIONS_PATH: Final[Path] = Path(__file__).parents[1] / "migrations"
+
+
+class SqliteTestStorage:
+    """A SQLite database with the tables for just the entities a test needs.
+
+    The migrations can only run against the database from the global config,
+    so the tables are instead built from the repositories themselves. The
+    tables they point to but which the test doesn't need are stubbed out.
+    """
+
+    connection: Final[SqliteConnection]
+    domain_storage_engine: Final[SqliteDomainStorageEngine]
+
+    def __init__(
+        self,
+        realm_codec_registry: RealmCodecRegistry,
+        path: Path,
+        manifest_section: ManifestSection | None = None,
+    ) -> None:
+        """Constructor."""
+        self.connection = SqliteConnection(
+            SqliteConnection.Config(
+                sqlite_db_url=f"sqlite+aiosqlite:///{path / 'jupiter.sqlite'}",
+                alembic_ini_path=_MIGRATIONS_PATH / "alembic.ini",
+                alembic_migrations_path=_MIGRATIONS_PATH,
+                tuning=SqliteConnection.Tuning.sqlite_defaults(),
+            )
+        )
+        self.domain_storage_engine = (
+            SqliteDomainStorageEngine.build_from_manifest(
+                realm_codec_registry, self.connection, manifest_section
+            )
+            if manifest_section is not None
+            else SqliteDomainStorageEngine.build_from_module_root(
+                realm_codec_registry,
+                self.connection,
+                jupiter.core.impl.repository.sqlite.domain,
+                jupiter.core.domain,
+            )
+        )
+
+    async def create_tables(
+        self,
+        *entity_types: type[Entity],
+        repository_types: tuple[type[Repository], ...] = (),
+    ) -> None:
+        """Create the tables for some entities and repositories."""
+        metadata = self.connection.metadata
+        async with self.domain_storage_engine.get_unit_of_work() as uow:
+            for entity_type in entity_types:
+                uow.get_for(entity_type)  # type: ignore[type-var]
+            for repository_type in repository_types:
+                uow.get(repository_type)
+        for table in list(metadata.tables.values()):
+            for foreign_key in table.foreign_keys:
+                target_table_name = foreign_key.target_fullname.split(".")[0]
+                if target_table_name not in metadata.tables:
+                    Table(
+                        target_table_name,
+                        metadata,
+                        Column("ref_id", Integer, primary_key=True),
+                    )
+        async with self.connection.sql_engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+
+    async def dispose(self) -> None:
+        """Close all the connections to the database."""
+        await self.connection.dispose()
@@ -0,0 +1,148 @@
+"""Tests for the use case for checking the rollups which reports are computed from."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.inbox_tasks.inbox_task import (
+    InboxTask,
+    InboxTaskRepository,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_collection import (
+    InboxTaskCollection,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_name import InboxTaskName
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_report_rollup import (
+    InboxTaskReportRollupKind,
+)
+from jupiter.core.domain.concept.inbox_tasks.inbox_task_status import InboxTaskStatus
+from jupiter.core.domain.concept.user.user import User
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.difficulty import Difficulty
+from jupiter.core.domain.core.eisen import Eisen
+from jupiter.core.domain.storage_engine import SearchStorageEngine
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.use_cases.application.report_check import (
+    ReportCheckArgs,
+    ReportCheckResult,
+    ReportCheckUseCase,
+)
+from jupiter.core.use_cases.infra.use_cases import AppLoggedInReadonlyUseCaseContext
+from jupiter.core.utils.global_properties import GlobalProperties
+from jupiter.core.utils.time_provider import TimeProvider
+from pendulum import UTC, DateTime
+from sqlalchemy import text
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_CTX = DomainContext.from_sys(
+    EventSource.GEN_CRON, Timestamp(DateTime(2026, 10, 17, 12, tzinfo=UTC))
+)
+_WORKSPACE_REF_ID = EntityId("1")
+
+
+async def _check_before_and_after_tampering(
+    realm_codec_registry: RealmCodecRegistry, storage: SqliteTestStorage
+) -> tuple[ReportCheckResult, ReportCheckResult]:
+    await storage.create_tables(InboxTaskCollection, InboxTask)
+    engine = storage.domain_storage_engine
+    async with engine.get_unit_of_work() as uow:
+        inbox_task_collection = await uow.get_for(InboxTaskCollection).create(
+            InboxTaskCollection.new_inbox_task_collection(_CTX, _WORKSPACE_REF_ID)
+        )
+        await uow.get(InboxTaskRepository).create_many(
+            [
+                InboxTask.new_inbox_task(
+                    _CTX,
+                    inbox_task_collection_ref_id=inbox_task_collection.ref_id,
+                    name=InboxTaskName(name),
+                    status=status,
+                    is_key=False,
+                    eisen=Eisen.REGULAR,
+                    difficulty=Difficulty.EASY,
+                    actionable_date=None,
+                    due_date=None,
+                    project_ref_id=EntityId("1"),
+                    big_plan_ref_id=None,
+                    big_plan_project_ref_id=None,
+                    big_plan_actionable_date=None,
+                    big_plan_due_date=None,
+                )
+                for name, status in [
+                    ("First", InboxTaskStatus.NOT_STARTED),
+                    ("Second", InboxTaskStatus.DONE),
+                ]
+            ]
+        )
+
+    use_case = ReportCheckUseCase(
+        global_properties=cast(GlobalProperties, None),
+        time_provider=cast(TimeProvider, None),
+        realm_codec_registry=realm_codec_registry,
+        auth_token_stamper=cast(AuthTokenStamper, None),
+        domain_storage_engine=engine,
+        search_storage_engine=cast(SearchStorageEngine, None),
+    )
+    context = AppLoggedInReadonlyUseCaseContext(
+        user=cast(User, None),
+        workspace=cast(Workspace, SimpleNamespace(ref_id=_WORKSPACE_REF_ID)),
+    )
+    before = await use_case._execute(context, ReportCheckArgs())
+
+    async with storage.connection.sql_engine.begin() as connection:
+        await connection.execute(
+            text(
+                "UPDATE inbox_task_report_rollup SET count = count + 1 "
+                "WHERE kind = 'created'"
+            )
+        )
+        await connection.execute(
+            text(
+                "UPDATE inbox_task_report_rollup SET modified_day = '2026-10-01', "
+                "event_day = '2026-10-01' WHERE kind = 'done'"
+            )
+        )
+    after = await use_case._execute(context, ReportCheckArgs())
+
+    await storage.dispose()
+    return before, after
+
+
+def test_mismatches_are_found_against_a_scan_and_sorted(
+    realm_codec_registry: RealmCodecRegistry, sqlite_storage: SqliteTestStorage
+) -> None:
+    before, after = asyncio.run(
+        _check_before_and_after_tampering(realm_codec_registry, sqlite_storage)
+    )
+
+    assert before.inbox_tasks_cnt == 2
+    assert before.mismatches == []
+    assert [
+        (m.rollup.modified_day, m.rollup.kind, m.rollup.count, m.expected_count)
+        for m in after.mismatches
+    ] == [
+        (
+            ADate.from_str("2026-10-01"),
+            InboxTaskReportRollupKind.DONE,
+            1,
+            0,
+        ),
+        (
+            ADate.from_str("2026-10-17"),
+            InboxTaskReportRollupKind.CREATED,
+            3,
+            2,
+        ),
+        (
+            ADate.from_str("2026-10-17"),
+            InboxTaskReportRollupKind.DONE,
+            0,
+            1,
+        ),
+    ]
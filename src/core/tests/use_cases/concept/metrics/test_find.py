@@ -0,0 +1,146 @@
+"""Tests for the use case for finding metrics."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.metrics.metric import Metric
+from jupiter.core.domain.concept.metrics.metric_collection import MetricCollection
+from jupiter.core.domain.concept.metrics.metric_entry import MetricEntry
+from jupiter.core.domain.concept.metrics.metric_name import MetricName
+from jupiter.core.domain.concept.projects.project import Project
+from jupiter.core.domain.concept.projects.project_name import ProjectName
+from jupiter.core.domain.concept.user.user import User
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.core.notes.note import Note
+from jupiter.core.domain.core.notes.note_collection import NoteCollection
+from jupiter.core.domain.core.notes.note_domain import NoteDomain
+from jupiter.core.domain.storage_engine import SearchStorageEngine
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.use_cases.concept.metrics.find import (
+    MetricFindArgs,
+    MetricFindUseCase,
+)
+from jupiter.core.use_cases.infra.use_cases import AppLoggedInReadonlyUseCaseContext
+from jupiter.core.utils.global_properties import GlobalProperties
+from jupiter.core.utils.time_provider import TimeProvider
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+_WORKSPACE_REF_ID = EntityId("1")
+
+
+async def _find_entry_notes(
+    realm_codec_registry: RealmCodecRegistry, storage: SqliteTestStorage
+) -> dict[str, list[EntityId]]:
+    await storage.create_tables(
+        Project, MetricCollection, Metric, MetricEntry, NoteCollection, Note
+    )
+    engine = storage.domain_storage_engine
+    async with engine.get_unit_of_work() as uow:
+        project = await uow.get_for(Project).create(
+            Project.new_root_project(_CTX, EntityId("1"), ProjectName("Life"))
+        )
+        collection = await uow.get_for(MetricCollection).create(
+            MetricCollection.new_metric_collection(
+                _CTX, _WORKSPACE_REF_ID, project.ref_id
+            )
+        )
+        note_collection = await uow.get_for(NoteCollection).create(
+            NoteCollection.new_note_collection(_CTX, _WORKSPACE_REF_ID)
+        )
+        metrics = await uow.get_for(Metric).create_many(
+            [
+                Metric.new_metric(
+                    _CTX,
+                    collection.ref_id,
+                    MetricName(name),
+                    is_key=False,
+                    icon=None,
+                    collection_params=None,
+                    metric_unit=None,
+                )
+                for name in ("Weight", "Steps")
+            ]
+        )
+        entries = await uow.get_for(MetricEntry).create_many(
+            [
+                MetricEntry.new_metric_entry(
+                    _CTX, metric.ref_id, ADate.from_str(day), value
+                )
+                for metric, day, value in [
+                    (metrics[0], "2026-10-01", 70.0),
+                    (metrics[0], "2026-10-02", 71.0),
+                    (metrics[1], "2026-10-01", 9000.0),
+                ]
+            ]
+        )
+        await uow.get_for(Note).create_many(
+            [
+                Note.new_note(
+                    _CTX,
+                    note_collection.ref_id,
+                    NoteDomain.METRIC_ENTRY,
+                    entry.ref_id,
+                    [],
+                )
+                for entry in entries[1:]
+            ]
+        )
+
+    use_case = MetricFindUseCase(
+        global_properties=cast(GlobalProperties, None),
+        time_provider=cast(TimeProvider, None),
+        realm_codec_registry=realm_codec_registry,
+        auth_token_stamper=cast(AuthTokenStamper, None),
+        domain_storage_engine=engine,
+        search_storage_engine=cast(SearchStorageEngine, None),
+    )
+    context = AppLoggedInReadonlyUseCaseContext(
+        user=cast(User, None),
+        workspace=cast(Workspace, SimpleNamespace(ref_id=_WORKSPACE_REF_ID)),
+    )
+    async with engine.get_read_unit_of_work() as uow:
+        result = await use_case._perform_transactional_read(
+            uow,
+            context,
+            MetricFindArgs(
+                page_size=None,
+                cursor=None,
+                allow_archived=False,
+                include_notes=False,
+                include_entries=True,
+                include_collection_inbox_tasks=False,
+                include_metric_entry_notes=True,
+                filter_ref_ids=None,
+                filter_entry_ref_ids=None,
+            ),
+        )
+    await storage.dispose()
+
+    return {
+        str(entry.metric.name): [
+            cast(EntityId, n.source_entity_ref_id)
+            for n in entry.metric_entry_notes or []
+        ]
+        for entry in result.entries
+    }
+
+
+def test_entry_notes_are_found_for_the_loaded_entries(
+    realm_codec_registry: RealmCodecRegistry, sqlite_storage: SqliteTestStorage
+) -> None:
+    assert asyncio.run(_find_entry_notes(realm_codec_registry, sqlite_storage)) == {
+        "Weight": [EntityId("2")],
+        "Steps": [EntityId("3")],
+    }
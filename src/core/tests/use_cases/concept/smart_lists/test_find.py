@@ -0,0 +1,120 @@
+"""Tests for the use case for finding smart lists."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.smart_lists.smart_list import SmartList
+from jupiter.core.domain.concept.smart_lists.smart_list_collection import (
+    SmartListCollection,
+)
+from jupiter.core.domain.concept.smart_lists.smart_list_item import SmartListItem
+from jupiter.core.domain.concept.smart_lists.smart_list_item_name import (
+    SmartListItemName,
+)
+from jupiter.core.domain.concept.smart_lists.smart_list_name import SmartListName
+from jupiter.core.domain.concept.user.user import User
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.storage_engine import SearchStorageEngine
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.use_cases.concept.smart_lists.find import (
+    SmartListFindArgs,
+    SmartListFindUseCase,
+)
+from jupiter.core.use_cases.infra.use_cases import AppLoggedInReadonlyUseCaseContext
+from jupiter.core.utils.global_properties import GlobalProperties
+from jupiter.core.utils.time_provider import TimeProvider
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+_WORKSPACE_REF_ID = EntityId("1")
+
+
+async def _find_items(
+    realm_codec_registry: RealmCodecRegistry, storage: SqliteTestStorage
+) -> dict[str, list[str]]:
+    await storage.create_tables(SmartListCollection, SmartList, SmartListItem)
+    engine = storage.domain_storage_engine
+    async with engine.get_unit_of_work() as uow:
+        collection = await uow.get_for(SmartListCollection).create(
+            SmartListCollection.new_smart_list_collection(_CTX, _WORKSPACE_REF_ID)
+        )
+        smart_lists = await uow.get_for(SmartList).create_many(
+            [
+                SmartList.new_smart_list(
+                    _CTX, collection.ref_id, SmartListName(name), None
+                )
+                for name in ("Books", "Films")
+            ]
+        )
+        await uow.get_for(SmartListItem).create_many(
+            [
+                SmartListItem.new_smart_list_item(
+                    _CTX,
+                    smart_lists[0].ref_id,
+                    SmartListItemName(name),
+                    is_done=False,
+                    tags_ref_id=[],
+                    url=None,
+                )
+                for name in ("Dune", "Emma")
+            ]
+        )
+
+    use_case = SmartListFindUseCase(
+        global_properties=cast(GlobalProperties, None),
+        time_provider=cast(TimeProvider, None),
+        realm_codec_registry=realm_codec_registry,
+        auth_token_stamper=cast(AuthTokenStamper, None),
+        domain_storage_engine=engine,
+        search_storage_engine=cast(SearchStorageEngine, None),
+    )
+    context = AppLoggedInReadonlyUseCaseContext(
+        user=cast(User, None),
+        workspace=cast(Workspace, SimpleNamespace(ref_id=_WORKSPACE_REF_ID)),
+    )
+    async with engine.get_read_unit_of_work() as uow:
+        result = await use_case._perform_transactional_read(
+            uow,
+            context,
+            SmartListFindArgs(
+                page_size=None,
+                cursor=None,
+                allow_archived=False,
+                include_notes=False,
+                include_tags=False,
+                include_items=True,
+                include_item_notes=False,
+                filter_ref_ids=None,
+                filter_is_done=None,
+                filter_tag_names=None,
+                filter_tag_ref_id=None,
+                filter_item_ref_id=None,
+            ),
+        )
+    await storage.dispose()
+
+    return {
+        str(entry.smart_list.name): sorted(
+            str(item.name) for item in entry.smart_list_items or []
+        )
+        for entry in result.entries
+    }
+
+
+def test_items_are_found_without_an_item_filter(
+    realm_codec_registry: RealmCodecRegistry, sqlite_storage: SqliteTestStorage
+) -> None:
+    assert asyncio.run(_find_items(realm_codec_registry, sqlite_storage)) == {
+        "Books": ["Dune", "Emma"],
+        "Films": [],
+    }
@@ -0,0 +1,222 @@
+"""Tests for the cache of the user and workspace behind a logged-in session."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+from jupiter.core.domain.concept.user.user import User
+from jupiter.core.domain.concept.user.user_name import UserName
+from jupiter.core.domain.concept.user_workspace_link.user_workspace_link import (
+    UserWorkspaceLink,
+)
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.concept.workspaces.workspace_name import WorkspaceName
+from jupiter.core.domain.core.email_address import EmailAddress
+from jupiter.core.domain.core.timezone import Timezone
+from jupiter.core.domain.features import (
+    BASIC_USER_FEATURE_FLAGS,
+    BASIC_WORKSPACE_FEATURE_FLAGS,
+    LOCAL_WORKSPACE_FEATURE_FLAGS_CONTROLS,
+    USER_FEATURE_FLAGS_CONTROLS,
+)
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.update_action import UpdateAction
+from jupiter.core.use_cases.infra.logged_in_context_cache import (
+    LoggedInContextCache,
+)
+from jupiter.core.use_cases.infra.use_cases import _load_user_and_workspace
+from pendulum import UTC, DateTime
+
+from tests.sqlite_storage import SqliteTestStorage
+
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+
+
+class _Clock:
+    now: float
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _user_and_workspace(
+    user_version: int, workspace_version: int
+) -> tuple[User, Workspace]:
+    user = cast(User, SimpleNamespace(ref_id=EntityId("1"), version=user_version))
+    workspace = cast(
+        Workspace, SimpleNamespace(ref_id=EntityId("2"), version=workspace_version)
+    )
+    return user, workspace
+
+
+def _get_if_current(
+    cache: LoggedInContextCache, user_version: int | None, workspace_version: int
+) -> tuple[User, Workspace] | None:
+    async def load_versions(
+        user_ref_id: EntityId, workspace_ref_id: EntityId
+    ) -> tuple[int | None, int | None]:
+        return user_version, workspace_version
+
+    return asyncio.run(cache.get_if_current(EntityId("1"), load_versions))
+
+
+def test_a_fresh_entry_is_a_hit() -> None:
+    cache = LoggedInContextCache(ttl_secs=10, clock=_Clock())
+    user, workspace = _user_and_workspace(1, 1)
+
+    assert cache.get(EntityId("1")) is None
+    cache.put(user, workspace)
+
+    assert cache.get(EntityId("1")) == (user, workspace)
+    assert _get_if_current(cache, 1, 1) == (user, workspace)
+    assert cache.get(EntityId("3")) is None
+
+
+def test_an_expired_entry_is_a_miss() -> None:
+    clock = _Clock()
+    cache = LoggedInContextCache(ttl_secs=10, clock=clock)
+    user, workspace = _user_and_workspace(1, 1)
+    cache.put(user, workspace)
+
+    clock.now = 10.0
+
+    assert cache.get(EntityId("1")) is None
+
+
+def test_a_newer_version_evicts_the_entry() -> None:
+    cache = LoggedInContextCache(ttl_secs=10, clock=_Clock())
+    user, workspace = _user_and_workspace(1, 1)
+
+    cache.put(user, workspace)
+    assert _get_if_current(cache, 2, 1) is None
+    assert cache.get(EntityId("1")) is None
+
+    cache.put(user, workspace)
+    assert _get_if_current(cache, 1, 2) is None
+    assert cache.get(EntityId("1")) is None
+
+    cache.put(user, workspace)
+    assert _get_if_current(cache, None, 1) is None
+
+
+def test_concurrent_stale_hits_evict_only_the_entry_they_read() -> None:
+    async def run() -> (
+        tuple[list[tuple[User, Workspace] | None], tuple[User, Workspace] | None]
+    ):
+        cache = LoggedInContextCache(ttl_secs=10, clock=_Clock())
+        cache.put(*_user_and_workspace(1, 1))
+        versions_loading = asyncio.Event()
+        release = asyncio.Event()
+
+        async def load_versions(
+            user_ref_id: EntityId, workspace_ref_id: EntityId
+        ) -> tuple[int | None, int | None]:
+            versions_loading.set()
+            await release.wait()
+            return 2, 1
+
+        stale_hits = [
+            asyncio.create_task(cache.get_if_current(EntityId("1"), load_versions))
+            for _ in range(2)
+        ]
+        await versions_loading.wait()
+        await asyncio.sleep(0)
+        # A request which loaded the user afresh caches it in the meantime.
+        fresh = _user_and_workspace(2, 1)
+        cache.put(*fresh)
+        release.set()
+        results = list(await asyncio.gather(*stale_hits))
+        return results, cache.get(EntityId("1"))
+
+    results, after = asyncio.run(run())
+
+    assert results == [None, None]
+    assert after is not None
+    assert after[0].version == 2
+
+
+async def _load_around_saves(
+    storage: SqliteTestStorage,
+) -> tuple[list[UserName], list[WorkspaceName], bool]:
+    await storage.create_tables(User, Workspace, UserWorkspaceLink)
+    engine = storage.domain_storage_engine
+    async with engine.get_unit_of_work() as uow:
+        user = await uow.get_for(User).create(
+            User.new_standard_user(
+                _CTX,
+                email_address=EmailAddress("user@example.com"),
+                name=UserName("User"),
+                timezone=Timezone("Europe/Paris"),
+                feature_flag_controls=USER_FEATURE_FLAGS_CONTROLS,
+                feature_flags=BASIC_USER_FEATURE_FLAGS,
+            )
+        )
+        workspace = await uow.get_for(Workspace).create(
+            Workspace.new_workspace(
+                _CTX,
+                name=WorkspaceName("Workspace"),
+                feature_flag_controls=LOCAL_WORKSPACE_FEATURE_FLAGS_CONTROLS,
+                feature_flags=BASIC_WORKSPACE_FEATURE_FLAGS,
+            )
+        )
+        await uow.get_for(UserWorkspaceLink).create(
+            UserWorkspaceLink.new_user_workspace_link(
+                _CTX, user_ref_id=user.ref_id, workspace_ref_id=workspace.ref_id
+            )
+        )
+
+    cache = LoggedInContextCache(ttl_secs=10, clock=_Clock())
+    first = await _load_user_and_workspace(engine, cache, user.ref_id)
+    second = await _load_user_and_workspace(engine, cache, user.ref_id)
+    was_hit = first[0] is second[0] and first[1] is second[1]
+
+    async with engine.get_unit_of_work() as uow:
+        await uow.get_for(User).save(
+            user.update(
+                _CTX,
+                name=UpdateAction.change_to(UserName("Renamed User")),
+                timezone=UpdateAction.do_nothing(),
+            )
+        )
+    after_user_save = await _load_user_and_workspace(engine, cache, user.ref_id)
+
+    async with engine.get_unit_of_work() as uow:
+        await uow.get_for(Workspace).save(
+            workspace.update(
+                _CTX, name=UpdateAction.change_to(WorkspaceName("Renamed Workspace"))
+            )
+        )
+    after_workspace_save = await _load_user_and_workspace(engine, cache, user.ref_id)
+
+    await storage.dispose()
+
+    loads = [first, after_user_save, after_workspace_save]
+    return [u.name for u, _ in loads], [w.name for _, w in loads], was_hit
+
+
+def test_saves_made_outside_the_use_case_are_never_hidden(
+    sqlite_storage: SqliteTestStorage,
+) -> None:
+    user_names, workspace_names, was_hit = asyncio.run(
+        _load_around_saves(sqlite_storage)
+    )
+
+    assert was_hit
+    assert user_names == [
+        UserName("User"),
+        UserName("Renamed User"),
+        UserName("Renamed User"),
+    ]
+    assert workspace_names == [
+        WorkspaceName("Workspace"),
+        WorkspaceName("Workspace"),
+        WorkspaceName("Renamed Workspace"),
+    ]
@@ -0,0 +1,152 @@
+"""Tests for the module explorer realm codec registry."""
+
+import jupiter.core.domain
+import jupiter.core.use_cases
+import pytest
+from jupiter.core.domain.concept.vacations.vacation import Vacation
+from jupiter.core.domain.concept.vacations.vacation_name import VacationName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.entity_name import EntityName
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.manifest import ManifestSection, import_path
+from jupiter.core.framework.realm import (
+    DatabaseRealm,
+    EncoderNotFoundError,
+    RealmCodecRegistry,
+    RealmDecoder,
+    RealmEncoder,
+    WebRealm,
+)
+from jupiter.core.use_cases.concept.vacations.create import VacationCreateArgs
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+from pendulum import UTC, DateTime
+
+_CTX = DomainContext.from_sys(
+    EventSource.GEN_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+
+
+class _NotAThing:
+    pass
+
+
+def test_structural_codecs_are_cached() -> None:
+    registry = ModuleExplorerRealmCodecRegistry.build_from_module_root()
+
+    first_encoder = registry.get_encoder(list[EntityName], DatabaseRealm)  # type: ignore[type-var]
+    second_encoder = registry.get_encoder(list[EntityName], DatabaseRealm)  # type: ignore[type-var]
+    first_decoder = registry.get_decoder(list[EntityName], DatabaseRealm)  # type: ignore[type-var]
+    second_decoder = registry.get_decoder(list[EntityName], DatabaseRealm)  # type: ignore[type-var]
+
+    assert first_encoder is second_encoder
+    assert first_decoder is second_decoder
+    stats = registry.codec_cache_stats()
+    assert stats.misses == 2
+    assert stats.hits == 2
+    assert stats.encoders == 1
+    assert stats.decoders == 1
+
+
+def test_union_codecs_resolve_each_member() -> None:
+    registry = ModuleExplorerRealmCodecRegistry.build_from_module_root()
+
+    encoder: RealmEncoder[EntityName, DatabaseRealm] = registry.get_encoder(
+        EntityName | None, DatabaseRealm  # type: ignore[arg-type]
+    )
+    decoder: RealmDecoder[EntityName, DatabaseRealm] = registry.get_decoder(
+        EntityName | None, DatabaseRealm  # type: ignore[arg-type]
+    )
+
+    assert encoder.encode(EntityName("Foo")) == "Foo"
+    assert encoder.encode(None) is None  # type: ignore[arg-type]
+    assert decoder.decode("Foo") == EntityName("Foo")
+    assert decoder.decode(None) is None
+
+
+def test_union_encoder_skips_members_without_an_encoder() -> None:
+    registry = ModuleExplorerRealmCodecRegistry.build_from_module_root()
+
+    encoder: RealmEncoder[EntityName, DatabaseRealm] = registry.get_encoder(
+        EntityName | _NotAThing, DatabaseRealm  # type: ignore[arg-type]
+    )
+
+    assert encoder.encode(EntityName("Foo")) == "Foo"
+
+
+def test_missing_codecs_are_not_cached() -> None:
+    registry = ModuleExplorerRealmCodecRegistry.build_from_module_root()
+
+    for _ in range(2):
+        with pytest.raises(EncoderNotFoundError):
+            registry.get_encoder(_NotAThing, DatabaseRealm)  # type: ignore[type-var]
+
+    stats = registry.codec_cache_stats()
+    assert stats.hits == 0
+    assert stats.encoders == 0
+
+
+@pytest.fixture(scope="module")
+def manifest_section() -> ManifestSection:
+    return ModuleExplorerRealmCodecRegistry.build_manifest_section(
+        jupiter.core.domain, jupiter.core.use_cases
+    )
+
+
+def test_manifest_section_lists_codecs_and_things(
+    manifest_section: ManifestSection,
+) -> None:
+    assert ("thing", import_path(Vacation)) in manifest_section
+    assert ("thing", import_path(VacationCreateArgs)) in manifest_section
+    assert {entry[0] for entry in manifest_section} <= {"encoder", "decoder", "thing"}
+
+
+def test_registry_from_manifest_matches_scanning(
+    manifest_section: ManifestSection, realm_codec_registry: RealmCodecRegistry
+) -> None:
+    registry = ModuleExplorerRealmCodecRegistry.build_from_manifest(manifest_section)
+    vacation = Vacation.new_vacation(
+        _CTX,
+        EntityId("1"),
+        VacationName("Holiday"),
+        ADate.from_str("2026-01-01"),
+        ADate.from_str("2026-01-10"),
+    )
+
+    encoded = registry.get_encoder(Vacation, DatabaseRealm).encode(vacation)
+
+    assert encoded == realm_codec_registry.get_encoder(Vacation, DatabaseRealm).encode(
+        vacation
+    )
+    assert registry.get_decoder(Vacation, DatabaseRealm).decode(
+        encoded
+    ) == realm_codec_registry.get_decoder(Vacation, DatabaseRealm).decode(encoded)
+    args = {
+        "name": "Holiday",
+        "start_date": "2026-01-01",
+        "end_date": "2026-01-10",
+    }
+    assert registry.get_decoder(VacationCreateArgs, WebRealm).decode(
+        args
+    ) == realm_codec_registry.get_decoder(VacationCreateArgs, WebRealm).decode(args)
+
+
+def test_registry_from_manifest_only_knows_listed_things() -> None:
+    registry = ModuleExplorerRealmCodecRegistry.build_from_manifest(
+        [("thing", import_path(Vacation))]
+    )
+
+    assert registry.get_encoder(Vacation, DatabaseRealm) is registry.get_encoder(
+        Vacation, DatabaseRealm
+    )
+    with pytest.raises(EncoderNotFoundError):
+        registry.get_encoder(VacationCreateArgs, WebRealm)
+
+
+def test_registry_from_manifest_rejects_unknown_entries() -> None:
+    with pytest.raises(Exception, match="Unknown codec manifest entry kind"):
+        ModuleExplorerRealmCodecRegistry.build_from_manifest(
+            [("widget", import_path(Vacation))]
+        )
@@ -0,0 +1,253 @@
+"""Tests for the queue of search index changes."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import cast
+
+from jupiter.core.domain.concept.vacations.vacation import Vacation
+from jupiter.core.domain.concept.vacations.vacation_name import VacationName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.storage_engine import SearchStorageEngine, SearchUnitOfWork
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.entity import CrownEntity
+from jupiter.core.framework.event import EventSource
+from jupiter.core.use_cases.infra.search_index_queue import SearchIndexQueue
+from pendulum import UTC, DateTime
+
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+_WORKSPACE_REF_ID = EntityId("1")
+
+_Call = tuple[str, EntityId, list[tuple[EntityId, str]]]
+
+
+def _vacation(ref_id: str, name: str) -> Vacation:
+    return Vacation.new_vacation(
+        _CTX,
+        vacation_collection_ref_id=EntityId("1"),
+        name=VacationName(name),
+        start_date=ADate.from_str("2026-10-20"),
+        end_date=ADate.from_str("2026-10-25"),
+    ).assign_ref_id(EntityId(ref_id))
+
+
+class _FakeSearchRepository:
+    calls: list[_Call]
+    entered: asyncio.Event
+    release: asyncio.Event | None
+    failures_left: int
+    poisoned: set[EntityId]
+    attempts: int
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.entered = asyncio.Event()
+        self.release = None
+        self.failures_left = 0
+        self.poisoned = set()
+        self.attempts = 0
+
+    async def upsert_many(
+        self, workspace_ref_id: EntityId, entities: list[CrownEntity]
+    ) -> None:
+        self.entered.set()
+        if self.release is not None:
+            await self.release.wait()
+        self.attempts += 1
+        if self.failures_left > 0:
+            self.failures_left -= 1
+            raise Exception("Search index is down")
+        if any(e.ref_id in self.poisoned for e in entities):
+            raise Exception("Cannot index this")
+        self.calls.append(("upsert", workspace_ref_id, self._describe(entities)))
+
+    async def remove_many(
+        self, workspace_ref_id: EntityId, entities: list[CrownEntity]
+    ) -> None:
+        self.calls.append(("remove", workspace_ref_id, self._describe(entities)))
+
+    @staticmethod
+    def _describe(entities: list[CrownEntity]) -> list[tuple[EntityId, str]]:
+        return sorted((e.ref_id, str(e.name)) for e in entities)
+
+
+class _FakeSearchStorageEngine(SearchStorageEngine):
+    repository: _FakeSearchRepository
+
+    def __init__(self) -> None:
+        self.repository = _FakeSearchRepository()
+
+    @asynccontextmanager
+    async def get_unit_of_work(self) -> AsyncIterator[SearchUnitOfWork]:
+        yield cast(SearchUnitOfWork, SimpleNamespace(search_repository=self.repository))
+
+
+def test_flush_applies_only_the_last_change_for_each_entity() -> None:
+    async def run() -> list[_Call]:
+        engine = _FakeSearchStorageEngine()
+        queue = SearchIndexQueue(engine)
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("1", "First")], [])
+        queue.enqueue(
+            _WORKSPACE_REF_ID,
+            [_vacation("1", "First again"), _vacation("2", "Second")],
+            [_vacation("3", "Third")],
+        )
+        queue.enqueue(_WORKSPACE_REF_ID, [], [_vacation("2", "Second")])
+        await queue.flush()
+        await queue.flush()
+        return engine.repository.calls
+
+    assert asyncio.run(run()) == [
+        (
+            "remove",
+            _WORKSPACE_REF_ID,
+            [(EntityId("2"), "Second"), (EntityId("3"), "Third")],
+        ),
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("1"), "First again")]),
+    ]
+
+
+def test_the_worker_applies_changes_in_the_background() -> None:
+    async def run() -> list[_Call]:
+        engine = _FakeSearchStorageEngine()
+        queue = SearchIndexQueue(engine, coalesce_delay_secs=0)
+        queue.start()
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("1", "First")], [])
+        await asyncio.wait_for(engine.repository.entered.wait(), timeout=5)
+        await queue.stop()
+        return engine.repository.calls
+
+    assert asyncio.run(run()) == [
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("1"), "First")])
+    ]
+
+
+def test_stop_lets_the_batch_in_flight_land_and_then_drains() -> None:
+    async def run() -> list[_Call]:
+        engine = _FakeSearchStorageEngine()
+        engine.repository.release = asyncio.Event()
+        queue = SearchIndexQueue(engine, coalesce_delay_secs=0)
+        queue.start()
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("1", "First")], [])
+        await asyncio.wait_for(engine.repository.entered.wait(), timeout=5)
+
+        stopping = asyncio.create_task(queue.stop())
+        await asyncio.sleep(0)
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("2", "Second")], [])
+        assert not stopping.done()
+
+        engine.repository.release.set()
+        await asyncio.wait_for(stopping, timeout=5)
+        return engine.repository.calls
+
+    assert asyncio.run(run()) == [
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("1"), "First")]),
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("2"), "Second")]),
+    ]
+
+
+def test_flush_waits_for_the_batch_in_flight() -> None:
+    async def run() -> tuple[bool, list[_Call]]:
+        engine = _FakeSearchStorageEngine()
+        engine.repository.release = asyncio.Event()
+        queue = SearchIndexQueue(engine, coalesce_delay_secs=0)
+        queue.start()
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("1", "First")], [])
+        await asyncio.wait_for(engine.repository.entered.wait(), timeout=5)
+
+        flushing = asyncio.create_task(queue.flush())
+        await asyncio.sleep(0)
+        done_before_release = flushing.done()
+
+        engine.repository.release.set()
+        await asyncio.wait_for(flushing, timeout=5)
+        calls = list(engine.repository.calls)
+        await queue.stop()
+        return done_before_release, calls
+
+    done_before_release, calls = asyncio.run(run())
+
+    assert not done_before_release
+    assert calls == [("upsert", _WORKSPACE_REF_ID, [(EntityId("1"), "First")])]
+
+
+def test_a_failed_batch_is_retried_a_workspace_at_a_time() -> None:
+    async def run() -> list[_Call]:
+        engine = _FakeSearchStorageEngine()
+        engine.repository.failures_left = 1
+        queue = SearchIndexQueue(engine)
+        queue.enqueue(
+            _WORKSPACE_REF_ID, [_vacation("1", "First"), _vacation("2", "Second")], []
+        )
+        await queue.flush()
+        return engine.repository.calls
+
+    assert asyncio.run(run()) == [
+        (
+            "upsert",
+            _WORKSPACE_REF_ID,
+            [(EntityId("1"), "First"), (EntityId("2"), "Second")],
+        )
+    ]
+
+
+def test_an_entity_which_keeps_failing_is_dropped_and_the_rest_land() -> None:
+    async def run() -> tuple[list[_Call], int]:
+        engine = _FakeSearchStorageEngine()
+        engine.repository.poisoned = {EntityId("2")}
+        queue = SearchIndexQueue(engine, max_attempts=2)
+        queue.enqueue(
+            _WORKSPACE_REF_ID,
+            [
+                _vacation("1", "First"),
+                _vacation("2", "Second"),
+                _vacation("3", "Third"),
+            ],
+            [],
+        )
+        await queue.flush()
+        # The next batch is not held up by the dropped change.
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("4", "Fourth")], [])
+        await queue.flush()
+        return engine.repository.calls, engine.repository.attempts
+
+    calls, attempts = asyncio.run(run())
+
+    assert calls == [
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("1"), "First")]),
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("3"), "Third")]),
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("4"), "Fourth")]),
+    ]
+    # Two tries of the whole batch, its workspace, and each of its entities,
+    # then one of the batch with the fourth entity.
+    assert attempts == 2 * 3 + 2 + 1
+
+
+def test_a_newer_change_replaces_one_which_is_failing() -> None:
+    async def run() -> list[_Call]:
+        engine = _FakeSearchStorageEngine()
+        engine.repository.poisoned = {EntityId("1")}
+        queue = SearchIndexQueue(
+            engine, coalesce_delay_secs=0, retry_delay_secs=60, max_attempts=2
+        )
+        queue.start()
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("1", "First")], [])
+        await asyncio.wait_for(engine.repository.entered.wait(), timeout=5)
+        await asyncio.sleep(0.1)
+        # The worker backs off rather than retrying straight away.
+        attempts_while_backing_off = engine.repository.attempts
+
+        engine.repository.poisoned = set()
+        queue.enqueue(_WORKSPACE_REF_ID, [_vacation("1", "First again")], [])
+        await queue.stop()
+        assert attempts_while_backing_off == 3
+        return engine.repository.calls
+
+    assert asyncio.run(run()) == [
+        ("upsert", _WORKSPACE_REF_ID, [(EntityId("1"), "First again")])
+    ]
@@ -0,0 +1,179 @@
+"""Tests for running background mutation use cases across workspaces."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from jupiter.core.domain.concept.schedule.ical_fetcher import ICalFetcher
+from jupiter.core.domain.concept.workspaces.workspace import Workspace
+from jupiter.core.domain.crm import CRM
+from jupiter.core.domain.storage_engine import (
+    DomainStorageEngine,
+    DomainUnitOfWork,
+    SearchStorageEngine,
+    SearchUnitOfWork,
+)
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.framework.use_case import EmptyContext, ProgressReporterFactory
+from jupiter.core.framework.use_case_io import UseCaseArgsBase, use_case_args
+from jupiter.core.use_cases.infra.use_cases import (
+    SysBackgroundMutationUseCase,
+    WorkspaceRunsFailedError,
+)
+from jupiter.core.utils.global_properties import GlobalProperties
+from jupiter.core.utils.time_provider import TimeProvider
+
+
+class _Tracker:
+    """Records how many units of work are open at once."""
+
+    open_now: int
+    max_open: int
+    workspaces_now: int
+    max_workspaces: int
+
+    def __init__(self) -> None:
+        self.open_now = 0
+        self.max_open = 0
+        self.workspaces_now = 0
+        self.max_workspaces = 0
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[None]:
+        self.open_now += 1
+        self.max_open = max(self.max_open, self.open_now)
+        try:
+            await asyncio.sleep(0)
+            yield
+        finally:
+            self.open_now -= 1
+
+
+class _FakeDomainStorageEngine(DomainStorageEngine):
+    _tracker: _Tracker
+    _read_tracker: _Tracker
+
+    def __init__(self, tracker: _Tracker, read_tracker: _Tracker) -> None:
+        self._tracker = tracker
+        self._read_tracker = read_tracker
+
+    @asynccontextmanager
+    async def get_unit_of_work(self) -> AsyncIterator[DomainUnitOfWork]:
+        async with self._tracker.open():
+            yield cast(DomainUnitOfWork, None)
+
+    @asynccontextmanager
+    async def get_read_unit_of_work(self) -> AsyncIterator[DomainUnitOfWork]:
+        async with self._read_tracker.open():
+            yield cast(DomainUnitOfWork, None)
+
+
+class _FakeSearchStorageEngine(SearchStorageEngine):
+    _tracker: _Tracker
+
+    def __init__(self, tracker: _Tracker) -> None:
+        self._tracker = tracker
+
+    @asynccontextmanager
+    async def get_unit_of_work(self) -> AsyncIterator[SearchUnitOfWork]:
+        async with self._tracker.open():
+            yield cast(SearchUnitOfWork, None)
+
+
+@use_case_args
+class _DoAllArgs(UseCaseArgsBase):
+    """_DoAllArgs."""
+
+
+class _DoAllUseCase(SysBackgroundMutationUseCase[_DoAllArgs, None]):
+    async def _execute(self, context: EmptyContext, args: _DoAllArgs) -> None:
+        raise NotImplementedError
+
+
+def _build_use_case(
+    tracker: _Tracker, read_tracker: _Tracker, workspace_concurrency: int
+) -> _DoAllUseCase:
+    return _DoAllUseCase(
+        global_properties=cast(GlobalProperties, None),
+        time_provider=cast(TimeProvider, None),
+        realm_codec_registry=cast(RealmCodecRegistry, None),
+        progress_reporter_factory=cast(ProgressReporterFactory[EmptyContext], None),
+        domain_storage_engine=_FakeDomainStorageEngine(tracker, read_tracker),
+        search_storage_engine=_FakeSearchStorageEngine(tracker),
+        crm=cast(CRM, None),
+        ical_fetcher=cast(ICalFetcher, None),
+        workspace_concurrency=workspace_concurrency,
+    )
+
+
+def _workspaces(count: int) -> list[Workspace]:
+    return [
+        cast(Workspace, SimpleNamespace(ref_id=EntityId(str(idx))))
+        for idx in range(1, count + 1)
+    ]
+
+
+def test_workspaces_are_limited_in_flight_and_transactions_run_one_at_a_time() -> None:
+    tracker = _Tracker()
+    read_tracker = _Tracker()
+    use_case = _build_use_case(tracker, read_tracker, workspace_concurrency=3)
+    done: list[EntityId] = []
+
+    async def do_for_workspace(
+        workspace: Workspace,
+        domain_storage_engine: DomainStorageEngine,
+        search_storage_engine: SearchStorageEngine,
+    ) -> None:
+        tracker.workspaces_now += 1
+        tracker.max_workspaces = max(tracker.max_workspaces, tracker.workspaces_now)
+        async with domain_storage_engine.get_read_unit_of_work():
+            await asyncio.sleep(0)
+        async with domain_storage_engine.get_unit_of_work():
+            # Nested units of work from the same task don't deadlock.
+            async with domain_storage_engine.get_unit_of_work():
+                await asyncio.sleep(0)
+        async with search_storage_engine.get_unit_of_work():
+            await asyncio.sleep(0)
+        tracker.workspaces_now -= 1
+        done.append(workspace.ref_id)
+
+    asyncio.run(use_case._for_each_workspace(_workspaces(7), do_for_workspace))
+
+    assert sorted(done) == sorted(w.ref_id for w in _workspaces(7))
+    assert tracker.max_workspaces == 3
+    # The nested unit of work is the only overlap.
+    assert tracker.max_open == 2
+    # Reads skip the writer lock, so several workspaces plan at once.
+    assert read_tracker.max_open > 1
+
+
+def test_a_failing_workspace_does_not_stop_the_others() -> None:
+    use_case = _build_use_case(_Tracker(), _Tracker(), workspace_concurrency=2)
+    done: list[EntityId] = []
+
+    async def do_for_workspace(
+        workspace: Workspace,
+        domain_storage_engine: DomainStorageEngine,
+        search_storage_engine: SearchStorageEngine,
+    ) -> None:
+        if workspace.ref_id == EntityId("2"):
+            raise Exception("Boom")
+        async with domain_storage_engine.get_unit_of_work():
+            done.append(workspace.ref_id)
+
+    with pytest.raises(WorkspaceRunsFailedError) as exc_info:
+        asyncio.run(use_case._for_each_workspace(_workspaces(4), do_for_workspace))
+
+    assert sorted(done) == [EntityId("1"), EntityId("3"), EntityId("4")]
+    failed_outcomes = exc_info.value.failed_outcomes
+    assert [o.workspace_ref_id for o in failed_outcomes] == [EntityId("2")]
+    assert str(failed_outcomes[0].error) == "Boom"
+
+
+def test_workspace_concurrency_must_be_positive() -> None:
+    with pytest.raises(Exception, match="at least 1"):
+        _build_use_case(_Tracker(), _Tracker(), workspace_concurrency=0)
@@ -2,9 +2,11 @@
 
 import abc
 import dataclasses
+import importlib
+import json
 import types
 import typing
-from collections.abc import Callable, Iterator, Mapping
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
 from datetime import date, datetime
 from typing import (
     Annotated,
@@ -22,8 +24,9 @@ import inflection
 import uvicorn
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import Depends, FastAPI, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.routing import APIRoute
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.types import DecoratedCallable
@@ -41,11 +44,21 @@ from jupiter.core.domain.concept.auth.auth_token_ext import (
 )
 from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
 from jupiter.core.domain.concept.auth.password_plain import PasswordPlain
+from jupiter.core.domain.concept.schedule.ical_fetcher import ICalFetcher
 from jupiter.core.domain.core.email_address import EmailAddress
 from jupiter.core.domain.crm import CRM
 from jupiter.core.domain.storage_engine import DomainStorageEngine, SearchStorageEngine
 from jupiter.core.framework.entity import Entity, ParentLink
+from jupiter.core.framework.manifest import (
+    ManifestSection,
+    import_path,
+    resolve_import_path,
+)
 from jupiter.core.framework.optional import normalize_optional
+from jupiter.core.framework.pagination import (
+    PaginatedUseCaseArgsBase,
+    PaginatedUseCaseResultBase,
+)
 from jupiter.core.framework.primitive import Primitive
 from jupiter.core.framework.realm import DomainThing, RealmCodecRegistry, WebRealm
 from jupiter.core.framework.record import Record
@@ -69,9 +82,13 @@ from jupiter.core.framework.value import (
     EnumValue,
     SecretValue,
 )
+from jupiter.core.use_cases.infra.logged_in_context_cache import (
+    LoggedInContextCache,
+)
 from jupiter.core.use_cases.infra.realms import (
     _StandardEnumValueDatabaseDecoder,
 )
+from jupiter.core.use_cases.infra.search_index_queue import SearchIndexQueue
 from jupiter.core.use_cases.infra.storage_engine import UseCaseStorageEngine
 from jupiter.core.use_cases.infra.use_cases import (
     AppGuestMutationUseCase,
@@ -114,6 +131,9 @@ HOSTING_HEADER: Final[str] = "X-Jupiter-Hosting"
 VERSION_HEADER: Final[str] = "X-Jupiter-Version"
 FRONTDOOR_HEADER: Final[str] = "X-Jupiter-FrontDoor"
 
+NDJSON_MEDIA_TYPE: Final[str] = "application/x-ndjson"
+STREAMING_PAGE_SIZE: Final[int] = 500
+
 AUTH_TOKEN_EXT_DECODER = AuthTokenExtDatabaseDecoder()
 APP_VERSION_DECODER = AppVersionDatabaseDecoder()
 APP_SHELL_DECODER = _StandardEnumValueDatabaseDecoder(AppShell)
@@ -269,6 +289,49 @@ class UseCaseCommand(Generic[UseCaseT], Command, abc.ABC):
         the_one_tag = inflection.dasherize(the_one_module)
         return the_one_tag
 
+    @staticmethod
+    def _accepts_ndjson(request: Request) -> bool:
+        return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+    async def _stream_pages(
+        self, session: UseCaseSessionBase, args: PaginatedUseCaseArgsBase
+    ) -> StreamingResponse:
+        """Stream the entries of all the pages past the args' cursor, one JSON per line.
+
+        The first page is read before the response starts, so bad args still
+        get the usual error responses.
+        """
+        result_encoder = self._realm_codec_registry.get_encoder(
+            self._result_type, WebRealm
+        )
+        page_args = dataclasses.replace(
+            args, page_size=args.page_size or STREAMING_PAGE_SIZE
+        )
+        first_result = cast(
+            PaginatedUseCaseResultBase,
+            (await self._use_case.execute(session, page_args))[1],
+        )
+
+        async def stream_entries() -> AsyncIterator[str]:
+            result = first_result
+            while True:
+                encoded_result = cast(dict[str, Any], result_encoder.encode(result))
+                for entry in encoded_result["entries"]:
+                    yield json.dumps(jsonable_encoder(entry)) + "\n"
+                if result.next_cursor is None:
+                    return
+                result = cast(
+                    PaginatedUseCaseResultBase,
+                    (
+                        await self._use_case.execute(
+                            session,
+                            dataclasses.replace(page_args, cursor=result.next_cursor),
+                        )
+                    )[1],
+                )
+
+        return StreamingResponse(stream_entries(), media_type=NDJSON_MEDIA_TYPE)
+
     @abc.abstractmethod
     def attach_route(self, app: FastAPI) -> None:
         """Attach the route to the app."""
@@ -416,6 +479,10 @@ class LoggedInReadonlyCommand(
                 self._args_type, WebRealm
             )
             decoded_args = args_decoder.decode(await request.json())
+            if isinstance(
+                decoded_args, PaginatedUseCaseArgsBase
+            ) and self._accepts_ndjson(request):
+                return await self._stream_pages(session, decoded_args)
             result = cast(
                 UseCaseResultT, (await self._use_case.execute(session, decoded_args))[1]
             )
@@ -477,6 +544,28 @@ class WebExceptionHandler(Generic[_ExceptionT], abc.ABC):
             return self.handle(web_service_app, exc)
 
 
+@dataclasses.dataclass
+class _WebModuleRootsExploration:
+    """The use cases and exception handlers defined in the modules under some module roots."""
+
+    use_case_types: list[
+        tuple[
+            type[
+                UseCase[
+                    UseCaseSessionBase,
+                    UseCaseContextBase,
+                    UseCaseArgsBase,
+                    UseCaseResultBase | None,
+                ]
+            ],
+            types.ModuleType,
+        ]
+    ]
+    exception_handlers: list[
+        tuple[type[Exception], type[WebExceptionHandler[Exception]]]
+    ]
+
+
 class WebServiceApp:
     """The app."""
 
@@ -491,6 +580,9 @@ class WebServiceApp:
     _search_storage_engine: Final[SearchStorageEngine]
     _use_case_storage_engine: Final[UseCaseStorageEngine]
     _crm: Final[CRM]
+    _ical_fetcher: Final[ICalFetcher]
+    _logged_in_context_cache: Final[LoggedInContextCache]
+    _search_index_queue: Final[SearchIndexQueue]
     _use_case_commands: Final[
         dict[
             type[
@@ -522,6 +614,7 @@ class WebServiceApp:
         search_storage_engine: SearchStorageEngine,
         use_case_storage_engine: UseCaseStorageEngine,
         crm: CRM,
+        ical_fetcher: ICalFetcher,
     ) -> None:
         """Constructor."""
         self._global_properties = global_properties
@@ -535,6 +628,11 @@ class WebServiceApp:
         self._search_storage_engine = search_storage_engine
         self._use_case_storage_engine = use_case_storage_engine
         self._crm = crm
+        self._ical_fetcher = ical_fetcher
+        self._logged_in_context_cache = LoggedInContextCache(
+            global_properties.logged_in_context_cache_ttl_secs
+        )
+        self._search_index_queue = SearchIndexQueue(search_storage_engine)
         self._use_case_commands = {}
         self._commands = {}
         self._exception_handlers = {}
@@ -562,10 +660,123 @@ class WebServiceApp:
         search_storage_engine: SearchStorageEngine,
         use_case_storage_engine: UseCaseStorageEngine,
         crm: CRM,
+        ical_fetcher: ICalFetcher,
         *module_root: types.ModuleType,
     ) -> "WebServiceApp":
         """Build the app from the module root."""
+        return WebServiceApp._build(
+            global_properties,
+            request_time_provider,
+            cron_run_time_provider,
+            invocation_recorder,
+            progress_reporter_factory,
+            realm_codec_registry,
+            auth_token_stamper,
+            domain_storage_engine,
+            search_storage_engine,
+            use_case_storage_engine,
+            crm,
+            ical_fetcher,
+            WebServiceApp._explore_module_roots(*module_root),
+        )
+
+    @staticmethod
+    def build_manifest_section(*module_root: types.ModuleType) -> ManifestSection:
+        """Build the manifest section from which the app for the module root can be built."""
+        exploration = WebServiceApp._explore_module_roots(*module_root)
+
+        section: ManifestSection = []
+        for use_case_type, root_module in exploration.use_case_types:
+            section.append(
+                ("use-case", import_path(use_case_type), root_module.__name__)
+            )
+        for exception_type, exception_handler in exploration.exception_handlers:
+            section.append(
+                (
+                    "exception-handler",
+                    import_path(exception_type),
+                    import_path(exception_handler),
+                )
+            )
+        return section
+
+    @staticmethod
+    def build_from_manifest(
+        global_properties: GlobalProperties,
+        request_time_provider: PerRequestTimeProvider,
+        cron_run_time_provider: CronRunTimeProvider,
+        invocation_recorder: MutationUseCaseInvocationRecorder,
+        progress_reporter_factory: WebsocketProgressReporterFactory,
+        realm_codec_registry: RealmCodecRegistry,
+        auth_token_stamper: AuthTokenStamper,
+        domain_storage_engine: DomainStorageEngine,
+        search_storage_engine: SearchStorageEngine,
+        use_case_storage_engine: UseCaseStorageEngine,
+        crm: CRM,
+        ical_fetcher: ICalFetcher,
+        section: ManifestSection,
+    ) -> "WebServiceApp":
+        """Build the app from a manifest section.
+
+        Every route needs to be attached up front, so all the use cases are
+        imported, but only the modules which define them are.
+        """
+        exploration = _WebModuleRootsExploration(
+            use_case_types=[], exception_handlers=[]
+        )
+        for kind, *paths in section:
+            if kind == "use-case":
+                use_case_path, root_module_name = paths
+                exploration.use_case_types.append(
+                    (
+                        cast(
+                            type[
+                                UseCase[
+                                    UseCaseSessionBase,
+                                    UseCaseContextBase,
+                                    UseCaseArgsBase,
+                                    UseCaseResultBase | None,
+                                ]
+                            ],
+                            resolve_import_path(use_case_path),
+                        ),
+                        importlib.import_module(root_module_name),
+                    )
+                )
+            elif kind == "exception-handler":
+                exception_path, exception_handler_path = paths
+                exploration.exception_handlers.append(
+                    (
+                        cast(type[Exception], resolve_import_path(exception_path)),
+                        cast(
+                            type[WebExceptionHandler[Exception]],
+                            resolve_import_path(exception_handler_path),
+                        ),
+                    )
+                )
+            else:
+                raise Exception(f"Unknown route manifest entry kind {kind}")
+
+        return WebServiceApp._build(
+            global_properties,
+            request_time_provider,
+            cron_run_time_provider,
+            invocation_recorder,
+            progress_reporter_factory,
+            realm_codec_registry,
+            auth_token_stamper,
+            domain_storage_engine,
+            search_storage_engine,
+            use_case_storage_engine,
+            crm,
+            ical_fetcher,
+            exploration,
+        )
 
+    @staticmethod
+    def _explore_module_roots(
+        *module_root: types.ModuleType,
+    ) -> _WebModuleRootsExploration:
         def extract_use_case(
             the_module: types.ModuleType,
         ) -> Iterator[
@@ -629,6 +840,37 @@ class WebServiceApp:
 
                 yield exception_type, obj
 
+        exploration = _WebModuleRootsExploration(
+            use_case_types=[], exception_handlers=[]
+        )
+
+        for mr in module_root:
+            for m in find_all_modules(mr):
+                for use_case_type in extract_use_case(m):
+                    exploration.use_case_types.append((use_case_type, mr))
+
+        for mr in module_root:
+            for m in find_all_modules(mr):
+                exploration.exception_handlers.extend(extract_exception_handler(m))
+
+        return exploration
+
+    @staticmethod
+    def _build(
+        global_properties: GlobalProperties,
+        request_time_provider: PerRequestTimeProvider,
+        cron_run_time_provider: CronRunTimeProvider,
+        invocation_recorder: MutationUseCaseInvocationRecorder,
+        progress_reporter_factory: WebsocketProgressReporterFactory,
+        realm_codec_registry: RealmCodecRegistry,
+        auth_token_stamper: AuthTokenStamper,
+        domain_storage_engine: DomainStorageEngine,
+        search_storage_engine: SearchStorageEngine,
+        use_case_storage_engine: UseCaseStorageEngine,
+        crm: CRM,
+        ical_fetcher: ICalFetcher,
+        exploration: _WebModuleRootsExploration,
+    ) -> "WebServiceApp":
         app = WebServiceApp(
             global_properties,
             request_time_provider,
@@ -641,6 +883,7 @@ class WebServiceApp:
             search_storage_engine,
             use_case_storage_engine,
             crm=crm,
+            ical_fetcher=ical_fetcher,
         )
 
         login_use_case = LoginUseCase(
@@ -685,12 +928,10 @@ class WebServiceApp:
                 "token_type": "bearer",
             }
 
-        for mr in module_root:
-            for m in find_all_modules(mr):
-                for use_case_type in extract_use_case(m):
-                    if use_case_type in app._use_case_commands:
-                        continue
-                    app._add_use_case_type(use_case_type, mr)
+        for use_case_type, root_module in exploration.use_case_types:
+            if use_case_type in app._use_case_commands:
+                continue
+            app._add_use_case_type(use_case_type, root_module)
 
         for idx, (use_case, command) in enumerate(app._use_case_commands.items()):
             if isinstance(command, CronCommand):
@@ -707,15 +948,11 @@ class WebServiceApp:
             else:
                 raise Exception(f"Unknown command type {command}")
 
-        for mr in module_root:
-            for m in find_all_modules(mr):
-                for exception_type, exception_handler in extract_exception_handler(m):
-                    if exception_type in app._exception_handlers:
-                        continue
-                    handler = app._add_exception_handler(
-                        exception_type, exception_handler
-                    )
-                    handler.attach_handler(app, app.fast_app)
+        for exception_type, exception_handler in exploration.exception_handlers:
+            if exception_type in app._exception_handlers:
+                continue
+            handler = app._add_exception_handler(exception_type, exception_handler)
+            handler.attach_handler(app, app.fast_app)
 
         return app
 
@@ -738,7 +975,11 @@ class WebServiceApp:
             log_level="info",
         )
         server = uvicorn.Server(config)
-        await server.serve()
+        self._search_index_queue.start()
+        try:
+            await server.serve()
+        finally:
+            await self._search_index_queue.stop()
 
     @property
     def fast_app(self) -> FastAPI:
@@ -821,6 +1062,9 @@ class WebServiceApp:
                             search_storage_engine=self._search_storage_engine,
                             use_case_storage_engine=self._use_case_storage_engine,
                             crm=self._crm,
+                            ical_fetcher=self._ical_fetcher,
+                            logged_in_context_cache=self._logged_in_context_cache,
+                            search_index_queue=self._search_index_queue,
                         ),
                         root_module=root_module,
                     )
@@ -841,6 +1085,7 @@ class WebServiceApp:
                             auth_token_stamper=self._auth_token_stamper,
                             domain_storage_engine=self._domain_storage_engine,
                             search_storage_engine=self._search_storage_engine,
+                            logged_in_context_cache=self._logged_in_context_cache,
                         ),
                         root_module=root_module,
                     )
@@ -848,12 +1093,15 @@ class WebServiceApp:
             self._use_case_commands[use_case_type] = CronCommand(
                 realm_codec_registry=self._realm_codec_registry,
                 use_case=use_case_type(  # type: ignore
+                    global_properties=self._global_properties,
                     time_provider=self._cron_time_provider,
                     realm_codec_registry=self._realm_codec_registry,
                     progress_reporter_factory=EmptyProgressReporterFactory(),
                     domain_storage_engine=self._domain_storage_engine,
                     search_storage_engine=self._search_storage_engine,
                     crm=self._crm,
+                    ical_fetcher=self._ical_fetcher,
+                    workspace_concurrency=self._global_properties.cron_workspace_concurrency,
                 ),
                 root_module=root_module,
             )
@@ -1018,6 +1266,7 @@ class WebServiceApp:
                 build_field_name(f, f.type)
                 for f in dataclasses.fields(composite_value_type)
                 if f.name != "events"
+                and f.init
                 and not normalize_optional(cast(type[object], f.type))[1]
             ]
             result: dict[str, None | str | list[str] | dict[str, Any]] = {
@@ -1027,7 +1276,7 @@ class WebServiceApp:
                 "properties": {
                     build_field_name(f, f.type): build_composite_field(f, f.type)
                     for f in dataclasses.fields(composite_value_type)
-                    if f.name != "events"
+                    if f.name != "events" and f.init
                 },
             }
             if len(required) > 0:
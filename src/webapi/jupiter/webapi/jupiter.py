@@ -9,11 +9,15 @@ import jupiter.core.impl.repository.sqlite.domain
 import jupiter.core.use_cases
 import jupiter.webapi.exceptions
 from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.schedule.service.ical_parser import (
+    shutdown_ical_parse_workers,
+)
 from jupiter.core.domain.crm import CRM
 from jupiter.core.domain.env import Env
 from jupiter.core.domain.hosting import Hosting
 from jupiter.core.impl.crm.noop import NoOpCRM
 from jupiter.core.impl.crm.wix import WixCRM
+from jupiter.core.impl.ical.aiohttp_fetcher import AiohttpICalFetcher
 from jupiter.core.impl.repository.sqlite.connection import SqliteConnection
 from jupiter.core.impl.repository.sqlite.domain.storage_engine import (
     SqliteDomainStorageEngine,
@@ -28,6 +32,7 @@ from jupiter.core.use_cases.infra.persistent_mutation_use_case_recoder import (
 from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
 from jupiter.core.utils.global_properties import build_global_properties
 from jupiter.webapi.app import WebServiceApp
+from jupiter.webapi.manifest import load_webapi_manifest
 from jupiter.webapi.time_provider import CronRunTimeProvider, PerRequestTimeProvider
 from jupiter.webapi.websocket_progress_reporter import WebsocketProgressReporterFactory
 from rich import print
@@ -59,15 +64,25 @@ async def main() -> None:
 
     no_timezone_global_properties = build_global_properties()
 
-    realm_codec_registry = ModuleExplorerRealmCodecRegistry.build_from_module_root(
-        jupiter.core.domain, jupiter.core.use_cases
-    )
+    # A manifest built ahead of time lets us skip scanning all the modules, and
+    # only import the ones which are needed. Without one, we scan.
+    manifest = load_webapi_manifest()
+
+    if manifest is not None:
+        realm_codec_registry = ModuleExplorerRealmCodecRegistry.build_from_manifest(
+            manifest.section("realm-codecs")
+        )
+    else:
+        realm_codec_registry = ModuleExplorerRealmCodecRegistry.build_from_module_root(
+            jupiter.core.domain, jupiter.core.use_cases
+        )
 
     sqlite_connection = SqliteConnection(
         SqliteConnection.Config(
             no_timezone_global_properties.sqlite_db_url,
             no_timezone_global_properties.alembic_ini_path,
             no_timezone_global_properties.alembic_migrations_path,
+            event_archive_db_path=no_timezone_global_properties.event_archive_db_path,
         ),
     )
 
@@ -75,12 +90,17 @@ async def main() -> None:
 
     global_properties = build_global_properties()
 
-    domain_storage_engine = SqliteDomainStorageEngine.build_from_module_root(
-        realm_codec_registry,
-        sqlite_connection,
-        jupiter.core.impl.repository.sqlite.domain,
-        jupiter.core.domain,
-    )
+    if manifest is not None:
+        domain_storage_engine = SqliteDomainStorageEngine.build_from_manifest(
+            realm_codec_registry, sqlite_connection, manifest.section("repositories")
+        )
+    else:
+        domain_storage_engine = SqliteDomainStorageEngine.build_from_module_root(
+            realm_codec_registry,
+            sqlite_connection,
+            jupiter.core.impl.repository.sqlite.domain,
+            jupiter.core.domain,
+        )
     search_storage_engine = SqliteSearchStorageEngine(
         realm_codec_registry, sqlite_connection
     )
@@ -102,6 +122,8 @@ async def main() -> None:
     else:
         crm = NoOpCRM()
 
+    ical_fetcher = AiohttpICalFetcher(aio_session)
+
     auth_token_stamper = AuthTokenStamper(
         auth_token_secret=global_properties.auth_token_secret,
         time_provider=request_time_provider,
@@ -113,21 +135,39 @@ async def main() -> None:
         storage_engine=usecase_storage_engine,
     )
 
-    web_app = WebServiceApp.build_from_module_root(
-        global_properties,
-        request_time_provider,
-        cron_run_time_provider,
-        invocation_recorder,
-        progress_reporter_factory,
-        realm_codec_registry,
-        auth_token_stamper,
-        domain_storage_engine,
-        search_storage_engine,
-        usecase_storage_engine,
-        crm,
-        jupiter.core.use_cases,
-        jupiter.webapi.exceptions,
-    )
+    if manifest is not None:
+        web_app = WebServiceApp.build_from_manifest(
+            global_properties,
+            request_time_provider,
+            cron_run_time_provider,
+            invocation_recorder,
+            progress_reporter_factory,
+            realm_codec_registry,
+            auth_token_stamper,
+            domain_storage_engine,
+            search_storage_engine,
+            usecase_storage_engine,
+            crm,
+            ical_fetcher,
+            manifest.section("routes"),
+        )
+    else:
+        web_app = WebServiceApp.build_from_module_root(
+            global_properties,
+            request_time_provider,
+            cron_run_time_provider,
+            invocation_recorder,
+            progress_reporter_factory,
+            realm_codec_registry,
+            auth_token_stamper,
+            domain_storage_engine,
+            search_storage_engine,
+            usecase_storage_engine,
+            crm,
+            ical_fetcher,
+            jupiter.core.use_cases,
+            jupiter.webapi.exceptions,
+        )
 
     await sqlite_connection.prepare()
     # await domain_storage_engine.initialize()
@@ -148,6 +188,10 @@ async def main() -> None:
             await sqlite_connection.dispose()
         finally:
             pass
+        try:
+            shutdown_ical_parse_workers()
+        finally:
+            pass
         try:
             await aio_session.close()
         finally:
@@ -0,0 +1,57 @@
+"""Build the manifest the web service starts up from, rather than scanning its modules."""
+
+from pathlib import Path
+from typing import Final
+
+import jupiter.core
+import jupiter.core.domain
+import jupiter.core.impl.repository.sqlite.domain
+import jupiter.core.use_cases
+import jupiter.webapi
+import jupiter.webapi.exceptions
+from jupiter.core.framework.manifest import (
+    Manifest,
+    fingerprint_module_roots,
+    load_manifest,
+    save_manifest,
+)
+from jupiter.core.impl.repository.sqlite.domain.storage_engine import (
+    SqliteDomainStorageEngine,
+)
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+from jupiter.webapi.app import WebServiceApp
+
+MANIFEST_PATH: Final[Path] = Path(__file__).parent / "manifest.json"
+
+
+def load_webapi_manifest() -> Manifest | None:
+    """Load the manifest, if it has been built and is up to date with the sources."""
+    return load_manifest(MANIFEST_PATH, jupiter.core, jupiter.webapi)
+
+
+def build_webapi_manifest() -> Manifest:
+    """Build the manifest by scanning the modules of the web service."""
+    return Manifest(
+        fingerprint=fingerprint_module_roots(jupiter.core, jupiter.webapi),
+        sections={
+            "realm-codecs": ModuleExplorerRealmCodecRegistry.build_manifest_section(
+                jupiter.core.domain, jupiter.core.use_cases
+            ),
+            "repositories": SqliteDomainStorageEngine.build_manifest_section(
+                jupiter.core.impl.repository.sqlite.domain, jupiter.core.domain
+            ),
+            "routes": WebServiceApp.build_manifest_section(
+                jupiter.core.use_cases, jupiter.webapi.exceptions
+            ),
+        },
+    )
+
+
+def main() -> None:
+    """Build and save the manifest."""
+    save_manifest(MANIFEST_PATH, build_webapi_manifest())
+    print(f"Wrote {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Tests for the Web RPC API app."""
+
+import asyncio
+import json
+from typing import cast
+
+import jupiter.core.domain
+import jupiter.core.use_cases
+import pytest
+from jupiter.core.domain.concept.auth.auth_token_stamper import AuthTokenStamper
+from jupiter.core.domain.concept.vacations.vacation import Vacation
+from jupiter.core.domain.concept.vacations.vacation_name import VacationName
+from jupiter.core.domain.core.adate import ADate
+from jupiter.core.domain.storage_engine import DomainStorageEngine, SearchStorageEngine
+from jupiter.core.framework.base.entity_id import EntityId
+from jupiter.core.framework.base.page_cursor import PageCursor
+from jupiter.core.framework.base.timestamp import Timestamp
+from jupiter.core.framework.context import DomainContext
+from jupiter.core.framework.errors import InputValidationError
+from jupiter.core.framework.event import EventSource
+from jupiter.core.framework.realm import RealmCodecRegistry
+from jupiter.core.framework.use_case import UseCaseSessionBase
+from jupiter.core.use_cases.concept.vacations.find import (
+    VacationFindArgs,
+    VacationFindResult,
+    VacationFindResultEntry,
+    VacationFindUseCase,
+)
+from jupiter.core.use_cases.infra.realms import ModuleExplorerRealmCodecRegistry
+from jupiter.core.use_cases.infra.use_cases import AppLoggedInReadonlyUseCaseContext
+from jupiter.core.utils.global_properties import GlobalProperties
+from jupiter.core.utils.time_provider import TimeProvider
+from jupiter.webapi.app import STREAMING_PAGE_SIZE, LoggedInReadonlyCommand
+from pendulum import UTC, DateTime
+
+_CTX = DomainContext.from_sys(
+    EventSource.GC_CRON, Timestamp(DateTime(2026, 10, 17, tzinfo=UTC))
+)
+
+
+@pytest.fixture(scope="module")
+def realm_codec_registry() -> RealmCodecRegistry:
+    """The codec registry for all the domain and use case types."""
+    return ModuleExplorerRealmCodecRegistry.build_from_module_root(
+        jupiter.core.domain, jupiter.core.use_cases
+    )
+
+
+class _FakeVacationFindUseCase(VacationFindUseCase):
+    """Pages through vacations held in memory, remembering what it was asked."""
+
+    vacations: list[Vacation]
+    calls: list[VacationFindArgs]
+
+    def __init__(self, realm_codec_registry: RealmCodecRegistry, count: int) -> None:
+        super().__init__(
+            global_properties=cast(GlobalProperties, None),
+            time_provider=cast(TimeProvider, None),
+            realm_codec_registry=realm_codec_registry,
+            auth_token_stamper=cast(AuthTokenStamper, None),
+            domain_storage_engine=cast(DomainStorageEngine, None),
+            search_storage_engine=cast(SearchStorageEngine, None),
+        )
+        self.vacations = [
+            Vacation.new_vacation(
+                _CTX,
+                EntityId("1"),
+                VacationName(f"Vacation {idx}"),
+                ADate.from_str("2026-10-20"),
+                ADate.from_str("2026-10-25"),
+            ).assign_ref_id(EntityId(str(idx)))
+            for idx in range(1, count + 1)
+        ]
+        self.calls = []
+
+    async def execute(
+        self, session: UseCaseSessionBase, args: VacationFindArgs
+    ) -> tuple[AppLoggedInReadonlyUseCaseContext, VacationFindResult]:
+        self.calls.append(args)
+        if args.page_size is None or args.page_size < 1:
+            raise InputValidationError("Page size must be positive")
+        cursor = args.cursor
+        remaining = [
+            v
+            for v in self.vacations
+            if cursor is None or v.ref_id.as_int() > cursor.ref_id.as_int()
+        ]
+        page = remaining[: args.page_size]
+        return cast(AppLoggedInReadonlyUseCaseContext, None), VacationFindResult(
+            entries=[
+                VacationFindResultEntry(vacation=v, note=None, time_event_block=None)
+                for v in page
+            ],
+            next_cursor=(
+                PageCursor.after_entity(page[-1])
+                if len(remaining) > args.page_size
+                else None
+            ),
+        )
+
+
+class _VacationFindCommand(
+    LoggedInReadonlyCommand[_FakeVacationFindUseCase, VacationFindResult]
+):
+    """The command for finding vacations."""
+
+
+def _args(page_size: int | None) -> VacationFindArgs:
+    return VacationFindArgs(
+        page_size=page_size,
+        cursor=None,
+        allow_archived=False,
+        include_notes=False,
+        include_time_event_blocks=False,
+        filter_ref_ids=None,
+    )
+
+
+def _stream(
+    realm_codec_registry: RealmCodecRegistry, count: int, page_size: int | None
+) -> tuple[list[str], str, list[VacationFindArgs]]:
+    use_case = _FakeVacationFindUseCase(realm_codec_registry, count)
+    command = _VacationFindCommand(realm_codec_registry, use_case, jupiter.core)
+
+    async def run() -> tuple[list[str], str]:
+        response = await command._stream_pages(
+            cast(UseCaseSessionBase, None), _args(page_size)
+        )
+        chunks = [cast(str, chunk) async for chunk in response.body_iterator]
+        return chunks, cast(str, response.media_type)
+
+    chunks, media_type = asyncio.run(run())
+    return chunks, media_type, use_case.calls
+
+
+def test_every_page_is_streamed_as_one_json_entry_per_line(
+    realm_codec_registry: RealmCodecRegistry,
+) -> None:
+    chunks, media_type, calls = _stream(realm_codec_registry, 5, page_size=2)
+
+    assert media_type == "application/x-ndjson"
+    assert all(chunk.endswith("\n") for chunk in chunks)
+    assert [json.loads(chunk)["vacation"]["name"] for chunk in chunks] == [
+        f"Vacation {idx}" for idx in range(1, 6)
+    ]
+    assert [(c.page_size, c.cursor and c.cursor.ref_id) for c in calls] == [
+        (2, None),
+        (2, EntityId("2")),
+        (2, EntityId("4")),
+    ]
+
+
+def test_an_empty_result_streams_nothing(
+    realm_codec_registry: RealmCodecRegistry,
+) -> None:
+    chunks, _, calls = _stream(realm_codec_registry, 0, page_size=None)
+
+    assert chunks == []
+    assert [c.page_size for c in calls] == [STREAMING_PAGE_SIZE]
+
+
+def test_bad_args_fail_before_the_response_starts(
+    realm_codec_registry: RealmCodecRegistry,
+) -> None:
+    with pytest.raises(InputValidationError, match="Page size must be positive"):
+        _stream(realm_codec_registry, 5, page_size=-1)